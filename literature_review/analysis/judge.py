@@ -19,7 +19,6 @@ import sys
 import json
 import csv
 import time
-import hashlib
 import pandas as pd
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
@@ -33,10 +32,13 @@ import warnings
 import re               # For normalization
 import difflib          # For fuzzy matching
 from collections import defaultdict  # For grouping claims by file
+from concurrent.futures import ThreadPoolExecutor
 
 # Import global rate limiter
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.global_rate_limiter import global_limiter, ErrorAction
+from utils.global_rate_limiter import global_limiter
+from literature_review.utils.llm_client import LLMClient, GeminiTransport, PersistentCache, prompt_cache_key
+from literature_review.io.version_history_store import VersionHistoryStore, open_version_history
 
 # --- NEW: Import the Deep Requirements Analyzer ---
 from . import requirements as dra
@@ -68,7 +70,10 @@ API_CONFIG = {
     "TIE_BREAKER_ENABLED": True,
     "BORDERLINE_SCORE_MIN": 2.5,  # Apply consensus to scores 2.5-3.5
     "BORDERLINE_SCORE_MAX": 3.5,
-    "ENABLE_ADAPTIVE_CONSENSUS": True  # Enable multi-judge consensus for borderline claims
+    "ENABLE_ADAPTIVE_CONSENSUS": True,  # Enable multi-judge consensus for borderline claims
+    "MAX_CONCURRENT_CLAIMS": 4,  # Claims judged in parallel per batch (1 = sequential)
+    "PACKED_PROMPTS": False,  # Judge claims sharing a sub-requirement in one request
+    "MAX_CLAIMS_PER_PROMPT": 5  # Claims per packed request
 }
 
 # (Setup code, Logging, and UTF8Formatter are identical)
@@ -128,10 +133,6 @@ class PaperAnalyzer:
 class APIManager:
     """Manages API calls with rate limiting, caching, and retry logic"""
     def __init__(self):
-        self.cache = {}
-        self.last_call_time = 0
-        self.calls_this_minute = 0
-        self.minute_start = time.time()
         try:
             api_key = os.getenv('GEMINI_API_KEY')
             if not api_key:
@@ -168,135 +169,20 @@ class APIManager:
             safe_print(f"❌ Critical Error initializing Gemini Client: {e}")
             raise
 
-    def rate_limit(self):
-        """Implement rate limiting using global limiter"""
-        global_limiter.wait_for_quota()
+        self.llm = LLMClient(
+            transport=GeminiTransport(self.client),
+            limiter=global_limiter,
+            cache=PersistentCache(),
+            module='judge',
+            json_config=self.json_generation_config,
+            text_config=self.text_generation_config,
+            retry_attempts=API_CONFIG['RETRY_ATTEMPTS'],
+            retry_delay=API_CONFIG['RETRY_DELAY']
+        )
 
     # --- MODIFIED: cached_api_call now accepts 'is_json' ---
     def cached_api_call(self, prompt: str, use_cache: bool = True, is_json: bool = True) -> Optional[Any]:
-        prompt_hash = hashlib.md5(prompt.encode('utf-8')).hexdigest()
-        if use_cache and prompt_hash in self.cache:
-            logger.debug(f"Cache hit for hash: {prompt_hash}")
-            safe_print("📦 Using cached response")
-            return self.cache[prompt_hash]
-
-        # Validate request before making API call
-        is_valid, reason = global_limiter.validate_request(prompt, {'response_mime_type': 'application/json' if is_json else None})
-        if not is_valid:
-            logger.error(f"Request validation failed: {reason}")
-            global_limiter.record_request(success=False)
-            return None
-        
-        # Check if we should abort due to error patterns
-        if global_limiter.should_abort_pipeline():
-            logger.critical("Pipeline abort recommended due to error patterns")
-            return None
-
-        logger.debug(f"Cache miss for hash: {prompt_hash}. Calling API...")
-        self.rate_limit()
-
-        response_text = ""
-        for attempt in range(API_CONFIG['RETRY_ATTEMPTS']):
-            try:
-                # --- MODIFICATION: Select correct config ---
-                current_config_object = self.json_generation_config if is_json else self.text_generation_config
-
-                response = self.client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=prompt,
-                    config=current_config_object
-                )
-                response_text = response.text
-                
-                # DEBUG: Check for truncation issues
-                if response.candidates:
-                    finish_reason = response.candidates[0].finish_reason
-                    if finish_reason != 1:  # 1 = STOP (normal completion)
-                        logger.warning(f"⚠️ Response finish_reason: {finish_reason}, text length: {len(response_text)}")
-                        if hasattr(response.candidates[0], 'safety_ratings'):
-                            logger.warning(f"Safety ratings: {response.candidates[0].safety_ratings}")
-
-                # --- MODIFICATION: Parse based on 'is_json' ---
-                if is_json:
-                    result = json.loads(response_text)
-                else:
-                    result = response_text
-                # --- END MODIFICATION ---
-
-                self.cache[prompt_hash] = result
-                # Record successful request
-                global_limiter.record_request(success=True)
-                return result
-
-            except json.JSONDecodeError as e:
-                # DEBUG: Save full response to file for analysis
-                debug_file = f"/tmp/judge_response_debug_{attempt}.txt"
-                with open(debug_file, 'w') as f:
-                    f.write(f"Response length: {len(response_text)}\n")
-                    f.write(f"Error: {e}\n")
-                    f.write(f"Full response:\n{response_text}\n")
-                logger.error(f"Saved debug response to {debug_file}")
-                
-                logger.error(
-                    f"JSON decode error on attempt {attempt + 1}: {e}. Response text: '{response_text[:500]}...'")
-                
-                # Try to repair common JSON issues
-                if attempt == 0:  # Only try repair on first attempt
-                    try:
-                        # Fix common malformations
-                        repaired = response_text
-                        # Fix double quotes at key start: ""key" -> "key"
-                        repaired = repaired.replace('""', '"')
-                        # Try parsing repaired JSON
-                        result = json.loads(repaired)
-                        logger.info("✅ Successfully repaired malformed JSON")
-                        self.cache[prompt_hash] = result
-                        global_limiter.record_request(success=True)
-                        return result
-                    except json.JSONDecodeError:
-                        logger.warning("JSON repair failed, will retry API call")
-                
-                # Categorize error
-                category = global_limiter.categorize_error(e, response_text)
-                action = global_limiter.get_action_for_error(category)
-                global_limiter.record_request(success=False, error=e, response_text=response_text)
-                
-                if action == ErrorAction.SKIP_DOCUMENT:
-                    logger.error(f"Skipping claim due to {category.name}")
-                    return None
-                elif attempt < API_CONFIG['RETRY_ATTEMPTS'] - 1:
-                    time.sleep(API_CONFIG['RETRY_DELAY'])
-                else:
-                    logger.error("Max retries reached for JSON decode error.")
-            except Exception as e:
-                # Categorize error
-                category = global_limiter.categorize_error(e, str(e))
-                action = global_limiter.get_action_for_error(category)
-                global_limiter.record_request(success=False, error=e, response_text=str(e))
-                
-                if "DeadlineExceeded" in str(e) or "Timeout" in str(e):
-                    logger.error(f"API call timed out on attempt {attempt + 1}")
-                else:
-                    logger.error(f"API error on attempt {attempt + 1}: {type(e).__name__} - {e}")
-                
-                if action == ErrorAction.ABORT_PIPELINE:
-                    logger.critical(f"Aborting due to {category.name}")
-                    return None
-                elif action == ErrorAction.SKIP_DOCUMENT:
-                    logger.error(f"Skipping claim due to {category.name}")
-                    return None
-                elif "429" in str(e):
-                    logger.warning("Rate limit error detected by API, increasing sleep time.")
-                    time.sleep(API_CONFIG['RETRY_DELAY'] * (attempt + 2))
-                elif attempt < API_CONFIG['RETRY_ATTEMPTS'] - 1:
-                    # Use delay from action's value tuple (name, delay_seconds)
-                    _, delay = action.value
-                    time.sleep(delay if delay > 0 else API_CONFIG['RETRY_DELAY'])
-                else:
-                    logger.error("Max retries reached for API error.")
-
-        logger.error(f"API call failed after {API_CONFIG['RETRY_ATTEMPTS']} attempts.")
-        return None
+        return self.llm.call(prompt, is_json=is_json, use_cache=use_cache)
 
     def call_with_temperature(self, prompt: str, temperature: float, cache_key: Optional[str] = None, is_json: bool = True) -> Optional[Any]:
         """
@@ -311,67 +197,15 @@ class APIManager:
         Returns:
             Parsed response or None on failure
         """
-        # Use custom cache key if provided
-        prompt_hash = hashlib.md5(cache_key.encode('utf-8')).hexdigest() if cache_key else hashlib.md5(prompt.encode('utf-8')).hexdigest()
-        
-        if prompt_hash in self.cache:
-            logger.debug(f"Cache hit for hash: {prompt_hash}")
-            return self.cache[prompt_hash]
-        
-        logger.debug(f"Cache miss for hash: {prompt_hash}. Calling API with temperature={temperature}...")
-        self.rate_limit()
-        
-        response_text = ""
-        for attempt in range(API_CONFIG['RETRY_ATTEMPTS']):
-            try:
-                thinking_config = types.ThinkingConfig(thinking_budget=0)
-                
-                # Create custom config with specified temperature
-                custom_config = types.GenerateContentConfig(
-                    temperature=temperature,
-                    top_p=1.0,
-                    top_k=1,
-                    max_output_tokens=16384,
-                    response_mime_type="application/json" if is_json else None,
-                    thinking_config=thinking_config
-                )
-                
-                response = self.client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=prompt,
-                    config=custom_config
-                )
-                response_text = response.text
-                
-                if is_json:
-                    result = json.loads(response_text)
-                else:
-                    result = response_text
-                
-                self.cache[prompt_hash] = result
-                return result
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error on attempt {attempt + 1}: {e}. Response text: '{response_text[:500]}...'")
-                if attempt < API_CONFIG['RETRY_ATTEMPTS'] - 1:
-                    time.sleep(API_CONFIG['RETRY_DELAY'])
-                else:
-                    logger.error("Max retries reached for JSON decode error.")
-            except Exception as e:
-                if "DeadlineExceeded" in str(e) or "Timeout" in str(e):
-                    logger.error(f"API call timed out on attempt {attempt + 1}")
-                else:
-                    logger.error(f"API error on attempt {attempt + 1}: {type(e).__name__} - {e}")
-                if "429" in str(e):
-                    logger.warning("Rate limit error detected by API, increasing sleep time.")
-                    time.sleep(API_CONFIG['RETRY_DELAY'] * (attempt + 2))
-                elif attempt < API_CONFIG['RETRY_ATTEMPTS'] - 1:
-                    time.sleep(API_CONFIG['RETRY_DELAY'])
-                else:
-                    logger.error("Max retries reached for API error.")
-        
-        logger.error(f"API call failed after {API_CONFIG['RETRY_ATTEMPTS']} attempts.")
-        return None
+        custom_config = types.GenerateContentConfig(
+            temperature=temperature,
+            top_p=1.0,
+            top_k=1,
+            max_output_tokens=16384,
+            response_mime_type="application/json" if is_json else None,
+            thinking_config=types.ThinkingConfig(thinking_budget=0)
+        )
+        return self.llm.call(prompt, is_json=is_json, cache_key=cache_key, config=custom_config)
 # --- END APIManager MODIFICATION ---
 
 
@@ -625,27 +459,8 @@ def process_claims_in_batches(claims: List[Dict], batch_size: int) -> List[List[
 
 # --- ENHANCED EVIDENCE SCORING FUNCTIONS (Task Card #16) ---
 
-def build_judge_prompt_enhanced(claim: Dict, sub_requirement_definition: str) -> str:
-    """
-    Enhanced prompt with multi-dimensional scoring.
-    
-    Returns prompt requesting 6-dimensional evidence quality scores
-    following PRISMA systematic review standards.
-    """
-    sub_req_key = claim.get('sub_requirement') or claim.get('sub_requirement_key', 'N/A')
-    return f"""
-You are an impartial "Judge" AI evaluating scientific evidence quality.
-
-**Claim to Evaluate:**
-{json.dumps(claim, indent=2)}
-
-**Target Requirement:**
-{sub_requirement_definition}
-
-**Your Task:**
-Assess this claim using PRISMA systematic review standards across 6 dimensions:
-
-1. **Strength of Evidence** (1-5):
+# Shared by the single-claim and packed Judge prompts
+JUDGE_SCORING_DIMENSIONS = """1. **Strength of Evidence** (1-5):
    - 5: Strong (Multiple RCTs, meta-analysis, direct experimental proof)
    - 4: Moderate (Single well-designed study, clear experimental validation)
    - 3: Weak (Observational study, indirect evidence)
@@ -683,12 +498,11 @@ Assess this claim using PRISMA systematic review standards across 6 dimensions:
 
 **Decision Criteria:**
 - APPROVE if composite_score ≥ 3.0 AND strength_score ≥ 3 AND relevance_score ≥ 3
-- REJECT otherwise
+- REJECT otherwise"""
 
-**Return Format (JSON only):**
-{{
+JUDGE_VERDICT_FORMAT = """{
   "verdict": "approved|rejected",
-  "evidence_quality": {{
+  "evidence_quality": {
     "strength_score": <1-5>,
     "strength_rationale": "<brief justification>",
     "rigor_score": <1-5>,
@@ -700,12 +514,78 @@ Assess this claim using PRISMA systematic review standards across 6 dimensions:
     "reproducibility_score": <1-5>,
     "composite_score": <calculated weighted average>,
     "confidence_level": "high|medium|low"
-  }},
+  },
   "judge_notes": "<1-2 sentence summary>"
-}}
+}"""
+
+JUDGE_COMPOSITE_FORMULA = """composite_score = (strength × 0.30) + (rigor × 0.25) + (relevance × 0.25) + (directness/3 × 0.10) + (recency × 0.05) + (reproducibility × 0.05)"""
+
+
+def build_judge_prompt_enhanced(claim: Dict, sub_requirement_definition: str) -> str:
+    """
+    Enhanced prompt with multi-dimensional scoring.
+    
+    Returns prompt requesting 6-dimensional evidence quality scores
+    following PRISMA systematic review standards.
+    """
+    sub_req_key = claim.get('sub_requirement') or claim.get('sub_requirement_key', 'N/A')
+    return f"""
+You are an impartial "Judge" AI evaluating scientific evidence quality.
+
+**Claim to Evaluate:**
+{json.dumps(claim, indent=2)}
+
+**Target Requirement:**
+{sub_requirement_definition}
+
+**Your Task:**
+Assess this claim using PRISMA systematic review standards across 6 dimensions:
+
+{JUDGE_SCORING_DIMENSIONS}
+
+**Return Format (JSON only):**
+{JUDGE_VERDICT_FORMAT}
+
+**Composite Score Formula:**
+{JUDGE_COMPOSITE_FORMULA}
+"""
+
+
+def build_packed_judge_prompt(claims: List[Dict], sub_requirement_definition: str) -> str:
+    """
+    Prompt judging several claims against the same sub-requirement in one request.
+
+    Each claim is numbered; the response carries one verdict per claim, keyed by
+    "claim_index", in the same format as build_judge_prompt_enhanced().
+    """
+    claims_text = "\n\n".join(
+        f"### Claim {index}\n{json.dumps(claim, indent=2)}"
+        for index, claim in enumerate(claims, 1)
+    )
+    return f"""
+You are an impartial "Judge" AI evaluating scientific evidence quality.
+
+**Claims to Evaluate ({len(claims)}):**
+Judge each claim independently; do not let one claim influence another's scores.
+
+{claims_text}
+
+**Target Requirement (shared by all claims):**
+{sub_requirement_definition}
+
+**Your Task:**
+Assess each claim using PRISMA systematic review standards across 6 dimensions:
+
+{JUDGE_SCORING_DIMENSIONS}
+
+**Return Format (JSON only):**
+{{"judgments": [<one object per claim>]}}
+
+Each object has "claim_index" (the claim's number above) plus exactly this structure:
+{JUDGE_VERDICT_FORMAT}
 
 **Composite Score Formula:**
-composite_score = (strength × 0.30) + (rigor × 0.25) + (relevance × 0.25) + (directness/3 × 0.10) + (recency × 0.05) + (reproducibility × 0.05)
+{JUDGE_COMPOSITE_FORMULA}
 """
 
 
@@ -796,6 +676,22 @@ def meets_approval_criteria(quality: Dict) -> bool:
     return composite >= 3.0 and strength >= 3 and relevance >= 3
 
 
+# Default moderate scores for legacy approved claims
+LEGACY_EVIDENCE_QUALITY = {
+    "strength_score": 3,
+    "strength_rationale": "Legacy claim (default score)",
+    "rigor_score": 3,
+    "study_type": "unknown",
+    "relevance_score": 3,
+    "relevance_notes": "Legacy claim",
+    "directness": 2,
+    "is_recent": False,
+    "reproducibility_score": 3,
+    "composite_score": 3.0,
+    "confidence_level": "medium"
+}
+
+
 def migrate_existing_claims(history: Dict) -> Dict:
     """
     Add default scores to claims without evidence_quality for backward compatibility.
@@ -810,19 +706,7 @@ def migrate_existing_claims(history: Dict) -> Dict:
             for claim in claims:
                 if 'evidence_quality' not in claim and claim.get('status') == 'approved':
                     # Assign default moderate scores for legacy approved claims
-                    claim['evidence_quality'] = {
-                        "strength_score": 3,
-                        "strength_rationale": "Legacy claim (default score)",
-                        "rigor_score": 3,
-                        "study_type": "unknown",
-                        "relevance_score": 3,
-                        "relevance_notes": "Legacy claim",
-                        "directness": 2,
-                        "is_recent": False,
-                        "reproducibility_score": 3,
-                        "composite_score": 3.0,
-                        "confidence_level": "medium"
-                    }
+                    claim['evidence_quality'] = dict(LEGACY_EVIDENCE_QUALITY)
                     migrated_count += 1
     
     if migrated_count > 0:
@@ -830,6 +714,28 @@ def migrate_existing_claims(history: Dict) -> Dict:
     
     return history
 
+
+def migrate_existing_claims_in_store(history_store: VersionHistoryStore) -> int:
+    """
+    migrate_existing_claims for the version history store.
+
+    Only the latest approved claims are migrated, as one 'quality_migration'
+    version per affected paper. Legacy claims only arrive by importing the JSON
+    (the judge always scores the claims it approves), so this scans the claims
+    once per import rather than on every run.
+    """
+    if history_store.meta('quality_migration_import') == history_store.import_id:
+        return 0
+    legacy_claims = [claim for _, claim in history_store.claims(status='approved')
+                     if 'evidence_quality' not in claim]
+    for claim in legacy_claims:
+        claim['evidence_quality'] = dict(LEGACY_EVIDENCE_QUALITY)
+    migrated_count = history_store.put_claims(legacy_claims, status='quality_migration') if legacy_claims else 0
+    history_store.set_meta('quality_migration_import', history_store.import_id)
+    if migrated_count > 0:
+        logger.info(f"Migrated {migrated_count} legacy claims with default quality scores.")
+    return migrated_count
+
 # --- END ENHANCED EVIDENCE SCORING FUNCTIONS ---
 
 
@@ -871,21 +777,28 @@ def judge_with_consensus(claim: Dict, sub_req_def: str, api_manager) -> Optional
         Consensus judgment with aggregated scores and metadata
     """
     judgments = []
-    
-    for judge_num in range(API_CONFIG["CONSENSUS_JUDGES"]):
-        # Each judge gets identical prompt but different temperature for diversity
-        prompt = build_judge_prompt_enhanced(claim, sub_req_def)
+    # Each judge gets identical prompt but different temperature for diversity
+    prompt = build_judge_prompt_enhanced(claim, sub_req_def)
+    # The response cache is persistent, so key on the prompt too: an edited
+    # claim, evidence or definition must not reuse an earlier verdict
+    prompt_digest = prompt_cache_key(prompt)
+
+    def consult_judge(judge_num: int) -> Optional[Any]:
         temperature = 0.3 + (judge_num * 0.1)  # 0.3, 0.4, 0.5
-        
         logger.info(f"  Calling consensus judge {judge_num + 1}/{API_CONFIG['CONSENSUS_JUDGES']} (temp={temperature})")
-        
-        judgment = api_manager.call_with_temperature(
+        return api_manager.call_with_temperature(
             prompt,
             temperature=temperature,
-            cache_key=f"{claim.get('claim_id', 'unknown')}_judge_{judge_num}",
+            cache_key=f"{claim.get('claim_id', 'unknown')}_judge_{judge_num}_{prompt_digest}",
             is_json=True
         )
-        
+
+    # Judges are independent, so they run in parallel (each call still waits on the global limiter)
+    with ThreadPoolExecutor(max_workers=max(1, API_CONFIG["CONSENSUS_JUDGES"]),
+                            thread_name_prefix="consensus-judge") as executor:
+        responses = list(executor.map(consult_judge, range(API_CONFIG["CONSENSUS_JUDGES"])))
+
+    for judge_num, judgment in enumerate(responses):
         validated = validate_judge_response_enhanced(judgment)
         if validated:
             judgments.append(validated)
@@ -1034,10 +947,26 @@ def process_claim_with_adaptive_consensus(claim: Dict, sub_req_def: str, api_man
                     logger.warning(f"  Missing scores in evidence_quality: {missing_scores}")
         return None
     
+    return resolve_borderline_judgment(claim, sub_req_def, single_judgment, api_manager)
+
+
+def resolve_borderline_judgment(claim: Dict, sub_req_def: str, single_judgment: Dict, api_manager) -> Dict:
+    """
+    Escalate a borderline single-judge verdict to multi-judge consensus.
+
+    Args:
+        claim: Claim that was judged
+        sub_req_def: Sub-requirement definition text
+        single_judgment: Validated single-judge verdict for the claim
+        api_manager: API manager instance
+
+    Returns:
+        Consensus judgment for borderline scores, otherwise single_judgment
+    """
     # Add evidence quality to claim temporarily to check if consensus needed
     temp_claim = claim.copy()
     temp_claim['evidence_quality'] = single_judgment.get('evidence_quality', {})
-    
+
     # Check if needs consensus
     if should_use_consensus(temp_claim):
         logger.info(f"  Borderline score detected ({single_judgment['evidence_quality']['composite_score']:.2f}). Using multi-judge consensus...")
@@ -1061,6 +990,144 @@ def process_claim_with_adaptive_consensus(claim: Dict, sub_req_def: str, api_man
 # --- END CONSENSUS REVIEW FUNCTIONS ---
 
 
+# --- CONCURRENT JUDGING ---
+
+def missing_definition_ruling(sub_req_key: str, appeal: bool = False) -> Dict:
+    """Rejection (with default quality scores) for a claim whose sub-requirement has no definition."""
+    if appeal:
+        notes = f"Rejected. (DRA Appeal) Could not find sub-requirement definition for '{sub_req_key}'."
+    else:
+        notes = f"Rejected. Could not find sub-requirement definition for '{sub_req_key}' in pillar file."
+    return {
+        "verdict": "rejected",
+        "judge_notes": notes,
+        "evidence_quality": {
+            "strength_score": 1,
+            "strength_rationale": "No definition found",
+            "rigor_score": 1,
+            "study_type": "unknown",
+            "relevance_score": 1,
+            "relevance_notes": "No definition to match against",
+            "directness": 1,
+            "is_recent": False,
+            "reproducibility_score": 1,
+            "composite_score": 1.0,
+            "confidence_level": "low"
+        }
+    }
+
+
+def judge_single_claim(claim: Dict, definition_text: str, api_manager) -> Optional[Dict]:
+    """Judge one claim: adaptive consensus if enabled, otherwise a single judge."""
+    if API_CONFIG.get("ENABLE_ADAPTIVE_CONSENSUS", False):
+        # Adaptive consensus: single judge first, then consensus for borderline
+        return process_claim_with_adaptive_consensus(claim, definition_text, api_manager)
+
+    prompt = build_judge_prompt_enhanced(claim, definition_text)
+    logger.info(f"  Submitting claim {claim.get('claim_id', 'N/A')} to Judge AI...")
+    response = api_manager.cached_api_call(prompt, use_cache=False, is_json=True)
+    ruling = validate_judge_response_enhanced(response)
+    if not ruling and response:
+        logger.warning(f"  ⚠️ Validation failed. Response keys: {list(response.keys()) if isinstance(response, dict) else 'not a dict'}")
+    return ruling
+
+
+def judge_packed_claims(claims: List[Dict], definition_text: str, api_manager) -> List[Optional[Dict]]:
+    """
+    Judge claims sharing a sub-requirement with one packed request.
+
+    Each verdict is validated on its own with validate_judge_response_enhanced();
+    claims the response has no valid verdict for are judged individually. With
+    adaptive consensus enabled, borderline verdicts still go to the consensus panel.
+
+    Returns:
+        One ruling (or None) per claim, in input order
+    """
+    prompt = build_packed_judge_prompt(claims, definition_text)
+    logger.info(f"  Submitting {len(claims)} claims to Judge AI in one packed request...")
+    response = api_manager.cached_api_call(prompt, use_cache=False, is_json=True)
+
+    items = response.get("judgments") if isinstance(response, dict) else response
+    verdicts_by_index = {}
+    for item in items if isinstance(items, list) else []:
+        index = item.get("claim_index") if isinstance(item, dict) else None
+        if isinstance(index, int) and not isinstance(index, bool):
+            verdicts_by_index.setdefault(index, {k: v for k, v in item.items() if k != "claim_index"})
+
+    rulings = []
+    for index, claim in enumerate(claims, 1):
+        ruling = validate_judge_response_enhanced(verdicts_by_index.get(index))
+        if not ruling:
+            logger.warning(f"  No valid packed verdict for claim {claim.get('claim_id', 'N/A')}. Judging it individually.")
+            ruling = judge_single_claim(claim, definition_text, api_manager)
+        elif API_CONFIG.get("ENABLE_ADAPTIVE_CONSENSUS", False):
+            ruling = resolve_borderline_judgment(claim, definition_text, ruling, api_manager)
+        rulings.append(ruling)
+    return rulings
+
+
+def judge_claims(claims: List[Dict], api_manager, appeal: bool = False) -> List[Tuple[Optional[str], Optional[Dict]]]:
+    """
+    Judge a batch of claims concurrently. The claims themselves are not modified.
+
+    Up to API_CONFIG['MAX_CONCURRENT_CLAIMS'] claims (or packed requests) are judged
+    in parallel; every request still waits on the global rate limiter. With
+    API_CONFIG['PACKED_PROMPTS'], claims for the same sub-requirement are sent up to
+    API_CONFIG['MAX_CLAIMS_PER_PROMPT'] per request.
+
+    Args:
+        claims: Claims to judge
+        api_manager: API manager instance
+        appeal: Whether these are DRA appeal claims (only changes rejection notes)
+
+    Returns:
+        (definition_text, ruling) per claim, in input order. definition_text is None
+        when the sub-requirement has no definition; ruling is None when the Judge AI
+        returned no valid verdict.
+    """
+    definitions = [find_robust_sub_requirement_text(claim.get('sub_requirement') or claim.get('sub_requirement_key', 'N/A'))
+                   for claim in claims]
+    rulings: List[Optional[Dict]] = [None] * len(claims)
+
+    groups = []  # Claim indices judged by one request
+    packed_groups = defaultdict(list)
+    for index, (claim, definition_text) in enumerate(zip(claims, definitions)):
+        if not definition_text:
+            sub_req_key = claim.get('sub_requirement') or claim.get('sub_requirement_key', 'N/A')
+            rulings[index] = missing_definition_ruling(sub_req_key, appeal)
+        elif API_CONFIG.get("PACKED_PROMPTS", False):
+            packed_groups[definition_text].append(index)
+        else:
+            groups.append([index])
+    pack_size = max(1, int(API_CONFIG.get("MAX_CLAIMS_PER_PROMPT", 1)))
+    for indices in packed_groups.values():
+        groups.extend(indices[n:n + pack_size] for n in range(0, len(indices), pack_size))
+
+    def judge_group(indices: List[int]) -> List[Optional[Dict]]:
+        definition_text = definitions[indices[0]]
+        try:
+            if len(indices) == 1:
+                return [judge_single_claim(claims[indices[0]], definition_text, api_manager)]
+            return judge_packed_claims([claims[i] for i in indices], definition_text, api_manager)
+        except Exception as e:
+            claim_ids = [claims[i].get('claim_id', 'N/A') for i in indices]
+            logger.critical(f"  CRITICAL UNHANDLED ERROR judging claim(s) {claim_ids}: {e}")
+            return [None] * len(indices)
+
+    max_workers = max(1, min(int(API_CONFIG.get("MAX_CONCURRENT_CLAIMS", 1)), len(groups)))
+    if max_workers > 1:
+        logger.info(f"Judging {len(claims)} claims in {len(groups)} requests with {max_workers} concurrent workers")
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="judge-worker") as executor:
+            group_rulings = list(executor.map(judge_group, groups))
+    else:
+        group_rulings = [judge_group(indices) for indices in groups]
+
+    for indices, results in zip(groups, group_rulings):
+        for index, ruling in zip(indices, results):
+            rulings[index] = ruling
+    return list(zip(definitions, rulings))
+
+
 # --- MAIN EXECUTION ---
 def main():
     start_time = time.time()
@@ -1086,8 +1153,8 @@ def main():
     logger.info("\n=== LOADING DATA ===")
     safe_print("\n=== LOADING DATA ===")
 
-    # NEW: Load ONLY from version history
-    version_history = load_version_history(VERSION_HISTORY_FILE)
+    # NEW: Load ONLY from version history (store re-imports the JSON if it changed)
+    history_store = open_version_history(VERSION_HISTORY_FILE)
     pillar_definitions = load_pillar_definitions(DEFINITIONS_FILE)
 
     if not pillar_definitions:
@@ -1096,20 +1163,21 @@ def main():
         return
     
     # Migrate legacy claims to include default quality scores
-    if version_history:
-        version_history = migrate_existing_claims(version_history)
-    
-    if not version_history:
+    migrate_existing_claims_in_store(history_store)
+
+    # Pending claims come from the store's work queue, not a scan of the history
+    claims_to_judge = history_store.pending_claims()
+
+    if not claims_to_judge and not len(history_store):
         logger.info("No version history found. Nothing to judge.")
         safe_print("⚖️ No version history found. All work is done.")
         return
 
-    # Extract pending claims
-    claims_to_judge = extract_pending_claims_from_history(version_history)
-    
     if not claims_to_judge:
         logger.info("No pending claims found in version history.")
         safe_print("⚖️ No pending claims found. All work is done.")
+        if history_store.unexported:
+            history_store.export_json(VERSION_HISTORY_FILE)
         return True  # No claims to judge is success, not failure
     
     logger.info(f"Found {len(claims_to_judge)} total claims pending judgment.")
@@ -1133,7 +1201,10 @@ def main():
         logger.info(f"\n=== Processing Batch {batch_num}/{len(claim_batches)} ({len(claim_batch)} claims) ===")
         safe_print(f"\n=== Processing Batch {batch_num}/{len(claim_batches)} ({len(claim_batch)} claims) ===")
         
-        for i, claim in enumerate(claim_batch, 1):
+        # Claims are judged concurrently; verdicts are applied in input order
+        rulings = judge_claims(claim_batch, api_manager)
+        batch_start = len(all_judged_claims)
+        for i, (claim, (definition_text, ruling)) in enumerate(zip(claim_batch, rulings), 1):
             overall_index = (batch_num - 1) * API_CONFIG['CLAIM_BATCH_SIZE'] + i
             filename = claim.get('_source_filename', 'N/A')
             claim_id_short = f"{filename[:15]}... ({claim['claim_id'][:6]})"
@@ -1143,46 +1214,10 @@ def main():
             try:
                 sub_req_key = claim.get('sub_requirement') or claim.get('sub_requirement_key', 'N/A')
                 pillar_key = claim.get('pillar', 'N/A')
-                definition_text = find_robust_sub_requirement_text(sub_req_key)
 
                 if not definition_text:
                     logger.error(f"  Could not find definition for claim. Rejecting.")
                     safe_print(f"  ❌ Could not find definition for '{sub_req_key}'. Rejecting.")
-                    # Create default quality scores for rejected claim
-                    ruling = {
-                        "verdict": "rejected",
-                        "judge_notes": f"Rejected. Could not find sub-requirement definition for '{sub_req_key}' in pillar file.",
-                        "evidence_quality": {
-                            "strength_score": 1,
-                            "strength_rationale": "No definition found",
-                            "rigor_score": 1,
-                            "study_type": "unknown",
-                            "relevance_score": 1,
-                            "relevance_notes": "No definition to match against",
-                            "directness": 1,
-                            "is_recent": False,
-                            "reproducibility_score": 1,
-                            "composite_score": 1.0,
-                            "confidence_level": "low"
-                        }
-                    }
-                else:
-                    # Use adaptive consensus if enabled, otherwise use single judge
-                    if API_CONFIG.get("ENABLE_ADAPTIVE_CONSENSUS", False):
-                        # Adaptive consensus: single judge first, then consensus for borderline
-                        ruling = process_claim_with_adaptive_consensus(claim, definition_text, api_manager)
-                    else:
-                        # Original single-judge approach
-                        prompt = build_judge_prompt_enhanced(claim, definition_text)
-                        logger.info(f"  Submitting claim to Judge AI...")
-                        safe_print(f"  Submitting claim to Judge AI...")
-                        response = api_manager.cached_api_call(prompt, use_cache=False, is_json=True)
-                        logger.info(f"  Response type: {type(response)}, has keys: {bool(response and isinstance(response, dict))}")
-                        ruling = validate_judge_response_enhanced(response)
-                        if not ruling and response:
-                            logger.warning(f"  ⚠️ Validation failed. Response keys: {list(response.keys()) if isinstance(response, dict) else 'not a dict'}")
-
-
 
                 if ruling:
                     canonical_pillar = find_robust_pillar_key(pillar_key)
@@ -1224,10 +1259,9 @@ def main():
         logger.info(f"\nBatch {batch_num} complete. Progress: {init_approved_count} approved, {init_rejected_count} rejected")
         safe_print(f"Batch {batch_num} complete. Progress: {init_approved_count} approved, {init_rejected_count} rejected")
         
-        # ✅ CHECKPOINT: Save progress after each batch
+        # ✅ CHECKPOINT: Save progress after each batch (only claims the judge ruled on are written)
         logger.info(f"Saving checkpoint after batch {batch_num}...")
-        version_history = update_claims_in_history(version_history, all_judged_claims)
-        save_version_history(VERSION_HISTORY_FILE, version_history)
+        history_store.put_claims(all_judged_claims[batch_start:])
         logger.info(f"✓ Checkpoint saved: {len(all_judged_claims)} claims persisted to version history")
 
     # --- PHASE 2: DRA Appeal Process ---
@@ -1251,6 +1285,8 @@ def main():
         for claim in new_claims_for_rejudgment:
             claim['_source_filename'] = claim.get('filename')
             claim['_source_type'] = 'dra_appeal'
+        # Persist the appeals right away; they join the pending queue until judged below
+        history_store.add_claims(new_claims_for_rejudgment)
 
     # --- PHASE 3: Final Judgment (on Appeals) (WITH BATCHING) ---
     logger.info("\n--- PHASE 3: Final Judgment (on Appeals) (Batched Processing) ---")
@@ -1274,7 +1310,9 @@ def main():
             logger.info(f"\n=== Processing DRA Batch {batch_num}/{len(dra_claim_batches)} ({len(claim_batch)} claims) ===")
             safe_print(f"\n=== Processing DRA Batch {batch_num}/{len(dra_claim_batches)} ({len(claim_batch)} claims) ===")
             
-            for i, new_claim in enumerate(claim_batch, 1):
+            rulings = judge_claims(claim_batch, api_manager, appeal=True)
+            batch_start = len(all_judged_claims)
+            for i, (new_claim, (definition_text, ruling)) in enumerate(zip(claim_batch, rulings), 1):
                 overall_index = (batch_num - 1) * API_CONFIG['CLAIM_BATCH_SIZE'] + i
                 filename = new_claim.get('filename', 'N/A')
                 claim_id_short = f"{filename[:15]}... ({new_claim['claim_id'][:6]})"
@@ -1282,43 +1320,10 @@ def main():
                 safe_print(f"\n--- Re-Judging Claim {overall_index}/{len(new_claims_for_rejudgment)}: {claim_id_short} ---")
 
                 try:
-                    sub_req_key = new_claim.get('sub_requirement', 'N/A')
-                    pillar_key = new_claim.get('pillar', 'N/A')
-                    definition_text = find_robust_sub_requirement_text(sub_req_key)
-
                     if not definition_text:
+                        sub_req_key = new_claim.get('sub_requirement') or new_claim.get('sub_requirement_key', 'N/A')
                         logger.error(f"  Could not find definition for DRA claim. Rejecting.")
                         safe_print(f"  ❌ Could not find definition for '{sub_req_key}'. Rejecting.")
-                        # Create default quality scores for rejected claim
-                        ruling = {
-                            "verdict": "rejected",
-                            "judge_notes": f"Rejected. (DRA Appeal) Could not find sub-requirement definition for '{sub_req_key}'.",
-                            "evidence_quality": {
-                                "strength_score": 1,
-                                "strength_rationale": "No definition found",
-                                "rigor_score": 1,
-                                "study_type": "unknown",
-                                "relevance_score": 1,
-                                "relevance_notes": "No definition to match against",
-                                "directness": 1,
-                                "is_recent": False,
-                                "reproducibility_score": 1,
-                                "composite_score": 1.0,
-                                "confidence_level": "low"
-                            }
-                        }
-                    else:
-                        # Use adaptive consensus if enabled, otherwise use single judge
-                        if API_CONFIG.get("ENABLE_ADAPTIVE_CONSENSUS", False):
-                            # Adaptive consensus: single judge first, then consensus for borderline
-                            ruling = process_claim_with_adaptive_consensus(new_claim, definition_text, api_manager)
-                        else:
-                            # Original single-judge approach
-                            prompt = build_judge_prompt_enhanced(new_claim, definition_text)
-                            logger.info(f"  Submitting DRA claim to Judge AI...")
-                            safe_print(f"  Submitting DRA claim to Judge AI...")
-                            response = api_manager.cached_api_call(prompt, use_cache=False, is_json=True)
-                            ruling = validate_judge_response_enhanced(response)
 
                     if ruling:
                         new_claim['status'] = ruling['verdict']
@@ -1356,25 +1361,18 @@ def main():
             
             # ✅ CHECKPOINT: Save progress after each DRA batch
             logger.info(f"Saving checkpoint after DRA batch {batch_num}...")
-            version_history = update_claims_in_history(version_history, all_judged_claims)
-            if new_claims_for_rejudgment:
-                version_history = add_new_claims_to_history(version_history, new_claims_for_rejudgment)
-            save_version_history(VERSION_HISTORY_FILE, version_history)
+            history_store.put_claims(all_judged_claims[batch_start:])
             logger.info(f"✓ Checkpoint saved: {len(all_judged_claims)} total claims persisted")
 
     # --- PHASE 4: Save All Results to Version History ---
     logger.info("\n--- PHASE 4: Saving Results to Version History ---")
     safe_print("\n--- PHASE 4: Saving Results to Version History ---")
 
-    # Update existing claims
-    version_history = update_claims_in_history(version_history, all_judged_claims)
-    
-    # Add new DRA claims
-    if new_claims_for_rejudgment:
-        version_history = add_new_claims_to_history(version_history, new_claims_for_rejudgment)
+    # Update judged claims (a no-op for anything already checkpointed)
+    history_store.put_claims(all_judged_claims)
 
     # Save to version history ONLY
-    save_version_history(VERSION_HISTORY_FILE, version_history)
+    history_store.export_json(VERSION_HISTORY_FILE)
 
     logger.info("\n" + "=" * 80)
     logger.info("JUDGMENT COMPLETE")
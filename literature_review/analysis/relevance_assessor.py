@@ -13,8 +13,9 @@ logger = logging.getLogger(__name__)
 
 # Optional: Semantic similarity
 try:
-    from sentence_transformers import SentenceTransformer
+    import sentence_transformers  # noqa: F401
     import numpy as np
+    from literature_review.utils.embedding_service import EmbeddingService, get_embedding_service
     SEMANTIC_AVAILABLE = True
 except ImportError:
     SEMANTIC_AVAILABLE = False
@@ -39,7 +40,8 @@ class RelevanceAssessor:
         self,
         relevance_threshold: float = 0.3,
         use_semantic: bool = False,
-        semantic_model: str = "all-MiniLM-L6-v2"
+        semantic_model: str = "all-MiniLM-L6-v2",
+        embedding_service: Optional['EmbeddingService'] = None
     ):
         """
         Initialize relevance assessor.
@@ -48,19 +50,23 @@ class RelevanceAssessor:
             relevance_threshold: Minimum score to consider paper relevant (0.0-1.0)
             use_semantic: Enable semantic similarity scoring (requires sentence-transformers)
             semantic_model: SentenceTransformer model name
+            embedding_service: Embedding service to use (default: the shared service for semantic_model)
         """
         self.relevance_threshold = relevance_threshold
         self.use_semantic = use_semantic and SEMANTIC_AVAILABLE
 
         # Load semantic model if enabled
         self.semantic_model = None
+        self.embeddings = None
         if self.use_semantic:
             try:
-                self.semantic_model = SentenceTransformer(semantic_model)
+                self.embeddings = embedding_service or get_embedding_service(semantic_model)
+                self.semantic_model = self.embeddings.model
                 logger.info(f"Loaded semantic model: {semantic_model}")
             except Exception as e:
                 logger.warning(f"Failed to load semantic model: {e}. Falling back to keyword-only.")
                 self.use_semantic = False
+                self.embeddings = None
 
         # Weights for hybrid scoring
         self.keyword_weight = 0.7
@@ -151,6 +157,9 @@ class RelevanceAssessor:
         matched_gaps = []
         confidences = []
 
+        # Embed the paper and all gaps in one batch; the per-gap scores below hit the cache
+        self._prefetch_embeddings([paper_text] + [gap.get('requirement_text', '') for gap in gaps])
+
         for gap in gaps:
             gap_id = gap.get('gap_id', 'unknown')
             gap_text = gap.get('requirement_text', '')
@@ -208,14 +217,9 @@ class RelevanceAssessor:
             return 0.0
 
         try:
-            # Generate embeddings
-            paper_embedding = self.semantic_model.encode(paper_text, convert_to_tensor=False)
-            gap_embedding = self.semantic_model.encode(gap_text, convert_to_tensor=False)
-
-            # Cosine similarity
-            similarity = np.dot(paper_embedding, gap_embedding) / (
-                np.linalg.norm(paper_embedding) * np.linalg.norm(gap_embedding)
-            )
+            # Cached, normalized embeddings: cosine similarity is a dot product
+            paper_embedding, gap_embedding = self.embeddings.embed_many([paper_text, gap_text])
+            similarity = np.dot(paper_embedding, gap_embedding)
 
             # Normalize to 0-1 (cosine can be -1 to 1)
             normalized = (similarity + 1) / 2
@@ -225,6 +229,15 @@ class RelevanceAssessor:
             logger.error(f"Semantic similarity failed: {e}")
             return 0.0
 
+    def _prefetch_embeddings(self, texts: List[str]) -> None:
+        """Embed texts in batches ahead of per-pair scoring (no-op without semantic scoring)."""
+        if not (self.use_semantic and self.embeddings):
+            return
+        try:
+            self.embeddings.embed_many(texts)
+        except Exception as e:
+            logger.error(f"Semantic embedding failed: {e}")
+
     def _extract_keywords(self, text: str) -> Set[str]:
         """
         Extract keywords from text (lowercase, alphanumeric, length > 2).
@@ -279,9 +292,10 @@ class RelevanceAssessor:
             >>> relevant_papers = [r for r in results if r['is_relevant']]
         """
         results = []
+        paper_texts = [f"{paper.get('title', '')} {paper.get('abstract', '')}" for paper in papers]
+        self._prefetch_embeddings(paper_texts + [gap.get('requirement_text', '') for gap in gaps])
 
-        for paper in papers:
-            paper_text = f"{paper.get('title', '')} {paper.get('abstract', '')}"
+        for paper, paper_text in zip(papers, paper_texts):
 
             is_relevant, matched_gaps, confidence = self.assess_paper_to_gaps(
                 paper_text, gaps
@@ -14,8 +14,6 @@ It performs a deeper AI-driven search to find better evidence for
 import os
 import sys
 import json
-import pypdf
-import pdfplumber
 import time
 import hashlib
 import numpy as np
@@ -26,6 +24,7 @@ from google.generativeai import types
 from bs4 import BeautifulSoup
 import logging
 from collections import defaultdict # <-- NEW: For grouping claims
+from literature_review.utils.text_extraction import extract_document
 
 # --- CONFIGURATION ---
 REVIEW_CONFIG = {
@@ -78,53 +77,13 @@ def find_sub_requirement_definition(definitions: Dict, pillar_key: str,
 class TextExtractor:
     """Robust text extraction from multiple file formats"""
     @staticmethod
-    def extract_with_pypdf(filepath: str) -> Tuple[str, float]:
-        text, quality, page_count = "", 0.0, 0
+    def extract_from_pdf(filepath: str) -> Tuple[str, str, float]:
         try:
-            with open(filepath, 'rb') as f:
-                reader = pypdf.PdfReader(f)
-                page_count = len(reader.pages)
-                if page_count == 0: return "", 0.0
-                extracted_chars = 0
-                for page in reader.pages:
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                            extracted_chars += len(page_text)
-                    except Exception as page_e:
-                        logger.warning(f"pypdf error on page: {page_e}")
-                if page_count > 0:
-                    quality = min(extracted_chars / (page_count * 1500.0), 1.0)
-                logger.debug(f"pypdf extracted ~{len(text)} chars, quality score: {quality:.2f}")
-                return text, quality
-        except Exception as e:
-            logger.error(f"pypdf extraction failed for {os.path.basename(filepath)}: {e}")
-            return "", 0.0
-
-    @staticmethod
-    def extract_with_pdfplumber(filepath: str) -> Tuple[str, float]:
-        text, quality, page_count = "", 0.0, 0
-        try:
-            with pdfplumber.open(filepath) as pdf:
-                page_count = len(pdf.pages)
-                if page_count == 0: return "", 0.0
-                extracted_chars = 0
-                for i, page in enumerate(pdf.pages):
-                    try:
-                        page_text = page.extract_text(x_tolerance=1, y_tolerance=1)
-                        if page_text:
-                            text += page_text + "\n"
-                            extracted_chars += len(page_text)
-                    except Exception as page_e:
-                        logger.warning(f"pdfplumber error on page {i + 1}: {page_e}")
-                if page_count > 0:
-                    quality = min(extracted_chars / (page_count * 1500.0), 1.0)
-                logger.debug(f"pdfplumber extracted ~{len(text)} chars, quality score: {quality:.2f}")
-                return text, quality
+            document = extract_document(filepath)
         except Exception as e:
-            logger.error(f"pdfplumber extraction failed for {os.path.basename(filepath)}: {e}")
-            return "", 0.0
+            logger.error(f"PDF extraction failed for {os.path.basename(filepath)}: {e}")
+            return "", "none", 0.0
+        return document.text, document.method, document.quality
 
     @staticmethod
     def extract_from_html(filepath: str) -> Tuple[str, float]:
@@ -156,15 +115,7 @@ class TextExtractor:
             text, quality = cls.extract_from_html(filepath)
             method = "html_parser"
         elif file_ext == '.pdf':
-            methods_to_try = [("pdfplumber", cls.extract_with_pdfplumber), ("pypdf", cls.extract_with_pypdf)]
-            best_text, best_quality, best_method = "", 0.0, "none"
-            for method_name, method_func in methods_to_try:
-                current_text, current_quality = method_func(filepath)
-                if len(current_text) > len(best_text):
-                    best_text, best_quality, best_method = current_text, current_quality, method_name
-                elif best_method == "none":
-                    best_text, best_quality, best_method = current_text, current_quality, method_name
-            text, quality, method = best_text, best_quality, best_method
+            text, method, quality = cls.extract_from_pdf(filepath)
             if method == "none":
                 logger.error(f"All PDF extraction methods failed for {os.path.basename(filepath)}")
         elif file_ext == '.txt':
@@ -0,0 +1,404 @@
+"""
+Columnar Research Database Store
+SQLite image of neuromorphic-research_database.csv with typed columns and a
+normalized claims table.
+
+Each paper is one row keyed by FILENAME. Score columns are stored as numbers,
+list columns as strict JSON text, and the 'Requirement(s)' claims live in their
+own table indexed by (pillar, status). Writers upsert individual papers instead
+of rewriting the file, and readers select only the columns they need.
+
+The CSV is still written for compatibility. The store records the size and
+mtime of the CSV it last matched and re-imports the file if another tool has
+rewritten it since, so the CSV can always be edited by hand.
+"""
+
+import csv
+import json
+import logging
+import math
+import os
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from literature_review.utils.sqlite_store import SQLiteStore, StoreRegistry
+
+logger = logging.getLogger(__name__)
+
+KEY_COLUMN = 'FILENAME'
+REQUIREMENTS_COLUMN = 'Requirement(s)'
+
+# Declared SQLite types; every other column is TEXT
+COLUMN_TYPES = {
+    'BIOLOGICAL_FIDELITY': 'INTEGER',
+    'CORE_DOMAIN_RELEVANCE_SCORE': 'INTEGER',
+    'CROSS_REFERENCES_COUNT': 'INTEGER',
+    'EXTRACTION_QUALITY': 'INTEGER',
+    'PUBLICATION_YEAR': 'INTEGER',
+    'REPRODUCIBILITY_SCORE': 'INTEGER',
+    'SUBDOMAIN_RELEVANCE_TO_RESEARCH_SCORE': 'INTEGER',
+    'SUMMARIZED_FROM_CHUNKS': 'BOOLEAN',
+}
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS papers (
+    "{KEY_COLUMN}" TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS claims (
+    filename TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    claim_id TEXT,
+    pillar TEXT,
+    sub_requirement TEXT,
+    status TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (filename, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_claims_pillar_status ON claims(pillar, status);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def research_store_path(csv_file: str) -> str:
+    """Store file that sits next to `csv_file` (same name, .db extension)."""
+    return os.path.splitext(csv_file)[0] + '.db'
+
+
+def _quote(column: str) -> str:
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _parse_list(value):
+    """Legacy list cells are JSON or Python reprs; return the parsed value, or None."""
+    for text in (value, value.replace("'", "\"")):
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            continue
+    return None
+
+
+def _to_sql(column: str, value):
+    """Convert one review value to its stored form."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, str):
+        if COLUMN_TYPES.get(column) == 'BOOLEAN' and value.lower() in ('true', 'false'):
+            return int(value.lower() == 'true')
+        if value.startswith('['):
+            # Normalize once on write so readers never need the quote-replacing fallback
+            parsed = _parse_list(value)
+            if parsed is not None:
+                return json.dumps(parsed)
+    return value
+
+
+def _from_sql(column: str, value):
+    if COLUMN_TYPES.get(column) == 'BOOLEAN' and isinstance(value, int):
+        return bool(value)
+    return value
+
+
+def _claims_of(review: Dict) -> List[Dict]:
+    claims = review.get(REQUIREMENTS_COLUMN)
+    if isinstance(claims, str):
+        claims = _parse_list(claims) if claims.strip() else []
+    if not isinstance(claims, list):
+        if claims is not None and not (isinstance(claims, float) and math.isnan(claims)):
+            logger.warning(f"Unparseable {REQUIREMENTS_COLUMN} for {review.get(KEY_COLUMN)}; storing no claims")
+        return []
+    return claims
+
+
+class ResearchStore(SQLiteStore):
+    """
+    Typed, row-addressable store for the research database.
+
+    Args:
+        db_path: Path to the SQLite database file
+    """
+
+    def __init__(self, db_path: str):
+        super().__init__(db_path)
+        self._connection().executescript(_SCHEMA)
+
+    # --- Schema ---
+
+    @property
+    def columns(self) -> List[str]:
+        """All columns in CSV order, including the claims column."""
+        row = self._connection().execute("SELECT value FROM meta WHERE name = 'columns'").fetchone()
+        return json.loads(row[0]) if row else []
+
+    def _ensure_columns(self, conn: sqlite3.Connection, columns: Iterable[str]) -> List[str]:
+        row = conn.execute("SELECT value FROM meta WHERE name = 'columns'").fetchone()
+        order = json.loads(row[0]) if row else []
+        known = set(order)
+        added = [column for column in dict.fromkeys(columns) if column not in known]
+        if not added:
+            return order
+        stored = {info[1] for info in conn.execute("PRAGMA table_info(papers)")}
+        for column in added:
+            if column != REQUIREMENTS_COLUMN and column not in stored:
+                conn.execute(f"ALTER TABLE papers ADD COLUMN {_quote(column)} {COLUMN_TYPES.get(column, 'TEXT')}")
+        order = order + added
+        conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('columns', ?)", (json.dumps(order),))
+        return order
+
+    # --- CSV freshness ---
+
+    @staticmethod
+    def _csv_state(csv_file: str) -> Optional[List]:
+        try:
+            stat = os.stat(csv_file)
+        except OSError:
+            return None
+        return [os.path.abspath(csv_file), stat.st_mtime_ns, stat.st_size]
+
+    def _synced_state(self) -> Optional[List]:
+        row = self._connection().execute("SELECT value FROM meta WHERE name = 'csv_state'").fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _mark_synced(self, conn: sqlite3.Connection, csv_file: str) -> None:
+        conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('csv_state', ?)",
+                     (json.dumps(self._csv_state(csv_file)),))
+
+    def is_synced(self, csv_file: str) -> bool:
+        """True if the store already reflects `csv_file` as it is on disk now."""
+        state = self._csv_state(csv_file)
+        return state is not None and self._synced_state() == state
+
+    # --- Writes ---
+
+    def _write(self, conn: sqlite3.Connection, reviews: List[Dict]) -> int:
+        written = 0
+        statements: Dict[Tuple[str, ...], str] = {}
+        for review in reviews:
+            filename = review.get(KEY_COLUMN)
+            if not filename or (isinstance(filename, float) and math.isnan(filename)):
+                logger.warning("Skipping review without a FILENAME")
+                continue
+            filename = str(filename)
+            columns = tuple(c for c in review if c not in (KEY_COLUMN, REQUIREMENTS_COLUMN))
+            statement = statements.get(columns)
+            if statement is None:
+                names = ', '.join(_quote(c) for c in (KEY_COLUMN,) + columns)
+                placeholders = ', '.join('?' * (len(columns) + 1))
+                updates = ', '.join(f"{_quote(c)} = excluded.{_quote(c)}" for c in columns)
+                statement = f"INSERT INTO papers ({names}) VALUES ({placeholders}) ON CONFLICT({_quote(KEY_COLUMN)}) "
+                statement += f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+                statements[columns] = statement
+            conn.execute(statement, [filename] + [_to_sql(c, review[c]) for c in columns])
+
+            if REQUIREMENTS_COLUMN in review:
+                conn.execute("DELETE FROM claims WHERE filename = ?", (filename,))
+                conn.executemany(
+                    "INSERT INTO claims (filename, seq, claim_id, pillar, sub_requirement, status, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(filename, seq, claim.get('claim_id'), claim.get('pillar'), claim.get('sub_requirement'),
+                      claim.get('status'), json.dumps(claim))
+                     if isinstance(claim, dict) else (filename, seq, None, None, None, None, json.dumps(claim))
+                     for seq, claim in enumerate(_claims_of(review))]
+                )
+            written += 1
+        return written
+
+    def upsert_papers(self, reviews: List[Dict], csv_file: Optional[str] = None) -> int:
+        """
+        Insert or update papers by FILENAME, replacing each given paper's claims.
+
+        Only the keys present in a review are updated. Pass `csv_file` when the
+        same reviews were just written there, so the CSV change is not re-imported.
+
+        Returns:
+            Number of papers written
+        """
+        with self._transaction() as conn:
+            self._ensure_columns(conn, [key for review in reviews for key in review])
+            written = self._write(conn, reviews)
+            if csv_file is not None:
+                self._mark_synced(conn, csv_file)
+        return written
+
+    def replace_all(self, reviews: List[Dict], columns: Optional[List[str]] = None,
+                    csv_file: Optional[str] = None) -> int:
+        """Replace the whole store with `reviews` (columns in `columns` order when given)."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM papers")
+            conn.execute("DELETE FROM claims")
+            conn.execute("DELETE FROM meta WHERE name = 'columns'")
+            self._ensure_columns(conn, list(columns or []) + [key for review in reviews for key in review])
+            written = self._write(conn, reviews)
+            if csv_file is not None:
+                self._mark_synced(conn, csv_file)
+        return written
+
+    def import_csv(self, csv_file: str) -> int:
+        """Replace the store with the contents of a research database CSV."""
+        df = pd.read_csv(csv_file, encoding='utf-8')
+        df = df.replace({np.nan: None})
+        written = self.replace_all(df.to_dict('records'), columns=list(df.columns), csv_file=csv_file)
+        logger.info(f"Imported {written} papers from {csv_file} into {self.db_path}")
+        return written
+
+    # --- Reads ---
+
+    def _projection(self, columns: Optional[List[str]]) -> List[str]:
+        available = self.columns
+        if columns is None:
+            return available
+        wanted = set(columns)
+        return [column for column in available if column in wanted]
+
+    def _select(self, columns: List[str]) -> Tuple[List[str], List[tuple]]:
+        """Selected paper columns (FILENAME always first) and their rows in insertion order."""
+        selected = [KEY_COLUMN] + [c for c in columns if c not in (KEY_COLUMN, REQUIREMENTS_COLUMN)]
+        rows = self._connection().execute(
+            f"SELECT {', '.join(_quote(c) for c in selected)} FROM papers ORDER BY rowid"
+        ).fetchall()
+        return selected, rows
+
+    def _claim_texts(self) -> Dict[str, List[str]]:
+        texts: Dict[str, List[str]] = {}
+        for filename, data in self._connection().execute(
+                "SELECT filename, data FROM claims ORDER BY filename, seq"):
+            texts.setdefault(filename, []).append(data)
+        return texts
+
+    def read_papers(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Papers as a DataFrame shaped like pd.read_csv of the research database.
+
+        Only `columns` are read (all columns when None). 'Requirement(s)' is
+        rebuilt as JSON text from the claims table only if requested.
+        """
+        projection = self._projection(columns)
+        selected, rows = self._select(projection)
+        df = pd.DataFrame.from_records(rows, columns=selected)
+        for column in selected:
+            if COLUMN_TYPES.get(column) == 'BOOLEAN':
+                df[column] = df[column].map(lambda value: _from_sql(column, value))
+        if REQUIREMENTS_COLUMN in projection:
+            texts = self._claim_texts()
+            df[REQUIREMENTS_COLUMN] = ['[' + ', '.join(texts.get(filename, [])) + ']' for filename in df[KEY_COLUMN]]
+        return df[[c for c in projection if c in df.columns]]
+
+    def read_records(self, columns: Optional[List[str]] = None, parse_lists: bool = False) -> List[Dict]:
+        """
+        Papers as dicts, with 'Requirement(s)' always included as a list of claims.
+
+        Args:
+            columns: Columns to read (all when None)
+            parse_lists: Also decode JSON list columns such as KEYWORDS
+        """
+        projection = self._projection(columns)
+        selected, rows = self._select(projection)
+        claims: Dict[str, List[Dict]] = {}
+        for filename, data in self._connection().execute(
+                "SELECT filename, data FROM claims ORDER BY filename, seq"):
+            claims.setdefault(filename, []).append(json.loads(data))
+
+        records = []
+        for row in rows:
+            record = {}
+            for column, value in zip(selected, row):
+                value = _from_sql(column, value)
+                if parse_lists and isinstance(value, str) and value.startswith('['):
+                    try:
+                        value = json.loads(value)
+                    except json.JSONDecodeError:
+                        pass
+                record[column] = value
+            record[REQUIREMENTS_COLUMN] = claims.get(row[0], [])
+            records.append(record)
+        return records
+
+    def read_claims(self, pillar: Optional[str] = None, status: Optional[str] = None) -> List[Dict]:
+        """Claims (each with 'filename' set), optionally filtered by pillar and status."""
+        clauses, params = [], []
+        if pillar is not None:
+            clauses.append("pillar = ?")
+            params.append(pillar)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connection().execute(
+            f"SELECT filename, data FROM claims {where} ORDER BY filename, seq", params
+        ).fetchall()
+        return [{**json.loads(data), 'filename': filename} for filename, data in rows]
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    # --- Export ---
+
+    def export_csv(self, csv_file: str, fieldnames: Optional[List[str]] = None) -> int:
+        """
+        Write the store as a research database CSV (QUOTE_ALL, JSON list cells).
+
+        Args:
+            csv_file: Destination path; written to a temp file and renamed into place
+            fieldnames: Leading column order (remaining stored columns follow)
+
+        Returns:
+            Number of papers written
+        """
+        columns = self.columns
+        if fieldnames:
+            columns = list(fieldnames) + [c for c in columns if c not in set(fieldnames)]
+        df = self.read_papers(columns)
+        tmp_file = csv_file + '.tmp'
+        with open(tmp_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer.writerow(columns)
+            for row in df.reindex(columns=columns).itertuples(index=False, name=None):
+                writer.writerow('' if value is None or (isinstance(value, float) and math.isnan(value))
+                                else value for value in row)
+        os.replace(tmp_file, csv_file)
+        synced = self._synced_state()
+        if synced is None or synced[0] == os.path.abspath(csv_file):
+            # Rewrote the CSV this store mirrors; it still matches, so don't re-import it
+            with self._transaction() as conn:
+                self._mark_synced(conn, csv_file)
+        return len(df)
+
+
+# Shared instances, one per database path
+_research_stores: StoreRegistry[ResearchStore] = StoreRegistry(ResearchStore)
+
+
+def get_research_store(db_path: str) -> ResearchStore:
+    """Get the shared ResearchStore for `db_path`."""
+    return _research_stores.get(db_path)
+
+
+def open_research_store(csv_file: str) -> Optional[ResearchStore]:
+    """
+    Store for a research database CSV, re-imported first if the CSV changed.
+
+    Returns None if the CSV does not exist or the store cannot be used, in
+    which case callers read the CSV directly.
+    """
+    if not os.path.exists(csv_file):
+        return None
+    try:
+        store = get_research_store(research_store_path(csv_file))
+        if not store.is_synced(csv_file):
+            store.import_csv(csv_file)
+        return store
+    except Exception as e:
+        logger.warning(f"Research store unavailable for {csv_file} ({e}); reading the CSV directly")
+        return None
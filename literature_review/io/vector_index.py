@@ -0,0 +1,229 @@
+"""
+Vector Index
+Persistent, incrementally updated nearest-neighbour index over paper embeddings.
+
+Vectors are stored L2-normalized as a float32 matrix in a .npy file, with the
+row keys (paper filenames) in a sidecar '<name>.keys.json'. On open the matrix
+is memory-mapped copy-on-write, so start-up costs one header read however many
+papers are indexed. New vectors are appended to an in-memory tail; save()
+writes matrix and keys to temporary files, releases the mapping and swaps
+them in.
+
+Queries are a single matrix-vector product over the stored rows (cosine
+similarity, since rows are normalized). With backend='hnsw' and the optional
+hnswlib package installed, queries go through an HNSW graph instead, built on
+the first query and extended as vectors are added.
+"""
+
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+logger = logging.getLogger(__name__)
+
+HNSW_SPACE = 'ip'
+HNSW_EF_CONSTRUCTION = 200
+HNSW_M = 16
+HNSW_EF_SEARCH = 64
+
+
+def keys_path_for(matrix_path: str) -> str:
+    """Sidecar key file stored next to a vector matrix."""
+    return os.path.splitext(matrix_path)[0] + '.keys.json'
+
+
+def _normalize(vector) -> np.ndarray:
+    vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm > 0 else vector
+
+
+class VectorIndex:
+    """Normalized float32 vectors keyed by id, with top-k cosine queries."""
+
+    def __init__(self, path: Optional[str] = None, backend: str = 'exact'):
+        self.path = path
+        self.backend = backend
+        if backend == 'hnsw' and hnswlib is None:
+            logger.warning("hnswlib is not installed; vector index falls back to exact search")
+            self.backend = 'exact'
+        self._keys: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._base = np.empty((0, 0), dtype=np.float32)  # Rows loaded from disk (memory-mapped)
+        self._tail = np.empty((0, 0), dtype=np.float32)  # Appended rows; capacity grows by doubling
+        self._tail_size = 0
+        self._dirty = False
+        self._hnsw = None
+        if path:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._ids
+
+    @property
+    def dim(self) -> int:
+        return self._base.shape[1] if len(self._base) else self._tail.shape[1]
+
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    def missing(self, keys: Iterable[str]) -> List[str]:
+        """Keys not yet in the index, in input order."""
+        return [key for key in keys if key not in self._ids]
+
+    def load(self) -> None:
+        """Memory-map the saved matrix and read its keys; a missing or inconsistent pair loads empty."""
+        keys_path = keys_path_for(self.path)
+        if not (os.path.exists(self.path) and os.path.exists(keys_path)):
+            return
+        try:
+            with open(keys_path, 'r', encoding='utf-8') as f:
+                keys = json.load(f)['keys']
+            matrix = np.load(self.path, mmap_mode='c')
+            if matrix.ndim != 2 or matrix.shape[0] != len(keys):
+                raise ValueError(f"{matrix.shape[0]} rows for {len(keys)} keys")
+        except Exception as e:
+            logger.warning(f"Could not load vector index {self.path}: {e}")
+            return
+        self._keys = list(keys)
+        self._ids = {key: i for i, key in enumerate(self._keys)}
+        self._base = matrix
+        self._tail = np.empty((0, matrix.shape[1]), dtype=np.float32)
+        self._tail_size = 0
+        self._dirty = False
+        self._hnsw = None
+
+    def save(self) -> bool:
+        """Write the matrix and keys if anything changed since the last load or save."""
+        if not self.path or not self._dirty:
+            return False
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        matrix = self.matrix()
+        keys_path = keys_path_for(self.path)
+        tmp_matrix, tmp_keys = self.path + '.tmp', keys_path + '.tmp'
+        with open(tmp_matrix, 'wb') as f:
+            np.save(f, matrix)
+        with open(tmp_keys, 'w', encoding='utf-8') as f:
+            json.dump({'dim': int(matrix.shape[1]) if matrix.size else 0, 'keys': self._keys}, f)
+        # Release the memory map of the file being replaced: Windows cannot replace a
+        # mapped file, and elsewhere the old mapping would go stale
+        del matrix
+        if isinstance(self._base, np.memmap):
+            self._base = np.array(self._base)
+        os.replace(tmp_matrix, self.path)
+        os.replace(tmp_keys, keys_path)
+        hnsw = self._hnsw
+        self.load()
+        self._hnsw = hnsw  # Same rows in the same order; the graph stays valid
+        return True
+
+    def matrix(self) -> np.ndarray:
+        """All rows, base then tail, in id order."""
+        tail = self._tail[:self._tail_size]
+        if not len(self._base):
+            return np.array(tail, dtype=np.float32)
+        if not len(tail):
+            return np.asarray(self._base)
+        return np.concatenate([self._base, tail])
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        row = self._ids.get(key)
+        if row is None:
+            return None
+        base_rows = len(self._base)
+        return np.array(self._base[row] if row < base_rows else self._tail[row - base_rows])
+
+    def add(self, key: str, vector) -> None:
+        """Insert or replace one vector. New keys are appended; nothing is rebuilt."""
+        vector = _normalize(vector)
+        if len(self) and vector.shape[0] != self.dim:
+            raise ValueError(f"Vector for {key} has dimension {vector.shape[0]}, index has {self.dim}")
+        row = self._ids.get(key)
+        base_rows = len(self._base)
+        if row is not None and row < base_rows:
+            self._base[row] = vector  # Copy-on-write: the file is untouched until save()
+        elif row is not None:
+            self._tail[row - base_rows] = vector
+        else:
+            row = len(self._keys)
+            if self._tail_size == len(self._tail):
+                grown = np.empty((max(16, 2 * len(self._tail)), vector.shape[0]), dtype=np.float32)
+                if self._tail_size:
+                    grown[:self._tail_size] = self._tail[:self._tail_size]
+                self._tail = grown
+            self._tail[self._tail_size] = vector
+            self._tail_size += 1
+            self._keys.append(key)
+            self._ids[key] = row
+        if self._hnsw is not None:
+            if row >= self._hnsw.get_max_elements():
+                self._hnsw.resize_index(max(2 * self._hnsw.get_max_elements(), row + 1))
+            self._hnsw.add_items(vector[np.newaxis, :], np.array([row]))
+        self._dirty = True
+
+    def _build_hnsw(self):
+        matrix = self.matrix()
+        index = hnswlib.Index(space=HNSW_SPACE, dim=matrix.shape[1])
+        index.init_index(max_elements=max(16, 2 * len(matrix)), ef_construction=HNSW_EF_CONSTRUCTION, M=HNSW_M)
+        index.add_items(matrix, np.arange(len(matrix)))
+        index.set_ef(HNSW_EF_SEARCH)
+        return index
+
+    def _exact_scores(self, query: np.ndarray) -> np.ndarray:
+        parts = []
+        if len(self._base):
+            parts.append(self._base @ query)
+        if self._tail_size:
+            parts.append(self._tail[:self._tail_size] @ query)
+        return np.concatenate(parts) if len(parts) > 1 else parts[0]
+
+    def search(self, vector, k: Optional[int] = 10, threshold: Optional[float] = None,
+               exclude: Iterable[str] = ()) -> List[Tuple[str, float]]:
+        """
+        Return up to k (key, cosine similarity) pairs, most similar first.
+
+        Only scores strictly above threshold are returned when one is given.
+        k=None returns every match above the threshold.
+        """
+        if not len(self):
+            return []
+        query = _normalize(vector)
+        excluded = {self._ids[key] for key in exclude if key in self._ids}
+        wanted = len(self) if k is None else min(k, len(self))
+
+        if self.backend == 'hnsw':
+            if self._hnsw is None:
+                self._hnsw = self._build_hnsw()
+            fetch = min(len(self), wanted + len(excluded))
+            labels, distances = self._hnsw.knn_query(query, k=fetch)
+            rows, scores = labels[0], 1.0 - distances[0]
+        else:
+            all_scores = self._exact_scores(query)
+            if excluded:
+                all_scores[list(excluded)] = -np.inf
+            candidates = np.flatnonzero(all_scores > threshold) if threshold is not None \
+                else np.arange(len(all_scores))
+            if wanted < len(candidates):
+                candidates = candidates[np.argpartition(-all_scores[candidates], wanted - 1)[:wanted]]
+            rows = candidates[np.argsort(-all_scores[candidates], kind='stable')]
+            scores = all_scores[rows]
+
+        results = []
+        for row, score in zip(rows, scores):
+            if row in excluded or (threshold is not None and score <= threshold):
+                continue
+            results.append((self._keys[row], float(score)))
+        return results[:wanted]
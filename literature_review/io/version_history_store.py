@@ -0,0 +1,595 @@
+"""
+Review Version History Store
+Append-only SQLite event log behind review_version_history.json, with a
+materialized view of each paper's latest review.
+
+Every write appends one event per paper. The first version of a paper, and any
+re-review whose claims list shrank, is stored as a full snapshot; everything
+else is stored as a patch with field-level set/unset changes per claim plus any
+appended claims. The 'papers' and 'claims' tables always hold the latest
+review, and writes touch only the papers and claims that changed.
+
+Claims awaiting judgment are kept in a work queue ('claim_queue'), maintained
+whenever a write creates a claim or changes its status, and every status change
+is logged in 'claim_transitions'. Reading the pending claims costs time
+proportional to the queue, not to the history.
+
+review_version_history.json stays the interchange format read by the rest of the
+pipeline. It is rebuilt from the event log by export_json, with unchanged claims
+shared between versions while replaying. The store records the size and mtime of
+the JSON it last matched and re-imports the file if another tool has rewritten it.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from literature_review.utils.sqlite_store import SQLiteStore, StoreRegistry
+
+logger = logging.getLogger(__name__)
+
+REQUIREMENTS_KEY = 'Requirement(s)'
+PENDING_STATUS = 'pending_judge_review'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    filename TEXT PRIMARY KEY,
+    review TEXT NOT NULL,
+    versions INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS claims (
+    filename TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    claim_id TEXT,
+    status TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (filename, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_claims_status ON claims(status);
+CREATE INDEX IF NOT EXISTS idx_claims_claim_id ON claims(claim_id);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    filename TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    version TEXT,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS claim_queue (
+    filename TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    claim_id TEXT,
+    enqueued_at TEXT NOT NULL,
+    PRIMARY KEY (filename, seq)
+);
+CREATE TABLE IF NOT EXISTS claim_transitions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    claim_id TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    from_status TEXT,
+    to_status TEXT,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_claim_transitions_claim_id ON claim_transitions(claim_id);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('unexported', '0');
+"""
+
+
+def version_history_store_path(json_file: str) -> str:
+    """Store file that sits next to `json_file` (same name, .db extension)."""
+    return os.path.splitext(json_file)[0] + '.db'
+
+
+def _plain(value):
+    """JSON round-trip, so stored values and comparisons match what export writes."""
+    return json.loads(json.dumps(value))
+
+
+def _stored_claim(claim: Dict) -> Dict:
+    """Claim as stored, without working keys such as the judge's '_source_filename' tag."""
+    return {k: v for k, v in _plain(claim).items() if not k.startswith('_')}
+
+
+def _dict_patch(before: Dict, after: Dict, skip: str = None) -> Dict:
+    """Field-level changes turning `before` into `after` ({} if equal)."""
+    changed = {k: v for k, v in after.items() if k != skip and (k not in before or before[k] != v)}
+    removed = [k for k in before if k != skip and k not in after]
+    patch = {}
+    if changed:
+        patch['set'] = changed
+    if removed:
+        patch['unset'] = removed
+    return patch
+
+
+def _apply_dict_patch(target: Dict, patch: Dict) -> Dict:
+    target.update(patch.get('set', {}))
+    for key in patch.get('unset', []):
+        target.pop(key, None)
+    return target
+
+
+def _review_patch(before: Dict, after: Dict) -> Optional[Dict]:
+    """
+    Patch turning review `before` into `after`, or None if it needs a snapshot.
+
+    Claims are matched by position; a patch can change claims in place and append
+    new ones, but not remove or reorder them.
+    """
+    if (REQUIREMENTS_KEY in before) != (REQUIREMENTS_KEY in after):
+        return None
+    old_claims = before.get(REQUIREMENTS_KEY, [])
+    new_claims = after.get(REQUIREMENTS_KEY, [])
+    if not isinstance(old_claims, list) or not isinstance(new_claims, list) or len(new_claims) < len(old_claims):
+        return None
+
+    patch = _dict_patch(before, after, skip=REQUIREMENTS_KEY)
+    claims = {}
+    for seq, (old, new) in enumerate(zip(old_claims, new_claims)):
+        if old == new:
+            continue
+        if not isinstance(old, dict) or not isinstance(new, dict):
+            return None
+        claims[str(seq)] = _dict_patch(old, new)
+    if claims:
+        patch['claims'] = claims
+    if len(new_claims) > len(old_claims):
+        patch['added'] = new_claims[len(old_claims):]
+    return patch
+
+
+def _apply_review_patch(review: Dict, patch: Dict) -> Dict:
+    """New review with `patch` applied; claims it does not touch are shared with `review`."""
+    review = _apply_dict_patch(dict(review), patch)
+    if 'claims' in patch or 'added' in patch:
+        claims = list(review.get(REQUIREMENTS_KEY, []))
+        for seq, change in patch.get('claims', {}).items():
+            claims[int(seq)] = _apply_dict_patch(dict(claims[int(seq)]), change)
+        claims.extend(patch.get('added', []))
+        review[REQUIREMENTS_KEY] = claims
+    return review
+
+
+class VersionHistoryStore(SQLiteStore):
+    """
+    Event-sourced review version history with a materialized latest view.
+
+    Args:
+        db_path: Path to the SQLite database file
+    """
+
+    def __init__(self, db_path: str):
+        super().__init__(db_path)
+        self._connection().executescript(_SCHEMA)
+        if self.meta('claim_queue') is None:
+            # Stores written before the claim queue existed: queue their pending claims once
+            with self._transaction() as conn:
+                self._enqueue_pending(conn)
+                self._set_meta(conn, 'claim_queue', True)
+
+    def meta(self, name: str):
+        """A JSON value stored with the history (None if unset)."""
+        row = self._connection().execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_meta(self, name: str, value) -> None:
+        """Store a JSON value with the history, e.g. a marker for a one-time migration."""
+        with self._transaction() as conn:
+            self._set_meta(conn, name, value)
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, name: str, value) -> None:
+        conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, json.dumps(value)))
+
+    # --- JSON freshness ---
+
+    @staticmethod
+    def _json_state(json_file: str) -> Optional[List]:
+        try:
+            stat = os.stat(json_file)
+        except OSError:
+            return None
+        return [os.path.abspath(json_file), stat.st_mtime_ns, stat.st_size]
+
+    def _mark_synced(self, conn: sqlite3.Connection, json_file: str) -> None:
+        self._set_meta(conn, 'json_state', self._json_state(json_file))
+        self._set_meta(conn, 'unexported', 0)
+
+    def is_synced(self, json_file: str) -> bool:
+        """True if the store already reflects `json_file` as it is on disk now (or both are new)."""
+        return self.meta('json_state') == self._json_state(json_file)
+
+    @property
+    def unexported(self) -> int:
+        """Number of events written since the last import or export."""
+        return self.meta('unexported') or 0
+
+    @property
+    def import_id(self) -> int:
+        """Incremented by every import_json, so callers can run per-import migrations once."""
+        return self.meta('imports') or 0
+
+    # --- Materialized view ---
+
+    def _latest(self, conn: sqlite3.Connection, filename: str) -> Optional[Dict]:
+        row = conn.execute("SELECT review FROM papers WHERE filename = ?", (filename,)).fetchone()
+        if row is None:
+            return None
+        review = json.loads(row[0])
+        review[REQUIREMENTS_KEY] = [json.loads(data) for (data,) in conn.execute(
+            "SELECT data FROM claims WHERE filename = ? ORDER BY seq", (filename,))]
+        return review
+
+    def _append_event(self, conn: sqlite3.Connection, filename: str, version: Optional[Dict], kind: str,
+                      body: Dict, review: Dict, changed_seqs: Optional[Iterable[int]] = None) -> None:
+        """
+        Log one event and bring the latest view of `filename` up to `review`.
+
+        `version` is the version entry without its review, or None to amend the
+        latest version. `changed_seqs` limits which claim rows are rewritten
+        (all of them when None). The claim queue and status transitions are
+        updated for the rewritten claims.
+        """
+        conn.execute("INSERT INTO events (filename, kind, version, body) VALUES (?, ?, ?, ?)",
+                     (filename, kind, None if version is None else json.dumps(version), json.dumps(body)))
+        head = {key: value for key, value in review.items() if key != REQUIREMENTS_KEY}
+        conn.execute(
+            "INSERT INTO papers (filename, review, versions) VALUES (?, ?, ?) ON CONFLICT(filename) "
+            "DO UPDATE SET review = excluded.review, versions = versions + excluded.versions",
+            (filename, json.dumps(head), 0 if version is None else 1)
+        )
+        claims = review.get(REQUIREMENTS_KEY)
+        claims = claims if isinstance(claims, list) else []
+        previous = dict(conn.execute(
+            "SELECT claim_id, status FROM claims WHERE filename = ? AND claim_id IS NOT NULL", (filename,)))
+        if changed_seqs is None:
+            conn.execute("DELETE FROM claims WHERE filename = ?", (filename,))
+            conn.execute("DELETE FROM claim_queue WHERE filename = ? AND seq >= ?", (filename, len(claims)))
+            changed_seqs = range(len(claims))
+        rows = [(filename, seq) + self._claim_columns(claims[seq]) for seq in changed_seqs]
+        conn.executemany(
+            "INSERT OR REPLACE INTO claims (filename, seq, claim_id, status, data) VALUES (?, ?, ?, ?, ?)", rows)
+        self._track_statuses(conn, rows, previous)
+        conn.execute("UPDATE meta SET value = value + 1 WHERE name = 'unexported'")
+
+    @staticmethod
+    def _track_statuses(conn: sqlite3.Connection, rows: List[Tuple], previous: Dict[str, str]) -> None:
+        """Queue or dequeue rewritten claims and log their status changes."""
+        timestamp = datetime.now().isoformat()
+        transitions = []
+        for filename, seq, claim_id, status, _ in rows:
+            if status == PENDING_STATUS:
+                # A claim that stays pending keeps its place in the queue
+                conn.execute(
+                    "INSERT INTO claim_queue (filename, seq, claim_id, enqueued_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(filename, seq) DO UPDATE SET claim_id = excluded.claim_id",
+                    (filename, seq, claim_id, timestamp)
+                )
+            else:
+                conn.execute("DELETE FROM claim_queue WHERE filename = ? AND seq = ?", (filename, seq))
+            if claim_id is not None and (claim_id not in previous or previous[claim_id] != status):
+                transitions.append((claim_id, filename, previous.get(claim_id), status, timestamp))
+        conn.executemany(
+            "INSERT INTO claim_transitions (claim_id, filename, from_status, to_status, timestamp) "
+            "VALUES (?, ?, ?, ?, ?)", transitions)
+
+    @staticmethod
+    def _enqueue_pending(conn: sqlite3.Connection) -> None:
+        """Queue every pending claim in the latest view that is not queued yet."""
+        conn.execute(
+            "INSERT OR IGNORE INTO claim_queue (filename, seq, claim_id, enqueued_at) "
+            "SELECT filename, seq, claim_id, ? FROM claims WHERE status = ? ORDER BY rowid",
+            (datetime.now().isoformat(), PENDING_STATUS)
+        )
+
+    @staticmethod
+    def _claim_columns(claim) -> Tuple:
+        if not isinstance(claim, dict):
+            return None, None, json.dumps(claim)
+        return claim.get('claim_id'), claim.get('status'), json.dumps(claim)
+
+    # --- Writes ---
+
+    def append_review(self, filename: str, review: Dict, changes: Optional[Dict] = None,
+                      timestamp: Optional[str] = None) -> None:
+        """Record a new version of a paper's whole review (stored as a patch when possible)."""
+        review = _plain(review)
+        version = {'timestamp': timestamp or datetime.now().isoformat(), 'review': None, 'changes': changes or {}}
+        with self._transaction() as conn:
+            latest = self._latest(conn, filename)
+            patch = _review_patch(latest, review) if latest is not None else None
+            if patch is None:
+                self._append_event(conn, filename, version, 'snapshot', review, review)
+            else:
+                old_count = len(latest[REQUIREMENTS_KEY])
+                changed = [int(seq) for seq in patch.get('claims', {})]
+                changed += range(old_count, len(review[REQUIREMENTS_KEY]))
+                self._append_event(conn, filename, version, 'patch', patch, review, changed)
+
+    def put_claims(self, claims: List[Dict], status: str = 'judge_update') -> int:
+        """
+        Write the current state of existing claims, matched by claim_id.
+
+        Each claim dict is the claim's complete new content: changed keys are set
+        and keys it no longer has are removed. Keys starting with '_' (working
+        tags such as those added by pending_claims) are never stored. Claims
+        identical to the stored copy are skipped, so re-sending already-saved
+        claims writes nothing. Each paper with changes gets one new version,
+        like update_claims_in_history.
+
+        Returns:
+            Number of claims changed
+        """
+        timestamp = datetime.now().isoformat()
+        updated = 0
+        with self._transaction() as conn:
+            by_file: Dict[str, List[Tuple[int, Dict]]] = defaultdict(list)
+            for claim in claims:
+                claim = _stored_claim(claim)
+                for filename, seq in conn.execute(
+                        "SELECT filename, seq FROM claims WHERE claim_id = ?", (claim.get('claim_id'),)):
+                    by_file[filename].append((seq, claim))
+
+            for filename, changes in by_file.items():
+                review = self._latest(conn, filename)
+                stored = review[REQUIREMENTS_KEY]
+                patch = {}
+                for seq, claim in changes:
+                    change = _dict_patch(stored[seq], claim)
+                    if change:
+                        patch[str(seq)] = change
+                        stored[seq] = claim
+                if not patch:
+                    continue
+                claim_ids = [stored[int(seq)].get('claim_id') for seq in patch]
+                version = {'timestamp': timestamp, 'review': None, 'changes': {
+                    'status': status, 'updated_claims': len(claim_ids), 'claim_ids': claim_ids}}
+                self._append_event(conn, filename, version, 'patch', {'claims': patch}, review,
+                                   [int(seq) for seq in patch])
+                updated += len(claim_ids)
+        if updated:
+            logger.info(f"Updated {updated} claims in version history store")
+        return updated
+
+    def add_claims(self, claims: List[Dict], filename: Optional[str] = None, status: str = 'dra_appeal',
+                   amend_latest: bool = False, create_missing: bool = False) -> int:
+        """
+        Append new claims to their papers' latest reviews.
+
+        Claims are grouped by '_source_filename' (or 'filename') unless `filename`
+        is given; claim_ids the paper already has are skipped. As in put_claims,
+        keys starting with '_' are not stored.
+
+        Args:
+            claims: New claims
+            filename: Paper all of `claims` belong to
+            status: 'status' recorded in the version's changes
+            amend_latest: Add to the latest version instead of creating a new one
+            create_missing: Start a history for unknown papers instead of skipping them
+
+        Returns:
+            Number of claims added
+        """
+        timestamp = datetime.now().isoformat()
+        by_file: Dict[str, List[Dict]] = defaultdict(list)
+        for claim in claims:
+            claim_file = filename or claim.get('_source_filename') or claim.get('filename')
+            if claim_file:
+                by_file[claim_file].append(_stored_claim(claim))
+
+        added = 0
+        with self._transaction() as conn:
+            for claim_file, file_claims in by_file.items():
+                review = self._latest(conn, claim_file)
+                if review is None:
+                    if not create_missing:
+                        logger.warning(f"File {claim_file} not in history. Skipping new claims.")
+                        continue
+                    logger.info(f"Creating new version history entry for {claim_file}")
+                    review = {'FILENAME': claim_file, REQUIREMENTS_KEY: []}
+                    self._append_event(conn, claim_file, {'timestamp': timestamp, 'review': None,
+                                                        'changes': {'status': status}},
+                                       'snapshot', review, review)
+
+                known = {claim.get('claim_id') for claim in review[REQUIREMENTS_KEY] if isinstance(claim, dict)}
+                new_claims = []
+                for claim in file_claims:
+                    if claim.get('claim_id') not in known:
+                        known.add(claim.get('claim_id'))
+                        new_claims.append(claim)
+                if not new_claims:
+                    continue
+
+                start = len(review[REQUIREMENTS_KEY])
+                review[REQUIREMENTS_KEY].extend(new_claims)
+                version = None if amend_latest else {'timestamp': timestamp, 'review': None, 'changes': {
+                    'status': status, 'new_claims': len(new_claims),
+                    'claim_ids': [claim.get('claim_id') for claim in new_claims]}}
+                self._append_event(conn, claim_file, version, 'patch', {'added': new_claims}, review,
+                                   range(start, len(review[REQUIREMENTS_KEY])))
+                added += len(new_claims)
+        if added:
+            logger.info(f"Added {added} new claims to version history store")
+        return added
+
+    # --- Reads ---
+
+    def claims(self, status: Optional[str] = None) -> List[Tuple[str, Dict]]:
+        """(filename, claim) pairs from every paper's latest review, in history order."""
+        where, params = ("WHERE c.status = ?", (status,)) if status is not None else ("", ())
+        rows = self._connection().execute(
+            f"SELECT c.filename, c.data FROM claims c JOIN papers p ON p.filename = c.filename "
+            f"{where} ORDER BY p.rowid, c.seq", params
+        ).fetchall()
+        return [(filename, json.loads(data)) for filename, data in rows]
+
+    def pending_claims(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Claims awaiting judgment, oldest first, tagged like extract_pending_claims_from_history.
+
+        Args:
+            limit: Return at most this many claims
+        """
+        rows = self._connection().execute(
+            "SELECT q.filename, c.data FROM claim_queue q "
+            "JOIN claims c ON c.filename = q.filename AND c.seq = q.seq ORDER BY q.rowid LIMIT ?",
+            (-1 if limit is None else limit,)
+        ).fetchall()
+        pending = []
+        for filename, data in rows:
+            claim = json.loads(data)
+            claim['_source_filename'] = filename
+            claim['_source_type'] = 'version_history'
+            pending.append(claim)
+        logger.info(f"Extracted {len(pending)} pending claims from version history store")
+        return pending
+
+    def pending_count(self) -> int:
+        """Number of claims awaiting judgment."""
+        return self._connection().execute("SELECT COUNT(*) FROM claim_queue").fetchone()[0]
+
+    def transitions(self, claim_id: Optional[str] = None) -> List[Dict]:
+        """Logged claim status changes since the last import, oldest first."""
+        where, params = ("WHERE claim_id = ?", (claim_id,)) if claim_id is not None else ("", ())
+        rows = self._connection().execute(
+            f"SELECT claim_id, filename, from_status, to_status, timestamp FROM claim_transitions "
+            f"{where} ORDER BY id", params
+        ).fetchall()
+        return [dict(zip(('claim_id', 'filename', 'from_status', 'to_status', 'timestamp'), row)) for row in rows]
+
+    def latest_review(self, filename: str) -> Optional[Dict]:
+        """Latest review of `filename` (with its claims), or None if it has no history."""
+        return self._latest(self._connection(), filename)
+
+    def __contains__(self, filename: str) -> bool:
+        return self._connection().execute(
+            "SELECT 1 FROM papers WHERE filename = ?", (filename,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    def history(self) -> Dict[str, List[Dict]]:
+        """
+        Full history in the review_version_history.json layout.
+
+        Versions are rebuilt by replaying the event log; a claim that did not
+        change between versions is the same dict object in both.
+        """
+        history: Dict[str, List[Dict]] = {}
+        for filename, kind, version, body in self._connection().execute(
+                "SELECT filename, kind, version, body FROM events ORDER BY id"):
+            versions = history.setdefault(filename, [])
+            body = json.loads(body)
+            if version is None:
+                versions[-1]['review'] = _apply_review_patch(versions[-1]['review'], body)
+                continue
+            version = json.loads(version)
+            if kind == 'snapshot':
+                version['review'] = body
+            else:
+                version['review'] = _apply_review_patch(versions[-1]['review'] if versions else {}, body)
+            versions.append(version)
+        return history
+
+    # --- Import / export ---
+
+    def import_json(self, json_file: str) -> int:
+        """
+        Replace the store with the contents of a review_version_history.json.
+
+        Consecutive versions are stored as patches where possible. A missing file
+        imports as an empty history.
+
+        Returns:
+            Number of papers imported
+        """
+        history = {}
+        if os.path.exists(json_file):
+            with open(json_file, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+        if self.unexported:
+            logger.warning(f"{json_file} changed on disk; discarding {self.unexported} unexported "
+                           f"version history change(s) in {self.db_path}")
+
+        events, papers, claims = [], [], []
+        for filename, versions in history.items():
+            review = None
+            for version in versions or []:
+                if not isinstance(version, dict):
+                    continue
+                new_review = version.get('review') or {}
+                patch = _review_patch(review, new_review) if review is not None else None
+                kind, body = ('snapshot', new_review) if patch is None else ('patch', patch)
+                events.append((filename, kind, json.dumps({**version, 'review': None}), json.dumps(body)))
+                review = new_review
+            if review is None:
+                continue
+            papers.append((filename, json.dumps({k: v for k, v in review.items() if k != REQUIREMENTS_KEY}),
+                           len(versions)))
+            file_claims = review.get(REQUIREMENTS_KEY)
+            for seq, claim in enumerate(file_claims if isinstance(file_claims, list) else []):
+                claims.append((filename, seq) + self._claim_columns(claim))
+
+        with self._transaction() as conn:
+            for table in ('events', 'papers', 'claims', 'claim_queue', 'claim_transitions'):
+                conn.execute(f"DELETE FROM {table}")
+            conn.executemany("INSERT INTO events (filename, kind, version, body) VALUES (?, ?, ?, ?)", events)
+            conn.executemany("INSERT INTO papers (filename, review, versions) VALUES (?, ?, ?)", papers)
+            conn.executemany(
+                "INSERT INTO claims (filename, seq, claim_id, status, data) VALUES (?, ?, ?, ?, ?)", claims)
+            self._enqueue_pending(conn)
+            self._set_meta(conn, 'imports', self.import_id + 1)
+            self._mark_synced(conn, json_file)
+        logger.info(f"Imported version history for {len(papers)} files from {json_file} into {self.db_path}")
+        return len(papers)
+
+    def export_json(self, json_file: str) -> int:
+        """
+        Write the full history as review_version_history.json.
+
+        The file is written to a temp file and renamed into place.
+
+        Returns:
+            Number of papers written
+        """
+        history = self.history()
+        tmp_file = json_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(history, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, json_file)
+        with self._transaction() as conn:
+            self._mark_synced(conn, json_file)
+        logger.info(f"Saved version history for {len(history)} files to {json_file}")
+        return len(history)
+
+
+# Shared instances, one per database path
+_version_history_stores: StoreRegistry[VersionHistoryStore] = StoreRegistry(VersionHistoryStore)
+
+
+def get_version_history_store(db_path: str) -> VersionHistoryStore:
+    """Get the shared VersionHistoryStore for `db_path`."""
+    return _version_history_stores.get(db_path)
+
+
+def open_version_history(json_file: str) -> VersionHistoryStore:
+    """
+    Store for a review_version_history.json, re-imported first if the JSON changed.
+
+    If the JSON cannot be parsed, the store keeps its last imported or written
+    contents; export_json will then replace the broken file.
+    """
+    store = get_version_history_store(version_history_store_path(json_file))
+    if not store.is_synced(json_file):
+        try:
+            store.import_json(json_file)
+        except json.JSONDecodeError as e:
+            logger.error(f"Error decoding {json_file} ({e}); using the version history store as is")
+    return store
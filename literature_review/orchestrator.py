@@ -11,6 +11,7 @@ import os
 import sys
 import time
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any, Callable
 from dataclasses import dataclass
@@ -22,9 +23,9 @@ from literature_review.utils import plotter
 import networkx as nx
 import logging
 from collections import defaultdict
-import pickle
 import csv
 import hashlib
+import re
 from sentence_transformers import SentenceTransformer
 import subprocess  # To run external scripts
 from pathlib import Path  # For file state checking
@@ -34,7 +35,10 @@ from literature_review.optimization.search_optimizer import generate_search_plan
 
 # Import global rate limiter
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from utils.global_rate_limiter import global_limiter, ErrorAction
+from utils.global_rate_limiter import global_limiter
+from literature_review.utils.llm_client import LLMClient, GeminiTransport, PersistentCache
+from literature_review.utils.response_cache import ResponseCache, get_response_cache
+from literature_review.io.research_store import open_research_store
 
 # --- CONFIGURATION & SETUP ---
 load_dotenv()
@@ -71,7 +75,8 @@ VERSION_HISTORY_FILE = 'review_version_history.json'
 # Default value here, but can be overridden by environment variable or config
 OUTPUT_FOLDER = os.getenv('LITERATURE_REVIEW_OUTPUT_DIR', 'gap_analysis_output')
 CACHE_FOLDER = 'analysis_cache'
-CACHE_FILE = os.path.join(CACHE_FOLDER, 'analysis_cache.pkl')
+ANALYSIS_CACHE_DB = os.path.join(CACHE_FOLDER, 'pillar_analysis.db')
+ANALYSIS_CACHE_VERSION = 2  # Bump when the cached pillar result layout changes
 # Note: These paths will be updated in main() based on dynamic OUTPUT_FOLDER
 CONTRIBUTION_REPORT_FILE = os.path.join(OUTPUT_FOLDER, 'sub_requirement_paper_contributions.md')
 ORCHESTRATOR_STATE_FILE = os.path.join(OUTPUT_FOLDER, 'orchestrator_state.json')
@@ -97,7 +102,8 @@ ANALYSIS_CONFIG = {
     'API_CALLS_PER_MINUTE': 10,  # Conservative limit for gemini-2.5-flash (1000 RPM available)
     'RETRY_ATTEMPTS': 3,
     'RETRY_DELAY': 5,
-    'CONVERGENCE_THRESHOLD': 5.0  # 5% threshold
+    'CONVERGENCE_THRESHOLD': 5.0,  # 5% threshold
+    'MAX_CONCURRENT_PILLARS': 4  # Pillars analyzed in parallel per iteration (1 = sequential)
 }
 
 
@@ -331,10 +337,6 @@ class ProgressTracker:
 class APIManager:
     """Manages API calls with rate limiting, caching, and retry logic"""
     def __init__(self):
-        self.cache = {}
-        self.last_call_time = 0
-        self.calls_this_minute = 0
-        self.minute_start = time.time()
         try:
             api_key = os.getenv('GEMINI_API_KEY')
             if not api_key:
@@ -355,6 +357,16 @@ class APIManager:
             logger.critical(f"[ERROR] Critical Error initializing Gemini Client: {e}")
             safe_print(f"❌ Critical Error initializing Gemini Client: {e}")
             raise
+        self.llm = LLMClient(
+            transport=GeminiTransport(self.client),
+            limiter=global_limiter,
+            cache=PersistentCache(),
+            module='orchestrator',
+            json_config=self.json_generation_config,
+            text_config=self.text_generation_config,
+            retry_attempts=ANALYSIS_CONFIG['RETRY_ATTEMPTS'],
+            retry_delay=ANALYSIS_CONFIG['RETRY_DELAY']
+        )
         
         # Initialize sentence transformer only if semantic search enabled
         if ANALYSIS_CONFIG.get('ENABLE_SEMANTIC_SEARCH', False):
@@ -371,109 +383,46 @@ class APIManager:
             logger.info("[INFO] Semantic search disabled (ENABLE_SEMANTIC_SEARCH=False)")
             safe_print("ℹ️ Semantic search disabled for faster testing")
 
-    def rate_limit(self):
-        """Implement rate limiting using global limiter"""
-        global_limiter.wait_for_quota()
-
     def cached_api_call(self, prompt: str, use_cache: bool = True, is_json: bool = True) -> Optional[Any]:
-        prompt_hash = hashlib.md5(prompt.encode('utf-8')).hexdigest()
-        if use_cache and prompt_hash in self.cache:
-            logger.debug(f"Cache hit for hash: {prompt_hash}")
-            safe_print("📦 Using cached response")
-            return self.cache[prompt_hash]
-        
-        # Validate request before making API call
-        is_valid, reason = global_limiter.validate_request(prompt, {'response_mime_type': 'application/json' if is_json else None})
-        if not is_valid:
-            logger.error(f"Request validation failed: {reason}")
-            global_limiter.record_request(success=False)
-            return None
-        
-        # Check if we should abort due to error patterns
-        if global_limiter.should_abort_pipeline():
-            logger.critical("Pipeline abort recommended due to error patterns")
-            return None
-        
-        logger.debug(f"Cache miss for hash: {prompt_hash}. Calling API...")
-        self.rate_limit()
-        response_text = ""
-        for attempt in range(ANALYSIS_CONFIG['RETRY_ATTEMPTS']):
-            try:
-                current_config_object = self.json_generation_config if is_json else self.text_generation_config
-                response = self.client.models.generate_content(
-                    model="gemini-2.5-flash", contents=prompt, config=current_config_object
-                )
-                response_text = response.text
-                result = json.loads(response_text) if is_json else response_text
-                self.cache[prompt_hash] = result
-                # Record successful request
-                global_limiter.record_request(success=True)
-                return result
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error on attempt {attempt + 1}: {e}. Response text: '{response_text[:500]}...'")
-                # Categorize error
-                category = global_limiter.categorize_error(e, response_text or "")
-                action = global_limiter.get_action_for_error(category)
-                global_limiter.record_request(success=False, error=e, response_text=response_text or "")
-                
-                if action == ErrorAction.SKIP_DOCUMENT:
-                    logger.error(f"Skipping request due to {category.name}")
-                    return None
-                elif attempt < ANALYSIS_CONFIG['RETRY_ATTEMPTS'] - 1: 
-                    time.sleep(ANALYSIS_CONFIG['RETRY_DELAY'])
-                else: 
-                    logger.error("Max retries reached for JSON decode error.")
-            except Exception as e:
-                # Categorize error
-                category = global_limiter.categorize_error(e, str(e))
-                action = global_limiter.get_action_for_error(category)
-                global_limiter.record_request(success=False, error=e, response_text=str(e))
-                
-                if "DeadlineExceeded" in str(e) or "Timeout" in str(e):
-                     logger.error(f"API call timed out on attempt {attempt + 1}")
-                else:
-                    logger.error(f"API error on attempt {attempt + 1}: {type(e).__name__} - {e}")
-                
-                if action == ErrorAction.ABORT_PIPELINE:
-                    logger.critical(f"Aborting due to {category.name}")
-                    return None
-                elif action == ErrorAction.SKIP_DOCUMENT:
-                    logger.error(f"Skipping request due to {category.name}")
-                    return None
-                elif "429" in str(e):
-                     logger.warning("Rate limit error detected by API, increasing sleep time.")
-                     time.sleep(ANALYSIS_CONFIG['RETRY_DELAY'] * (attempt + 2))
-                elif attempt < ANALYSIS_CONFIG['RETRY_ATTEMPTS'] - 1:
-                     # Use delay from action's value tuple
-                     _, delay = action.value
-                     time.sleep(delay if delay > 0 else ANALYSIS_CONFIG['RETRY_DELAY'])
-                else:
-                     logger.error("Max retries reached for API error.")
-        logger.error(f"API call failed after {ANALYSIS_CONFIG['RETRY_ATTEMPTS']} attempts.")
-        return None
+        return self.llm.call(prompt, is_json=is_json, use_cache=use_cache)
 # --- END APIManager CLASS ---
 
 
 # --- ResearchDatabase Class (Unchanged) ---
 class ResearchDatabase:
     """Manages the research paper database"""
-    def __init__(self, csv_file: str):
+    SEARCH_FIELDS = [
+        'CORE_DOMAIN', 'SUB_DOMAIN', 'APPLICABILITY_NOTES',
+        'KEYWORDS', 'CORE_CONCEPTS', 'INTERDISCIPLINARY_BRIDGES', 'MAJOR_FINDINGS', 'TITLE'
+    ]
+    QUALITY_COLUMNS = [
+        'REPRODUCIBILITY_SCORE', 'BIOLOGICAL_FIDELITY', 'CORE_DOMAIN_RELEVANCE_SCORE',
+        'SUBDOMAIN_RELEVANCE_TO_RESEARCH_SCORE', 'EXTRACTION_QUALITY'
+    ]
+    # Everything gap analysis, trends and the paper network read from a paper row
+    ANALYSIS_COLUMNS = ['FILENAME', 'PUBLICATION_YEAR', 'MENTIONED_PAPERS', 'CROSS_REFERENCES',
+                        'SUBDOMAIN_RELEVANCE_TO_RESEARCH_SCORE'] + SEARCH_FIELDS + QUALITY_COLUMNS
+    _TOKEN_PATTERN = re.compile(r'\w+')
+
+    def __init__(self, csv_file: str, columns: Optional[List[str]] = None):
         self.db = None
-        self.load_database(csv_file)
+        self.load_database(csv_file, columns)
         self.paper_network = None
         if ANALYSIS_CONFIG['ENABLE_NETWORK_ANALYSIS'] and self.db is not None:
             self.build_network()
 
-    def load_database(self, csv_file: str):
+    def load_database(self, csv_file: str, columns: Optional[List[str]] = None):
+        """Load papers from the columnar store (or the CSV if it is unavailable), reading only `columns`."""
         try:
-            self.db = pd.read_csv(csv_file)
+            store = open_research_store(csv_file)
+            if store is not None:
+                self.db = store.read_papers(columns)
+            else:
+                wanted = None if columns is None else set(columns)
+                self.db = pd.read_csv(csv_file, usecols=None if wanted is None else wanted.__contains__)
             for col in self.db.select_dtypes(include=['object']).columns:
                  self.db[col] = self.db[col].fillna('')
-            score_columns = [
-                'CORE_DOMAIN_RELEVANCE_SCORE', 'SUBDOMAIN_RELEVANCE_TO_RESEARCH_SCORE',
-                'REPRODUCIBILITY_SCORE', 'BIOLOGICAL_FIDELITY', 'EXTRACTION_QUALITY'
-            ]
-            for col in score_columns:
+            for col in self.QUALITY_COLUMNS:
                 if col in self.db.columns:
                     self.db[col] = pd.to_numeric(self.db[col], errors='coerce').fillna(0)
             if 'PUBLICATION_YEAR' in self.db.columns:
@@ -481,6 +430,7 @@ class ResearchDatabase:
             self.db.fillna(0, inplace=True)
             if 'FILENAME' in self.db.columns:
                 self.db['FILENAME'] = self.db['FILENAME'].astype(str)
+            self.build_search_index()
             logger.info(f"[SUCCESS] Loaded {len(self.db)} papers from database")
         except FileNotFoundError:
             logger.error(f"[ERROR] Database file not found: {csv_file}")
@@ -523,28 +473,73 @@ class ResearchDatabase:
         else: logger.warning("No 'MENTIONED_PAPERS' or 'CROSS_REFERENCES' column found.")
         logger.info(f"[INFO] Built network with {self.paper_network.number_of_nodes()} nodes")
 
+    def build_search_index(self):
+        """
+        Build the keyword prefilter index over SEARCH_FIELDS.
+
+        Maps each lowercase word token to the row positions containing it, and
+        keeps one lowercase search string per row for multi-word keywords.
+        """
+        self._token_rows = defaultdict(set)
+        self._row_search_text = []
+        self._keyword_rows_cache = {}
+        fields = [field for field in self.SEARCH_FIELDS if field in self.db.columns]
+        self._indexed_fields = fields
+        columns = [self.db[field].tolist() for field in fields]
+        for position, values in enumerate(zip(*columns)):
+            # \x00 separates fields so a keyword never matches across two of them
+            text = '\x00'.join(value.lower() for value in values if isinstance(value, str))
+            self._row_search_text.append(text)
+            for token in set(self._TOKEN_PATTERN.findall(text)):
+                self._token_rows[token].add(position)
+        self._vocabulary = '\n'.join(self._token_rows)
+
+    def _rows_with_token_containing(self, fragment: str) -> set:
+        """Rows with any token that contains `fragment` as a substring."""
+        rows = set()
+        pattern = re.compile('^.*' + re.escape(fragment) + '.*$', re.MULTILINE)
+        for token in pattern.findall(self._vocabulary):
+            rows |= self._token_rows[token]
+        return rows
+
+    def _rows_matching_keyword(self, keyword: str) -> frozenset:
+        """Rows where any search field contains `keyword` (case-insensitive substring)."""
+        keyword = keyword.lower()
+        cached = self._keyword_rows_cache.get(keyword)
+        if cached is not None:
+            return cached
+        parts = self._TOKEN_PATTERN.findall(keyword)
+        if parts == [keyword]:
+            # A single word can only occur inside one token, so the index is exact
+            rows = self._rows_with_token_containing(keyword)
+        else:
+            # Multi-word / punctuated keywords: narrow with the index, then verify the substring
+            candidates = None
+            for part in parts:
+                part_rows = self._rows_with_token_containing(part)
+                candidates = part_rows if candidates is None else candidates & part_rows
+                if not candidates:
+                    break
+            if candidates is None:
+                candidates = range(len(self._row_search_text))
+            rows = {row for row in candidates if keyword in self._row_search_text[row]}
+        rows = frozenset(rows)
+        self._keyword_rows_cache[keyword] = rows
+        return rows
+
     def get_relevant_papers(self, pillar_name: str, pillar_keywords: List[str]) -> pd.DataFrame:
         if self.db is None or self.db.empty:
             return pd.DataFrame(columns=self.db.columns)
         pillar_short = pillar_name.split(':')[1].split('(')[0].strip() if ':' in pillar_name else pillar_name
-        conditions = []
-        search_fields = [
-            'CORE_DOMAIN', 'SUB_DOMAIN', 'APPLICABILITY_NOTES',
-            'KEYWORDS', 'CORE_CONCEPTS', 'INTERDISCIPLINARY_BRIDGES', 'MAJOR_FINDINGS', 'TITLE'
-        ]
-        search_terms = [pillar_short] + pillar_keywords
-        for field in search_fields:
-            if field in self.db.columns:
-                for keyword in search_terms:
-                    if keyword:
-                        condition = self.db[field].str.contains(keyword, case=False, na=False)
-                        conditions.append(condition)
-        if conditions:
-            combined = pd.concat(conditions, axis=1).any(axis=1)
-            relevant = self.db[combined].drop_duplicates(subset=['FILENAME'])
-        else:
-            relevant = pd.DataFrame(columns=self.db.columns)
-        return relevant
+        search_terms = [term for term in [pillar_short] + pillar_keywords if term]
+        if getattr(self, '_row_search_text', None) is None or len(self._row_search_text) != len(self.db):
+            self.build_search_index()
+        if not self._indexed_fields or not search_terms:
+            return pd.DataFrame(columns=self.db.columns)
+        matched_rows = set()
+        for keyword in search_terms:
+            matched_rows |= self._rows_matching_keyword(keyword)
+        return self.db.iloc[sorted(matched_rows)].drop_duplicates(subset=['FILENAME'])
 
     def calculate_paper_quality(self, paper: pd.Series) -> float:
         quality_factors = {
@@ -580,6 +575,218 @@ class ResearchDatabase:
 # --- END ResearchDatabase Class ---
 
 
+# --- ClaimIndex Class ---
+@dataclass
+class IndexedClaim:
+    """A claim held by reference, with the paper it came from."""
+    seq: int
+    source: str
+    filename: str
+    claim: Dict
+
+
+class ClaimIndex:
+    """
+    Claims bucketed by (pillar, sub_requirement, status).
+
+    Built once from the research DB records and the version-history claims.
+    When the version history changes, ResearchDataLayer.refresh() swaps in
+    each changed paper's claims with replace_file_claims(). Claim dicts are
+    stored by reference and never copied or mutated; lookups return them in
+    insertion order (version history first, then research DB).
+    """
+
+    SOURCE_VERSION_HISTORY = 'version_history'
+    SOURCE_RESEARCH_DB = 'research_db'
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[str, str, str], Dict[Any, IndexedClaim]] = defaultdict(dict)
+        self._pillar_keys: Dict[str, set] = defaultdict(set)
+        self._locations: Dict[Any, Tuple[str, str, str]] = {}
+        self._by_file: Dict[Tuple[str, str], set] = defaultdict(set)
+        self._next_seq = 0
+
+    @classmethod
+    def build(cls, db_records: List[Dict], version_claims: List[Dict]) -> 'ClaimIndex':
+        index = cls()
+        for claim in version_claims:
+            index.add(claim, claim.get('filename', 'N/A'), cls.SOURCE_VERSION_HISTORY)
+        for row in db_records:
+            for claim in row.get("Requirement(s)", []):
+                index.add(claim, row.get('FILENAME', 'N/A'), cls.SOURCE_RESEARCH_DB)
+        return index
+
+    @staticmethod
+    def _bucket_key(claim: Dict) -> Tuple[str, str, str]:
+        sub_req = claim.get('sub_requirement') or claim.get('sub_requirement_key') or ''
+        return claim.get('pillar', ''), sub_req, claim.get('status', 'pending_judge_review')
+
+    def _entry_id(self, claim: Dict, source: str) -> Any:
+        claim_id = claim.get('claim_id')
+        if claim_id and source == self.SOURCE_VERSION_HISTORY:
+            return claim_id
+        # Version-history claims keep their slot across replace_file_claims(); others get a unique one
+        return (source, self._next_seq)
+
+    def add(self, claim: Dict, filename: str, source: str = SOURCE_VERSION_HISTORY,
+            seq: Optional[int] = None) -> None:
+        """Index a claim (replacing any earlier claim with the same id from the same source)."""
+        entry_id = self._entry_id(claim, source)
+        previous = self._remove(entry_id)
+        if seq is None:
+            seq = previous.seq if previous else self._next_seq
+        self._next_seq += 1
+        key = self._bucket_key(claim)
+        self._buckets[key][entry_id] = IndexedClaim(seq, source, filename, claim)
+        self._pillar_keys[key[0]].add(key)
+        self._locations[entry_id] = key
+        self._by_file[(source, filename)].add(entry_id)
+
+    def _remove(self, entry_id: Any) -> Optional[IndexedClaim]:
+        key = self._locations.pop(entry_id, None)
+        if key is None:
+            return None
+        entry = self._buckets[key].pop(entry_id, None)
+        if entry is not None:
+            self._by_file[(entry.source, entry.filename)].discard(entry_id)
+        return entry
+
+    def replace_file_claims(self, filename: str, claims: List[Dict],
+                            source: str = SOURCE_VERSION_HISTORY) -> None:
+        """Swap in the current claims for one paper; claims that survive keep their position."""
+        previous = {}
+        for entry_id in list(self._by_file.pop((source, filename), ())):
+            entry = self._remove(entry_id)
+            if entry is not None:
+                previous[entry_id] = entry.seq
+        for claim in claims:
+            self.add(claim, filename, source, seq=previous.get(self._entry_id(claim, source)))
+
+    def claims(self, pillar: str, status: Optional[str] = 'approved',
+               sub_requirement: Optional[str] = None) -> List[IndexedClaim]:
+        """Claims for a pillar, optionally narrowed to one sub-requirement; status=None means any."""
+        entries = []
+        for key in self._pillar_keys.get(pillar, ()):
+            if status is not None and key[2] != status:
+                continue
+            if sub_requirement is not None and key[1] != sub_requirement:
+                continue
+            entries.extend(self._buckets[key].values())
+        return sorted(entries, key=lambda entry: entry.seq)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+# --- END ClaimIndex Class ---
+
+
+# --- ResearchDataLayer Class ---
+class ResearchDataLayer:
+    """
+    Research DB, parsed records, approved claims and ClaimIndex kept in memory
+    across DEEP_LOOP iterations.
+
+    refresh() stats both source files and only re-reads one whose mtime/size
+    changed and whose SHA-256 differs. A changed research DB CSV is reloaded in
+    full (it is normally static during a loop). A changed version history,
+    which the deep reviewer and judge rewrite each iteration, is diffed per
+    paper, and only papers whose latest claims changed are re-indexed.
+    """
+
+    def __init__(self, research_db_file: str, version_history_file: str):
+        self.research_db_file = research_db_file
+        self.version_history_file = version_history_file
+        self._file_states: Dict[str, Tuple[Tuple[int, int], Optional[str]]] = {}
+        self.version_history: Dict = {}
+        self._approved_by_file: Dict[str, List[Dict]] = {}
+        self._load_research_db()
+        self._load_version_history()
+        self.claim_index = ClaimIndex.build(self.db_records, self.approved_claims)
+
+    @property
+    def approved_claims(self) -> List[Dict]:
+        return [claim for claims in self._approved_by_file.values() for claim in claims]
+
+    def _changed(self, path: str) -> bool:
+        """True if `path` differs from what was last loaded; records its new state."""
+        try:
+            stat = os.stat(path)
+            stat_key = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stat_key = None
+        previous = self._file_states.get(path)
+        if previous is not None and previous[0] == stat_key:
+            return False
+        digest = None
+        if stat_key is not None:
+            with open(path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        self._file_states[path] = (stat_key, digest)
+        return previous is None or previous[1] != digest
+
+    def _load_research_db(self) -> None:
+        self._changed(self.research_db_file)
+        self.database = ResearchDatabase(self.research_db_file, ResearchDatabase.ANALYSIS_COLUMNS)
+        self.db_records = load_research_db_records(self.research_db_file, columns=['FILENAME'])
+
+    def _read_version_history(self) -> Dict:
+        if not os.path.exists(self.version_history_file):
+            logger.info("No version history file found.")
+            return {}
+        try:
+            with open(self.version_history_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading version history: {e}")
+            return {}
+
+    @staticmethod
+    def _approved_for_file(filename: str, versions: List[Dict]) -> List[Dict]:
+        return [c for c in latest_claims_for_file(filename, versions) if c.get("status") == "approved"]
+
+    def _load_version_history(self) -> None:
+        self._changed(self.version_history_file)
+        self.version_history = self._read_version_history()
+        self._approved_by_file = {
+            filename: self._approved_for_file(filename, versions)
+            for filename, versions in self.version_history.items()
+        }
+        logger.info(f"Loaded {len(self.approved_claims)} approved claims from version history.")
+
+    def refresh(self) -> Dict[str, Any]:
+        """
+        Apply on-disk changes since the last load.
+
+        Returns:
+            {'research_db_reloaded': bool, 'papers_updated': [filenames whose claims changed]}
+        """
+        summary = {'research_db_reloaded': False, 'papers_updated': []}
+        db_changed = self._changed(self.research_db_file)
+        if db_changed:
+            logger.info(f"[INFO] {self.research_db_file} changed on disk; reloading research DB.")
+            self._load_research_db()
+            summary['research_db_reloaded'] = True
+
+        if self._changed(self.version_history_file):
+            self.version_history = self._read_version_history()
+            for filename in set(self._approved_by_file) | set(self.version_history):
+                approved = self._approved_for_file(filename, self.version_history.get(filename, []))
+                if approved == self._approved_by_file.get(filename, []):
+                    continue
+                if approved:
+                    self._approved_by_file[filename] = approved
+                else:
+                    self._approved_by_file.pop(filename, None)
+                summary['papers_updated'].append(filename)
+                if not db_changed:
+                    self.claim_index.replace_file_claims(filename, approved)
+            logger.info(f"[INFO] Version history changed; {len(summary['papers_updated'])} paper(s) have new approved claims.")
+
+        if db_changed:
+            self.claim_index = ClaimIndex.build(self.db_records, self.approved_claims)
+        return summary
+# --- END ResearchDataLayer Class ---
+
+
 # --- PillarAnalyzer Class (MODIFIED) ---
 class PillarAnalyzer:
     """Analyzes research completeness for each pillar"""
@@ -587,13 +794,15 @@ class PillarAnalyzer:
     # --- MODIFIED: Now takes parsed CSV data and approved deep claims ---
     def __init__(self, definitions: Dict, database: ResearchDatabase,
                  api_manager: APIManager, all_db_records: List[Dict],
-                 approved_deep_claims: List[Dict], config: Optional[Dict] = None):
+                 approved_deep_claims: List[Dict], config: Optional[Dict] = None,
+                 claim_index: Optional[ClaimIndex] = None,
+                 version_history: Optional[Dict] = None):
         self.definitions = definitions
         self.database = database # The ResearchDatabase object
         self.all_db_records = all_db_records # The raw list of dicts from CSV
         self.api_manager = api_manager
         self.approved_deep_claims = approved_deep_claims # Approved claims from JSON DB
-        self.cache = {}
+        self.claim_index = claim_index or ClaimIndex.build(all_db_records, approved_deep_claims)
         self.config = config or {}
         
         # Initialize gap analyzer for decay weighting
@@ -601,26 +810,64 @@ class PillarAnalyzer:
         self.gap_analyzer = GapAnalyzer(config=self.config)
         
         # Load version history for decay calculations
-        self.version_history = self._load_version_history()
+        self.version_history = version_history if version_history is not None else self._load_version_history()
         
-        self.load_cache()
+        self.cache = self._open_cache()
 
-    def load_cache(self):
-        if os.path.exists(CACHE_FILE) and ANALYSIS_CONFIG['CACHE_RESULTS']:
-            try:
-                with open(CACHE_FILE, 'rb') as f: self.cache = pickle.load(f)
-                logger.info(f"[INFO] Loaded {len(self.cache)} cached analyses from {CACHE_FILE}")
-            except Exception as e:
-                logger.warning(f"Could not load cache: {e}. Deleting old cache.")
-                if os.path.exists(CACHE_FILE): os.remove(CACHE_FILE)
-                self.cache = {}
+    def _open_cache(self) -> Optional[ResponseCache]:
+        """Open the persistent pillar analysis store (None when caching is disabled or unavailable)."""
+        if not ANALYSIS_CONFIG['CACHE_RESULTS']:
+            return None
+        cache_path = self.config.get('analysis_cache_path', ANALYSIS_CACHE_DB)
+        try:
+            return get_response_cache(cache_path)
+        except Exception as e:
+            # Leave the file in place; a later run (or a newer schema) may still read it
+            logger.warning(f"Could not open analysis cache {cache_path}: {e}. Continuing without cache.")
+            return None
 
-    def save_cache(self):
-        if not ANALYSIS_CONFIG['CACHE_RESULTS']: return
+    def analysis_cache_key(self, pillar_name: str, pillar_data: Dict,
+                           relevant_papers: pd.DataFrame) -> str:
+        """Digest of every input build_expert_prompt reads for this pillar."""
+        claims = [
+            {'filename': entry.filename, 'claim': entry.claim}
+            for entry in self.claim_index.claims(pillar_name)
+        ]
+        material = {
+            'version': ANALYSIS_CACHE_VERSION,
+            'pillar': pillar_name,
+            'definition': pillar_data,
+            'papers': relevant_papers.drop(columns=['quality_score'], errors='ignore').to_dict(orient='records'),
+            'claims': claims,
+            'quality_threshold': ANALYSIS_CONFIG['QUALITY_WEIGHT_THRESHOLD'],
+            'min_papers': ANALYSIS_CONFIG['MIN_PAPERS_FOR_ANALYSIS'],
+        }
+        payload = json.dumps(material, sort_keys=True, default=str)
+        return f"pillar_analysis:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    def _load_cached_analysis(self, cache_key: str) -> Optional[Tuple[Dict, float, List]]:
+        if self.cache is None:
+            return None
         try:
-            with open(CACHE_FILE, 'wb') as f: pickle.dump(self.cache, f)
+            entry = self.cache.get(cache_key)
         except Exception as e:
-            logger.warning(f"Could not save cache: {e}")
+            logger.warning(f"Could not read analysis cache: {e}")
+            return None
+        try:
+            return entry['analysis'], entry['completeness'], entry['waterfall']
+        except (KeyError, TypeError):
+            return None  # Missing or written with an older layout; recompute
+
+    def _store_cached_analysis(self, cache_key: str, analysis_results: Dict,
+                               completeness: float, waterfall: List) -> None:
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(cache_key, {
+                'analysis': analysis_results, 'completeness': float(completeness), 'waterfall': waterfall
+            })
+        except Exception as e:
+            logger.warning(f"Could not save analysis to cache: {e}")
     
     def _load_version_history(self) -> Dict:
         """Load version history for publication years."""
@@ -662,33 +909,20 @@ CORE_CONCEPTS: {row.get('CORE_CONCEPTS', 'N/A')}
 """
             paper_summaries.append(summary)
 
-        # 2. Get Approved Claims from Deep Coverage DB (JSON file)
-        claims_from_json_db = [
-            c for c in self.approved_deep_claims
-            if c.get('pillar') == pillar_name
-        ]
-
-        # 3. Get Approved Claims from Research DB (CSV file)
-        claims_from_csv_db = []
-        for row in self.all_db_records:
-            for claim in row.get("Requirement(s)", []):
-                if claim.get('pillar') == pillar_name and claim.get('status') == 'approved':
-                    # Add context for the AI
-                    claim['_filename'] = row.get('FILENAME', 'N/A')
-                    claims_from_csv_db.append(claim)
-
-        all_approved_claims = claims_from_json_db + claims_from_csv_db
+        # 2. Get Approved Claims from Deep Coverage DB (JSON file) and Research DB (CSV file)
+        all_approved_claims = self.claim_index.claims(pillar_name, status='approved')
 
         deep_claims_summaries = []
         if all_approved_claims:
             logger.info(f"   Injecting {len(all_approved_claims)} approved claims (from CSV & JSON).")
-            for c in all_approved_claims:
+            for entry in all_approved_claims:
+                c = entry.claim
                 sub_req_key = c.get('sub_requirement') or c.get('sub_requirement_key', 'N/A')
                 claim_str = f"""
 ---
 (Source: Approved Claim)
 CLAIM FOR SUB-REQ: {sub_req_key}
-FROM PAPER: {c.get('filename') or c.get('_filename', 'N/A')}
+FROM PAPER: {c.get('filename') or entry.filename}
 EVIDENCE CHUNK: {c.get('evidence_chunk', 'N/A')}
 REVIEWER'S CLAIM: {c.get('claim_summary', 'N/A')}
 JUDGE'S RULING: {c.get('judge_notes', 'Approved.')}
@@ -751,26 +985,22 @@ Return ONLY a JSON object with the exact structure:
 
     def analyze_pillar(self, pillar_name: str, pillar_data: Dict) -> Tuple[Dict, float, List]:
         """Analyze a single pillar's completeness."""
-        # --- MODIFIED: Cache key now includes all data sources ---
-        cache_key = f"{pillar_name}_{len(self.database.db)}_{len(self.all_db_records)}_{len(self.approved_deep_claims)}"
-
-        if cache_key in self.cache:
-            logger.info(f"   Found cached analysis for {pillar_name} (key: {cache_key})")
-            return self.cache[cache_key]
-
         keywords = pillar_data.get('keywords', [])
         relevant_papers_df = self.database.get_relevant_papers(pillar_name, keywords)
+
+        # Cache key is a digest of the prompt inputs, so any changed paper or claim forces a re-run
+        cache_key = self.analysis_cache_key(pillar_name, pillar_data, relevant_papers_df)
+        cached = self._load_cached_analysis(cache_key)
+        if cached is not None:
+            logger.info(f"   Found cached analysis for {pillar_name} (key: {cache_key[-12:]})")
+            return cached
+
         logger.info(f"   Found {len(relevant_papers_df)} relevant papers from main DB.")
 
         # Check if we have *any* data for this pillar
-        has_csv_claims = any(
-            claim.get('pillar') == pillar_name
-            for row in self.all_db_records
-            for claim in row.get("Requirement(s)", [])
-        )
-        has_json_claims = any(c.get('pillar') == pillar_name for c in self.approved_deep_claims)
+        has_claims = bool(self.claim_index.claims(pillar_name, status=None))
 
-        if relevant_papers_df.empty and not has_csv_claims and not has_json_claims:
+        if relevant_papers_df.empty and not has_claims:
             logger.warning(f"   No relevant papers or claims for meaningful analysis.")
             empty_results = self._create_empty_results(pillar_data['requirements'])
             completeness, waterfall = self._calculate_weighted_completeness(
@@ -802,8 +1032,7 @@ Return ONLY a JSON object with the exact structure:
                 analysis_results,
                 relevant_papers_df # Pass the DF for quality scoring
             )
-            self.cache[cache_key] = (analysis_results, completeness, waterfall)
-            self.save_cache()
+            self._store_cached_analysis(cache_key, analysis_results, completeness, waterfall)
             return analysis_results, completeness, waterfall
 
         except Exception as e:
@@ -814,6 +1043,34 @@ Return ONLY a JSON object with the exact structure:
             )
             return empty_results, completeness, waterfall
 
+    def analyze_pillars(self, pillars: List[Tuple[str, Dict]], max_workers: int = 1,
+                        on_complete: Optional[Callable[[str, float, int, int], None]] = None
+                        ) -> Dict[str, Tuple[Dict, float, List]]:
+        """
+        Analyze several pillars, up to `max_workers` at a time.
+
+        Each pillar is an independent LLM call that goes through the shared
+        rate limiter. `on_complete(pillar_name, completeness, done, total)` is
+        invoked on the calling thread as each pillar finishes, so callers may
+        update non-thread-safe state (e.g. ProgressTracker) from it.
+
+        Returns:
+            {pillar_name: (analysis_results, completeness, waterfall)} in input order
+        """
+        outcomes = {}
+        total = len(pillars)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(self.analyze_pillar, pillar_name, pillar_data): pillar_name
+                for pillar_name, pillar_data in pillars
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                pillar_name = futures[future]
+                outcomes[pillar_name] = future.result()
+                if on_complete:
+                    on_complete(pillar_name, outcomes[pillar_name][1], done, total)
+        return {pillar_name: outcomes[pillar_name] for pillar_name, _ in pillars}
+
     # --- Unmodified private methods: _create_empty_results, _validate_results, _calculate_weighted_completeness ---
     def _create_empty_results(self, requirements: Dict) -> Dict:
         results = {}
@@ -1505,11 +1762,20 @@ def run_script(script_name: str) -> bool:
         return False
 
 # --- MODIFIED: Load functions now parse data for PillarAnalyzer ---
-def load_research_db_records(filepath: str) -> List[Dict]:
-    """Loads the research CSV and parses JSON in 'Requirement(s)' column."""
+def load_research_db_records(filepath: str, columns: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Loads the research DB as dicts with 'Requirement(s)' parsed into a list of claims.
+
+    With the columnar store, only `columns` (plus the claims) are read.
+    """
     if not os.path.exists(filepath):
         logger.error(f"Research DB file not found: {filepath}.")
         return []
+    store = open_research_store(filepath)
+    if store is not None:
+        records = store.read_records(columns)
+        logger.info(f"Loaded {len(records)} records from {store.db_path}")
+        return records
     try:
         df = pd.read_csv(filepath, encoding='utf-8')
         df = df.replace({pd.NA: None, np.nan: None})
@@ -1531,6 +1797,13 @@ def load_research_db_records(filepath: str) -> List[Dict]:
         logger.error(f"Could not load or parse research DB {filepath}: {e}")
         return []
 
+def latest_claims_for_file(filename: str, versions: List[Dict]) -> List[Dict]:
+    """Claims from a paper's latest version-history entry, each copied with 'filename' added."""
+    if not versions:
+        return []
+    requirements_list = versions[-1].get('review', {}).get('Requirement(s)', [])
+    return [{**claim, 'filename': filename} for claim in requirements_list]
+
 def load_approved_claims_from_version_history(filepath: str) -> List[Dict]:
     """Loads the version history and filters for 'approved' claims."""
     if not os.path.exists(filepath):
@@ -1543,18 +1816,7 @@ def load_approved_claims_from_version_history(filepath: str) -> List[Dict]:
         # Extract all claims from version history
         all_claims = []
         for filename, versions in version_history.items():
-            if not versions:
-                continue
-            # Get latest version
-            latest_version = versions[-1]
-            review = latest_version.get('review', {})
-            requirements_list = review.get('Requirement(s)', [])
-            
-            for claim in requirements_list:
-                # Add filename for context
-                claim_with_file = claim.copy()
-                claim_with_file['filename'] = filename
-                all_claims.append(claim_with_file)
+            all_claims.extend(latest_claims_for_file(filename, versions))
         
         approved_claims = [c for c in all_claims if c.get("status") == "approved"]
         logger.info(f"Loaded {len(all_claims)} total claims, {len(approved_claims)} are 'approved'.")
@@ -2177,6 +2439,7 @@ def main(config: Optional[OrchestratorConfig] = None, output_folder: Optional[st
 
     all_results = previous_results.copy()
     iteration_count = 0
+    research_data = None  # Loaded on the first iteration, refreshed on later ones
     
     # --- NEW: Pre-filter Stage (INCR-W1-6) ---
     prefilter_enabled = config.prefilter_enabled if config else True
@@ -2255,21 +2518,21 @@ def main(config: Optional[OrchestratorConfig] = None, output_folder: Optional[st
             iteration=iteration_count
         )
 
-        # --- 4a. Load databases (fresh every loop) ---
-        database_df_obj = ResearchDatabase(RESEARCH_DB_FILE)
+        # --- 4a. Load databases (once; later iterations apply only what changed on disk) ---
+        if research_data is None:
+            research_data = ResearchDataLayer(RESEARCH_DB_FILE, VERSION_HISTORY_FILE)
+        else:
+            research_data.refresh()
+        database_df_obj = research_data.database
         if database_df_obj.db is None or database_df_obj.db.empty:
             logger.error("No data in Research DB. Exiting.")
             safe_print("❌ No data in Research DB. Exiting.")
             return
 
-        # Load the *full* parsed CSV records and *approved* claims from version history
-        all_db_records = load_research_db_records(RESEARCH_DB_FILE)
-        approved_deep_claims = load_approved_claims_from_version_history(VERSION_HISTORY_FILE)
-
-        # Initialize analyzer with fresh data
         analyzer = PillarAnalyzer(
             definitions, database_df_obj, api_manager,
-            all_db_records, approved_deep_claims, pipeline_config
+            research_data.db_records, research_data.approved_claims, pipeline_config,
+            claim_index=research_data.claim_index, version_history=research_data.version_history
         )
 
         if ANALYSIS_CONFIG['ENABLE_TREND_ANALYSIS'] and trend_analyzer is None:
@@ -2282,6 +2545,33 @@ def main(config: Optional[OrchestratorConfig] = None, output_folder: Optional[st
         velocity_data = {}
 
         # --- 4b. Run Analysis on Target Pillars ---
+        target_pillars = [
+            (pillar_name, pillar_data) for pillar_name, pillar_data in definitions.items()
+            if pillar_name in analysis_target_pillars
+        ]
+        for pillar_name, _ in target_pillars:
+            logger.info(f"\n--- Analyzing: {pillar_name} ---")
+            safe_print(f"\n--- Analyzing: {pillar_name} ---")
+
+        def report_pillar(pillar_name, completeness, done, total):
+            logger.info(f"   [SUCCESS] {pillar_name} completeness: {completeness:.1f}%")
+            progress_tracker.emit(
+                "gap_analysis",
+                "running",
+                f"Analyzed {pillar_name} ({done}/{total})",
+                iteration=iteration_count,
+                pillar=pillar_name,
+                completeness=round(completeness, 1),
+                pillars_done=done,
+                pillars_total=total
+            )
+
+        pillar_outcomes = analyzer.analyze_pillars(
+            target_pillars,
+            max_workers=ANALYSIS_CONFIG['MAX_CONCURRENT_PILLARS'],
+            on_complete=report_pillar
+        )
+
         for pillar_name, pillar_data in definitions.items():
             if pillar_name not in analysis_target_pillars:
                 if pillar_name in all_results:
@@ -2289,11 +2579,7 @@ def main(config: Optional[OrchestratorConfig] = None, output_folder: Optional[st
                     radar_data[pillar_name] = all_results[pillar_name].get('completeness', 0)
                 continue
 
-            logger.info(f"\n--- Analyzing: {pillar_name} ---")
-            safe_print(f"\n--- Analyzing: {pillar_name} ---")
-
-            analysis_results, completeness, waterfall_steps = analyzer.analyze_pillar(pillar_name, pillar_data)
-            logger.info(f"   [SUCCESS] Completeness: {completeness:.1f}%")
+            analysis_results, completeness, waterfall_steps = pillar_outcomes[pillar_name]
 
             current_iteration_results[pillar_name] = {
                 'completeness': completeness, 'analysis': analysis_results, 'waterfall_data': waterfall_steps
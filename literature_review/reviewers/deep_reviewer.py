@@ -13,8 +13,6 @@ import os
 import sys
 import json
 import csv
-import pypdf
-import pdfplumber
 import time
 import hashlib
 import numpy as np
@@ -31,10 +29,15 @@ import pickle
 from sentence_transformers import SentenceTransformer
 import warnings
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 # Import global rate limiter
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.global_rate_limiter import global_limiter, ErrorAction
+from utils.global_rate_limiter import global_limiter
+from literature_review.utils.llm_client import LLMClient, GeminiTransport, PersistentCache
+from literature_review.utils.text_extraction import extract_document
+from literature_review.io.research_store import open_research_store
+from literature_review.io.version_history_store import open_version_history
 
 # --- CONFIGURATION ---
 load_dotenv()
@@ -61,6 +64,8 @@ API_CONFIG = {
 }
 REVIEW_CONFIG = {
     "DEEP_REVIEWER_CHUNK_SIZE": 75000,  # Chunk size for Deep Reviewer text processing
+    "MAX_CONCURRENT_CHUNKS": 4,  # Chunk prompts in flight at once (1 = sequential)
+    "EXTRACTION_WORKERS": 2,  # Papers extracted in the background while prompts run
 }
 SUPPORTED_EXTENSIONS = ('.pdf', '.html', '.txt', '.HTML', '.PDF', '.TXT')
 MIN_TEXT_LENGTH = 500  # For TextExtractor
@@ -133,11 +138,6 @@ class APIManager:
     """Manages API calls with rate limiting, caching, and retry logic"""
 
     def __init__(self):
-        self.cache = {}
-        self.last_call_time = 0
-        self.calls_this_minute = 0
-        self.minute_start = time.time()
-
         try:
             api_key = os.getenv('GEMINI_API_KEY')
             if not api_key:
@@ -161,91 +161,19 @@ class APIManager:
             safe_print(f"❌ Critical Error initializing Gemini Client: {e}")
             raise
 
-    def rate_limit(self):
-        """Implement rate limiting using global limiter"""
-        global_limiter.wait_for_quota()
+        self.llm = LLMClient(
+            transport=GeminiTransport(self.client),
+            limiter=global_limiter,
+            cache=PersistentCache(),
+            module='deep_reviewer',
+            json_config=self.json_generation_config,
+            retry_attempts=API_CONFIG['RETRY_ATTEMPTS'],
+            retry_delay=API_CONFIG['RETRY_DELAY']
+        )
 
     def cached_api_call(self, prompt: str, use_cache: bool = True) -> Optional[Any]:
         """Make API call with caching, validation, and retry logic"""
-        prompt_hash = hashlib.md5(prompt.encode('utf-8')).hexdigest()
-
-        if use_cache and prompt_hash in self.cache:
-            logger.debug(f"Cache hit for hash: {prompt_hash}")
-            safe_print("📦 Using cached response")
-            return self.cache[prompt_hash]
-
-        # Validate request before making API call
-        is_valid, reason = global_limiter.validate_request(prompt, {'response_mime_type': 'application/json'})
-        if not is_valid:
-            logger.error(f"Request validation failed: {reason}")
-            global_limiter.record_request(success=False)
-            return None
-        
-        # Check if we should abort due to error patterns
-        if global_limiter.should_abort_pipeline():
-            logger.critical("Pipeline abort recommended due to error patterns")
-            return None
-
-        logger.debug(f"Cache miss for hash: {prompt_hash}. Calling API...")
-        self.rate_limit()
-
-        response_text = ""
-        for attempt in range(API_CONFIG['RETRY_ATTEMPTS']):
-            try:
-                response = self.client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=prompt,
-                    config=self.json_generation_config
-                )
-
-                response_text = response.text
-                result = json.loads(response_text)
-                self.cache[prompt_hash] = result
-                # Record successful request
-                global_limiter.record_request(success=True)
-                return result
-            except json.JSONDecodeError as e:
-                logger.error(
-                    f"JSON decode error on attempt {attempt + 1}: {e}. Response text: '{response_text[:500]}...'")
-                # Categorize error
-                category = global_limiter.categorize_error(e, response_text)
-                action = global_limiter.get_action_for_error(category)
-                global_limiter.record_request(success=False, error_category=category, action=action)
-                
-                if action == ErrorAction.SKIP_DOCUMENT:
-                    logger.error(f"Skipping document due to {category.name}")
-                    return None
-                elif attempt < API_CONFIG['RETRY_ATTEMPTS'] - 1:
-                    time.sleep(API_CONFIG['RETRY_DELAY'])
-                else:
-                    logger.error("Max retries reached for JSON decode error.")
-            except Exception as e:
-                # Categorize error
-                category = global_limiter.categorize_error(e, str(e))
-                action = global_limiter.get_action_for_error(category)
-                global_limiter.record_request(success=False, error=e, response_text=str(e))
-                
-                if "DeadlineExceeded" in str(e) or "Timeout" in str(e):
-                    logger.error(f"API call timed out on attempt {attempt + 1}")
-                else:
-                    logger.error(f"API error on attempt {attempt + 1}: {type(e).__name__} - {e}")
-
-                if action == ErrorAction.ABORT_PIPELINE:
-                    logger.critical(f"Aborting due to {category.name}")
-                    return None
-                elif action == ErrorAction.SKIP_DOCUMENT:
-                    logger.error(f"Skipping document due to {category.name}")
-                    return None
-                elif "429" in str(e):
-                    logger.warning("Rate limit error detected by API, increasing sleep time.")
-                    time.sleep(API_CONFIG['RETRY_DELAY'] * (attempt + 2))
-                elif attempt < API_CONFIG['RETRY_ATTEMPTS'] - 1:
-                    time.sleep(API_CONFIG['RETRY_DELAY'])
-                else:
-                    logger.error("Max retries reached for API error.")
-
-        logger.error(f"API call failed after {API_CONFIG['RETRY_ATTEMPTS']} attempts.")
-        return None
+        return self.llm.call(prompt, is_json=True, use_cache=use_cache)
 
 
 # --- TextExtractor CLASS (Copied from Journal-Reviewer v3.1) ---
@@ -254,58 +182,12 @@ class TextExtractor:
     """Robust text extraction from multiple file formats"""
 
     @staticmethod
-    def extract_with_pypdf(filepath: str) -> Tuple[str, List[str]]:
-        """Extract text using pypdf, returning full text and page-wise text"""
-        full_text = ""
-        pages_text = []
-        try:
-            with open(filepath, 'rb') as f:
-                reader = pypdf.PdfReader(f)
-                page_count = len(reader.pages)
-                if page_count == 0:
-                    return "", []
-
-                for i, page in enumerate(reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            page_text_with_header = f"\n--- Page {i + 1} ---\n{page_text}\n"
-                            full_text += page_text_with_header
-                            pages_text.append(page_text_with_header)
-                        else:
-                            pages_text.append(f"\n--- Page {i + 1} ---\n[No text extracted]\n")
-                    except Exception:
-                        pages_text.append(f"\n--- Page {i + 1} ---\n[Error extracting page]\n")
-                return full_text, pages_text
-        except Exception as e:
-            logger.error(f"pypdf extraction failed for {os.path.basename(filepath)}: {e}")
-            return "", []
-
-    @staticmethod
-    def extract_with_pdfplumber(filepath: str) -> Tuple[str, List[str]]:
-        """Extract text using pdfplumber, returning full text and page-wise text"""
-        full_text = ""
-        pages_text = []
+    def extract_from_pdf(filepath: str) -> Tuple[str, List[str]]:
+        """Extract PDF text through the shared, SHA-256-cached page extractor"""
         try:
-            with pdfplumber.open(filepath) as pdf:
-                page_count = len(pdf.pages)
-                if page_count == 0:
-                    return "", []
-
-                for i, page in enumerate(pdf.pages):
-                    try:
-                        page_text = page.extract_text(x_tolerance=1, y_tolerance=1)
-                        if page_text:
-                            page_text_with_header = f"\n--- Page {i + 1} ---\n{page_text}\n"
-                            full_text += page_text_with_header
-                            pages_text.append(page_text_with_header)
-                        else:
-                            pages_text.append(f"\n--- Page {i + 1} ---\n[No text extracted]\n")
-                    except Exception:
-                        pages_text.append(f"\n--- Page {i + 1} ---\n[Error extracting page]\n")
-                return full_text, pages_text
+            return extract_document(filepath).paged_text()
         except Exception as e:
-            logger.error(f"pdfplumber extraction failed for {os.path.basename(filepath)}: {e}")
+            logger.error(f"PDF extraction failed for {os.path.basename(filepath)}: {e}")
             return "", []
 
     @staticmethod
@@ -342,14 +224,7 @@ class TextExtractor:
         if file_ext == '.html':
             full_text, pages_text = cls.extract_from_html(filepath)
         elif file_ext == '.pdf':
-            # Try pdfplumber first, fallback to pypdf
-            plumber_text, plumber_pages = cls.extract_with_pdfplumber(filepath)
-            pypdf_text, pypdf_pages = cls.extract_with_pypdf(filepath)
-
-            if len(plumber_text) >= len(pypdf_text):
-                full_text, pages_text = plumber_text, plumber_pages
-            else:
-                full_text, pages_text = pypdf_text, pypdf_pages
+            full_text, pages_text = cls.extract_from_pdf(filepath)
         elif file_ext == '.txt':
             try:
                 encodings_to_try = ['utf-8', 'cp1252', 'latin-1']
@@ -410,6 +285,9 @@ def load_research_db(filepath: str) -> Optional[pd.DataFrame]:
     if not os.path.exists(filepath):
         logger.error(f"Research DB not found: {filepath}")
         return None
+    store = open_research_store(filepath)
+    if store is not None:
+        return store.read_papers()
     try:
         return pd.read_csv(filepath, encoding='utf-8')
     except Exception as e:
@@ -831,6 +709,234 @@ def add_claim_to_version_history(
     logger.debug(f"Added claim {claim['claim_id']} to {filename}")
 
 
+# --- PARALLEL DEEP REVIEW ---
+
+def plan_deep_review(
+        gaps_to_review: List[Dict],
+        research_db: pd.DataFrame,
+        all_claims: List[Dict]
+) -> Dict[str, Dict]:
+    """
+    Plans the run: groups the promising (gap, paper) pairs by paper.
+
+    Returns:
+        {filename: {"paper_info": ..., "gaps": [...]}}, in the order papers are first needed
+    """
+    review_plan = {}
+    for i, gap in enumerate(gaps_to_review, 1):
+        gap_id = f"{gap['pillar'].split(':')[0]} / {gap['sub_requirement_key'].split(':')[0]}"
+        logger.info(f"\n--- Planning Gap {i}/{len(gaps_to_review)}: {gap_id} ---")
+        safe_print(f"\n--- Planning Gap {i}/{len(gaps_to_review)}: {gap_id} ---")
+
+        promising_papers = find_promising_papers(gap, research_db, all_claims)
+
+        if not promising_papers:
+            logger.info(f"No promising papers found for this gap (all may be 'approved' or 'pending').")
+            safe_print(f"  No new papers to review for this gap.")
+            continue
+
+        logger.info(f"  Found {len(promising_papers)} promising papers to scan.")
+        for paper_info in promising_papers:
+            filename = paper_info.get('FILENAME', 'N/A')
+            review_plan.setdefault(filename, {"paper_info": paper_info, "gaps": []})["gaps"].append(gap)
+
+    return review_plan
+
+
+def load_paper_text(filename: str, text_extractor: TextExtractor) -> Optional[Tuple[str, List[str]]]:
+    """Finds and extracts a paper. Returns (full_text, pages_text), or None if unusable."""
+    filepath = find_paper_filepath(filename, PAPERS_FOLDER)
+    if not filepath:
+        logger.warning(f"    Could not find file {filename}. Skipping.")
+        safe_print(f"    ❌ Could not find file {filename}. Skipping.")
+        return None
+
+    full_text, pages_text = text_extractor.robust_text_extraction(filepath)
+
+    if not full_text or len(full_text) < MIN_TEXT_LENGTH:
+        logger.warning(f"    Text extraction failed or text too short for {filename}. Skipping.")
+        safe_print(f"    ❌ Text extraction failed for {filename}. Skipping.")
+        return None
+    return full_text, pages_text
+
+
+def build_paper_prompts(
+        paper_info: Dict,
+        gaps: List[Dict],
+        full_text: str,
+        pages_text: List[str],
+        all_claims: List[Dict]
+) -> List[List[Tuple[str, str]]]:
+    """
+    Builds one paper's deep review prompts: for each gap, one per chunk.
+
+    Returns:
+        Per gap, a list of (page_range, prompt) in chunk order
+    """
+    filename = paper_info.get('FILENAME', 'N/A')
+
+    # Check if document needs chunking
+    total_text_length = len(full_text)
+    if total_text_length > REVIEW_CONFIG['DEEP_REVIEWER_CHUNK_SIZE']:
+        logger.info(f"    Deep Reviewer: {filename} is large ({total_text_length} chars). Chunking at {REVIEW_CONFIG['DEEP_REVIEWER_CHUNK_SIZE']} chars.")
+        # Chunk the pages with page tracking
+        page_chunks = chunk_pages_with_tracking(pages_text, REVIEW_CONFIG['DEEP_REVIEWER_CHUNK_SIZE'])
+    else:
+        page_chunks = [(pages_text, "Full Document")]
+
+    prompts = []
+    for gap in gaps:
+        # Find all existing claims for this specific paper+gap
+        existing_claims_for_paper = [
+            claim for claim in all_claims
+            if claim.get('filename') == filename
+               and claim.get('sub_requirement') == gap['sub_requirement_key']
+        ]
+        prompts.append([
+            (page_range, build_deep_review_prompt(gap, paper_info, chunk_pages, existing_claims_for_paper, page_range))
+            for chunk_pages, page_range in page_chunks
+        ])
+    return prompts
+
+
+def review_chunk(api_manager, prompt: str, label: str) -> Optional[Dict]:
+    """Sends one chunk prompt. Returns the response if it has 'new_claims', else None."""
+    logger.info(f"    Deep Reviewer: Processing chunk {label}")
+    try:
+        # Use cache=False to ensure we re-analyze for *new* claims
+        # if the context (e.g., existing claims) has changed.
+        response = api_manager.cached_api_call(prompt, use_cache=False)
+    except Exception as e:
+        logger.error(f"    Deep Reviewer: Error processing chunk {label}: {e}")
+        return None
+
+    if response and "new_claims" in response:
+        logger.info(f"    Deep Reviewer: Chunk {label} returned {len(response.get('new_claims', []))} potential claims")
+        return response
+    logger.warning(f"    Deep Reviewer: Chunk {label} returned invalid response")
+    return None
+
+
+def collect_paper_claims(paper_info: Dict, gaps: List[Dict], chunk_responses: List[List[Optional[Dict]]]) -> List[Dict]:
+    """
+    Turns one paper's chunk responses into new requirement entries.
+
+    Args:
+        paper_info: Paper row from the research DB
+        gaps: Gaps the paper was reviewed for
+        chunk_responses: Per gap, the chunk responses in chunk order (None for failed chunks)
+    """
+    filename = paper_info.get('FILENAME', 'N/A')
+    new_requirements = []
+    for gap, responses in zip(gaps, chunk_responses):
+        chunk_results = [response for response in responses if response is not None]
+        if len(responses) > 1:
+            # Aggregate results from all chunks
+            aggregated_claims = aggregate_deep_review_results(chunk_results)
+            if not chunk_results:
+                logger.warning(f"    Deep Reviewer: No valid chunk results for {filename}")
+            new_claims_data = aggregated_claims
+        elif chunk_results:
+            new_claims_data = chunk_results[0]["new_claims"]
+        else:
+            logger.error(f"    API call failed or returned invalid JSON for {filename}.")
+            safe_print(f"    ❌ API call failed for {filename}.")
+            continue
+
+        if not new_claims_data:
+            logger.info(f"    No *new* evidence found in {filename} for {gap['sub_requirement_key']}.")
+            continue
+        new_requirements.extend(create_requirement_entry(claim_data, paper_info, gap) for claim_data in new_claims_data)
+    return new_requirements
+
+
+def run_deep_review(
+        review_plan: Dict[str, Dict],
+        api_manager,
+        text_extractor: TextExtractor,
+        history_store,
+        all_claims: List[Dict]
+) -> int:
+    """
+    Runs the planned (gap, paper, chunk) prompts and saves the new claims.
+
+    Each paper is extracted once per run, by REVIEW_CONFIG['EXTRACTION_WORKERS']
+    background threads, so parsing overlaps with API calls. Chunk prompts for all
+    gaps are sent by up to REVIEW_CONFIG['MAX_CONCURRENT_CHUNKS'] workers, each
+    call waiting on the global rate limiter. A paper's new claims are added to
+    version history in one transaction once its last chunk has finished.
+
+    Returns:
+        Number of new claims saved
+    """
+    existing_claim_ids = {claim.get('claim_id') for claim in all_claims}
+    new_claims_found = 0
+    chunk_responses: Dict[str, List[List[Optional[Dict]]]] = {}
+    chunks_left: Dict[str, int] = {}
+
+    def save_paper_claims(filename: str) -> int:
+        entry = review_plan[filename]
+        new_claims = []
+        for new_requirement in collect_paper_claims(entry["paper_info"], entry["gaps"], chunk_responses.pop(filename)):
+            if new_requirement['claim_id'] in existing_claim_ids:
+                logger.warning(f"    Duplicate claim ID detected. Skipping.")
+                continue
+            existing_claim_ids.add(new_requirement['claim_id'])
+            new_claims.append(new_requirement)
+            safe_print(f"    ✅ Found new claim in {filename}! (Confidence: {new_requirement['reviewer_confidence']:.1f})")
+        if not new_claims:
+            safe_print(f"    No *new* evidence found in {filename}.")
+            return 0
+        # Add the claims to the latest version of the paper's history
+        added = history_store.add_claims(new_claims, filename=filename, status='deep_reviewer_claims',
+                                         amend_latest=True, create_missing=True)
+        logger.info(f"    ✅ Saved {added} new claims for {filename}")
+        return added
+
+    extraction_workers = max(1, int(REVIEW_CONFIG.get('EXTRACTION_WORKERS', 1)))
+    chunk_workers = max(1, int(REVIEW_CONFIG.get('MAX_CONCURRENT_CHUNKS', 1)))
+    logger.info(f"Deep review of {len(review_plan)} papers with {extraction_workers} extraction "
+                f"and {chunk_workers} chunk workers")
+
+    with ThreadPoolExecutor(max_workers=extraction_workers, thread_name_prefix="deep-review-extract") as extract_pool, \
+            ThreadPoolExecutor(max_workers=chunk_workers, thread_name_prefix="deep-review-chunk") as chunk_pool:
+        # future -> (filename, None) for extractions, (filename, (gap index, chunk index)) for chunk prompts
+        outstanding = {extract_pool.submit(load_paper_text, filename, text_extractor): (filename, None)
+                       for filename in review_plan}
+
+        while outstanding:
+            done, _ = wait(outstanding, return_when=FIRST_COMPLETED)
+            for future in done:
+                filename, slot = outstanding.pop(future)
+                entry = review_plan[filename]
+                try:
+                    if slot is None:
+                        paper_text = future.result()
+                        if paper_text is None:
+                            continue
+                        prompts = build_paper_prompts(entry["paper_info"], entry["gaps"], *paper_text, all_claims)
+                        chunk_responses[filename] = [[None] * len(gap_prompts) for gap_prompts in prompts]
+                        chunks_left[filename] = sum(len(gap_prompts) for gap_prompts in prompts)
+                        safe_print(f"  Scanning paper: {filename} ({len(entry['gaps'])} gaps, {chunks_left[filename]} prompts)")
+                        for gap_index, gap_prompts in enumerate(prompts):
+                            for chunk_index, (page_range, prompt) in enumerate(gap_prompts):
+                                label = f"{chunk_index + 1}/{len(gap_prompts)} ({page_range}) of {filename}"
+                                outstanding[chunk_pool.submit(review_chunk, api_manager, prompt, label)] = \
+                                    (filename, (gap_index, chunk_index))
+                        continue
+
+                    gap_index, chunk_index = slot
+                    chunk_responses[filename][gap_index][chunk_index] = future.result()
+                    chunks_left[filename] -= 1
+                    if chunks_left[filename] == 0:
+                        new_claims_found += save_paper_claims(filename)
+                except Exception as e:
+                    logger.critical(f"    CRITICAL UNHANDLED ERROR on file {filename}: {e}")
+                    safe_print(f"    ❌ CRITICAL ERROR on {filename}. See log. Skipping.")
+
+    return new_claims_found
+
+
 # --- MAIN EXECUTION ---
 def main():
     start_time = time.time()
@@ -856,7 +962,7 @@ def main():
     safe_print("\n=== LOADING DATABASES ===")
     gap_report = load_gap_report(GAP_REPORT_FILE)
     research_db = load_research_db(RESEARCH_DB_FILE)
-    version_history = load_version_history(VERSION_HISTORY_FILE)
+    history_store = open_version_history(VERSION_HISTORY_FILE)
     directions = load_directions(DEEP_REVIEW_DIRECTIONS_FILE)
 
     if not gap_report or research_db is None:
@@ -878,136 +984,20 @@ def main():
     safe_print(f"Found {len(gaps_to_review)} sub-requirement gaps to analyze.")
 
     # Extract all claims from version history for comparison
-    all_claims = get_all_claims_from_history(version_history)
+    all_claims = [{**claim, 'filename': filename} for filename, claim in history_store.claims()]
     logger.info(f"Found {len(all_claims)} existing claims in version history")
-    
-    new_claims_found = 0
-    existing_claim_ids = {claim.get('claim_id') for claim in all_claims}
 
-    for i, gap in enumerate(gaps_to_review, 1):
-        gap_id = f"{gap['pillar'].split(':')[0]} / {gap['sub_requirement_key'].split(':')[0]}"
-        logger.info(f"\n--- Processing Gap {i}/{len(gaps_to_review)}: {gap_id} ---")
-        safe_print(f"\n--- Processing Gap {i}/{len(gaps_to_review)}: {gap_id} ---")
-
-        promising_papers = find_promising_papers(gap, research_db, all_claims)
-
-        if not promising_papers:
-            logger.info(f"No promising papers found for this gap (all may be 'approved' or 'pending').")
-            safe_print(f"  No new papers to review for this gap.")
-            continue
+    review_plan = plan_deep_review(gaps_to_review, research_db, all_claims)
+    logger.info(f"Planned deep review of {len(review_plan)} papers.")
+    safe_print(f"Planned deep review of {len(review_plan)} papers.")
 
-        logger.info(f"  Found {len(promising_papers)} promising papers to scan.")
-
-        for paper_info in promising_papers:
-            filename = paper_info.get('FILENAME', 'N/A')
-            logger.info(f"  Scanning paper: {filename}")
-            safe_print(f"  Scanning paper: {filename}")
-
-            try:
-                filepath = find_paper_filepath(filename, PAPERS_FOLDER)
-                if not filepath:
-                    logger.warning(f"    Could not find file {filename}. Skipping.")
-                    safe_print(f"    ❌ Could not find file {filename}. Skipping.")
-                    continue
-
-                # Re-extract the full text, page by page
-                full_text, pages_text = text_extractor.robust_text_extraction(filepath)
-
-                if not full_text or len(full_text) < MIN_TEXT_LENGTH:
-                    logger.warning(f"    Text extraction failed or text too short for {filename}. Skipping.")
-                    safe_print(f"    ❌ Text extraction failed for {filename}. Skipping.")
-                    continue
-
-                # Find all existing claims for this specific paper+gap
-                existing_claims_for_paper = [
-                    claim for claim in all_claims
-                    if claim.get('filename') == filename
-                       and claim.get('sub_requirement') == gap['sub_requirement_key']
-                ]
-
-                # Check if document needs chunking
-                total_text_length = len(full_text)
-                if total_text_length > REVIEW_CONFIG['DEEP_REVIEWER_CHUNK_SIZE']:
-                    logger.info(f"    Deep Reviewer: Document is large ({total_text_length} chars). Chunking at {REVIEW_CONFIG['DEEP_REVIEWER_CHUNK_SIZE']} chars.")
-                    safe_print(f"    Large document detected. Processing in chunks...")
-                    
-                    # Chunk the pages with page tracking
-                    page_chunks = chunk_pages_with_tracking(pages_text, REVIEW_CONFIG['DEEP_REVIEWER_CHUNK_SIZE'])
-                    chunk_results = []
-                    
-                    # Process each chunk
-                    for chunk_num, (chunk_pages, page_range) in enumerate(page_chunks, 1):
-                        logger.info(f"    Deep Reviewer: Processing chunk {chunk_num}/{len(page_chunks)} ({page_range})")
-                        safe_print(f"    Processing chunk {chunk_num}/{len(page_chunks)} ({page_range})")
-                        
-                        # Build prompt for this chunk
-                        prompt = build_deep_review_prompt(gap, paper_info, chunk_pages, existing_claims_for_paper, page_range)
-                        
-                        try:
-                            # Call API for this chunk
-                            chunk_response = api_manager.cached_api_call(prompt, use_cache=False)
-                            
-                            if chunk_response and "new_claims" in chunk_response:
-                                chunk_results.append(chunk_response)
-                                logger.info(f"    Deep Reviewer: Chunk {chunk_num} returned {len(chunk_response.get('new_claims', []))} potential claims")
-                            else:
-                                logger.warning(f"    Deep Reviewer: Chunk {chunk_num} returned invalid response")
-                                
-                        except Exception as e:
-                            logger.error(f"    Deep Reviewer: Error processing chunk {chunk_num}: {e}")
-                    
-                    # Aggregate results from all chunks
-                    if chunk_results:
-                        aggregated_claims = aggregate_deep_review_results(chunk_results)
-                        # Create a synthetic response with aggregated claims
-                        ai_response = {"new_claims": aggregated_claims}
-                        logger.info(f"    Deep Reviewer: Aggregated {len(aggregated_claims)} unique claims from {len(chunk_results)} chunks")
-                    else:
-                        ai_response = {"new_claims": []}
-                        logger.warning(f"    Deep Reviewer: No valid chunk results for {filename}")
-                else:
-                    # Document is small enough, process normally
-                    prompt = build_deep_review_prompt(gap, paper_info, pages_text, existing_claims_for_paper, "Full Document")
-
-                    # Use cache=False to ensure we re-analyze for *new* claims
-                    # if the context (e.g., existing claims) has changed.
-                    ai_response = api_manager.cached_api_call(prompt, use_cache=False)
-
-                # Process the response (same for chunked and non-chunked)
-                if ai_response and "new_claims" in ai_response:
-                    new_claims_data = ai_response["new_claims"]
-                    if not new_claims_data:
-                        logger.info(f"    No *new* evidence found in {filename}.")
-                        safe_print(f"    No *new* evidence found.")
-                        continue
-
-                    for claim_data in new_claims_data:
-                        new_requirement = create_requirement_entry(claim_data, paper_info, gap)
-
-                        if new_requirement['claim_id'] not in existing_claim_ids:
-                            # Add claim to version history
-                            add_claim_to_version_history(version_history, filename, new_requirement)
-                            existing_claim_ids.add(new_requirement['claim_id'])
-                            new_claims_found += 1
-                            logger.info(f"    ✅ Found new claim in {filename}!")
-                            safe_print(
-                                f"    ✅ Found new claim! (Confidence: {new_requirement['reviewer_confidence']:.1f})")
-                        else:
-                            logger.warning(f"    Duplicate claim ID detected. Skipping.")
-
-                else:
-                    logger.error(f"    API call failed or returned invalid JSON for {filename}.")
-                    safe_print(f"    ❌ API call failed for {filename}.")
-
-            except Exception as e:
-                logger.critical(f"    CRITICAL UNHANDLED ERROR on file {filename}: {e}")
-                safe_print(f"    ❌ CRITICAL ERROR on {filename}. See log. Skipping.")
+    new_claims_found = run_deep_review(review_plan, api_manager, text_extractor, history_store, all_claims)
 
     logger.info("\n" + "=" * 80)
     logger.info("DEEP REVIEW COMPLETE")
 
     if new_claims_found > 0:
-        save_version_history(VERSION_HISTORY_FILE, version_history)
+        history_store.export_json(VERSION_HISTORY_FILE)
         logger.info(f"Found and saved {new_claims_found} new claims.")
         safe_print(f"✅ Found and saved {new_claims_found} new claims to `{VERSION_HISTORY_FILE}`")
         safe_print("  Ready for 'Judge' script review.")
@@ -10,11 +10,11 @@ import sys
 import json
 import csv
 import re
-import pypdf
-import pdfplumber
 import time
 import hashlib
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
 # Use google.genai (new SDK) for Client() interface
@@ -26,13 +26,17 @@ import logging
 from dataclasses import dataclass, asdict
 import pickle
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import warnings
 from pathlib import Path
 
 # Import global rate limiter
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.global_rate_limiter import global_limiter, ErrorAction
+from utils.global_rate_limiter import global_limiter
+from literature_review.utils.llm_client import LLMClient, GeminiTransport, PersistentCache
+from literature_review.utils.text_extraction import extract_document
+from literature_review.io.research_store import open_research_store
+from literature_review.io.version_history_store import open_version_history
+from literature_review.io.vector_index import VectorIndex
 
 # Note: pandas is imported locally in the function that needs it
 # import pandas as pd
@@ -66,7 +70,8 @@ OUTPUT_CSV_FILE = 'neuromorphic-research_database.csv'
 NON_JOURNAL_CSV_FILE = 'non-journal_database.csv'
 DUPLICATE_MODE = 'skip'
 CACHE_DIR = 'cache'
-EMBEDDINGS_CACHE = os.path.join(CACHE_DIR, 'embeddings_cache.pkl')
+EMBEDDINGS_CACHE = os.path.join(CACHE_DIR, 'embeddings_cache.npy')
+LEGACY_EMBEDDINGS_CACHE = os.path.join(CACHE_DIR, 'embeddings_cache.pkl')
 VERSION_HISTORY_FILE = 'review_version_history.json'
 
 # --- NEW: Definitions file for cross-referencing ---
@@ -78,11 +83,19 @@ REVIEW_CONFIG = {
     "RETRY_DELAY": 5,
     "CACHE_EMBEDDINGS": True,
     "SIMILARITY_THRESHOLD": 0.85,
+    "SIMILAR_PAPERS_TOP_K": 10,  # Most similar papers returned by find_similar_papers
+    "EMBEDDING_INDEX_BACKEND": "exact",  # "exact" or "hnsw" (needs the optional hnswlib package)
+    "EMBEDDING_BATCH_SIZE": 64,  # Texts per SentenceTransformer encode call
     "MIN_TEXT_LENGTH": 500,
     "CHUNK_SIZE": 100000,
     "API_CALLS_PER_MINUTE": 10,  # Conservative limit for gemini-2.5-flash (1000 RPM available)
     "CONSENSUS_EVALUATIONS": 1,
-    "API_TIMEOUT": 600
+    "CONSENSUS_TEMPERATURES": [0.2, 0.5, 0.8],  # Sampling temperature per consensus evaluation (the first is the default config's)
+    "CONSENSUS_EARLY_STOP": True,  # Skip further evaluations when the first two agree on the numeric scores
+    "CONSENSUS_SCORE_TOLERANCE": 10,  # Max difference per numeric score for evaluations to agree
+    "API_TIMEOUT": 600,
+    "MAX_CONCURRENT_PAPERS": 1,  # Papers analyzed in parallel per batch (1 = sequential)
+    "MAX_CONCURRENT_CHUNKS": 4  # Chunk summaries requested in parallel per large paper (1 = sequential)
 }
 
 SUPPORTED_EXTENSIONS = ('.pdf', '.html', '.txt', '.HTML', '.PDF', '.TXT')
@@ -197,10 +210,6 @@ def collect_papers_to_process(folder_path, reviewed_files):
 class APIManager:
     """Manages API calls with rate limiting, caching, and retry logic"""
     def __init__(self):
-        self.cache = {}
-        self.last_call_time = 0
-        self.calls_this_minute = 0
-        self.minute_start = time.time()
         try:
             api_key = os.getenv('GEMINI_API_KEY')
             if not api_key:
@@ -228,6 +237,16 @@ class APIManager:
             logger.critical(f"[ERROR] Critical Error initializing Gemini Client: {e}")
             safe_print(f"❌ Critical Error initializing Gemini Client: {e}")
             raise
+        self.llm = LLMClient(
+            transport=GeminiTransport(self.client),
+            limiter=global_limiter,
+            cache=PersistentCache(),
+            module='journal_reviewer',
+            json_config=self.json_generation_config,
+            text_config=self.text_generation_config,
+            retry_attempts=REVIEW_CONFIG['RETRY_ATTEMPTS'],
+            retry_delay=REVIEW_CONFIG['RETRY_DELAY']
+        )
         try:
             self.embedder = SentenceTransformer('all-MiniLM-L6-v2')
             logger.info("[SUCCESS] Sentence Transformer initialized.")
@@ -237,93 +256,28 @@ class APIManager:
             safe_print(f"⚠️ Could not initialize Sentence Transformer: {e}")
             self.embedder = None
 
-    def rate_limit(self):
-        """Implement rate limiting using global limiter"""
-        global_limiter.wait_for_quota()
-
     def cached_api_call(self, prompt: str, use_cache: bool = True, is_json: bool = True) -> Optional[Any]:
         """Make API call with caching, validation, and retry logic"""
-        prompt_hash = hashlib.md5(prompt.encode('utf-8')).hexdigest()
-        if use_cache and prompt_hash in self.cache:
-            logger.debug(f"Cache hit for hash: {prompt_hash}")
-            safe_print("📦 Using cached response")
-            return self.cache[prompt_hash]
-        
-        # Validate request before making API call
-        is_valid, reason = global_limiter.validate_request(prompt, {'response_mime_type': 'application/json' if is_json else None})
-        if not is_valid:
-            logger.error(f"Request validation failed: {reason}")
-            global_limiter.record_request(success=False)
-            return None
-        
-        # Check if we should abort due to error patterns
-        if global_limiter.should_abort_pipeline():
-            logger.critical("Pipeline abort recommended due to error patterns")
-            return None
-        
-        logger.debug(f"Cache miss for hash: {prompt_hash}. Calling API...")
-        self.rate_limit()
-        response_text = ""
-        for attempt in range(REVIEW_CONFIG['RETRY_ATTEMPTS']):
-            try:
-                current_config_object = self.json_generation_config if is_json else self.text_generation_config
-                response = self.client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=prompt,
-                    config=current_config_object
-                )
-                response_text = response.text
-                if is_json:
-                    result = json.loads(response_text)
-                else:
-                    result = response_text
-                self.cache[prompt_hash] = result
-                # Record successful request
-                global_limiter.record_request(success=True)
-                return result
-            except json.JSONDecodeError as e:
-                logger.error(
-                    f"JSON decode error on attempt {attempt + 1}: {e}. Response text: '{response_text[:500]}...'")
-                # Categorize error
-                category = global_limiter.categorize_error(e, response_text)
-                action = global_limiter.get_action_for_error(category)
-                global_limiter.record_request(success=False, error_category=category, action=action)
-                
-                if action == ErrorAction.SKIP_DOCUMENT:
-                    logger.error(f"Skipping document due to {category.name}")
-                    return None
-                elif attempt < REVIEW_CONFIG['RETRY_ATTEMPTS'] - 1:
-                    time.sleep(REVIEW_CONFIG['RETRY_DELAY'])
-                else:
-                    logger.error("Max retries reached for JSON decode error.")
-            except Exception as e:
-                # Categorize error
-                category = global_limiter.categorize_error(e, str(e))
-                action = global_limiter.get_action_for_error(category)
-                global_limiter.record_request(success=False, error=e, response_text=str(e))
-                
-                if "DeadlineExceeded" in str(e) or "Timeout" in str(e):
-                    logger.error(f"API call timed out on attempt {attempt + 1}")
-                else:
-                    logger.error(f"API error on attempt {attempt + 1}: {type(e).__name__} - {e}")
-                
-                if action == ErrorAction.ABORT_PIPELINE:
-                    logger.critical(f"Aborting due to {category.name}")
-                    return None
-                elif action == ErrorAction.SKIP_DOCUMENT:
-                    logger.error(f"Skipping document due to {category.name}")
-                    return None
-                elif "429" in str(e):
-                    logger.warning("Rate limit error detected by API, increasing sleep time.")
-                    time.sleep(REVIEW_CONFIG['RETRY_DELAY'] * (attempt + 2))
-                elif attempt < REVIEW_CONFIG['RETRY_ATTEMPTS'] - 1:
-                    # Use delay from action's value tuple (name, delay_seconds)
-                    _, delay = action.value
-                    time.sleep(delay if delay > 0 else REVIEW_CONFIG['RETRY_DELAY'])
-                else:
-                    logger.error("Max retries reached for API error.")
-        logger.error(f"API call failed after {REVIEW_CONFIG['RETRY_ATTEMPTS']} attempts.")
-        return None
+        return self.llm.call(prompt, is_json=is_json, use_cache=use_cache)
+
+    def call_with_temperature(self, prompt: str, temperature: float, cache_key: Optional[str] = None,
+                              is_json: bool = True) -> Optional[Any]:
+        """
+        Make API call sampled at a custom temperature (for consensus evaluations).
+
+        Args:
+            prompt: The prompt to send to the API
+            temperature: Sampling temperature replacing the default config's
+            cache_key: Optional custom cache key, so each sample is cached separately
+            is_json: Whether to expect JSON response
+        """
+        base_config = self.llm.json_config if is_json else self.llm.text_config
+        if base_config is not None:
+            config = base_config.model_copy(update={'temperature': temperature})
+        else:
+            config = types.GenerateContentConfig(temperature=temperature,
+                                                 response_mime_type="application/json" if is_json else None)
+        return self.llm.call(prompt, is_json=is_json, cache_key=cache_key, config=config)
 
 
 # --- 2. File Handling and Text Extraction (Unchanged) ---
@@ -356,63 +310,16 @@ class TextExtractor:
         return is_valid, indicators
 
     @staticmethod
-    def extract_with_pypdf(filepath: str) -> Tuple[str, float]:
-        """Extract text using pypdf"""
-        text = ""
-        quality = 0.0
-        page_count = 0
+    def extract_from_pdf(filepath: str) -> Tuple[str, str, float]:
+        """Extract PDF text through the shared, SHA-256-cached page extractor"""
         try:
-            with open(filepath, 'rb') as f:
-                reader = pypdf.PdfReader(f)
-                page_count = len(reader.pages)
-                if page_count == 0:
-                    logger.warning(f"pypdf found 0 pages in {os.path.basename(filepath)}")
-                    return "", 0.0
-                extracted_chars = 0
-                for page in reader.pages:
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                            extracted_chars += len(page_text)
-                    except Exception as page_e:
-                        logger.warning(f"pypdf error on page: {page_e}")
-                if page_count > 0:
-                    quality = min(extracted_chars / (page_count * 1500.0), 1.0)
-                logger.debug(f"pypdf extracted ~{len(text)} chars, quality score: {quality:.2f}")
-                return text, quality
+            document = extract_document(filepath)
         except Exception as e:
-            logger.error(f"pypdf extraction failed for {os.path.basename(filepath)}: {e}")
-            return "", 0.0
-
-    @staticmethod
-    def extract_with_pdfplumber(filepath: str) -> Tuple[str, float]:
-        """Extract text using pdfplumber"""
-        text = ""
-        quality = 0.0
-        page_count = 0
-        try:
-            with pdfplumber.open(filepath) as pdf:
-                page_count = len(pdf.pages)
-                if page_count == 0:
-                    logger.warning(f"pdfplumber found 0 pages in {os.path.basename(filepath)}")
-                    return "", 0.0
-                extracted_chars = 0
-                for i, page in enumerate(pdf.pages):
-                    try:
-                        page_text = page.extract_text(x_tolerance=1, y_tolerance=1)
-                        if page_text:
-                            text += page_text + "\n"
-                            extracted_chars += len(page_text)
-                    except Exception as page_e:
-                        logger.warning(f"pdfplumber error on page {i + 1}: {page_e}")
-                if page_count > 0:
-                    quality = min(extracted_chars / (page_count * 1500.0), 1.0)
-                logger.debug(f"pdfplumber extracted ~{len(text)} chars, quality score: {quality:.2f}")
-                return text, quality
-        except Exception as e:
-            logger.error(f"pdfplumber extraction failed for {os.path.basename(filepath)}: {e}")
-            return "", 0.0
+            logger.error(f"PDF extraction failed for {os.path.basename(filepath)}: {e}")
+            return "", "none", 0.0
+        if document.from_cache:
+            logger.debug(f"Using cached page text for {os.path.basename(filepath)}")
+        return document.text, document.method, document.quality
 
     @staticmethod
     def extract_from_html(filepath: str) -> Tuple[str, float]:
@@ -446,15 +353,7 @@ class TextExtractor:
             text, quality = cls.extract_from_html(filepath)
             method = "html_parser"
         elif file_ext == '.pdf':
-            methods_to_try = [("pdfplumber", cls.extract_with_pdfplumber), ("pypdf", cls.extract_with_pypdf)]
-            best_text, best_quality, best_method = "", 0.0, "none"
-            for method_name, method_func in methods_to_try:
-                current_text, current_quality = method_func(filepath)
-                if len(current_text) > len(best_text):
-                    best_text, best_quality, best_method = current_text, current_quality, method_name
-                elif best_method == "none":
-                    best_text, best_quality, best_method = current_text, current_quality, method_name
-            text, quality, method = best_text, best_quality, best_method
+            text, method, quality = cls.extract_from_pdf(filepath)
             if method == "none":
                 logger.error(f"All PDF extraction methods failed for {os.path.basename(filepath)}")
         elif file_ext == '.txt':
@@ -508,26 +407,27 @@ def extract_text_with_provenance(file_path: str) -> List[Dict]:
     cumulative_chars = 0
     
     try:
-        with pdfplumber.open(file_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, start=1):
-                text = page.extract_text() or ""
-                
-                # Detect section heading
-                section = detect_section_heading(text)
-                
-                page_metadata = {
-                    "page_num": page_num,
-                    "text": text,
-                    "section": section or "Unknown",
-                    "char_start": cumulative_chars,
-                    "char_end": cumulative_chars + len(text)
-                }
-                
-                pages_with_metadata.append(page_metadata)
-                cumulative_chars += len(text)
+        document = extract_document(file_path)
     except Exception as e:
         logger.error(f"Error extracting text with provenance from {file_path}: {e}")
         return []
+
+    for page_num, text in enumerate(document.pages, start=1):
+        text = text or ""
+        
+        # Detect section heading
+        section = detect_section_heading(text)
+        
+        page_metadata = {
+            "page_num": page_num,
+            "text": text,
+            "section": section or "Unknown",
+            "char_start": cumulative_chars,
+            "char_end": cumulative_chars + len(text)
+        }
+        
+        pages_with_metadata.append(page_metadata)
+        cumulative_chars += len(text)
     
     return pages_with_metadata
 
@@ -680,11 +580,24 @@ class PaperAnalyzer:
     # Required JSON keys for validation (same as DATABASE_COLUMN_ORDER for journal papers)
     REQUIRED_JSON_KEYS = DATABASE_COLUMN_ORDER
 
+    # Scores averaged across consensus evaluations
+    CONSENSUS_NUMERIC_FIELDS = ['CORE_DOMAIN_RELEVANCE_SCORE', 'SUBDOMAIN_RELEVANCE_TO_RESEARCH_SCORE',
+                                'REPRODUCIBILITY_SCORE', 'BIOLOGICAL_FIDELITY']
+
     NON_JOURNAL_JSON_KEYS = [
         "FILENAME", "DOCUMENT_TYPE", "DETECTED_TOPICS", "KEY_CONCEPTS",
         "POTENTIAL_SEARCH_KEYWORDS", "SUMMARY_NOTES"
     ]
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def compact_pillar_context(pillar_definitions_str: str) -> str:
+        """Minified pillar definitions for chunk prompts (unchanged if the string is not JSON)."""
+        try:
+            return json.dumps(json.loads(pillar_definitions_str), separators=(',', ':'), ensure_ascii=False)
+        except (json.JSONDecodeError, TypeError):
+            return pillar_definitions_str
+
     # --- MODIFIED: Chunk prompt now needs to be aware of requirements ---
     @staticmethod
     def get_chunk_summary_prompt(chunk_text: str, chunk_num: int, total_chunks: int, pillar_definitions_str: str) -> str:
@@ -717,7 +630,13 @@ Do not include introductory or concluding phrases.
 
     @staticmethod
     def summarize_text_chunks(full_text: str, api_manager: APIManager, pillar_definitions_str: str) -> str:
-        """Splits large text, summarizes each chunk, and compiles the summaries."""
+        """
+        Splits large text, summarizes each chunk, and compiles the summaries.
+
+        Up to REVIEW_CONFIG['MAX_CONCURRENT_CHUNKS'] chunks are summarized in parallel
+        (each call still waits on the global rate limiter); summaries are compiled in
+        chunk order. Chunk prompts carry the minified pillar definitions.
+        """
         chunk_size = REVIEW_CONFIG['CHUNK_SIZE']
         overlap = int(chunk_size * 0.1)
         chunks = [full_text[i:i + chunk_size] for i in range(0, len(full_text), chunk_size - overlap)]
@@ -727,26 +646,33 @@ Do not include introductory or concluding phrases.
 
         logger.info(f"Document ({len(full_text)} chars) split into {len(chunks)} chunks for summarization.")
         safe_print(f"   Split into {len(chunks)} chunks for summarization...")
+        pillar_context = PaperAnalyzer.compact_pillar_context(pillar_definitions_str)
 
-        compiled_summary = "[[[ This document was summarized from multiple chunks due to its length. Key points from each chunk follow: ]]]\n\n"
-        successful_summaries = 0
-        for i, chunk in enumerate(chunks):
+        def summarize_chunk(i: int) -> Optional[str]:
             logger.info(f"Summarizing chunk {i + 1}/{len(chunks)}...")
-            safe_print(f"   Summarizing chunk {i + 1}/{len(chunks)}...")
-
-            # --- MODIFIED: Pass pillar definitions string ---
-            prompt = PaperAnalyzer.get_chunk_summary_prompt(chunk, i + 1, len(chunks), pillar_definitions_str)
+            prompt = PaperAnalyzer.get_chunk_summary_prompt(chunks[i], i + 1, len(chunks), pillar_context)
             logger.info(f"Sending chunk summary prompt ({len(prompt)} chars) to API...")
+            return api_manager.cached_api_call(prompt, is_json=False)
 
-            chunk_summary = api_manager.cached_api_call(prompt, is_json=False)
+        max_workers = max(1, min(int(REVIEW_CONFIG.get('MAX_CONCURRENT_CHUNKS', 1)), len(chunks)))
+        if max_workers > 1:
+            safe_print(f"   Summarizing {len(chunks)} chunks with {max_workers} concurrent workers...")
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chunk-worker") as executor:
+                chunk_summaries = list(executor.map(summarize_chunk, range(len(chunks))))
+        else:
+            chunk_summaries = [summarize_chunk(i) for i in range(len(chunks))]
 
+        parts = ["[[[ This document was summarized from multiple chunks due to its length. Key points from each chunk follow: ]]]\n\n"]
+        successful_summaries = 0
+        for i, chunk_summary in enumerate(chunk_summaries):
+            parts.append(f"\n--- SUMMARY OF CHUNK {i + 1}/{len(chunks)} ---\n")
             if chunk_summary:
-                compiled_summary += f"\n--- SUMMARY OF CHUNK {i + 1}/{len(chunks)} ---\n"
-                compiled_summary += chunk_summary.strip() + "\n"
+                parts.append(chunk_summary.strip() + "\n")
                 successful_summaries += 1
             else:
                 logger.error(f"Failed to summarize chunk {i + 1}.")
-                compiled_summary += f"\n--- SUMMARY OF CHUNK {i + 1}/{len(chunks)} ---\n[[[ Summarization Failed ]]]\n"
+                parts.append("[[[ Summarization Failed ]]]\n")
+        compiled_summary = "".join(parts)
 
         if successful_summaries < len(chunks) / 2:
             logger.error("Summarization failed for a significant number of chunks. Final analysis may be inaccurate.")
@@ -933,12 +859,31 @@ The JSON object must contain these exact keys:
 
     # --- END MODIFICATION ---
 
+    @staticmethod
+    def evaluations_agree(first: Optional[Dict], second: Optional[Dict]) -> bool:
+        """True if both evaluations are valid and every numeric score differs by at most CONSENSUS_SCORE_TOLERANCE."""
+        if first is None or second is None:
+            return False
+        tolerance = REVIEW_CONFIG['CONSENSUS_SCORE_TOLERANCE']
+        for field in PaperAnalyzer.CONSENSUS_NUMERIC_FIELDS:
+            a, b = first.get(field), second.get(field)
+            if not isinstance(a, int) or not isinstance(b, int) or abs(a - b) > tolerance:
+                return False
+        return True
+
     # --- MODIFIED: consensus_evaluation (passes definitions string) ---
     @staticmethod
     def consensus_evaluation(paper_text: str, metadata: PaperMetadata,
                              api_manager: APIManager, pillar_definitions_str: str,
                              num_evaluations: int = 1) -> Optional[Dict]:
-        """Handles large docs, performs analysis, validates."""
+        """
+        Handles large docs, performs analysis, validates.
+
+        Large documents are summarized once and every evaluation reuses the
+        summary. Evaluations run concurrently and differ by sampling temperature
+        (REVIEW_CONFIG['CONSENSUS_TEMPERATURES']); with CONSENSUS_EARLY_STOP, the
+        evaluations after the first two are skipped when those two agree.
+        """
         final_text_to_analyze = ""
         is_summarized = False
 
@@ -956,34 +901,56 @@ The JSON object must contain these exact keys:
             final_text_to_analyze = paper_text
 
         required_fields = PaperAnalyzer.REQUIRED_JSON_KEYS
+        # Every evaluation analyzes the same text, so the prompt is built once
+        prompt = PaperAnalyzer.get_enhanced_analysis_prompt(final_text_to_analyze, metadata, pillar_definitions_str)
+        temperatures = REVIEW_CONFIG['CONSENSUS_TEMPERATURES']
 
-        evaluations = []
-        for i in range(num_evaluations):
+        def evaluate(i: int) -> Optional[Dict]:
             logger.info(f"Performing analysis evaluation {i + 1}/{num_evaluations}")
             safe_print(f"🔄 Performing analysis evaluation {i + 1}/{num_evaluations}")
-
-            prompt = PaperAnalyzer.get_enhanced_analysis_prompt(final_text_to_analyze, metadata, pillar_definitions_str)
             logger.info(f"Sending final analysis prompt ({len(prompt)} chars) to API...")
 
-            result = api_manager.cached_api_call(prompt, use_cache=(i == 0), is_json=True)
-
-            if result:
-                # Add fields that will be populated post-processing (with correct types)
-                result.setdefault('CROSS_REFERENCES_COUNT', "0")
-                result.setdefault('EXTRACTION_METHOD', str(metadata.extraction_method))
-                result.setdefault('EXTRACTION_QUALITY', str(metadata.extraction_quality))
-                result.setdefault('MENTIONED_PAPERS', [])
-                result.setdefault('REVIEW_TIMESTAMP', str(metadata.timestamp))
-                result.setdefault('SIMILAR_PAPERS', [])
-                result.setdefault('SUMMARIZED_FROM_CHUNKS', 'Yes' if '[[[ This document was summarized' in final_text_to_analyze else 'No')
-                
-                is_valid, errors = PaperAnalyzer.validate_response(result, required_fields)
-                if is_valid:
-                    evaluations.append(result)
-                else:
-                    logger.error(f"Evaluation {i + 1} failed validation: {errors}")
+            if i == 0:
+                result = api_manager.cached_api_call(prompt, is_json=True)
             else:
+                # Later evaluations differ by sampling temperature; each is cached under its own key
+                temperature = temperatures[min(i, len(temperatures) - 1)]
+                cache_key = f"{metadata.filename}_consensus_{i}_{temperature}_{hashlib.md5(prompt.encode('utf-8')).hexdigest()}"
+                result = api_manager.call_with_temperature(prompt, temperature, cache_key=cache_key, is_json=True)
+
+            if not result:
                 logger.error(f"API call failed for evaluation {i + 1}")
+                return None
+            # Add fields that will be populated post-processing (with correct types)
+            result.setdefault('CROSS_REFERENCES_COUNT', "0")
+            result.setdefault('EXTRACTION_METHOD', str(metadata.extraction_method))
+            result.setdefault('EXTRACTION_QUALITY', str(metadata.extraction_quality))
+            result.setdefault('MENTIONED_PAPERS', [])
+            result.setdefault('REVIEW_TIMESTAMP', str(metadata.timestamp))
+            result.setdefault('SIMILAR_PAPERS', [])
+            result.setdefault('SUMMARIZED_FROM_CHUNKS', 'Yes' if '[[[ This document was summarized' in final_text_to_analyze else 'No')
+
+            is_valid, errors = PaperAnalyzer.validate_response(result, required_fields)
+            if not is_valid:
+                logger.error(f"Evaluation {i + 1} failed validation: {errors}")
+                return None
+            return result
+
+        def run_evaluations(indices: List[int]) -> List[Optional[Dict]]:
+            if len(indices) <= 1:
+                return [evaluate(i) for i in indices]
+            with ThreadPoolExecutor(max_workers=len(indices), thread_name_prefix="consensus-eval") as executor:
+                return list(executor.map(evaluate, indices))
+
+        # The first two evaluations run together; the rest only if they disagree (or early stop is off)
+        results = run_evaluations(list(range(min(num_evaluations, 2))))
+        if num_evaluations > 2:
+            if REVIEW_CONFIG.get('CONSENSUS_EARLY_STOP', False) and PaperAnalyzer.evaluations_agree(*results):
+                logger.info(f"First two evaluations agree within {REVIEW_CONFIG['CONSENSUS_SCORE_TOLERANCE']} points. "
+                            f"Skipping {num_evaluations - 2} further evaluations.")
+            else:
+                results += run_evaluations(list(range(2, num_evaluations)))
+        evaluations = [result for result in results if result is not None]
 
         if not evaluations:
             logger.error("All analysis evaluations failed.")
@@ -993,8 +960,7 @@ The JSON object must contain these exact keys:
         if len(evaluations) > 1:
             logger.info("Aggregating results from multiple evaluations...")
             aggregated = evaluations[0].copy()
-            numeric_fields = ['CORE_DOMAIN_RELEVANCE_SCORE', 'SUBDOMAIN_RELEVANCE_TO_RESEARCH_SCORE',
-                              'REPRODUCIBILITY_SCORE', 'BIOLOGICAL_FIDELITY']
+            numeric_fields = PaperAnalyzer.CONSENSUS_NUMERIC_FIELDS
             list_fields = ["MAJOR_FINDINGS", "KEYWORDS", "CORE_CONCEPTS", "INTERDISCIPLINARY_BRIDGES",
                            "NETWORK_ARCHITECTURE", "BRAIN_REGIONS", "DATASET_USED",
                            "Requirement(s)"] # <-- Added new field
@@ -1105,71 +1071,88 @@ class NetworkAnalyzer:
     """Analyze relationships between papers"""
     def __init__(self, embedder: Optional[SentenceTransformer] = None):
         self.embedder = embedder
-        self.embeddings_cache = {}
+        self.embeddings_cache = VectorIndex(backend=REVIEW_CONFIG['EMBEDDING_INDEX_BACKEND'])
         self.load_embeddings_cache()
     def load_embeddings_cache(self):
-        """Load cached embeddings"""
-        cache_path = Path(EMBEDDINGS_CACHE)
-        if cache_path.exists():
+        """Memory-map cached embeddings, importing the legacy pickle cache once if present"""
+        self.embeddings_cache.path = EMBEDDINGS_CACHE
+        self.embeddings_cache.load()
+        if len(self.embeddings_cache) == 0 and Path(LEGACY_EMBEDDINGS_CACHE).exists():
             try:
-                with cache_path.open('rb') as f:
-                    self.embeddings_cache = pickle.load(f)
-                logger.info(f"Loaded {len(self.embeddings_cache)} cached embeddings from {EMBEDDINGS_CACHE}")
+                with open(LEGACY_EMBEDDINGS_CACHE, 'rb') as f:
+                    legacy_embeddings = pickle.load(f)
+                for key, embedding in legacy_embeddings.items():
+                    self.embeddings_cache.add(key, embedding)
+                logger.info(f"Imported {len(legacy_embeddings)} embeddings from {LEGACY_EMBEDDINGS_CACHE}")
             except Exception as e:
-                logger.warning(f"Could not load embeddings cache: {e}")
+                logger.warning(f"Could not import legacy embeddings cache: {e}")
+        if len(self.embeddings_cache):
+            logger.info(f"Loaded {len(self.embeddings_cache)} cached embeddings from {EMBEDDINGS_CACHE}")
     def save_embeddings_cache(self):
         """Save embeddings cache"""
         if not REVIEW_CONFIG['CACHE_EMBEDDINGS']: return
         try:
-            with open(EMBEDDINGS_CACHE, 'wb') as f:
-                pickle.dump(self.embeddings_cache, f)
-            logger.info(f"Saved {len(self.embeddings_cache)} embeddings to {EMBEDDINGS_CACHE}")
+            if self.embeddings_cache.save():
+                logger.info(f"Saved {len(self.embeddings_cache)} embeddings to {EMBEDDINGS_CACHE}")
         except Exception as e:
             logger.warning(f"Could not save embeddings cache: {e}")
+    @staticmethod
+    def embedding_text(paper_data: Dict) -> str:
+        """Text embedded for similarity: title, concepts, findings and keywords"""
+        return f"Title: {paper_data.get('TITLE', '')}. Core Concepts: {', '.join(paper_data.get('CORE_CONCEPTS', []))}. Abstract/Findings: {paper_data.get('MAJOR_FINDINGS', '')}. Keywords: {', '.join(paper_data.get('KEYWORDS', []))}"
     def get_embedding(self, text: str, cache_key: str) -> Optional[np.ndarray]:
-        """Get embedding for text with caching"""
+        """Get embedding for text with caching (returned L2-normalized)"""
         if not self.embedder: return None
-        if cache_key in self.embeddings_cache: return self.embeddings_cache[cache_key]
+        if cache_key in self.embeddings_cache: return self.embeddings_cache.get(cache_key)
         try:
             embedding = self.embedder.encode(text[:10000])
-            if REVIEW_CONFIG['CACHE_EMBEDDINGS']:
-                self.embeddings_cache[cache_key] = embedding
-            return embedding
+            # Indexed even when CACHE_EMBEDDINGS is off; the setting only controls saving
+            self.embeddings_cache.add(cache_key, embedding)
+            return self.embeddings_cache.get(cache_key)
         except Exception as e:
             logger.error(f"Embedding generation failed for key {cache_key}: {e}")
             return None
+    def embed_papers(self, papers_by_key: Dict[str, Dict]) -> int:
+        """Embed papers not yet in the cache with batched encode calls; returns how many were added"""
+        if not self.embedder: return 0
+        missing = self.embeddings_cache.missing(papers_by_key)
+        if not missing: return 0
+        texts = [self.embedding_text(papers_by_key[key])[:10000] for key in missing]
+        try:
+            embeddings = self.embedder.encode(texts, batch_size=REVIEW_CONFIG['EMBEDDING_BATCH_SIZE'],
+                                              show_progress_bar=False)
+        except Exception as e:
+            logger.error(f"Batch embedding generation failed for {len(missing)} papers: {e}")
+            return 0
+        for key, embedding in zip(missing, embeddings):
+            self.embeddings_cache.add(key, embedding)
+        return len(missing)
     def find_similar_papers(self, paper_data: Dict, existing_papers: List[Dict],
-                            threshold: float = REVIEW_CONFIG['SIMILARITY_THRESHOLD']) -> List[Tuple[Dict, float]]:
-        """Find papers similar to the current one using embeddings"""
+                            threshold: float = REVIEW_CONFIG['SIMILARITY_THRESHOLD'],
+                            top_k: Optional[int] = None) -> List[Tuple[Dict, float]]:
+        """
+        Find papers similar to the current one using embeddings.
+
+        Existing papers not yet in the embedding index are embedded in batches
+        and appended once; after that each call is a single top-k index query, restricted to
+        the given existing papers.
+        """
         if not self.embedder: return []
-        paper_text = f"Title: {paper_data.get('TITLE', '')}. Core Concepts: {', '.join(paper_data.get('CORE_CONCEPTS', []))}. Abstract/Findings: {paper_data.get('MAJOR_FINDINGS', '')}. Keywords: {', '.join(paper_data.get('KEYWORDS', []))}"
         paper_key = paper_data.get('FILENAME', '')
         if not paper_key: return []
-        paper_embedding = self.get_embedding(paper_text, paper_key)
+        paper_embedding = self.get_embedding(self.embedding_text(paper_data), paper_key)
         if paper_embedding is None: return []
-        similar_papers = []
-        existing_embeddings = {}
-        target_keys = []
-        target_embeddings_list = []
-        for existing in existing_papers:
-            existing_key = existing.get('FILENAME', '')
-            if not existing_key or existing_key == paper_key: continue
-            existing_emb = self.embeddings_cache.get(existing_key)
-            if existing_emb is None:
-                existing_text = f"Title: {existing.get('TITLE', '')}. Core Concepts: {', '.join(existing.get('CORE_CONCEPTS', []))}. Abstract/Findings: {existing.get('MAJOR_FINDINGS', '')}. Keywords: {', '.join(existing.get('KEYWORDS', []))}"
-                existing_emb = self.get_embedding(existing_text, existing_key)
-            if existing_emb is not None:
-                target_keys.append(existing_key)
-                target_embeddings_list.append(existing_emb)
-        if not target_embeddings_list: return []
-        target_embeddings_matrix = np.array(target_embeddings_list)
-        similarities = cosine_similarity([paper_embedding], target_embeddings_matrix)[0]
-        for i, similarity in enumerate(similarities):
-            if similarity > threshold:
-                target_paper = next((p for p in existing_papers if p.get('FILENAME') == target_keys[i]), None)
-                if target_paper:
-                    similar_papers.append((target_paper, float(similarity)))
-        return sorted(similar_papers, key=lambda x: x[1], reverse=True)
+        papers_by_key = {p.get('FILENAME'): p for p in existing_papers if p.get('FILENAME')}
+        papers_by_key.pop(paper_key, None)
+        self.embed_papers(papers_by_key)
+        if top_k is None:
+            top_k = REVIEW_CONFIG['SIMILAR_PAPERS_TOP_K']
+        # Indexed papers outside existing_papers can rank ahead of them; fetch enough to filter them out
+        others = max(0, len(self.embeddings_cache) - 1 - len(papers_by_key))
+        matches = self.embeddings_cache.search(paper_embedding, k=top_k + others, threshold=threshold,
+                                               exclude=[paper_key])
+        similar_papers = [(papers_by_key[key], similarity) for key, similarity in matches if key in papers_by_key]
+        return similar_papers[:top_k]
     def extract_cross_references(self, paper_data: Dict, existing_papers: List[Dict]) -> List[Dict]:
         """Identify potential cross-references based on title mentions"""
         references = []
@@ -1201,28 +1184,27 @@ class NetworkAnalyzer:
 class ReviewVersionControl:
     """Track changes in paper assessments over time"""
     def __init__(self):
-        self.history = {}
+        self.store = None
         self.load_history()
     def load_history(self):
-        """Load version history from file"""
-        if os.path.exists(VERSION_HISTORY_FILE):
-            try:
-                with open(VERSION_HISTORY_FILE, 'r', encoding='utf-8') as f:
-                    self.history = json.load(f)
-            except Exception as e:
-                logger.warning(f"Could not load version history: {e}")
+        """Open the version history store (re-imports the JSON if it changed)"""
+        try:
+            self.store = open_version_history(VERSION_HISTORY_FILE)
+        except Exception as e:
+            logger.warning(f"Could not load version history: {e}")
     def save_history(self):
-        """Save version history to file"""
+        """Export version history to file"""
+        if self.store is None or not self.store.unexported:
+            return
         try:
-            with open(VERSION_HISTORY_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.history, f, indent=2, ensure_ascii=False)
+            self.store.export_json(VERSION_HISTORY_FILE)
         except Exception as e:
             logger.warning(f"Could not save version history: {e}")
     def diff_from_previous(self, paper_id: str, new_review: Dict) -> Dict:
         """Calculate differences from previous version"""
-        if paper_id not in self.history or not self.history[paper_id]:
+        previous = self.store.latest_review(paper_id) if self.store is not None else None
+        if previous is None:
             return {"status": "new_review"}
-        previous = self.history[paper_id][-1]['review']
         changes = {}
         score_fields = ['CORE_DOMAIN_RELEVANCE_SCORE', 'SUBDOMAIN_RELEVANCE_TO_RESEARCH_SCORE', 'REPRODUCIBILITY_SCORE',
                         'BIOLOGICAL_FIDELITY']
@@ -1236,18 +1218,15 @@ class ReviewVersionControl:
                 continue
         return changes
     def save_version(self, paper_id: str, review: Dict):
-        """Save a new version of a review"""
-        timestamp = datetime.now().isoformat()
-        if paper_id not in self.history:
-            self.history[paper_id] = []
+        """Save a new version of a review (appended to the store; exported by save_history)"""
+        if self.store is None:
+            return
         review_copy = review.copy()
         changes = self.diff_from_previous(paper_id, review_copy)
-        self.history[paper_id].append({
-            'timestamp': timestamp,
-            'review': review_copy,
-            'changes': changes
-        })
-        self.save_history()
+        try:
+            self.store.append_review(paper_id, review_copy, changes)
+        except Exception as e:
+            logger.warning(f"Could not save version history for {paper_id}: {e}")
 
 
 # --- 6. File Management Functions (Unchanged) ---
@@ -1281,13 +1260,18 @@ def save_review_log(reviewed_files_set):
     except Exception as e:
         logger.error(f"Error saving review log: {e}")
 
-def load_existing_reviews(csv_file=OUTPUT_CSV_FILE):
-    """Load existing reviews from CSV into a list of dictionaries"""
+def load_existing_reviews(csv_file=OUTPUT_CSV_FILE, use_store=True):
+    """Load existing reviews into a list of dictionaries (from the columnar store when use_store)"""
     try:
         import pandas as pd
     except ImportError:
         logger.critical("Pandas library not found. Please install with: pip install pandas")
         return []
+    store = open_research_store(csv_file) if use_store else None
+    if store is not None:
+        reviews = store.read_records(parse_lists=True)
+        logger.info(f"Loaded {len(reviews)} existing reviews from {store.db_path}")
+        return reviews
     if os.path.exists(csv_file):
         try:
             df = pd.read_csv(csv_file, encoding='utf-8')
@@ -1322,6 +1306,8 @@ def save_results_to_csv(reviews, csv_file=OUTPUT_CSV_FILE):
     try:
         file_exists = os.path.isfile(csv_file)
         has_headers = file_exists and os.path.getsize(csv_file) > 0
+        # Bring the store up to date with the CSV before appending, so only this batch is upserted after
+        store = open_research_store(csv_file) if has_headers else None
 
         # --- MODIFIED LOGIC ---
         # 1. Use the explicit order as the base
@@ -1372,6 +1358,12 @@ def save_results_to_csv(reviews, csv_file=OUTPUT_CSV_FILE):
 
         logger.info(f"Saved/Appended {len(reviews)} journal reviews to {csv_file}")
         safe_print(f"💾 Saved/Appended {len(reviews)} journal reviews to {csv_file}")
+        if store is not None:
+            try:
+                store.upsert_papers(reviews, csv_file=csv_file)
+            except Exception as e:
+                # The CSV now differs from the store, so the next read re-imports it
+                logger.warning(f"Could not upsert reviews into {store.db_path}: {e}")
     except Exception as e:
         logger.error(f"Error saving to CSV {csv_file}: {e}")
         safe_print(f"❌ Error saving to CSV {csv_file}: {e}")
@@ -1411,121 +1403,171 @@ def save_non_journal_results_to_csv(reviews, csv_file=NON_JOURNAL_CSV_FILE):
 
 
 # --- 7. Process Batch Function (MODIFIED) ---
+def analyze_paper(filepath: str, filename: str, api_manager: APIManager,
+                  pillar_definitions_str: str) -> Optional[Tuple[str, Dict]]:
+    """
+    Extract and analyze a single paper.
+
+    This is the independent, API-bound part of the per-paper work, so it is
+    safe to run concurrently; every LLM call still goes through the global
+    rate limiter in APIManager.cached_api_call.
+
+    Returns:
+        ('journal' | 'non_journal', result) or None if the paper was skipped
+    """
+    logger.info(f"\n{'=' * 60}")
+    safe_print(f"\n{'=' * 60}")
+    logger.info(f"Processing: {filename}")
+    safe_print(f"Processing: {filename}")
+
+    extractor = TextExtractor()
+    text, method, quality = extractor.robust_text_extraction(filepath)
+
+    if not text or len(text) < REVIEW_CONFIG['MIN_TEXT_LENGTH']:
+        logger.warning(
+            f"Skipping {filename} - text too short or extraction failed (Length: {len(text)}, Method: {method}, Quality: {quality:.2f})")
+        safe_print(f"⏭️ Skipping {filename} - text too short or extraction failed")
+        return None
+
+    # is_valid, indicators = extractor.validate_paper_quality(text)
+    # indicators.extraction_quality = (indicators.extraction_quality + quality) / 2.0
+
+    papers_root = PAPERS_FOLDER
+    rel_path = os.path.relpath(os.path.dirname(filepath), papers_root)
+    domain_context = rel_path if rel_path != '.' else 'root'
+
+    metadata = PaperMetadata(
+        filename=filename,
+        filepath=filepath,
+        domain_context=domain_context,
+        extraction_quality=quality, # Using direct quality from extraction
+        extraction_method=method,
+        timestamp=datetime.now().isoformat()
+    )
+
+    # The validation logic is now simplified. We trust the extraction more.
+    if quality > 0.1: # If extraction had some success
+        logger.info(
+            f"Analyzing as Journal Paper (quality: {quality:.2f}, method: {method})")
+        safe_print(
+            f"🧠 Analyzing as Journal Paper (quality: {quality:.2f}, method: {method})")
+
+        num_evals = REVIEW_CONFIG['CONSENSUS_EVALUATIONS']
+        if quality < 0.6:
+            num_evals = max(num_evals, 2)
+            logger.info(
+                f"Low quality score ({quality:.2f}), using {num_evals} evaluations for consensus.")
+            safe_print(f"   Low quality score, using {num_evals} evaluations...")
+
+        # --- MODIFIED: Pass definitions string ---
+        result = PaperAnalyzer.consensus_evaluation(
+            text, metadata, api_manager, pillar_definitions_str, num_evals
+        )
+
+        if not result:
+            logger.error(f"Journal analysis failed for {filename} after all attempts.")
+            safe_print(f"❌ Journal analysis failed for {filename}")
+            return None
+        # --- End Modification ---
+        return 'journal', result
+
+    # --- Non-journal item (simplified condition) ---
+    logger.warning(f"File {filename} has very low extraction quality ({quality:.2f}). Processing as 'Non-Journal' item.")
+    safe_print(f"📙 File {filename} has low quality. Processing as 'Non-Journal' item.")
+    result = PaperAnalyzer.analyze_non_journal_item(text, metadata, api_manager)
+    if not result:
+        logger.error(f"Non-journal analysis failed for {filename} after all attempts.")
+        safe_print(f"❌ Non-journal analysis failed for {filename}")
+        return None
+    return 'non_journal', result
+
+
+def add_network_context(result: Dict, filename: str, network_analyzer: NetworkAnalyzer,
+                        known_papers: List[Dict]) -> None:
+    """Populate similarity and cross-reference fields against already-known papers."""
+    try:
+        similar = network_analyzer.find_similar_papers(result, known_papers)
+        if similar:
+            logger.info(f"Found {len(similar)} similar papers:")
+            safe_print(f"🔗 Found {len(similar)} similar papers:")
+            result['SIMILAR_PAPERS'] = [p.get('FILENAME') for p, sim in similar[:5]]
+        else:
+            result['SIMILAR_PAPERS'] = []
+        references = network_analyzer.extract_cross_references(result, known_papers)
+        if references:
+            result['CROSS_REFERENCES_COUNT'] = str(len(references))
+            result['MENTIONED_PAPERS'] = list(
+                set([ref['target'] for ref in references if ref['source'] == filename] +
+                    [ref['source'] for ref in references if ref['target'] == filename]))
+        else:
+            result['CROSS_REFERENCES_COUNT'] = "0"
+            result['MENTIONED_PAPERS'] = []
+    except Exception as net_e:
+        logger.error(f"Error during network analysis for {filename}: {net_e}")
+        result['SIMILAR_PAPERS'] = ["Error"]
+        result['CROSS_REFERENCES_COUNT'] = "-1"
+        result['MENTIONED_PAPERS'] = ["Error"]
+
+
 def process_batch(batch_files: List[Tuple[str, str]], api_manager: APIManager,
                   network_analyzer: NetworkAnalyzer, version_control: ReviewVersionControl,
                   existing_reviews: List[Dict], pillar_definitions_str: str) -> Tuple[List[Dict], List[Dict]]:
-    """Process a batch of files"""
+    """
+    Process a batch of files.
+
+    Extraction and LLM analysis run on up to REVIEW_CONFIG['MAX_CONCURRENT_PAPERS']
+    worker threads. Results are consumed in input order, and network analysis and
+    version history writes happen on the calling thread, so output is identical
+    to a sequential run regardless of completion order.
+    """
     batch_journal_results = []
     batch_non_journal_results = []
 
-    for filepath, filename in batch_files:
-        try:
-            logger.info(f"\n{'=' * 60}")
-            safe_print(f"\n{'=' * 60}")
-            logger.info(f"Processing: {filename}")
-            safe_print(f"Processing: {filename}")
-
-            extractor = TextExtractor()
-            text, method, quality = extractor.robust_text_extraction(filepath)
-
-            if not text or len(text) < REVIEW_CONFIG['MIN_TEXT_LENGTH']:
-                logger.warning(
-                    f"Skipping {filename} - text too short or extraction failed (Length: {len(text)}, Method: {method}, Quality: {quality:.2f})")
-                safe_print(f"⏭️ Skipping {filename} - text too short or extraction failed")
-                continue
-
-            # is_valid, indicators = extractor.validate_paper_quality(text)
-            # indicators.extraction_quality = (indicators.extraction_quality + quality) / 2.0
-
-            papers_root = PAPERS_FOLDER
-            rel_path = os.path.relpath(os.path.dirname(filepath), papers_root)
-            domain_context = rel_path if rel_path != '.' else 'root'
-            
-            metadata = PaperMetadata(
-                filename=filename,
-                filepath=filepath,
-                domain_context=domain_context,
-                extraction_quality=quality, # Using direct quality from extraction
-                extraction_method=method,
-                timestamp=datetime.now().isoformat()
-            )
-
-            # The validation logic is now simplified. We trust the extraction more.
-            if quality > 0.1: # If extraction had some success
-                logger.info(
-                    f"Analyzing as Journal Paper (quality: {quality:.2f}, method: {method})")
-                safe_print(
-                    f"🧠 Analyzing as Journal Paper (quality: {quality:.2f}, method: {method})")
-                
-                num_evals = REVIEW_CONFIG['CONSENSUS_EVALUATIONS']
-                if quality < 0.6:
-                    num_evals = max(num_evals, 2)
-                    logger.info(
-                        f"Low quality score ({quality:.2f}), using {num_evals} evaluations for consensus.")
-                    safe_print(f"   Low quality score, using {num_evals} evaluations...")
-                
-                # --- MODIFIED: Pass definitions string ---
-                result = PaperAnalyzer.consensus_evaluation(
-                    text, metadata, api_manager, pillar_definitions_str, num_evals
-                )
-                
-                if not result:
-                    logger.error(f"Journal analysis failed for {filename} after all attempts.")
-                    safe_print(f"❌ Journal analysis failed for {filename}")
-                    continue
-                # --- End Modification ---
+    max_workers = max(1, min(int(REVIEW_CONFIG.get('MAX_CONCURRENT_PAPERS', 1)), len(batch_files)))
+    executor = None
+    futures = [None] * len(batch_files)
+    if max_workers > 1:
+        logger.info(f"Analyzing {len(batch_files)} papers with {max_workers} concurrent workers")
+        safe_print(f"⚡ Analyzing {len(batch_files)} papers with {max_workers} concurrent workers")
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="paper-worker")
+        futures = [executor.submit(analyze_paper, filepath, filename, api_manager, pillar_definitions_str)
+                   for filepath, filename in batch_files]
 
-                try:
-                    similar = network_analyzer.find_similar_papers(result, existing_reviews + batch_journal_results)
-                    if similar:
-                        logger.info(f"Found {len(similar)} similar papers:")
-                        safe_print(f"🔗 Found {len(similar)} similar papers:")
-                        result['SIMILAR_PAPERS'] = [p.get('FILENAME') for p, sim in similar[:5]]
-                    else:
-                        result['SIMILAR_PAPERS'] = []
-                    references = network_analyzer.extract_cross_references(result,
-                                                                         existing_reviews + batch_journal_results)
-                    if references:
-                        result['CROSS_REFERENCES_COUNT'] = str(len(references))
-                        result['MENTIONED_PAPERS'] = list(
-                            set([ref['target'] for ref in references if ref['source'] == filename] +
-                                [ref['source'] for ref in references if ref['target'] == filename]))
-                    else:
-                        result['CROSS_REFERENCES_COUNT'] = "0"
-                        result['MENTIONED_PAPERS'] = []
-                except Exception as net_e:
-                    logger.error(f"Error during network analysis for {filename}: {net_e}")
-                    result['SIMILAR_PAPERS'] = ["Error"]
-                    result['CROSS_REFERENCES_COUNT'] = "-1"
-                    result['MENTIONED_PAPERS'] = ["Error"]
-
-                version_control.save_version(filename, result)
-                batch_journal_results.append(result)
-                logger.info(f"Successfully analyzed {filename} as Journal Paper.")
-                safe_print(f"✅ Successfully analyzed {filename} as Journal Paper.")
-
-            else:
-                # --- Non-journal item (simplified condition) ---
-                logger.warning(f"File {filename} has very low extraction quality ({quality:.2f}). Processing as 'Non-Journal' item.")
-                safe_print(f"📙 File {filename} has low quality. Processing as 'Non-Journal' item.")
-                result = PaperAnalyzer.analyze_non_journal_item(text, metadata, api_manager)
-                if not result:
-                    logger.error(f"Non-journal analysis failed for {filename} after all attempts.")
-                    safe_print(f"❌ Non-journal analysis failed for {filename}")
+    try:
+        for (filepath, filename), future in zip(batch_files, futures):
+            try:
+                if future is not None:
+                    analysis = future.result()
+                else:
+                    analysis = analyze_paper(filepath, filename, api_manager, pillar_definitions_str)
+                if analysis is None:
                     continue
-                batch_non_journal_results.append(result)
-                logger.info(f"Successfully analyzed {filename} as Non-Journal Item.")
-                safe_print(f"✅ Successfully analyzed {filename} as Non-Journal Item.")
 
+                kind, result = analysis
+                if kind == 'journal':
+                    add_network_context(result, filename, network_analyzer,
+                                        existing_reviews + batch_journal_results)
+                    version_control.save_version(filename, result)
+                    batch_journal_results.append(result)
+                    logger.info(f"Successfully analyzed {filename} as Journal Paper.")
+                    safe_print(f"✅ Successfully analyzed {filename} as Journal Paper.")
+                else:
+                    batch_non_journal_results.append(result)
+                    logger.info(f"Successfully analyzed {filename} as Non-Journal Item.")
+                    safe_print(f"✅ Successfully analyzed {filename} as Non-Journal Item.")
 
-        except Exception as e:
-            logger.critical(f"CRITICAL UNHANDLED ERROR on file {filename}: {type(e).__name__} - {e}")
-            logger.critical("This file will be skipped. Moving to next file.")
-            safe_print(f"❌ CRITICAL ERROR on {filename}. See log. Skipping.")
-        except KeyboardInterrupt:
-            logger.warning("Keyboard interrupt detected. Stopping batch processing.")
-            safe_print("\n🛑 Batch stopped by user.")
-            break
+            except Exception as e:
+                logger.critical(f"CRITICAL UNHANDLED ERROR on file {filename}: {type(e).__name__} - {e}")
+                logger.critical("This file will be skipped. Moving to next file.")
+                safe_print(f"❌ CRITICAL ERROR on {filename}. See log. Skipping.")
+            except KeyboardInterrupt:
+                logger.warning("Keyboard interrupt detected. Stopping batch processing.")
+                safe_print("\n🛑 Batch stopped by user.")
+                break
+    finally:
+        if executor is not None:
+            # Drop queued papers on interrupt; in-flight API calls finish in the background.
+            executor.shutdown(wait=False, cancel_futures=True)
 
     network_analyzer.save_embeddings_cache()
     return batch_journal_results, batch_non_journal_results
@@ -1581,7 +1623,7 @@ def main():
 
     reviewed_files = load_review_log()
     existing_reviews = load_existing_reviews(OUTPUT_CSV_FILE)
-    existing_non_journal = load_existing_reviews(NON_JOURNAL_CSV_FILE)
+    existing_non_journal = load_existing_reviews(NON_JOURNAL_CSV_FILE, use_store=False)
 
     logger.info(f"Status: {len(reviewed_files)} files in review log")
     safe_print(f"📊 Status: {len(reviewed_files)} files in review log")
@@ -1663,6 +1705,9 @@ def main():
         logger.info(f"Progress: {total_processed}/{len(files_to_process)} papers processed")
         safe_print(f"📊 Progress: {total_processed}/{len(files_to_process)} papers processed")
 
+    # Versions are appended to the store as papers finish; write the JSON once per run
+    version_control.save_history()
+
     end_time = time.time()
     duration = end_time - start_time
 
@@ -1671,14 +1716,14 @@ def main():
     logger.info(f"Successfully reviewed {len(newly_reviewed_papers)} new journal papers in {duration:.2f} seconds.")
     logger.info(f"Successfully processed {len(newly_reviewed_non_journal)} new non-journal items.")
     logger.info(f"Total papers in journal database now: {len(load_existing_reviews(OUTPUT_CSV_FILE))}")
-    logger.info(f"Total items in non-journal database now: {len(load_existing_reviews(NON_JOURNAL_CSV_FILE))}")
+    logger.info(f"Total items in non-journal database now: {len(load_existing_reviews(NON_JOURNAL_CSV_FILE, use_store=False))}")
     logger.info("=" * 80)
     safe_print("\n" + "=" * 80)
     safe_print("PIPELINE COMPLETE")
     safe_print(f"✅ Reviewed {len(newly_reviewed_papers)} new journal papers in {duration:.2f} seconds.")
     safe_print(f"✅ Processed {len(newly_reviewed_non_journal)} new non-journal items.")
     safe_print(f"📊 Total in journal database: {len(load_existing_reviews(OUTPUT_CSV_FILE))}")
-    safe_print(f"📙 Total in non-journal database: {len(load_existing_reviews(NON_JOURNAL_CSV_FILE))}")
+    safe_print(f"📙 Total in non-journal database: {len(load_existing_reviews(NON_JOURNAL_CSV_FILE, use_store=False))}")
     safe_print(f"\nResults saved to:")
     safe_print(f"   📁 Journal CSV: {os.path.abspath(OUTPUT_CSV_FILE)}")
     safe_print(f"   📁 Non-Journal CSV: {os.path.abspath(NON_JOURNAL_CSV_FILE)}")
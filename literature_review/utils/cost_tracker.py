@@ -1,10 +1,18 @@
 """
 API Cost Tracker
 Track and analyze API usage costs across all modules.
+
+Calls are appended to a JSONL ledger by a buffered background writer, and
+summaries are served from running aggregates, so logging a call costs the
+same whether the ledger holds ten entries or a hundred thousand.
 """
 
+import heapq
 import json
 import os
+import queue
+import threading
+import weakref
 from datetime import datetime
 from typing import Dict, List, Optional
 import logging
@@ -12,6 +20,120 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class CostAggregate:
+    """Running totals over a set of logged API calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.cost = 0.0
+        self.tokens = 0
+        self.input_tokens = 0
+        self.cached_tokens = 0
+        self.cache_savings = 0.0
+        self.by_module: Dict[str, Dict] = {}
+        self.by_model: Dict[str, Dict] = {}
+
+    def add(self, entry: Dict) -> None:
+        tokens = entry['tokens']
+        cost = entry['cost_usd']
+        savings = entry.get('cache_savings_usd', 0)
+
+        self.calls += 1
+        self.cost += cost
+        self.tokens += tokens['total']
+        self.input_tokens += tokens.get('input', 0)
+        self.cached_tokens += tokens.get('cached', 0)
+        self.cache_savings += savings
+
+        module = self.by_module.setdefault(
+            entry['module'], {'calls': 0, 'cost': 0.0, 'tokens': 0, 'cache_savings': 0.0})
+        module['calls'] += 1
+        module['cost'] += cost
+        module['tokens'] += tokens['total']
+        module['cache_savings'] += savings
+
+        model = self.by_model.setdefault(entry['model'], {'calls': 0, 'cost': 0.0, 'tokens': 0})
+        model['calls'] += 1
+        model['cost'] += cost
+        model['tokens'] += tokens['total']
+
+    def summary(self) -> Dict:
+        return {
+            'total_calls': self.calls,
+            'total_cost': round(self.cost, 4),
+            'total_tokens': self.tokens,
+            'total_cache_savings': round(self.cache_savings, 4),
+            'by_module': {name: dict(stats) for name, stats in self.by_module.items()},
+            'by_model': {name: dict(stats) for name, stats in self.by_model.items()}
+        }
+
+
+class LedgerWriter:
+    """
+    Background thread that appends JSONL lines to the cost ledger in batches.
+
+    Each batch is written with a single append, so concurrent pipeline
+    processes interleave whole lines rather than corrupting a shared file.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path: str, flush_interval: float = 1.0, max_batch: int = 500):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="cost-ledger-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, entry: Dict) -> None:
+        self._queue.put(json.dumps(entry) + "\n")
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until everything queued so far is on disk."""
+        if not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+
+    def _run(self) -> None:
+        lines: List[str] = []
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._write(lines)
+                continue
+            if isinstance(item, str):
+                lines.append(item)
+                if len(lines) >= self.max_batch:
+                    self._write(lines)
+                continue
+            self._write(lines)
+            if item is self._STOP:
+                return
+            item.set()
+
+    def _write(self, lines: List[str]) -> None:
+        if not lines:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(''.join(lines))
+        except IOError as e:
+            logger.error(f"Could not append to cost ledger {self.path}: {e}")
+        lines.clear()
+
+
 class CostTracker:
     """Track API costs across all modules."""
     
@@ -40,27 +162,89 @@ class CostTracker:
         }
     }
     
-    def __init__(self, log_file: str = 'cost_reports/api_cost_log.json'):
-        self.log_file = log_file
-        self.usage_log = self._load_log()
+    def __init__(self, log_file: str = 'cost_reports/api_cost_log.jsonl', flush_interval: float = 1.0):
+        """
+        Args:
+            log_file: JSONL ledger path. A legacy JSON-array log at the same
+                path (or with a .json suffix) is migrated into the ledger.
+            flush_interval: Max seconds a logged call waits in the write buffer
+        """
+        base, _ = os.path.splitext(log_file)
+        self.log_file = base + '.jsonl'
+        self.legacy_log_file = base + '.json'
         self.session_start = datetime.now().isoformat()
-    
+        self.total = CostAggregate()
+        self.session = CostAggregate()
+        self.paper_costs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        self.usage_log = self._load_log()
+        for entry in self.usage_log:
+            self._accumulate(entry)
+
+        self._writer = LedgerWriter(self.log_file, flush_interval=flush_interval)
+        # Stops the writer at exit or once the tracker is collected (without keeping it alive)
+        self._finalizer = weakref.finalize(self, self._writer.close)
+
     def _load_log(self) -> List[Dict]:
-        """Load existing cost log."""
-        if os.path.exists(self.log_file):
-            try:
-                with open(self.log_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Could not load cost log from {self.log_file}: {e}")
-        return []
-    
-    def _save_log(self):
-        """Save cost log to file."""
-        os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
-        with open(self.log_file, 'w') as f:
-            json.dump(self.usage_log, f, indent=2)
-    
+        """Load the JSONL ledger, migrating a legacy JSON-array log first if present."""
+        self._migrate_legacy_log()
+        entries = []
+        if not os.path.exists(self.log_file):
+            return entries
+        with open(self.log_file, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A crash mid-append can leave one partial trailing line
+                    logger.warning(f"Skipping malformed cost ledger line {line_number} in {self.log_file}")
+        return entries
+
+    def _migrate_legacy_log(self) -> None:
+        """Convert api_cost_log.json (one JSON array) into the append-only ledger."""
+        if os.path.exists(self.log_file) or not os.path.exists(self.legacy_log_file):
+            return
+        try:
+            with open(self.legacy_log_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+            legacy_entries = json.loads(content) if content.strip() else []
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Could not load cost log from {self.legacy_log_file}: {e}")
+            return
+        if not legacy_entries:
+            return
+
+        tmp_file = self.log_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            for entry in legacy_entries:
+                f.write(json.dumps(entry) + "\n")
+        os.replace(tmp_file, self.log_file)
+        os.replace(self.legacy_log_file, self.legacy_log_file + '.migrated')
+        logger.info(f"Migrated {len(legacy_entries)} cost log entries to {self.log_file}")
+
+    def _accumulate(self, entry: Dict) -> None:
+        self.total.add(entry)
+        if entry['timestamp'] >= self.session_start:
+            self.session.add(entry)
+
+        paper = entry.get('paper', 'unknown')
+        if paper and paper != 'unknown':
+            stats = self.paper_costs.setdefault(paper, {'calls': 0, 'cost': 0.0, 'modules': set()})
+            stats['calls'] += 1
+            stats['cost'] += entry['cost_usd']
+            stats['modules'].add(entry['module'])
+
+    def flush(self) -> None:
+        """Write all buffered entries to the ledger."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Flush and stop the background writer (also done at exit or when the tracker is collected)."""
+        self._finalizer()
+
     def log_api_call(self, module: str, model: str, input_tokens: int, 
                     output_tokens: int, cached_tokens: int = 0, 
                     operation: str = '', paper: str = ''):
@@ -102,8 +286,10 @@ class CostTracker:
             'cache_savings_usd': round(cache_savings, 6)
         }
         
-        self.usage_log.append(entry)
-        self._save_log()
+        with self._lock:
+            self.usage_log.append(entry)
+            self._accumulate(entry)
+        self._writer.write(entry)
         
         logger.debug(f"API call logged: {module} - ${cost:.4f}")
     
@@ -129,71 +315,18 @@ class CostTracker:
     
     def get_session_summary(self) -> Dict:
         """Get cost summary for current session."""
-        session_calls = [
-            call for call in self.usage_log
-            if call['timestamp'] >= self.session_start
-        ]
-        
-        return self._summarize_calls(session_calls)
+        return self.session.summary()
     
     def get_total_summary(self) -> Dict:
         """Get cost summary for all time."""
-        return self._summarize_calls(self.usage_log)
+        return self.total.summary()
     
     def _summarize_calls(self, calls: List[Dict]) -> Dict:
-        """Summarize a list of API calls."""
-        if not calls:
-            return {
-                'total_calls': 0,
-                'total_cost': 0.0,
-                'total_tokens': 0,
-                'total_cache_savings': 0.0,
-                'by_module': {},
-                'by_model': {}
-            }
-        
-        total_cost = sum(call['cost_usd'] for call in calls)
-        total_tokens = sum(call['tokens']['total'] for call in calls)
-        total_cache_savings = sum(call.get('cache_savings_usd', 0) for call in calls)
-        
-        # Group by module
-        by_module = {}
+        """Summarize an arbitrary list of API calls."""
+        aggregate = CostAggregate()
         for call in calls:
-            module = call['module']
-            if module not in by_module:
-                by_module[module] = {
-                    'calls': 0,
-                    'cost': 0.0,
-                    'tokens': 0,
-                    'cache_savings': 0.0
-                }
-            by_module[module]['calls'] += 1
-            by_module[module]['cost'] += call['cost_usd']
-            by_module[module]['tokens'] += call['tokens']['total']
-            by_module[module]['cache_savings'] += call.get('cache_savings_usd', 0)
-        
-        # Group by model
-        by_model = {}
-        for call in calls:
-            model = call['model']
-            if model not in by_model:
-                by_model[model] = {
-                    'calls': 0,
-                    'cost': 0.0,
-                    'tokens': 0
-                }
-            by_model[model]['calls'] += 1
-            by_model[model]['cost'] += call['cost_usd']
-            by_model[model]['tokens'] += call['tokens']['total']
-        
-        return {
-            'total_calls': len(calls),
-            'total_cost': round(total_cost, 4),
-            'total_tokens': total_tokens,
-            'total_cache_savings': round(total_cache_savings, 4),
-            'by_module': by_module,
-            'by_model': by_model
-        }
+            aggregate.add(call)
+        return aggregate.summary()
     
     def get_budget_status(self, budget_usd: float = 50.0) -> Dict:
         """
@@ -205,8 +338,7 @@ class CostTracker:
         Returns:
             Budget status dictionary
         """
-        summary = self.get_total_summary()
-        total_cost = summary['total_cost']
+        total_cost = round(self.total.cost, 4)
         
         return {
             'budget': budget_usd,
@@ -220,43 +352,23 @@ class CostTracker:
     def cost_per_paper_analysis(self) -> Dict:
         """Analyze cost efficiency per paper."""
         analysis = {}
-        
-        # Group by paper
-        paper_costs = {}
-        for call in self.usage_log:
-            paper = call.get('paper', 'unknown')
-            if not paper or paper == 'unknown':
-                continue
-            
-            if paper not in paper_costs:
-                paper_costs[paper] = {
-                    'calls': 0,
-                    'cost': 0.0,
-                    'modules': set()
-                }
-            
-            paper_costs[paper]['calls'] += 1
-            paper_costs[paper]['cost'] += call['cost_usd']
-            paper_costs[paper]['modules'].add(call['module'])
+        paper_costs = self.paper_costs
         
         # Calculate averages
         if paper_costs:
             total_papers = len(paper_costs)
-            avg_cost_per_paper = sum(p['cost'] for p in paper_costs.values()) / total_papers
+            costs = [p['cost'] for p in paper_costs.values()]
+            avg_cost_per_paper = sum(costs) / total_papers
             
             analysis = {
                 'total_papers_analyzed': total_papers,
                 'avg_cost_per_paper': round(avg_cost_per_paper, 4),
-                'min_cost': round(min(p['cost'] for p in paper_costs.values()), 4),
-                'max_cost': round(max(p['cost'] for p in paper_costs.values()), 4),
-                'most_expensive_papers': sorted(
-                    [
-                        {'paper': p, 'cost': data['cost']}
-                        for p, data in paper_costs.items()
-                    ],
-                    key=lambda x: x['cost'],
-                    reverse=True
-                )[:5]
+                'min_cost': round(min(costs), 4),
+                'max_cost': round(max(costs), 4),
+                'most_expensive_papers': [
+                    {'paper': p, 'cost': data['cost']}
+                    for p, data in heapq.nlargest(5, paper_costs.items(), key=lambda item: item[1]['cost'])
+                ]
             }
         
         return analysis
@@ -282,19 +394,17 @@ class CostTracker:
     
     def _calculate_cache_efficiency(self) -> Dict:
         """Calculate cache hit efficiency."""
-        total_input_tokens = sum(call['tokens']['input'] for call in self.usage_log)
-        total_cached_tokens = sum(call['tokens']['cached'] for call in self.usage_log)
+        total_input_tokens = self.total.input_tokens
+        total_cached_tokens = self.total.cached_tokens
         
         cache_hit_rate = 0
         if total_input_tokens > 0:
             cache_hit_rate = (total_cached_tokens / total_input_tokens) * 100
         
-        total_savings = sum(call.get('cache_savings_usd', 0) for call in self.usage_log)
-        
         return {
             'cache_hit_rate_percent': round(cache_hit_rate, 1),
             'total_tokens_cached': total_cached_tokens,
-            'total_savings_usd': round(total_savings, 4)
+            'total_savings_usd': round(self.total.cache_savings, 4)
         }
     
     def _generate_recommendations(self) -> List[str]:
@@ -0,0 +1,120 @@
+"""
+Shared Embedding Service.
+
+Batches sentence-transformer encode calls and caches the resulting embeddings
+by text hash in a persistent vector index, so a text is encoded at most once
+across scorers, runs and processes sharing the same cache file.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import threading
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from literature_review.io.vector_index import VectorIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = 'all-MiniLM-L6-v2'
+CACHE_DIR = 'cache'
+ENCODE_BATCH_SIZE = 64
+MAX_TEXT_CHARS = 10000
+
+
+def text_key(text: str) -> str:
+    """Cache key for a text: SHA-256 of the (truncated) text."""
+    return hashlib.sha256(text[:MAX_TEXT_CHARS].encode('utf-8')).hexdigest()
+
+
+def default_cache_path(model_name: str) -> str:
+    safe_name = ''.join(c if c.isalnum() or c in '-_' else '_' for c in model_name)
+    return os.path.join(CACHE_DIR, f'text_embeddings_{safe_name}.npy')
+
+
+class EmbeddingService:
+    """Batched, cached text embeddings (L2-normalized, so dot products are cosine similarities)."""
+
+    def __init__(self, model=None, model_name: str = DEFAULT_MODEL, cache_path: Optional[str] = None,
+                 batch_size: int = ENCODE_BATCH_SIZE):
+        """
+        Args:
+            model: Loaded encoder with a sentence-transformers style encode(); loaded lazily if None
+            model_name: SentenceTransformer model to load when no model is given
+            cache_path: .npy file for the persistent cache; None keeps the cache in memory only
+            batch_size: Texts per encode() call
+        """
+        self._model = model
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.cache = VectorIndex(cache_path)
+        self.encoded_texts = 0
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        """The encoder, loading the SentenceTransformer on first use."""
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts, encoding only those not already cached, in batches.
+
+        Returns:
+            Array of shape (len(texts), dim), one normalized row per input text
+        """
+        keys = [text_key(text) for text in texts]
+        with self._lock:
+            missing: Dict[str, str] = {}
+            for key, text in zip(keys, texts):
+                if key not in self.cache and key not in missing:
+                    missing[key] = text[:MAX_TEXT_CHARS]
+            if missing:
+                embeddings = self.model.encode(list(missing.values()), batch_size=self.batch_size,
+                                               convert_to_numpy=True, show_progress_bar=False)
+                for key, embedding in zip(missing, embeddings):
+                    self.cache.add(key, embedding)
+                self.encoded_texts += len(missing)
+            if not keys:
+                return np.empty((0, self.cache.dim if len(self.cache) else 0), dtype=np.float32)
+            return np.stack([self.cache.get(key) for key in keys])
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_many([text])[0]
+
+    def similarity_matrix(self, texts_a: Sequence[str], texts_b: Sequence[str]) -> np.ndarray:
+        """Cosine similarities between every text in texts_a and every text in texts_b."""
+        if not texts_a or not texts_b:
+            return np.zeros((len(texts_a), len(texts_b)), dtype=np.float32)
+        return self.embed_many(texts_a) @ self.embed_many(texts_b).T
+
+    def save(self) -> None:
+        """Persist newly cached embeddings."""
+        with self._lock:
+            try:
+                if self.cache.save():
+                    logger.info(f"Saved {len(self.cache)} text embeddings to {self.cache.path}")
+            except Exception as e:
+                logger.warning(f"Could not save text embedding cache: {e}")
+
+
+# Singleton instances, one per model
+_services: Dict[str, EmbeddingService] = {}
+_services_lock = threading.Lock()
+
+
+def get_embedding_service(model_name: str = DEFAULT_MODEL) -> EmbeddingService:
+    """Get the shared EmbeddingService for `model_name`, cached on disk and saved at exit."""
+    with _services_lock:
+        service = _services.get(model_name)
+        if service is None:
+            service = EmbeddingService(model_name=model_name, cache_path=default_cache_path(model_name))
+            atexit.register(service.save)
+            _services[model_name] = service
+        return service
@@ -1,10 +1,12 @@
 """
 Global API Rate Limiter and Error Categorization System
-Version: 1.0
+Version: 1.1
 Date: 2025-11-15
 
 This module provides:
-1. Global rate limiting across all pipeline modules
+1. Global rate limiting across all pipeline modules (token buckets for
+   requests, input tokens and output tokens per minute, with optional
+   per-module sub-budgets and FIFO-fair waiting)
 2. Intelligent error categorization
 3. Error-specific handling strategies
 4. Request validation to prevent wasted API calls
@@ -12,8 +14,9 @@ This module provides:
 
 import time
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 from enum import Enum
 import threading
 import json
@@ -21,6 +24,26 @@ import os
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_GLOBAL_RPM = 10  # Conservative global limit
+# Overrides the global RPM limit for this process (set by the dashboard to a job's API allowance)
+API_RPM_ENV_VAR = "LITREVIEW_API_RPM"
+# File holding this process's current RPM limit; the dashboard rewrites it when jobs start or finish
+API_RPM_FILE_ENV_VAR = "LITREVIEW_API_RPM_FILE"
+# Seconds between checks of the API_RPM_FILE_ENV_VAR file
+API_RPM_FILE_POLL_SECONDS = 5.0
+
+
+def _rpm_from_environment() -> float:
+    value = os.environ.get(API_RPM_ENV_VAR)
+    if not value:
+        return DEFAULT_GLOBAL_RPM
+    try:
+        rpm = float(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {API_RPM_ENV_VAR}={value!r}")
+        return DEFAULT_GLOBAL_RPM
+    return rpm if rpm > 0 else DEFAULT_GLOBAL_RPM
+
 
 class ErrorCategory(Enum):
     """Categorization of API errors for intelligent handling"""
@@ -55,6 +78,218 @@ class ErrorAction(Enum):
     LOG_AND_CONTINUE = "log_and_continue"  # Log but continue
 
 
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate for Gemini prompts (~4 characters per token)."""
+    return len(text) // 4 if text else 0
+
+
+class TokenBucket:
+    """
+    Continuously refilling token bucket.
+
+    Holds up to `rate` tokens and refills at `rate / per_seconds` tokens per
+    second. Consumption may drive the balance negative (e.g. when output
+    tokens are only known after a response); callers then wait until the
+    debt has been repaid.
+    """
+
+    def __init__(self, rate: float, per_seconds: float = 60.0):
+        self.rate = float(rate)
+        self.per_seconds = per_seconds
+        self.tokens = float(rate)
+        self.last_refill = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.rate, self.tokens + elapsed * self.rate / self.per_seconds)
+            self.last_refill = now
+
+    def time_until(self, amount: float, now: float) -> float:
+        """Seconds until `amount` tokens are available (requests larger than the bucket wait for a full bucket)."""
+        self._refill(now)
+        needed = min(amount, self.rate) - self.tokens
+        if needed <= 0:
+            return 0.0
+        return needed * self.per_seconds / self.rate
+
+    def consume(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.tokens -= amount
+
+
+class QuotaTicket:
+    """A single pending acquire() call (compared by identity in the wait queue)."""
+    __slots__ = ("module", "demand")
+
+    def __init__(self, module: Optional[str], input_tokens: int, output_tokens: int):
+        self.module = module
+        self.demand = {"requests": 1, "input_tokens": input_tokens, "output_tokens": output_tokens}
+
+
+class QuotaScheduler:
+    """
+    FIFO-fair admission control over request and token budgets.
+
+    Every caller takes a ticket in arrival order. A ticket is admitted once all
+    of its buckets (global requests/input tokens/output tokens, plus its
+    module's sub-budget if one is configured) can cover it and no earlier
+    ticket is ready to go first. Waiting happens on a condition variable, so the
+    lock is released while callers sleep.
+
+    Earlier tickets only block later ones when they belong to the same module
+    or are held back solely by the global buckets; a module that has exhausted
+    its own sub-budget (e.g. the judge) therefore cannot hold up other modules
+    (e.g. intake).
+    """
+
+    # Upper bound on a single wait so blocked tickets periodically re-check ordering.
+    MAX_WAIT_SLICE = 1.0
+
+    def __init__(self, rpm: float, input_tpm: Optional[float] = None,
+                 output_tpm: Optional[float] = None, per_seconds: float = 60.0,
+                 module_budgets: Optional[Dict[str, Dict[str, float]]] = None):
+        """
+        Args:
+            rpm: Requests allowed per period
+            input_tpm: Input tokens allowed per period (None = unlimited)
+            output_tpm: Output tokens allowed per period (None = unlimited)
+            per_seconds: Length of the period in seconds (default: 60)
+            module_budgets: Optional {module: {'rpm', 'input_tpm', 'output_tpm'}} sub-budgets
+        """
+        self.per_seconds = per_seconds
+        self.cond = threading.Condition(threading.Lock())
+        self.waiters = deque()
+        self.global_buckets = self._make_buckets(rpm, input_tpm, output_tpm)
+        self.module_buckets: Dict[str, Dict[str, TokenBucket]] = {}
+        self.grant_times = deque()
+        self.total_granted = 0
+        self.total_waits = 0
+        for module, budget in (module_budgets or {}).items():
+            self.set_module_budget(module, **budget)
+
+    def _make_buckets(self, rpm: Optional[float], input_tpm: Optional[float],
+                      output_tpm: Optional[float]) -> Dict[str, TokenBucket]:
+        buckets = {}
+        for kind, limit in (("requests", rpm), ("input_tokens", input_tpm), ("output_tokens", output_tpm)):
+            if limit:
+                buckets[kind] = TokenBucket(limit, self.per_seconds)
+        return buckets
+
+    def set_limits(self, rpm: Optional[float] = None, input_tpm: Optional[float] = None,
+                   output_tpm: Optional[float] = None) -> None:
+        """Replace the global budgets (None leaves a budget unchanged). Current fill levels carry over."""
+        with self.cond:
+            previous = self.global_buckets
+            current = {kind: bucket.rate for kind, bucket in previous.items()}
+            self.global_buckets = self._make_buckets(
+                rpm if rpm is not None else current.get("requests"),
+                input_tpm if input_tpm is not None else current.get("input_tokens"),
+                output_tpm if output_tpm is not None else current.get("output_tokens"),
+            )
+            now = time.monotonic()
+            for kind, bucket in self.global_buckets.items():
+                if kind in previous:
+                    previous[kind]._refill(now)
+                    bucket.tokens = min(bucket.rate, previous[kind].tokens)
+                    bucket.last_refill = now
+            self.cond.notify_all()
+
+    def set_module_budget(self, module: str, rpm: Optional[float] = None,
+                          input_tpm: Optional[float] = None, output_tpm: Optional[float] = None) -> None:
+        """Cap one module's share of the global budget; all-None removes the cap."""
+        with self.cond:
+            buckets = self._make_buckets(rpm, input_tpm, output_tpm)
+            if buckets:
+                self.module_buckets[module] = buckets
+            else:
+                self.module_buckets.pop(module, None)
+            self.cond.notify_all()
+
+    def _delay(self, buckets: Dict[str, TokenBucket], demand: Dict[str, float], now: float) -> float:
+        return max((bucket.time_until(demand[kind], now) for kind, bucket in buckets.items()), default=0.0)
+
+    def _module_delay(self, ticket: QuotaTicket, now: float) -> float:
+        buckets = self.module_buckets.get(ticket.module)
+        return self._delay(buckets, ticket.demand, now) if buckets else 0.0
+
+    def _has_priority(self, ticket: QuotaTicket, now: float) -> bool:
+        """True if no earlier ticket should be admitted before this one."""
+        for other in self.waiters:
+            if other is ticket:
+                return True
+            if other.module == ticket.module or self._module_delay(other, now) <= 0:
+                return False
+        return True
+
+    def acquire(self, module: Optional[str] = None, input_tokens: int = 0,
+                output_tokens: int = 0, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Block until the request fits every applicable budget, then reserve it.
+
+        Returns:
+            Seconds spent waiting, or None if `timeout` expired first
+        """
+        ticket = QuotaTicket(module, input_tokens, output_tokens)
+        start = time.monotonic()
+        deadline = start + timeout if timeout is not None else None
+        with self.cond:
+            self.waiters.append(ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    if self._has_priority(ticket, now):
+                        demand = ticket.demand
+                        delay = max(self._delay(self.global_buckets, demand, now),
+                                    self._module_delay(ticket, now))
+                        if delay <= 0:
+                            for bucket_set in (self.global_buckets, self.module_buckets.get(module, {})):
+                                for kind, bucket in bucket_set.items():
+                                    bucket.consume(demand[kind], now)
+                            self._record_grant(now, waited=now - start)
+                            return now - start
+                    else:
+                        delay = self.MAX_WAIT_SLICE
+                    if deadline is not None:
+                        if now >= deadline:
+                            return None
+                        delay = min(delay, deadline - now)
+                    self.cond.wait(min(delay, self.MAX_WAIT_SLICE))
+            finally:
+                self.waiters.remove(ticket)
+                self.cond.notify_all()
+
+    def _record_grant(self, now: float, waited: float) -> None:
+        self.total_granted += 1
+        if waited > 0:
+            self.total_waits += 1
+        self.grant_times.append(now)
+        while self.grant_times and now - self.grant_times[0] >= self.per_seconds:
+            self.grant_times.popleft()
+
+    def record_output_tokens(self, output_tokens: int, module: Optional[str] = None) -> None:
+        """Charge output tokens that were only known after the response arrived."""
+        if output_tokens <= 0:
+            return
+        with self.cond:
+            now = time.monotonic()
+            for bucket_set in (self.global_buckets, self.module_buckets.get(module, {})):
+                if "output_tokens" in bucket_set:
+                    bucket_set["output_tokens"].consume(output_tokens, now)
+
+    def grants_in_window(self) -> int:
+        """Number of requests admitted during the trailing period."""
+        with self.cond:
+            now = time.monotonic()
+            while self.grant_times and now - self.grant_times[0] >= self.per_seconds:
+                self.grant_times.popleft()
+            return len(self.grant_times)
+
+    def queue_depth(self) -> int:
+        with self.cond:
+            return len(self.waiters)
+
+
 class GlobalRateLimiter:
     """
     Singleton class to track API usage across all pipeline modules.
@@ -75,10 +310,12 @@ class GlobalRateLimiter:
         if self._initialized:
             return
             
-        self.global_rpm_limit = 10  # Conservative global limit
         self.available_rpm = 1000  # What Google provides
-        self.calls_this_minute = 0
-        self.minute_start = time.time()
+        self.quota = QuotaScheduler(
+            rpm=_rpm_from_environment(),
+            input_tpm=1_000_000,  # gemini-2.5-flash input tokens per minute
+            output_tpm=None
+        )
         self.total_calls = 0
         self.error_counts = {}
         self.last_errors = []  # Track recent errors
@@ -86,6 +323,9 @@ class GlobalRateLimiter:
         self.consecutive_errors = 0
         self.max_consecutive_errors = 10
         self.lock = threading.Lock()
+        self.rpm_file = os.environ.get(API_RPM_FILE_ENV_VAR) or None
+        self._rpm_file_checked = 0.0
+        self._rpm_file_mtime = None
         
         # Error categorization rules
         self.error_rules = self._build_error_rules()
@@ -104,6 +344,34 @@ class GlobalRateLimiter:
         
         self._initialized = True
         logger.info(f"[GLOBAL LIMITER] Initialized with {self.global_rpm_limit} RPM limit (max available: {self.available_rpm})")
+
+    @property
+    def global_rpm_limit(self) -> int:
+        """Global requests-per-minute budget shared by all modules"""
+        return int(self.quota.global_buckets["requests"].rate)
+
+    @global_rpm_limit.setter
+    def global_rpm_limit(self, value: int) -> None:
+        self.quota.set_limits(rpm=value)
+
+    @property
+    def calls_this_minute(self) -> int:
+        return self.quota.grants_in_window()
+
+    def set_token_limits(self, input_tpm: Optional[int] = None, output_tpm: Optional[int] = None) -> None:
+        """Set global input/output tokens-per-minute budgets"""
+        self.quota.set_limits(input_tpm=input_tpm, output_tpm=output_tpm)
+
+    def set_module_budget(self, module: str, rpm: Optional[int] = None,
+                          input_tpm: Optional[int] = None, output_tpm: Optional[int] = None) -> None:
+        """
+        Cap a module's share of the global budget.
+
+        Module names match the pipeline stages ('journal_reviewer', 'judge',
+        'deep_reviewer', 'orchestrator'). Passing no limits removes the cap.
+        """
+        self.quota.set_module_budget(module, rpm=rpm, input_tpm=input_tpm, output_tpm=output_tpm)
+        logger.info(f"[GLOBAL LIMITER] Module budget for {module}: rpm={rpm}, input_tpm={input_tpm}, output_tpm={output_tpm}")
     
     def _build_error_rules(self) -> Dict[ErrorCategory, ErrorAction]:
         """Define how to handle each error category"""
@@ -217,28 +485,53 @@ class GlobalRateLimiter:
         
         return True, ""
     
-    def wait_for_quota(self) -> None:
-        """Global rate limiting across all modules"""
+    def wait_for_quota(self, module: Optional[str] = None, input_tokens: int = 0,
+                       output_tokens: int = 0) -> None:
+        """
+        Global rate limiting across all modules.
+
+        Blocks (without holding self.lock) until one request plus the given
+        token estimates fit the global budgets and the module's sub-budget.
+        Output tokens not known up front can be charged afterwards with
+        record_response_usage().
+        """
+        self._refresh_rpm_from_file()
+        waited = self.quota.acquire(module=module, input_tokens=input_tokens, output_tokens=output_tokens)
         with self.lock:
-            current_time = time.time()
-            
-            # Reset counter every 60 seconds
-            if current_time - self.minute_start >= 60:
-                self.calls_this_minute = 0
-                self.minute_start = current_time
-            
-            # Check if we need to wait
-            if self.calls_this_minute >= self.global_rpm_limit:
-                sleep_time = 60.1 - (current_time - self.minute_start)
-                if sleep_time > 0:
-                    self.stats["quota_pauses"] += 1
-                    logger.info(f"[GLOBAL LIMITER] Rate limit ({self.global_rpm_limit}/min) reached. Sleeping {sleep_time:.1f}s...")
-                    time.sleep(sleep_time)
-                    self.calls_this_minute = 0
-                    self.minute_start = time.time()
-            
-            self.calls_this_minute += 1
+            if waited and waited > 0.05:
+                self.stats["quota_pauses"] += 1
+                logger.info(f"[GLOBAL LIMITER] Rate limit ({self.global_rpm_limit}/min) reached. Waited {waited:.1f}s"
+                            f"{f' ({module})' if module else ''}")
             self.total_calls += 1
+
+    def _refresh_rpm_from_file(self) -> None:
+        """Apply a new RPM limit from the API_RPM_FILE_ENV_VAR file, checked every API_RPM_FILE_POLL_SECONDS."""
+        if not self.rpm_file:
+            return
+        with self.lock:
+            now = time.monotonic()
+            if now - self._rpm_file_checked < API_RPM_FILE_POLL_SECONDS:
+                return
+            self._rpm_file_checked = now
+            try:
+                mtime = os.stat(self.rpm_file).st_mtime_ns
+                if mtime == self._rpm_file_mtime:
+                    return
+                with open(self.rpm_file, 'r') as f:
+                    rpm = float(f.read().strip())
+            except (OSError, ValueError):
+                return
+            self._rpm_file_mtime = mtime
+        if rpm > 0 and rpm != self.quota.global_buckets["requests"].rate:
+            self.global_rpm_limit = rpm
+            logger.info(f"[GLOBAL LIMITER] RPM limit changed to {rpm:g} ({self.rpm_file})")
+
+    def record_response_usage(self, response: Any, module: Optional[str] = None) -> None:
+        """Charge a response's output tokens (from usage_metadata) against the output budget"""
+        usage_metadata = getattr(response, 'usage_metadata', None)
+        output_tokens = getattr(usage_metadata, 'candidates_token_count', 0) if usage_metadata else 0
+        if isinstance(output_tokens, int) and output_tokens > 0:
+            self.quota.record_output_tokens(output_tokens, module)
     
     def record_request(self, success: bool, error: Optional[Exception] = None, response_text: str = "") -> None:
         """Record API request outcome for statistics and error tracking"""
@@ -298,11 +591,12 @@ class GlobalRateLimiter:
                 stats["success_rate"] = 0.0
                 stats["error_rate"] = 0.0
             
-            stats["calls_this_minute"] = self.calls_this_minute
             stats["total_calls"] = self.total_calls
             stats["consecutive_errors"] = self.consecutive_errors
-            
-            return stats
+
+        stats["calls_this_minute"] = self.calls_this_minute
+        stats["quota_queue_depth"] = self.quota.queue_depth()
+        return stats
     
     def print_statistics(self) -> None:
         """Print formatted statistics"""
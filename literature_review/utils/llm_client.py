@@ -0,0 +1,377 @@
+"""
+Unified LLM Client
+Version: 1.0
+
+Single client used by every pipeline stage (journal reviewer, judge, deep
+reviewer, orchestrator and the shared utils APIManager) for Gemini calls.
+
+This module provides:
+1. One retry / error-categorization policy driven by the global rate limiter
+2. Pluggable response cache backends (in-memory, persistent SQLite, none)
+3. Pluggable transports (Gemini SDK, scripted fake, record/replay) so the
+   pipeline can be exercised and benchmarked offline
+4. Blocking (`call`), async (`acall`) and ordered fan-out (`call_many`) APIs
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+from literature_review.utils.global_rate_limiter import estimate_tokens
+from literature_review.utils.response_cache import ResponseCache, get_response_cache, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "gemini-2.5-flash"
+
+# Seconds to wait before retrying, keyed by ErrorAction value
+ACTION_RETRY_DELAYS = {
+    "retry_immediate": 2,
+    "retry_with_delay": 5,
+    "retry_long_delay": 10,
+}
+
+# finish_reason 1 = STOP (normal completion)
+NORMAL_FINISH_REASONS = (1, "STOP", "FinishReason.STOP")
+
+
+def prompt_cache_key(text: str) -> str:
+    """Cache key for a prompt (or custom cache key string)."""
+    return hashlib.md5(text.encode('utf-8')).hexdigest()
+
+
+def repair_json(response_text: str) -> Any:
+    """Parse JSON, fixing the doubled-quote malformation Gemini occasionally emits (""key" -> "key")."""
+    return json.loads(response_text.replace('""', '"'))
+
+
+# --- Cache Backends ---
+
+class CacheBackend(ABC):
+    """Interface for response caches. `get` returns None on a miss."""
+
+    def key_for(self, model: str, config: Any, prompt_key: str) -> str:
+        """Storage key for a prompt hash. Process-local caches key on the prompt alone."""
+        return prompt_key
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for `key`, or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Store `value` under `key`."""
+
+
+class NullCache(CacheBackend):
+    """Cache that never stores anything."""
+
+    def get(self, key: str) -> Optional[Any]:
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+class MemoryCache(CacheBackend):
+    """Process-local dict cache. Pass an existing dict to share it with the caller."""
+
+    def __init__(self, store: Optional[Dict[str, Any]] = None):
+        self.store = store if store is not None else {}
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.store.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        self.store[key] = value
+
+
+class PersistentCache(CacheBackend):
+    """
+    On-disk cache backed by the shared SQLite ResponseCache.
+
+    Keys are content addresses over (model, generation config, prompt hash),
+    so entries survive restarts and are shared between pipeline processes.
+    """
+
+    def __init__(self, store: Optional[ResponseCache] = None, ttl: Optional[float] = None):
+        self.store = store if store is not None else get_response_cache()
+        self.ttl = ttl
+
+    def key_for(self, model: str, config: Any, prompt_key: str) -> str:
+        return make_cache_key(model, config, prompt_key)
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            return self.store.get(key)
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            self.store.set(key, value, ttl=self.ttl)
+        except sqlite3.Error as e:
+            logger.error(f"Response cache write failed: {e}")
+
+
+# --- Transports ---
+
+class GeminiTransport:
+    """Sends prompts through a google.genai Client."""
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    def generate(self, model: str, prompt: str, config: Any) -> Any:
+        return self.client.models.generate_content(model=model, contents=prompt, config=config)
+
+
+def make_fake_response(text: str, prompt: str = "") -> SimpleNamespace:
+    """Build an object shaped like a Gemini response (text + usage_metadata)."""
+    return SimpleNamespace(
+        text=text,
+        candidates=[],
+        usage_metadata=SimpleNamespace(
+            prompt_token_count=estimate_tokens(prompt),
+            candidates_token_count=estimate_tokens(text),
+            cached_content_token_count=0,
+        ),
+    )
+
+
+class FakeTransport:
+    """
+    Scripted transport for tests and offline benchmarks.
+
+    Args:
+        responder: Function mapping a prompt to the response text
+        latency: Simulated seconds per call
+    """
+
+    def __init__(self, responder: Callable[[str], str], latency: float = 0.0):
+        self.responder = responder
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate(self, model: str, prompt: str, config: Any) -> Any:
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return make_fake_response(self.responder(prompt), prompt)
+
+
+class ReplayTransport:
+    """
+    Replays recorded responses from a JSONL file of {"key", "text"} records.
+
+    With `inner` set, prompts that have no recording are sent to the inner
+    transport and the response is appended to the file (record mode).
+    """
+
+    def __init__(self, path: str, inner: Optional[Any] = None):
+        self.path = path
+        self.inner = inner
+        self.recordings: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self.recordings[record["key"]] = record["text"]
+
+    def generate(self, model: str, prompt: str, config: Any) -> Any:
+        key = prompt_cache_key(f"{model}\n{prompt}")
+        if key in self.recordings:
+            return make_fake_response(self.recordings[key], prompt)
+        if self.inner is None:
+            raise LookupError(f"No recorded response for prompt {key}")
+        response = self.inner.generate(model, prompt, config)
+        with self._lock:
+            self.recordings[key] = response.text
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({"key": key, "text": response.text}) + "\n")
+        return response
+
+
+# --- Client ---
+
+class LLMClient:
+    """
+    Cached, rate-limited, retrying LLM client shared by all pipeline stages.
+
+    Args:
+        transport: Object with generate(model, prompt, config) -> response
+        limiter: GlobalRateLimiter instance used for quota, validation and
+            error categorization (pass the caller's own global_limiter)
+        cache: Response cache backend (default: in-memory)
+        module: Module name used for rate-limit sub-budgets
+        json_config: Generation config for JSON responses
+        text_config: Generation config for text responses
+        model: Model name
+        retry_attempts: Attempts per call
+        retry_delay: Base retry delay in seconds
+        on_response: Optional hook(response, context) called after each successful
+            API response (e.g. cost tracking); errors in the hook are logged and ignored
+    """
+
+    def __init__(self, transport: Any, limiter: Any = None, cache: Optional[CacheBackend] = None,
+                 module: Optional[str] = None, json_config: Any = None, text_config: Any = None,
+                 model: str = DEFAULT_MODEL, retry_attempts: int = 3, retry_delay: float = 5,
+                 on_response: Optional[Callable[[Any, Dict[str, Any]], None]] = None):
+        if limiter is None:
+            from literature_review.utils.global_rate_limiter import global_limiter
+            limiter = global_limiter
+        self.transport = transport
+        self.limiter = limiter
+        self.cache = cache if cache is not None else MemoryCache()
+        self.module = module
+        self.json_config = json_config
+        self.text_config = text_config
+        self.model = model
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        self.on_response = on_response
+
+    def call(self, prompt: str, is_json: bool = True, use_cache: bool = True,
+             cache_key: Optional[str] = None, config: Any = None,
+             module: Optional[str] = None, context: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """
+        Make a blocking API call with caching, validation, rate limiting and retries.
+
+        Args:
+            prompt: The prompt to send
+            is_json: Parse the response as JSON
+            use_cache: Return a cached response when available (responses are always stored)
+            cache_key: Custom string to key the cache on instead of the prompt
+            config: Generation config override (default: json_config / text_config)
+            module: Module name override for rate limiting
+            context: Extra metadata passed to the on_response hook
+
+        Returns:
+            Parsed JSON, response text, or None on failure
+        """
+        if config is None:
+            config = self.json_config if is_json else self.text_config
+
+        key = self.cache.key_for(self.model, config, prompt_cache_key(cache_key or prompt))
+        if use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.debug(f"Cache hit for hash: {key}")
+                return cached
+
+        is_valid, reason = self.limiter.validate_request(
+            prompt, {'response_mime_type': 'application/json' if is_json else None})
+        if not is_valid:
+            logger.error(f"Request validation failed: {reason}")
+            self.limiter.record_request(success=False)
+            return None
+
+        if self.limiter.should_abort_pipeline():
+            logger.critical("Pipeline abort recommended due to error patterns")
+            return None
+
+        module = module or self.module
+        logger.debug(f"Cache miss for hash: {key}. Calling API...")
+        self.limiter.wait_for_quota(module=module, input_tokens=estimate_tokens(prompt))
+
+        for attempt in range(self.retry_attempts):
+            response_text = ""
+            try:
+                response = self.transport.generate(self.model, prompt, config)
+                response_text = response.text or ""
+                self.limiter.record_response_usage(response, module)
+                self._warn_on_truncation(response, response_text)
+                result = self._parse(response_text, is_json, attempt)
+                if self.on_response is not None:
+                    try:
+                        self.on_response(response, context or {})
+                    except Exception as hook_error:
+                        logger.warning(f"Response hook failed: {hook_error}")
+                self.cache.set(key, result)
+                self.limiter.record_request(success=True)
+                return result
+            except json.JSONDecodeError as e:
+                logger.error(
+                    f"JSON decode error on attempt {attempt + 1}: {e}. Response text: '{response_text[:500]}...'")
+                error, error_text = e, response_text
+            except Exception as e:
+                if "DeadlineExceeded" in str(e) or "Timeout" in str(e):
+                    logger.error(f"API call timed out on attempt {attempt + 1}")
+                else:
+                    logger.error(f"API error on attempt {attempt + 1}: {type(e).__name__} - {e}")
+                error, error_text = e, str(e)
+
+            category = self.limiter.categorize_error(error, error_text)
+            action = self.limiter.get_action_for_error(category)
+            self.limiter.record_request(success=False, error=error, response_text=error_text)
+
+            if action.value == "abort_pipeline":
+                logger.critical(f"Aborting due to {category.name}")
+                return None
+            if action.value == "skip_document":
+                logger.error(f"Skipping request due to {category.name}")
+                return None
+            if attempt < self.retry_attempts - 1:
+                time.sleep(self._retry_delay(action, error, attempt))
+
+        logger.error(f"API call failed after {self.retry_attempts} attempts.")
+        return None
+
+    async def acall(self, prompt: str, **kwargs) -> Optional[Any]:
+        """Async variant of call(); runs the blocking transport in a worker thread."""
+        return await asyncio.to_thread(self.call, prompt, **kwargs)
+
+    def call_many(self, prompts: List[str], max_workers: int = 4, **kwargs) -> List[Optional[Any]]:
+        """
+        Issue several calls concurrently (each still rate limited).
+
+        Returns:
+            Results in the same order as `prompts`
+        """
+        if max_workers <= 1 or len(prompts) <= 1:
+            return [self.call(prompt, **kwargs) for prompt in prompts]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts)),
+                                thread_name_prefix="llm-call") as executor:
+            return list(executor.map(lambda prompt: self.call(prompt, **kwargs), prompts))
+
+    def _parse(self, response_text: str, is_json: bool, attempt: int) -> Any:
+        if not is_json:
+            return response_text
+        try:
+            return json.loads(response_text)
+        except json.JSONDecodeError:
+            if attempt != 0:
+                raise
+            # Only try the repair on the first attempt; later attempts get a fresh response
+            result = repair_json(response_text)
+            logger.info("✅ Successfully repaired malformed JSON")
+            return result
+
+    def _retry_delay(self, action: Any, error: Exception, attempt: int) -> float:
+        if "429" in str(error):
+            logger.warning("Rate limit error detected by API, increasing sleep time.")
+            return self.retry_delay * (attempt + 2)
+        return ACTION_RETRY_DELAYS.get(action.value, self.retry_delay)
+
+    @staticmethod
+    def _warn_on_truncation(response: Any, response_text: str) -> None:
+        candidates = getattr(response, 'candidates', None)
+        if not isinstance(candidates, (list, tuple)) or not candidates:
+            return
+        finish_reason = getattr(candidates[0], 'finish_reason', None)
+        if finish_reason is not None and finish_reason not in NORMAL_FINISH_REASONS:
+            logger.warning(f"⚠️ Response finish_reason: {finish_reason}, text length: {len(response_text)}")
@@ -14,8 +14,9 @@ logger = logging.getLogger(__name__)
 
 # Optional semantic similarity support
 try:
-    from sentence_transformers import SentenceTransformer
+    import sentence_transformers  # noqa: F401
     import numpy as np
+    from literature_review.utils.embedding_service import EmbeddingService, get_embedding_service
     SEMANTIC_AVAILABLE = True
 except ImportError:
     SEMANTIC_AVAILABLE = False
@@ -28,7 +29,8 @@ class RelevanceScorer:
     def __init__(
         self,
         use_semantic: bool = False,
-        semantic_weight: float = 0.5
+        semantic_weight: float = 0.5,
+        embedding_service: Optional['EmbeddingService'] = None
     ):
         """
         Initialize relevance scorer.
@@ -37,19 +39,23 @@ class RelevanceScorer:
             use_semantic: Enable semantic similarity (requires sentence-transformers)
             semantic_weight: Weight for semantic score (0.0-1.0).
                            Final = keyword_score * (1-weight) + semantic_score * weight
+            embedding_service: Embedding service to use (default: the shared
+                               all-MiniLM-L6-v2 service)
         """
         self.use_semantic = use_semantic and SEMANTIC_AVAILABLE
         self.semantic_weight = semantic_weight
+        self.model = None
+        self.embeddings = None
         
         if self.use_semantic:
             try:
-                self.model = SentenceTransformer('all-MiniLM-L6-v2')
+                self.embeddings = embedding_service or get_embedding_service('all-MiniLM-L6-v2')
+                self.model = self.embeddings.model
                 logger.info("Semantic similarity enabled")
             except Exception as e:
                 logger.warning(f"Failed to load semantic model: {e}. Using keyword-only.")
                 self.use_semantic = False
-        else:
-            self.model = None
+                self.embeddings = None
     
     def score_relevance(self, paper: Dict, gap: Dict) -> float:
         """
@@ -73,19 +79,26 @@ class RelevanceScorer:
         
         # If semantic scoring is enabled, compute semantic similarity
         if self.use_semantic and self.model:
-            gap_text = gap.get('requirement_text', '') or ' '.join(gap_keywords)
-            semantic_score = self._semantic_similarity_score(paper_text, gap_text)
-            
-            # Blend scores
+            semantic_score = self._semantic_similarity_score(paper_text, self._get_gap_text(gap))
+            return self._blend(keyword_score, semantic_score)
+        
+        return self._blend(keyword_score, None)
+    
+    def _blend(self, keyword_score: float, semantic_score: Optional[float]) -> float:
+        """Combine keyword and semantic scores, clamped to 0.0-1.0."""
+        if semantic_score is None:
+            final_score = keyword_score
+        else:
             final_score = (
                 keyword_score * (1 - self.semantic_weight) +
                 semantic_score * self.semantic_weight
             )
-        else:
-            final_score = keyword_score
-        
         return min(1.0, max(0.0, final_score))
     
+    def _get_gap_text(self, gap: Dict) -> str:
+        """Text compared semantically against papers: requirement text, else keywords."""
+        return gap.get('requirement_text', '') or ' '.join(gap.get('keywords', []))
+    
     def _get_paper_text(self, paper: Dict) -> str:
         """Extract searchable text from paper."""
         title = paper.get('title', '')
@@ -147,14 +160,9 @@ class RelevanceScorer:
             return 0.0
         
         try:
-            # Encode texts
-            embedding1 = self.model.encode(text1, convert_to_numpy=True)
-            embedding2 = self.model.encode(text2, convert_to_numpy=True)
-            
-            # Compute cosine similarity
-            similarity = np.dot(embedding1, embedding2) / (
-                np.linalg.norm(embedding1) * np.linalg.norm(embedding2)
-            )
+            # Embeddings are normalized and cached, so this is a dot product
+            embedding1, embedding2 = self.embeddings.embed_many([text1, text2])
+            similarity = np.dot(embedding1, embedding2)
             
             # Normalize to 0-1 range (cosine similarity is already -1 to 1, but usually 0-1)
             return max(0.0, min(1.0, float(similarity)))
@@ -171,7 +179,9 @@ class RelevanceScorer:
         """
         Score all papers against all gaps (batch processing).
         
-        For each paper, computes max relevance across all gaps.
+        For each paper, computes max relevance across all gaps. With semantic
+        scoring, all paper and gap texts are embedded in batches and the
+        papers x gaps similarities come from a single matrix product.
         
         Args:
             papers: List of paper dictionaries
@@ -181,12 +191,20 @@ class RelevanceScorer:
             Dictionary mapping paper_id -> max_relevance_score
         """
         results = {}
+        paper_texts = [self._get_paper_text(paper) for paper in papers]
+        semantic_scores = None
+        if self.use_semantic and self.model and papers and gaps:
+            semantic_scores = self._semantic_similarity_matrix(paper_texts, [self._get_gap_text(gap) for gap in gaps])
         
-        for paper in papers:
+        for i, (paper, paper_text) in enumerate(zip(papers, paper_texts)):
             paper_id = paper.get('id') or paper.get('filename', 'unknown')
             
             # Compute relevance to each gap
-            scores = [self.score_relevance(paper, gap) for gap in gaps]
+            scores = [
+                self._blend(self._keyword_match_score(paper_text, gap.get('keywords', [])),
+                            None if semantic_scores is None else float(semantic_scores[i, j]))
+                for j, gap in enumerate(gaps)
+            ]
             
             # Take max score (most relevant gap)
             max_score = max(scores) if scores else 0.0
@@ -194,3 +212,22 @@ class RelevanceScorer:
             results[paper_id] = max_score
         
         return results
+    
+    def _semantic_similarity_matrix(self, paper_texts: List[str], gap_texts: List[str]) -> 'np.ndarray':
+        """
+        Semantic similarity of every paper to every gap, clamped to 0.0-1.0.
+        
+        Empty texts score 0.0, as in _semantic_similarity_score.
+        """
+        scores = np.zeros((len(paper_texts), len(gap_texts)), dtype=np.float32)
+        rows = [i for i, text in enumerate(paper_texts) if text]
+        cols = [j for j, text in enumerate(gap_texts) if text]
+        if not rows or not cols:
+            return scores
+        try:
+            similarity = self.embeddings.similarity_matrix([paper_texts[i] for i in rows],
+                                                           [gap_texts[j] for j in cols])
+            scores[np.ix_(rows, cols)] = np.clip(similarity, 0.0, 1.0)
+        except Exception as e:
+            logger.warning(f"Semantic similarity failed: {e}")
+        return scores
@@ -0,0 +1,284 @@
+"""
+Persistent LLM Response Cache
+Content-addressed SQLite store shared by every pipeline stage and process.
+
+Entries are keyed by (model, generation config, prompt hash) so a change of
+model or temperature never returns a stale answer. The store supports
+size-capped LRU eviction, per-entry TTL and persistent hit/miss counters.
+SQLite WAL mode plus a busy timeout make it safe to share between the
+dashboard and concurrently running pipeline processes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from literature_review.utils.sqlite_store import SQLiteStore, StoreRegistry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DB = os.path.join('api_cache', 'llm_responses.db')
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    expires_at REAL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+CREATE INDEX IF NOT EXISTS idx_entries_expires_at ON entries(expires_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+COUNTER_NAMES = ('hits', 'misses', 'writes', 'evictions', 'expirations')
+# Entries deleted per statement when the size cap is exceeded
+EVICTION_BATCH = 64
+# Lookups buffered before hit/miss counters and access times are written
+ACCESS_FLUSH_BATCH = 64
+ACCESS_FLUSH_SECONDS = 5.0
+
+
+def config_fingerprint(config: Any) -> str:
+    """Stable string form of a generation config (GenerateContentConfig, dict or None)."""
+    if config is None:
+        return ""
+    if hasattr(config, 'model_dump'):
+        config = config.model_dump(mode='json', exclude_none=True)
+    elif hasattr(config, '__dict__') and not isinstance(config, dict):
+        config = {k: v for k, v in vars(config).items() if v is not None}
+    return json.dumps(config, sort_keys=True, default=str)
+
+
+def make_cache_key(model: str, config: Any, prompt_key: str) -> str:
+    """Content address for a response: sha256 over model, config and prompt hash."""
+    material = "\n".join([model or "", config_fingerprint(config), prompt_key])
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class ResponseCache(SQLiteStore):
+    """
+    SQLite-backed response store with LRU eviction and TTL.
+
+    Lookups are plain autocommit reads, so readers never take the write lock.
+    Hit/miss counters and access times are buffered and written in batches
+    (with the next `set`, every ACCESS_FLUSH_BATCH lookups or
+    ACCESS_FLUSH_SECONDS, and by `stats` and `close`). The total stored size is
+    kept in the counters table, so eviction only scans entries once the cap is
+    exceeded.
+
+    Args:
+        db_path: Path to the SQLite database file
+        max_bytes: Evict least-recently-used entries once stored values exceed this size
+        default_ttl: Seconds before an entry expires (None = never)
+        read_only: Open an existing database without creating or writing anything
+    """
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_DB, max_bytes: int = DEFAULT_MAX_BYTES,
+                 default_ttl: Optional[float] = None, read_only: bool = False):
+        super().__init__(db_path, read_only=read_only)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._pending_lock = threading.Lock()
+        self._pending_counters: Dict[str, int] = {}
+        self._pending_access: Dict[str, Tuple[float, int]] = {}
+        self._pending_lookups = 0
+        self._last_flush = time.monotonic()
+        if read_only:
+            return
+        # executescript manages its own transaction
+        self._connection().executescript(_SCHEMA)
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO counters (name, value) VALUES (?, 0)",
+                [(name,) for name in COUNTER_NAMES]
+            )
+            # Running total of stored value sizes (seeded once for older databases)
+            conn.execute(
+                "INSERT OR IGNORE INTO counters (name, value) "
+                "SELECT 'bytes', COALESCE(SUM(size), 0) FROM entries"
+            )
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, name: str, amount: int = 1) -> None:
+        conn.execute("UPDATE counters SET value = value + ? WHERE name = ?", (amount, name))
+
+    def _record(self, counter: str, key: Optional[str] = None, now: Optional[float] = None) -> None:
+        """Buffer a lookup outcome (and the entry's new access time on a hit)."""
+        if self.read_only:
+            return
+        with self._pending_lock:
+            self._pending_counters[counter] = self._pending_counters.get(counter, 0) + 1
+            if key is not None:
+                _, hits = self._pending_access.get(key, (now, 0))
+                self._pending_access[key] = (now, hits + 1)
+            self._pending_lookups += 1
+            due = (self._pending_lookups >= ACCESS_FLUSH_BATCH
+                   or time.monotonic() - self._last_flush >= ACCESS_FLUSH_SECONDS)
+        if due:
+            self.flush()
+
+    def _take_pending(self) -> Tuple[Dict[str, int], Dict[str, Tuple[float, int]]]:
+        with self._pending_lock:
+            counters, access = self._pending_counters, self._pending_access
+            self._pending_counters, self._pending_access = {}, {}
+            self._pending_lookups = 0
+            self._last_flush = time.monotonic()
+        return counters, access
+
+    def _write_pending(self, conn: sqlite3.Connection) -> None:
+        counters, access = self._take_pending()
+        for name, amount in counters.items():
+            self._bump(conn, name, amount)
+        if access:
+            conn.executemany(
+                "UPDATE entries SET last_access = MAX(last_access, ?), hits = hits + ? WHERE key = ?",
+                [(accessed, hits, key) for key, (accessed, hits) in access.items()]
+            )
+
+    def flush(self) -> None:
+        """Write buffered hit/miss counters and access times."""
+        if self.read_only:
+            return
+        with self._pending_lock:
+            if not self._pending_counters and not self._pending_access:
+                return
+        with self._transaction() as conn:
+            self._write_pending(conn)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss or expired entry."""
+        now = time.time()
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self._record('misses')
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= now:
+            if not self.read_only:
+                with self._transaction() as conn:
+                    self._delete_expired(conn, "key = ? AND expires_at <= ?", (key, now))
+            self._record('misses')
+            return None
+        self._record('hits', key, now)
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a JSON-serializable value, then evict LRU entries if over the size cap."""
+        payload = json.dumps(value, ensure_ascii=False)
+        size = len(payload.encode('utf-8'))
+        now = time.time()
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = now + ttl if ttl else None
+        with self._transaction() as conn:
+            self._write_pending(conn)
+            previous = conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, last_access, expires_at, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, payload, size, now, now, expires_at)
+            )
+            self._bump(conn, 'bytes', size - (previous[0] if previous else 0))
+            self._bump(conn, 'writes')
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT value FROM counters WHERE name = 'bytes'").fetchone()[0]
+        evicted = 0
+        while total > self.max_bytes:
+            batch = conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_access ASC LIMIT ?", (EVICTION_BATCH,)
+            ).fetchall()
+            if not batch:
+                break
+            doomed = []
+            for key, size in batch:
+                if total <= self.max_bytes:
+                    break
+                doomed.append((key,))
+                total -= size
+            conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+            self._bump(conn, 'bytes', -sum(size for _, size in batch[:len(doomed)]))
+            evicted += len(doomed)
+        if evicted:
+            self._bump(conn, 'evictions', evicted)
+            logger.debug(f"Response cache evicted {evicted} entries")
+
+    def _delete_expired(self, conn: sqlite3.Connection, where: str, params: Tuple) -> int:
+        removed, size = conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE {where}", params
+        ).fetchone()
+        if removed:
+            conn.execute(f"DELETE FROM entries WHERE {where}", params)
+            self._bump(conn, 'bytes', -size)
+            self._bump(conn, 'expirations', removed)
+        return removed
+
+    def purge_expired(self) -> int:
+        """Delete all expired entries. Returns the number removed."""
+        with self._transaction() as conn:
+            return self._delete_expired(conn, "expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        self._take_pending()
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("UPDATE counters SET value = 0")
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, size, hit/miss counters and entry age range."""
+        self.flush()
+        conn = self._connection()
+        count, oldest, newest = conn.execute(
+            "SELECT COUNT(*), MIN(created_at), MAX(created_at) FROM entries"
+        ).fetchone()
+        counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+        if 'bytes' in counters:
+            size = counters['bytes']
+        else:
+            # Read-only view of a database written before the running total existed
+            size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        lookups = counters.get('hits', 0) + counters.get('misses', 0)
+        return {
+            "entry_count": count,
+            "total_size_mb": round(size / (1024 * 1024), 2),
+            "max_size_mb": round(self.max_bytes / (1024 * 1024), 2),
+            "hits": counters.get('hits', 0),
+            "misses": counters.get('misses', 0),
+            "hit_rate": round(counters.get('hits', 0) / lookups, 4) if lookups else 0.0,
+            "writes": counters.get('writes', 0),
+            "evictions": counters.get('evictions', 0),
+            "expirations": counters.get('expirations', 0),
+            "oldest_entry": datetime.fromtimestamp(oldest).isoformat() if oldest else None,
+            "newest_entry": datetime.fromtimestamp(newest).isoformat() if newest else None,
+        }
+
+    def close(self) -> None:
+        """Write buffered lookups and close this thread's connection."""
+        self.flush()
+        super().close()
+
+
+# Shared instances, one per database path
+_response_caches: StoreRegistry[ResponseCache] = StoreRegistry(ResponseCache)
+
+
+def get_response_cache(db_path: str = DEFAULT_CACHE_DB) -> ResponseCache:
+    """Get the shared ResponseCache for `db_path`."""
+    return _response_caches.get(db_path)
@@ -0,0 +1,99 @@
+"""
+SQLite Store Plumbing
+Connection handling shared by the SQLite-backed stores (response cache,
+research store, version history store, dashboard job catalog).
+
+Each store gets one connection per thread (sqlite3 connections are not
+thread-safe), WAL journaling so readers in other processes are not blocked
+by a writer, a busy timeout for cross-process write contention, and
+BEGIN IMMEDIATE transactions so concurrent writers serialize on the SQLite
+lock instead of failing on upgrade. StoreRegistry holds the shared instance
+per database path.
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Generic, Hashable, Iterator, TypeVar
+from urllib.request import pathname2url
+
+BUSY_TIMEOUT_SECONDS = 30.0
+
+StoreT = TypeVar('StoreT')
+
+
+class SQLiteStore:
+    """
+    Base class for stores kept in a single SQLite database file.
+
+    Args:
+        db_path: Path to the SQLite database file
+        read_only: Open an existing database read-only (mode=ro) instead of
+            creating it
+    """
+
+    def __init__(self, db_path: str, read_only: bool = False):
+        self.db_path = str(db_path)
+        self.read_only = read_only
+        self._local = threading.local()
+        if not read_only:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            if self.read_only:
+                uri = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+                conn = sqlite3.connect(uri, uri=True, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+            else:
+                conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """BEGIN IMMEDIATE ... COMMIT, rolled back if the block raises."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class StoreRegistry(Generic[StoreT]):
+    """
+    Shared store instances, created on first request.
+
+    Args:
+        factory: Builds the store from the lookup arguments
+    """
+
+    def __init__(self, factory: Callable[..., StoreT]):
+        self.factory = factory
+        self._instances: Dict[Hashable, StoreT] = {}
+        self._lock = threading.Lock()
+
+    def get(self, *args: Hashable) -> StoreT:
+        """The instance for `args`, built as factory(*args) the first time."""
+        with self._lock:
+            store = self._instances.get(args)
+            if store is None:
+                store = self.factory(*args)
+                self._instances[args] = store
+            return store
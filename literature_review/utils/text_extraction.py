@@ -0,0 +1,200 @@
+"""
+Shared Document Text Extraction
+Streaming per-page PDF extraction used by the journal reviewer, deep reviewer
+and DRA, with page text cached on disk by file SHA-256.
+
+A cheap first-page probe picks one extractor per document instead of running
+pdfplumber and pypdf over every page and keeping the longer result. Repeat
+reads of the same file (in any stage or process) are a single cache lookup.
+"""
+
+import hashlib
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import pdfplumber
+import pypdf
+
+from literature_review.utils.response_cache import ResponseCache, get_response_cache
+
+logger = logging.getLogger(__name__)
+
+TEXT_CACHE_DB = os.path.join('analysis_cache', 'extracted_text.db')
+EXTRACTOR_VERSION = 1  # Bump when page text produced for the same file would change
+PROBE_MIN_CHARS = 200  # First-page text below this makes us probe the other extractor too
+CHARS_PER_FULL_PAGE = 1500.0
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass
+class ExtractedDocument:
+    """Page-level text for one file. A page is None if extraction raised on it."""
+    sha256: Optional[str]
+    method: str
+    pages: List[Optional[str]] = field(default_factory=list)
+    from_cache: bool = False
+
+    @property
+    def quality(self) -> float:
+        """Fraction of a 'full' page of text per page, capped at 1.0."""
+        if not self.pages:
+            return 0.0
+        extracted_chars = sum(len(page) for page in self.pages if page)
+        return min(extracted_chars / (len(self.pages) * CHARS_PER_FULL_PAGE), 1.0)
+
+    @property
+    def text(self) -> str:
+        """Plain concatenation: each non-empty page followed by a newline."""
+        return "".join(page + "\n" for page in self.pages if page)
+
+    def paged_text(self) -> Tuple[str, List[str]]:
+        """Full text and per-page text with '--- Page N ---' headers (deep reviewer format)."""
+        full_text, pages_text = [], []
+        for i, page in enumerate(self.pages):
+            if page:
+                page_text = f"\n--- Page {i + 1} ---\n{page}\n"
+                full_text.append(page_text)
+                pages_text.append(page_text)
+            elif page is None:
+                pages_text.append(f"\n--- Page {i + 1} ---\n[Error extracting page]\n")
+            else:
+                pages_text.append(f"\n--- Page {i + 1} ---\n[No text extracted]\n")
+        return "".join(full_text), pages_text
+
+
+def file_sha256(filepath: str) -> str:
+    """SHA-256 of a file, read in fixed-size blocks."""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _pdfplumber_pages(filepath: str) -> Iterator[Optional[str]]:
+    with pdfplumber.open(filepath) as pdf:
+        for i, page in enumerate(pdf.pages):
+            try:
+                yield page.extract_text(x_tolerance=1, y_tolerance=1) or ""
+            except Exception as page_e:
+                logger.warning(f"pdfplumber error on page {i + 1}: {page_e}")
+                yield None
+            # Drop parsed layout objects as we go so large PDFs stay flat in memory
+            if hasattr(page, 'close'):
+                page.close()
+
+
+def _pypdf_pages(filepath: str) -> Iterator[Optional[str]]:
+    with open(filepath, 'rb') as f:
+        reader = pypdf.PdfReader(f)
+        for i, page in enumerate(reader.pages):
+            try:
+                yield page.extract_text() or ""
+            except Exception as page_e:
+                logger.warning(f"pypdf error on page {i + 1}: {page_e}")
+                yield None
+
+
+PDF_EXTRACTORS: Dict[str, Callable[[str], Iterator[Optional[str]]]] = {
+    "pdfplumber": _pdfplumber_pages,
+    "pypdf": _pypdf_pages,
+}
+
+
+class _Probe:
+    """An extractor's page stream with its first page already read."""
+
+    def __init__(self, method: str, filepath: str):
+        self.method = method
+        self.pages = PDF_EXTRACTORS[method](filepath)
+        self.first: List[Optional[str]] = []
+        self.error: Optional[Exception] = None
+        try:
+            self.first = [next(self.pages)]
+        except StopIteration:
+            pass
+        except Exception as e:
+            self.error = e
+
+    @property
+    def first_page_chars(self) -> int:
+        if self.error is not None:
+            return -1
+        return len(self.first[0] or "") if self.first else 0
+
+    def read_all(self) -> List[Optional[str]]:
+        return self.first + list(self.pages)
+
+    def close(self) -> None:
+        self.pages.close()
+
+
+def _extract_pdf_pages(filepath: str) -> Tuple[str, List[Optional[str]]]:
+    """Pick an extractor from a first-page probe, then stream the remaining pages."""
+    primary = _Probe("pdfplumber", filepath)
+    chosen = primary
+    if primary.first_page_chars < PROBE_MIN_CHARS:
+        secondary = _Probe("pypdf", filepath)
+        if secondary.first_page_chars > primary.first_page_chars:
+            chosen = secondary
+        (primary if chosen is secondary else secondary).close()
+
+    if chosen.error is not None:
+        raise chosen.error
+    try:
+        return chosen.method, chosen.read_all()
+    finally:
+        chosen.close()
+
+
+def _open_cache(cache_path: Optional[str]) -> Optional[ResponseCache]:
+    if cache_path is None:
+        return None
+    try:
+        return get_response_cache(cache_path)
+    except Exception as e:
+        logger.warning(f"Text cache unavailable at {cache_path}: {e}")
+        return None
+
+
+def extract_document(filepath: str, cache_path: Optional[str] = TEXT_CACHE_DB) -> ExtractedDocument:
+    """
+    Extract page text from a PDF, reusing the cached pages for identical file contents.
+
+    Args:
+        filepath: Path to the PDF
+        cache_path: SQLite text cache (None disables caching)
+
+    Raises:
+        Exception from the PDF backend if no extractor can open the file
+    """
+    try:
+        sha256 = file_sha256(filepath)
+    except OSError as e:
+        logger.debug(f"Could not hash {filepath} ({e}); extracting without cache")
+        sha256 = None
+
+    cache = _open_cache(cache_path) if sha256 else None
+    cache_key = f"text:v{EXTRACTOR_VERSION}:{sha256}"
+    if cache is not None:
+        try:
+            cached = cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Text cache read failed for {os.path.basename(filepath)}: {e}")
+            cached = None
+        if cached is not None:
+            return ExtractedDocument(sha256, cached['method'], cached['pages'], from_cache=True)
+
+    method, pages = _extract_pdf_pages(filepath)
+    document = ExtractedDocument(sha256, method, pages)
+    logger.debug(f"{method} extracted {len(pages)} pages from {os.path.basename(filepath)}, "
+                 f"quality score: {document.quality:.2f}")
+
+    if cache is not None:
+        try:
+            cache.set(cache_key, {'method': method, 'pages': pages})
+        except Exception as e:
+            logger.warning(f"Text cache write failed for {os.path.basename(filepath)}: {e}")
+    return document
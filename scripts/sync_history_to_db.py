@@ -24,6 +24,9 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Any
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from literature_review.io.research_store import get_research_store, open_research_store, research_store_path
+
 # --- CONFIGURATION ---
 OUTPUT_CSV_FILE = 'neuromorphic-research_database.csv'
 VERSION_HISTORY_FILE = 'review_version_history.json'
@@ -98,6 +101,12 @@ def load_existing_reviews_as_dict(csv_file=OUTPUT_CSV_FILE) -> Dict[str, Dict]:
         logger.warning(f"CSV file not found at {csv_file}. A new file will be created.")
         return reviews_dict
 
+    store = open_research_store(csv_file)
+    if store is not None:
+        reviews = store.read_records(parse_lists=True)
+        logger.info(f"Loaded {len(reviews)} existing reviews from {store.db_path}")
+        return {review['FILENAME']: review for review in reviews}
+
     try:
         df = pd.read_csv(csv_file, encoding='utf-8')
         df = df.replace({np.nan: None})  # Use None, not empty string
@@ -167,6 +176,13 @@ def overwrite_csv_with_master_list(master_list: List[Dict], csv_file=OUTPUT_CSV_
                         row_to_write[key] = value
                 writer.writerow(row_to_write)
 
+        try:
+            get_research_store(research_store_path(csv_file)).replace_all(
+                master_list, columns=final_fieldnames, csv_file=csv_file)
+        except Exception as e:
+            # The store no longer matches the CSV, so its next reader re-imports it
+            logger.warning(f"Could not update research store for {csv_file}: {e}")
+
         logger.info(f"Successfully overwrote {csv_file} with {len(master_list)} synced reviews.")
         safe_print(f"💾 Successfully synced {len(master_list)} reviews to {csv_file} with correct column order.")
     except PermissionError:
@@ -68,7 +68,6 @@ class TestJobRunner:
     async def test_job_runner_initialization(self, job_runner):
         """Test that JobRunner initializes correctly."""
         assert job_runner.queue is not None
-        assert job_runner.executor is not None
         assert len(job_runner.running_jobs) == 0
     
     @pytest.mark.asyncio
@@ -0,0 +1,16 @@
+"""
+Fixtures for the performance tests.
+
+Components default to paths relative to the working directory (api_cache/,
+cost_reports/, analysis_cache/incremental_state.json, pipeline_checkpoint.json),
+so every benchmark runs from its own temporary directory instead of the checkout.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run each test from a fresh temporary working directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
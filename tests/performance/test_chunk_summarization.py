@@ -0,0 +1,59 @@
+"""Benchmark: a large document summarizes in about the time of its slowest chunk."""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, REPO_ROOT)
+
+from literature_review.reviewers import journal_reviewer as jr
+from literature_review.utils.llm_client import LLMClient, FakeTransport, MemoryCache
+
+MOCK_LATENCY_SECONDS = 0.1
+NUM_PAGES = 200
+CHARS_PER_PAGE = 3000  # ~600k chars: 7 chunks at the default CHUNK_SIZE
+
+
+def make_api_manager() -> jr.APIManager:
+    """Build an APIManager around a fake LLM transport (no API key needed)."""
+    api_manager = jr.APIManager.__new__(jr.APIManager)
+    api_manager.llm = LLMClient(
+        FakeTransport(lambda prompt: "- Mock chunk summary", latency=MOCK_LATENCY_SECONDS),
+        limiter=jr.global_limiter,
+        cache=MemoryCache(),
+        module='journal_reviewer'
+    )
+    api_manager.embedder = None
+    return api_manager
+
+
+@pytest.mark.performance
+def test_thesis_summarizes_in_slowest_chunk_time(monkeypatch):
+    monkeypatch.setattr(jr.global_limiter, 'global_rpm_limit', 100000)
+    with open(os.path.join(REPO_ROOT, 'pillar_definitions.json'), 'r', encoding='utf-8') as f:
+        pillar_definitions_str = json.dumps(json.load(f), indent=2)
+    thesis = "".join(f"\n--- Page {p} ---\n" + f"Thesis page {p} on spiking networks. " * 90
+                     for p in range(1, NUM_PAGES + 1))[:NUM_PAGES * CHARS_PER_PAGE]
+
+    results = {}
+    for workers in (1, 8):
+        monkeypatch.setitem(jr.REVIEW_CONFIG, 'MAX_CONCURRENT_CHUNKS', workers)
+        api_manager = make_api_manager()
+        start = time.time()
+        summary = jr.PaperAnalyzer.summarize_text_chunks(thesis, api_manager, pillar_definitions_str)
+        results[workers] = (time.time() - start, api_manager.llm.transport.calls, summary)
+
+    chunks = results[1][1]
+    print(f"\n{NUM_PAGES}-page document, {chunks} chunks, {MOCK_LATENCY_SECONDS * 1000:.0f} ms per chunk: "
+          f"sequential {results[1][0]:.2f}s, 8 workers {results[8][0]:.2f}s")
+    print(f"Pillar context per chunk prompt: {len(pillar_definitions_str)} -> "
+          f"{len(jr.PaperAnalyzer.compact_pillar_context(pillar_definitions_str))} chars")
+
+    assert results[1][2] == results[8][2]
+    assert chunks > 1
+    assert results[8][0] < MOCK_LATENCY_SECONDS * 3
+    assert results[1][0] > MOCK_LATENCY_SECONDS * chunks * 0.9
@@ -0,0 +1,53 @@
+"""Benchmark: consensus evaluations of one paper run concurrently, at a single evaluation's latency."""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from literature_review.reviewers import journal_reviewer as jr
+from literature_review.utils.llm_client import LLMClient, FakeTransport, MemoryCache
+from tests.performance.test_journal_reviewer_concurrency import mock_journal_analysis
+
+MOCK_LATENCY_SECONDS = 0.2
+
+
+def make_api_manager() -> jr.APIManager:
+    """Build an APIManager around a fake LLM transport (no API key needed)."""
+    api_manager = jr.APIManager.__new__(jr.APIManager)
+    api_manager.llm = LLMClient(
+        FakeTransport(mock_journal_analysis, latency=MOCK_LATENCY_SECONDS),
+        limiter=jr.global_limiter,
+        cache=MemoryCache(),
+        module='journal_reviewer'
+    )
+    api_manager.embedder = None
+    return api_manager
+
+
+@pytest.mark.performance
+def test_low_quality_paper_consensus_latency(monkeypatch):
+    monkeypatch.setattr(jr.global_limiter, 'global_rpm_limit', 100000)
+    metadata = jr.PaperMetadata(filename="paper.pdf", filepath="paper.pdf", domain_context="",
+                                extraction_quality=0.4, extraction_method="pdfplumber",
+                                timestamp="2025-01-01T00:00:00")
+    text = json.dumps({"FILENAME": "paper.pdf"}) + " Spiking networks and memory consolidation." * 50
+
+    timings = {}
+    for num_evaluations in (1, 2, 3):
+        api_manager = make_api_manager()
+        start = time.time()
+        result = jr.PaperAnalyzer.consensus_evaluation(text, metadata, api_manager, "{}", num_evaluations)
+        timings[num_evaluations] = (time.time() - start, api_manager.llm.transport.calls)
+        assert result is not None
+
+    print(f"\nConsensus evaluation ({MOCK_LATENCY_SECONDS * 1000:.0f} ms mocked latency): " + ", ".join(
+        f"{n} evals {seconds:.2f}s / {calls} calls" for n, (seconds, calls) in timings.items()))
+
+    # Two evaluations cost one round trip; identical mock scores stop the third early
+    assert timings[2][1] == 2 and timings[2][0] < MOCK_LATENCY_SECONDS * 1.5
+    assert timings[3][1] == 2
@@ -0,0 +1,58 @@
+"""Microbenchmark: CostTracker.log_api_call overhead must not grow with ledger size."""
+
+import json
+import time
+
+import pytest
+
+from literature_review.utils.cost_tracker import CostTracker
+
+LEDGER_ENTRIES = 100_000
+SAMPLE_CALLS = 2_000
+
+
+def time_calls(tracker: CostTracker, count: int) -> float:
+    """Mean seconds per log_api_call over `count` calls."""
+    start = time.perf_counter()
+    for i in range(count):
+        tracker.log_api_call('judge', 'gemini-1.5-flash', 1200, 300, 100,
+                             operation='judge_claim', paper=f'paper_{i % 500}.pdf')
+    return (time.perf_counter() - start) / count
+
+
+@pytest.mark.performance
+def test_log_api_call_constant_overhead_at_100k_entries(tmp_path):
+    """Per-call cost at 100k ledger entries stays close to the empty-ledger cost."""
+    tracker = CostTracker(log_file=str(tmp_path / 'api_cost_log.jsonl'))
+    empty_ledger = time_calls(tracker, SAMPLE_CALLS)
+
+    time_calls(tracker, LEDGER_ENTRIES - 2 * SAMPLE_CALLS)
+    full_ledger = time_calls(tracker, SAMPLE_CALLS)
+    assert len(tracker.usage_log) == LEDGER_ENTRIES
+
+    start = time.perf_counter()
+    summary = tracker.get_total_summary()
+    tracker.get_budget_status()
+    tracker.cost_per_paper_analysis()
+    summary_seconds = time.perf_counter() - start
+    tracker.close()
+
+    with open(tracker.log_file, 'r') as f:
+        assert sum(1 for _ in f) == LEDGER_ENTRIES
+
+    # One full rewrite of the same log, as the previous implementation did per call
+    legacy_file = tmp_path / 'legacy.json'
+    start = time.perf_counter()
+    with open(legacy_file, 'w') as f:
+        json.dump(tracker.usage_log, f, indent=2)
+    legacy_rewrite = time.perf_counter() - start
+
+    print(f"\nCostTracker.log_api_call at {LEDGER_ENTRIES:,} entries:")
+    print(f"  empty ledger: {empty_ledger * 1e6:8.1f} us/call")
+    print(f"  full ledger:  {full_ledger * 1e6:8.1f} us/call")
+    print(f"  summaries:    {summary_seconds * 1e3:8.2f} ms (from running aggregates)")
+    print(f"  legacy full-file rewrite per call: {legacy_rewrite * 1e3:8.1f} ms")
+
+    assert summary['total_calls'] == LEDGER_ENTRIES
+    assert full_ledger < empty_ledger * 3, "Per-call overhead must not grow with ledger size"
+    assert summary_seconds < 0.05
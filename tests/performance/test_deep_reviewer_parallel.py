@@ -0,0 +1,109 @@
+"""
+Benchmark: planned, concurrent deep review vs. the previous gap -> paper -> chunk loop.
+
+Papers are "extracted" by a fake extractor with a fixed parse time and reviewed
+through a fake Gemini transport with a fixed latency, under the global limiter.
+The legacy loop re-extracts a paper for every gap that lists it and sends one
+chunk prompt at a time.
+"""
+
+import json
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from literature_review.io.version_history_store import VersionHistoryStore
+from literature_review.reviewers import deep_reviewer as dr
+from literature_review.utils.llm_client import LLMClient, FakeTransport, MemoryCache
+
+EXTRACTION_SECONDS = 0.05
+MOCK_LATENCY_SECONDS = 0.05
+NUM_GAPS = 3
+NUM_PAPERS = 6
+PAGES_PER_PAPER = 2  # One chunk per page at the benchmark's chunk size
+
+
+class SlowExtractor:
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def robust_text_extraction(self, filepath):
+        with self._lock:
+            self.calls += 1
+        time.sleep(EXTRACTION_SECONDS)
+        pages = [f"\n--- Page {i} ---\n" + f"{filepath} " * 100 for i in range(1, PAGES_PER_PAPER + 1)]
+        return "".join(pages), pages
+
+
+def mock_deep_review(prompt: str) -> str:
+    target = prompt.split("Sub-Requirement (Target): ", 1)[1].split("\n", 1)[0]
+    chunk = prompt.split("--- START FULL PAPER TEXT", 1)[1][:80]
+    return json.dumps({"new_claims": [{"claim_summary": "Mock", "evidence_chunk": f"{target}: {chunk}",
+                                       "page_number": 1, "reviewer_confidence": 0.9}]})
+
+
+def make_api_manager() -> dr.APIManager:
+    """Build an APIManager around a fake LLM transport (no API key needed)."""
+    api_manager = dr.APIManager.__new__(dr.APIManager)
+    api_manager.llm = LLMClient(
+        FakeTransport(mock_deep_review, latency=MOCK_LATENCY_SECONDS),
+        limiter=dr.global_limiter,
+        cache=MemoryCache(),
+        module='deep_reviewer'
+    )
+    return api_manager
+
+
+def legacy_run(gaps, research_db, api_manager, extractor, store):
+    """Previous main loop: per gap, per paper, re-extract, then one chunk prompt at a time."""
+    found = 0
+    for gap in gaps:
+        for paper_info in dr.find_promising_papers(gap, research_db, []):
+            filename = paper_info['FILENAME']
+            full_text, pages_text = extractor.robust_text_extraction(filename)
+            for chunk_pages, page_range in dr.chunk_pages_with_tracking(
+                    pages_text, dr.REVIEW_CONFIG['DEEP_REVIEWER_CHUNK_SIZE']):
+                prompt = dr.build_deep_review_prompt(gap, paper_info, chunk_pages, [], page_range)
+                response = api_manager.cached_api_call(prompt, use_cache=False)
+                for claim_data in response["new_claims"]:
+                    found += store.add_claims([dr.create_requirement_entry(claim_data, paper_info, gap)],
+                                              filename=filename, status='deep_reviewer_claims',
+                                              amend_latest=True, create_missing=True)
+    return found
+
+
+@pytest.mark.performance
+def test_planned_review_beats_nested_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(dr.global_limiter, 'global_rpm_limit', 100000)
+    monkeypatch.setattr(dr, 'find_paper_filepath', lambda filename, folder: filename)
+    monkeypatch.setitem(dr.REVIEW_CONFIG, 'DEEP_REVIEWER_CHUNK_SIZE', 1000)
+
+    filenames = [f"paper_{i}.pdf" for i in range(NUM_PAPERS)]
+    research_db = pd.DataFrame([{"FILENAME": name, "TITLE": name} for name in filenames])
+    gaps = [{"pillar": "Pillar 1: Test", "requirement_key": "REQ-1", "sub_requirement_key": f"Sub-1.{g}",
+             "gap_analysis": "Missing evidence.", "contributing_papers": filenames} for g in range(NUM_GAPS)]
+
+    legacy_extractor = SlowExtractor()
+    start = time.time()
+    legacy_found = legacy_run(gaps, research_db, make_api_manager(), legacy_extractor,
+                              VersionHistoryStore(str(tmp_path / "legacy.db")))
+    legacy_seconds = time.time() - start
+
+    extractor = SlowExtractor()
+    api_manager = make_api_manager()
+    start = time.time()
+    plan = dr.plan_deep_review(gaps, research_db, [])
+    found = dr.run_deep_review(plan, api_manager, extractor, VersionHistoryStore(str(tmp_path / "planned.db")), [])
+    planned_seconds = time.time() - start
+
+    print(f"\nDeep review of {NUM_GAPS} gaps x {NUM_PAPERS} papers x {PAGES_PER_PAPER} chunks: "
+          f"nested loop {legacy_seconds:.2f}s ({legacy_extractor.calls} extractions), "
+          f"planned {planned_seconds:.2f}s ({extractor.calls} extractions)")
+
+    assert found == legacy_found == NUM_GAPS * NUM_PAPERS * PAGES_PER_PAPER
+    assert extractor.calls == NUM_PAPERS
+    assert api_manager.llm.transport.calls == NUM_GAPS * NUM_PAPERS * PAGES_PER_PAPER
+    assert planned_seconds < legacy_seconds / 2.5
@@ -0,0 +1,102 @@
+"""
+Benchmark: duplicate check for an upload batch against a large review log.
+
+The previous check_for_duplicates re-read review_log.json on every upload and
+ran SequenceMatcher between each new title and every existing title. The
+full legacy check for the whole batch would take minutes, so it is timed on a
+sample of the batch and scaled up.
+
+Titles mix a skewed vocabulary with common title words ("learning",
+"neural", "of the", ...), which is the hard case for n-gram lookups.
+"""
+
+import json
+import random
+import time
+from difflib import SequenceMatcher
+
+import pytest
+
+from webdashboard.duplicate_detector import get_duplicate_index, load_existing_papers_from_review_log
+
+NUM_EXISTING = 20000
+BATCH_SIZE = 200
+LEGACY_SAMPLE = 4
+FUZZY_THRESHOLD = 0.95
+
+COMMON_WORDS = ("of for the a and in with on using learning neural network deep model analysis").split()
+SYLLABLES = ("ra ne to mi ka lo pe si du ver gen tic ion al mod struct net graph learn data").split()
+
+
+class TitleGenerator:
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.vocabulary = sorted({"".join(self.rng.choice(SYLLABLES) for _ in range(self.rng.randint(2, 4)))
+                                  for _ in range(5000)})
+        self.weights = [1 / (rank + 1) for rank in range(len(self.vocabulary))]
+
+    def __call__(self):
+        words = []
+        for _ in range(self.rng.randint(6, 12)):
+            if self.rng.random() < 0.35:
+                words.append(self.rng.choice(COMMON_WORDS))
+            else:
+                words.append(self.rng.choices(self.vocabulary, self.weights)[0])
+        return " ".join(words)
+
+
+def legacy_fuzzy_match(title, existing_papers):
+    existing_titles = {}
+    for paper in existing_papers:
+        if paper.get('title'):
+            existing_titles[paper['title'].lower().strip()] = paper
+    new_title = title.lower().strip()
+    best_similarity, best_match = 0.0, None
+    for existing_title_key, existing_paper in existing_titles.items():
+        similarity = SequenceMatcher(None, new_title, existing_title_key).ratio()
+        if similarity >= FUZZY_THRESHOLD and similarity > best_similarity:
+            best_similarity, best_match = similarity, existing_paper
+    return best_match
+
+
+@pytest.mark.performance
+def test_indexed_check_beats_pairwise_title_scan(tmp_path):
+    title = TitleGenerator(seed=7)
+    existing = [{'id': f'paper-{i}', 'hash': f'{i:064x}', 'title': title()} for i in range(NUM_EXISTING)]
+    review_log = tmp_path / "review_log.json"
+    review_log.write_text(json.dumps(existing))
+
+    def make_batch():
+        # Every fourth upload is a known paper with a slightly different title
+        return [{'original_name': f'upload_{i}.pdf', 'hash': f'new-{i}',
+                 'title': title.rng.choice(existing)['title'] + 's' if i % 4 == 0 else title()}
+                for i in range(BATCH_SIZE)]
+    batch = make_batch()
+
+    start = time.perf_counter()
+    papers = load_existing_papers_from_review_log(review_log)
+    for paper in batch[:LEGACY_SAMPLE]:
+        legacy_fuzzy_match(paper['title'], papers)
+    legacy_seconds = (time.perf_counter() - start) * BATCH_SIZE / LEGACY_SAMPLE
+
+    start = time.perf_counter()
+    get_duplicate_index(review_log)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    first = get_duplicate_index(review_log).check(batch, FUZZY_THRESHOLD)
+    first_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = get_duplicate_index(review_log).check(make_batch(), FUZZY_THRESHOLD)
+    check_seconds = time.perf_counter() - start
+
+    print(f"\n{BATCH_SIZE} uploads vs {NUM_EXISTING} papers: pairwise scan ~{legacy_seconds:.0f}s (extrapolated "
+          f"from {LEGACY_SAMPLE}); index build {build_seconds * 1000:.0f} ms and first check "
+          f"{first_seconds * 1000:.0f} ms (once per review log change), next batch {check_seconds * 1000:.0f} ms")
+
+    assert len(first['duplicates']) == len(result['duplicates']) == BATCH_SIZE // 4
+    for paper in batch[:LEGACY_SAMPLE]:
+        expected = legacy_fuzzy_match(paper['title'], existing)
+        assert first['matches'].get(paper['original_name'], {}).get('existing_paper') == expected
+    assert check_seconds < legacy_seconds / 100
@@ -0,0 +1,85 @@
+"""
+Benchmark: /api/jobs listing from the job catalog vs reading every job file.
+
+The previous list_jobs parsed every JOBS_DIR/*.json, ran extract_summary_metrics
+on each (opening the gap analysis report of completed jobs) and sorted the
+result in Python on every request.
+"""
+
+import json
+import time
+
+import pytest
+
+NUM_JOBS = 3000
+PAGE_SIZE = 50
+
+
+def legacy_list_jobs(app_module):
+    jobs = []
+    for job_file in app_module.JOBS_DIR.glob("*.json"):
+        with open(job_file, 'r') as f:
+            job_data = json.load(f)
+            job_data["summary"] = app_module.extract_summary_metrics(job_data)
+            jobs.append(job_data)
+    jobs.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+    return jobs
+
+
+@pytest.mark.performance
+def test_catalog_listing_beats_full_scan(tmp_path, monkeypatch):
+    from webdashboard import app as app_module
+
+    jobs_dir, status_dir = tmp_path / "jobs", tmp_path / "status"
+    jobs_dir.mkdir()
+    status_dir.mkdir()
+    monkeypatch.setattr(app_module, "WORKSPACE_DIR", tmp_path)
+    monkeypatch.setattr(app_module, "JOBS_DIR", jobs_dir)
+    monkeypatch.setattr(app_module, "STATUS_DIR", status_dir)
+
+    report = {"overall_completeness": 62.5, "gaps": [{"severity": 9}] * 40,
+              "recommendations": [f"Recommendation {i}" for i in range(20)]}
+    for i in range(NUM_JOBS):
+        job_id = f"job-{i:05d}"
+        status = "completed" if i % 3 == 0 else "failed"
+        (jobs_dir / f"{job_id}.json").write_text(json.dumps({
+            "id": job_id, "status": status, "created_at": f"2025-01-01T00:00:{i:05d}",
+            "files": [{"original_name": f"paper{j}.pdf"} for j in range(20)],
+            "config": {"run_mode": "ONCE", "pillar_selections": ["ALL"]}}))
+        if status == "completed":
+            output_dir = jobs_dir / job_id / "outputs" / "gap_analysis_output"
+            output_dir.mkdir(parents=True)
+            (output_dir / "gap_analysis.json").write_text(json.dumps(report))
+
+    start = time.perf_counter()
+    legacy = legacy_list_jobs(app_module)
+    legacy_seconds = time.perf_counter() - start
+
+    catalog = app_module.get_catalog()
+    start = time.perf_counter()
+    cold, _, _ = catalog.list_jobs(summarize=app_module.extract_summary_metrics)
+    cold_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    warm, count, _ = catalog.list_jobs(summarize=app_module.extract_summary_metrics)
+    warm_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    page, _, cursor = catalog.list_jobs(limit=PAGE_SIZE, summarize=app_module.extract_summary_metrics)
+    page_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    filtered, completed, _ = catalog.list_jobs(status="completed", limit=PAGE_SIZE,
+                                               summarize=app_module.extract_summary_metrics)
+    filtered_seconds = time.perf_counter() - start
+
+    print(f"\n/api/jobs over {NUM_JOBS} jobs: full scan {legacy_seconds * 1000:.0f} ms; catalog first build "
+          f"{cold_seconds * 1000:.0f} ms, full list {warm_seconds * 1000:.0f} ms, page of {PAGE_SIZE} "
+          f"{page_seconds * 1000:.1f} ms, completed-only page {filtered_seconds * 1000:.1f} ms")
+
+    assert [j["id"] for j in warm] == [j["id"] for j in legacy] == [j["id"] for j in cold]
+    assert [j["summary"] for j in warm] == [j["summary"] for j in legacy]
+    assert count == NUM_JOBS and completed == NUM_JOBS // 3 and cursor is not None
+    assert [j["id"] for j in page] == [j["id"] for j in legacy[:PAGE_SIZE]]
+    assert all(j["status"] == "completed" for j in filtered)
+    assert page_seconds < legacy_seconds / 5
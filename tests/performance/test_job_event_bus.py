@@ -0,0 +1,91 @@
+"""
+Benchmark: dashboard job updates pushed through the event bus vs per-client polling.
+
+The previous /ws/jobs handler globbed and stat'ed every status file once a
+second for each connected client, and each progress socket reopened the job's
+files every 500 ms. With the bus a status update or log append is read once
+and fanned out to the subscribers' queues.
+"""
+
+import json
+import time
+
+import pytest
+
+from webdashboard import event_bus as eb
+from webdashboard import job_runner as jr
+from webdashboard.event_bus import JOBS_TOPIC, JobEventBus
+
+NUM_JOBS = 300
+NUM_CLIENTS = 50
+NUM_LOG_LINES = 200
+
+
+def legacy_poll_tick(status_mtimes):
+    """One client's once-a-second scan from the old /ws/jobs loop. Returns the files it stat'ed."""
+    stats = 0
+    for status_file in eb.STATUS_DIR.glob("*.json"):
+        mtime = status_file.stat().st_mtime
+        stats += 1
+        if status_file not in status_mtimes or status_mtimes[status_file] < mtime:
+            status_mtimes[status_file] = mtime
+            with open(status_file, "r") as f:
+                json.load(f)
+    return stats
+
+
+@pytest.mark.performance
+async def test_pushed_updates_cost_one_read_per_change(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner = jr.PipelineJobRunner()
+    for i in range(NUM_JOBS):
+        await runner.update_job_status(f"job-{i}", "completed")
+
+    clients = [{} for _ in range(NUM_CLIENTS)]
+    for status_mtimes in clients:
+        legacy_poll_tick(status_mtimes)  # Initial scan
+    start = time.perf_counter()
+    idle_tick_stats = sum(legacy_poll_tick(status_mtimes) for status_mtimes in clients)
+    idle_tick_seconds = time.perf_counter() - start
+
+    bus = JobEventBus()
+    monkeypatch.setattr(eb, "event_bus", bus)
+    # Patch the module the runner was imported from (other tests re-import webdashboard.*)
+    monkeypatch.setattr(jr, "event_bus", bus)
+    job_list = [bus.subscribe(JOBS_TOPIC) for _ in range(NUM_CLIENTS)]
+    watchers = [bus.subscribe_job("job-0")[0] for _ in range(NUM_CLIENTS)]
+
+    file_ops = []
+    for name in ("_stat", "_size", "_read_bytes"):
+        def counted(*args, _method=getattr(bus, name)):
+            file_ops.append(args[0])
+            return _method(*args)
+        monkeypatch.setattr(bus, name, counted)
+
+    start = time.perf_counter()
+    await runner.update_job_status("job-0", "running")
+    status_seconds = time.perf_counter() - start
+    status_file_ops = len(file_ops)
+    assert [len(await s.get_batch()) for s in job_list + watchers] == [1] * (2 * NUM_CLIENTS)
+
+    reads = bus.tail_reads
+    latencies = []
+    for i in range(NUM_LOG_LINES):
+        written = time.perf_counter()
+        runner._write_log("job-0", f"line {i}")
+        batch = await watchers[-1].get_batch()
+        latencies.append(time.perf_counter() - written)
+        assert batch[0]["lines"][0].endswith(f"line {i}\n")
+    log_reads = bus.tail_reads - reads
+    assert watchers[0].queue.qsize() == NUM_LOG_LINES
+
+    print(f"\n{NUM_CLIENTS} clients, {NUM_JOBS} jobs: legacy polling {idle_tick_seconds * 1000:.0f} ms of "
+          f"scanning per second with nothing changing (update seen after up to 1 s); bus status push "
+          f"{status_seconds * 1000:.2f} ms ({status_file_ops} file ops vs {idle_tick_stats} stats per idle "
+          f"polling tick), log line delivered in {max(latencies) * 1000:.2f} ms max "
+          f"with {log_reads} reads for {NUM_LOG_LINES} lines")
+
+    assert log_reads == NUM_LOG_LINES
+    assert idle_tick_stats == NUM_CLIENTS * NUM_JOBS
+    # One stat of the status file just written and one per tailed file, however many clients or jobs
+    assert status_file_ops == 1 + len(eb.TAILED_FILES)
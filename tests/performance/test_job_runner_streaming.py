@@ -0,0 +1,65 @@
+"""
+Benchmark: live-log latency and memory for a chatty pipeline in PipelineJobRunner.
+
+A fake pipeline prints a marker line, then produces a large amount of output
+before exiting. The previous runner captured everything with subprocess.run
+and wrote it to the log at exit, so the marker appeared only at the end and
+the whole output was held in dashboard memory.
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from webdashboard.job_runner import PipelineJobRunner
+
+PIPELINE = """
+import time
+print("marker", flush=True)
+time.sleep(0.5)
+for i in range(200000):
+    print(f"[stage] processed item {i} " + "." * 60)
+"""
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses POSIX process groups")
+async def test_marker_reaches_log_before_the_job_ends(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cmd = [sys.executable, "-c", PIPELINE]
+
+    start = time.monotonic()
+    legacy = subprocess.run(cmd, capture_output=True, text=True)
+    legacy_seconds = time.monotonic() - start
+    legacy_buffered_mb = len(legacy.stdout) / 1e6
+
+    runner = PipelineJobRunner()
+    monkeypatch.setattr(runner, "_build_orchestrator_command", lambda job_id, job_data: (cmd, tmp_path))
+    log_file = Path("workspace/logs/job.log")
+
+    start = time.monotonic()
+    task = asyncio.create_task(runner._run_orchestrator("job", {}))
+    while not (log_file.exists() and "marker" in log_file.read_text()):
+        await asyncio.sleep(0.01)
+    marker_latency = time.monotonic() - start
+    await task
+    streamed_seconds = time.monotonic() - start
+    assert log_file.read_text().count("processed item") == 200000
+
+    # Second run under tracemalloc (which slows it down) for the dashboard-side memory peak
+    tracemalloc.start()
+    await runner._run_orchestrator("job-memory", {})
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"\nChatty pipeline ({legacy_buffered_mb:.1f} MB of output): captured run {legacy_seconds:.2f}s, "
+          f"marker visible at end; streamed run {streamed_seconds:.2f}s, marker visible after "
+          f"{marker_latency * 1000:.0f} ms, peak traced memory {peak / 1e6:.2f} MB")
+
+    assert marker_latency < 0.5
+    assert peak < legacy_buffered_mb * 1e6 / 4
@@ -0,0 +1,113 @@
+"""Throughput benchmark for concurrent paper processing in journal_reviewer."""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from literature_review.reviewers import journal_reviewer as jr
+from literature_review.utils.llm_client import LLMClient, FakeTransport, MemoryCache
+
+MOCK_LATENCY_SECONDS = 0.05
+NUM_PAPERS = 16
+
+
+def mock_journal_analysis(prompt: str) -> str:
+    """Return a valid journal analysis for the paper named in the prompt."""
+    filename = prompt.split('"FILENAME": "', 1)[1].split('"', 1)[0]
+    response = {key: "N/A" for key in jr.PaperAnalyzer.REQUIRED_JSON_KEYS}
+    response.update({
+        "FILENAME": filename,
+        "TITLE": f"Mock analysis of {filename}",
+        "CORE_DOMAIN_RELEVANCE_SCORE": 80,
+        "SUBDOMAIN_RELEVANCE_TO_RESEARCH_SCORE": 70,
+        "REPRODUCIBILITY_SCORE": 60,
+        "BIOLOGICAL_FIDELITY": 50,
+        "PUBLICATION_YEAR": 2024,
+        "Requirement(s)": [],
+    })
+    for key in ["MAJOR_FINDINGS", "KEYWORDS", "CORE_CONCEPTS", "INTERDISCIPLINARY_BRIDGES",
+                "NETWORK_ARCHITECTURE", "BRAIN_REGIONS", "DATASET_USED",
+                "SIMILAR_PAPERS", "MENTIONED_PAPERS"]:
+        response[key] = []
+    return json.dumps(response)
+
+
+def make_api_manager(latency: float = MOCK_LATENCY_SECONDS) -> jr.APIManager:
+    """Build an APIManager around a fake LLM transport (no API key needed)."""
+    api_manager = jr.APIManager.__new__(jr.APIManager)
+    api_manager.llm = LLMClient(
+        FakeTransport(mock_journal_analysis, latency=latency),
+        limiter=jr.global_limiter,
+        cache=MemoryCache(),
+        module='journal_reviewer'
+    )
+    api_manager.embedder = None
+    return api_manager
+
+
+@pytest.fixture
+def paper_batch(tmp_path, monkeypatch):
+    """Write a batch of text papers and redirect journal_reviewer's output files."""
+    monkeypatch.setattr(jr, 'VERSION_HISTORY_FILE', str(tmp_path / 'history.json'))
+    monkeypatch.setattr(jr, 'EMBEDDINGS_CACHE', str(tmp_path / 'embeddings.pkl'))
+    monkeypatch.setattr(jr.global_limiter, 'global_rpm_limit', 100000)
+
+    batch = []
+    for i in range(NUM_PAPERS):
+        path = tmp_path / f"paper_{i:02d}.txt"
+        path.write_text(f"Abstract. Paper {i} studies spiking networks and memory consolidation. " * 20)
+        batch.append((str(path), path.name))
+    return batch
+
+
+def run_batch(batch, workers: int):
+    jr.REVIEW_CONFIG['MAX_CONCURRENT_PAPERS'] = workers
+    api_manager = make_api_manager()
+    start = time.time()
+    journal_results, non_journal_results = jr.process_batch(
+        batch, api_manager, jr.NetworkAnalyzer(embedder=None),
+        jr.ReviewVersionControl(), [], "{}"
+    )
+    elapsed = time.time() - start
+    return journal_results, non_journal_results, elapsed, api_manager.llm.transport.calls
+
+
+@pytest.fixture(autouse=True)
+def restore_concurrency_setting():
+    original = jr.REVIEW_CONFIG['MAX_CONCURRENT_PAPERS']
+    yield
+    jr.REVIEW_CONFIG['MAX_CONCURRENT_PAPERS'] = original
+
+
+@pytest.mark.performance
+def test_concurrent_batch_preserves_input_order(paper_batch):
+    """Concurrent mode returns the same results, in the same order, as sequential mode."""
+    sequential, _, _, _ = run_batch(paper_batch, workers=1)
+    concurrent, _, _, _ = run_batch(paper_batch, workers=8)
+
+    expected = [filename for _, filename in paper_batch]
+    assert [r['FILENAME'] for r in sequential] == expected
+    assert [r['FILENAME'] for r in concurrent] == expected
+
+
+@pytest.mark.performance
+def test_papers_per_minute_by_worker_count(paper_batch):
+    """Report papers/minute at 1, 4 and 8 workers against a mocked Gemini client."""
+    throughput = {}
+    for workers in (1, 4, 8):
+        journal_results, _, elapsed, calls = run_batch(paper_batch, workers)
+        assert len(journal_results) == NUM_PAPERS
+        assert calls == NUM_PAPERS
+        throughput[workers] = NUM_PAPERS / elapsed * 60
+
+    print("\nJournal reviewer throughput (mocked {:.0f} ms API latency):".format(MOCK_LATENCY_SECONDS * 1000))
+    for workers, papers_per_minute in throughput.items():
+        print(f"  {workers} worker(s): {papers_per_minute:8.1f} papers/min")
+
+    assert throughput[4] > throughput[1] * 2, "4 workers should at least double throughput"
+    assert throughput[8] > throughput[4], "8 workers should beat 4 workers"
@@ -0,0 +1,103 @@
+"""
+Throughput benchmark: claims judged per minute at a fixed request budget.
+
+The judge is driven through judge_claims against a fake Gemini transport while
+the global limiter enforces a fixed budget (scaled down from per-minute to
+per-second so the benchmark finishes quickly, and started empty so the budget
+binds from the first request). Sequential, concurrent and concurrent + packed
+modes judge the same claims.
+"""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from literature_review.analysis import judge
+from literature_review.utils.global_rate_limiter import QuotaScheduler
+from literature_review.utils.llm_client import LLMClient, FakeTransport, MemoryCache
+
+MOCK_LATENCY_SECONDS = 0.2
+REQUESTS_PER_SECOND = 20
+NUM_CLAIMS = 30
+SUB_REQUIREMENTS = ("Sub-1.1", "Sub-1.2", "Sub-1.3")
+
+VERDICT = {
+    "verdict": "approved",
+    "evidence_quality": {
+        "strength_score": 4, "strength_rationale": "Mock", "rigor_score": 4, "study_type": "experimental",
+        "relevance_score": 4, "relevance_notes": "Mock", "directness": 3, "is_recent": True,
+        "reproducibility_score": 4, "composite_score": 4.0, "confidence_level": "high"
+    },
+    "judge_notes": "Mock verdict."
+}
+
+
+def mock_judge(prompt: str) -> str:
+    """Return one verdict, or one per claim for a packed prompt."""
+    if '"judgments"' not in prompt:
+        return json.dumps(VERDICT)
+    num_claims = prompt.count("### Claim ")
+    return json.dumps({"judgments": [{"claim_index": i, **VERDICT} for i in range(1, num_claims + 1)]})
+
+
+def make_api_manager() -> judge.APIManager:
+    """Build an APIManager around a fake LLM transport (no API key needed)."""
+    api_manager = judge.APIManager.__new__(judge.APIManager)
+    api_manager.llm = LLMClient(
+        FakeTransport(mock_judge, latency=MOCK_LATENCY_SECONDS),
+        limiter=judge.global_limiter,
+        cache=MemoryCache(),
+        module='judge'
+    )
+    return api_manager
+
+
+@pytest.fixture(autouse=True)
+def judge_setup(monkeypatch):
+    monkeypatch.setattr(judge, 'find_robust_sub_requirement_text', lambda key: f"{key}: Mock definition")
+    monkeypatch.setitem(judge.API_CONFIG, 'ENABLE_ADAPTIVE_CONSENSUS', False)
+    monkeypatch.setitem(judge.API_CONFIG, 'MAX_CLAIMS_PER_PROMPT', 5)
+
+
+def run_judge(monkeypatch, workers: int, packed: bool):
+    monkeypatch.setitem(judge.API_CONFIG, 'MAX_CONCURRENT_CLAIMS', workers)
+    monkeypatch.setitem(judge.API_CONFIG, 'PACKED_PROMPTS', packed)
+    quota = QuotaScheduler(rpm=REQUESTS_PER_SECOND, per_seconds=1.0)
+    quota.global_buckets['requests'].tokens = 0.0
+    monkeypatch.setattr(judge.global_limiter, 'quota', quota)
+
+    claims = [{"claim_id": f"claim-{i:03d}", "pillar": "Pillar 1",
+               "sub_requirement": SUB_REQUIREMENTS[i % len(SUB_REQUIREMENTS)],
+               "status": "pending_judge_review", "evidence_chunk": f"Evidence {i}"}
+              for i in range(NUM_CLAIMS)]
+    api_manager = make_api_manager()
+    start = time.time()
+    results = judge.judge_claims(claims, api_manager)
+    elapsed = time.time() - start
+    assert [ruling["verdict"] for _, ruling in results] == ["approved"] * NUM_CLAIMS
+    return NUM_CLAIMS / elapsed * 60, api_manager.llm.transport.calls
+
+
+@pytest.mark.performance
+def test_claims_per_minute_at_fixed_request_budget(monkeypatch):
+    modes = {
+        "sequential": (1, False),
+        "4 workers": (4, False),
+        "4 workers, packed": (4, True),
+    }
+    results = {name: run_judge(monkeypatch, workers, packed) for name, (workers, packed) in modes.items()}
+
+    print(f"\nJudge throughput ({REQUESTS_PER_SECOND} requests/s budget, "
+          f"{MOCK_LATENCY_SECONDS * 1000:.0f} ms mocked latency):")
+    for name, (claims_per_minute, calls) in results.items():
+        print(f"  {name:18s} {claims_per_minute:8.0f} claims/min in {calls} requests")
+
+    assert results["sequential"][1] == results["4 workers"][1] == NUM_CLAIMS
+    assert results["4 workers, packed"][1] == 3 * 2  # Ten claims per sub-requirement, five per request
+    assert results["4 workers"][0] > results["sequential"][0] * 1.5
+    assert results["4 workers, packed"][0] > results["4 workers"][0] * 2
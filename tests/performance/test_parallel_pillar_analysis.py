@@ -0,0 +1,125 @@
+"""Benchmark: concurrent per-pillar analysis in one DEEP_LOOP iteration."""
+
+import random
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from literature_review import orchestrator
+from literature_review.orchestrator import PillarAnalyzer, ResearchDatabase
+
+API_LATENCY = 0.2  # Seconds per mocked Gemini call
+
+PILLARS = {
+    f"Pillar {i}: Topic {name} (Area)": {
+        "description": f"Research on {name}",
+        "keywords": [name],
+        "requirements": {
+            f"REQ-{i}.1": [f"Sub-{i}.1.1", f"Sub-{i}.1.2"],
+            f"REQ-{i}.2": [f"Sub-{i}.2.1"],
+        },
+    }
+    for i, name in enumerate(
+        ["sensory", "spike", "plasticity", "memory", "oscillation", "neuromorphic", "cognitive"], start=1
+    )
+}
+
+
+class SlowAPIManager:
+    """Stand-in APIManager whose calls take API_LATENCY and score every sub-requirement."""
+
+    def __init__(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def cached_api_call(self, prompt, use_cache=True, is_json=True, **kwargs):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(API_LATENCY)
+        with self._lock:
+            self.in_flight -= 1
+        pillar = next(name for name in PILLARS if f'PILLAR: "{name}"' in prompt)
+        score = 10 * int(pillar.split()[1].rstrip(':'))
+        return {
+            req_key: {
+                sub_req: {
+                    "completeness_percent": score,
+                    "gap_analysis": "Mocked",
+                    "confidence_level": "medium",
+                    "contributing_papers": [],
+                }
+                for sub_req in sub_reqs
+            }
+            for req_key, sub_reqs in PILLARS[pillar]["requirements"].items()
+        }
+
+
+@pytest.fixture
+def analyzer_factory(tmp_path, monkeypatch):
+    rng = random.Random(3)
+    rows = [{
+        "FILENAME": f"paper_{i:03d}.pdf",
+        "TITLE": f"A study of {name}",
+        "KEYWORDS": name,
+        "CORE_CONCEPTS": name,
+        "MAJOR_FINDINGS": f"Findings about {name}",
+        "CORE_DOMAIN_RELEVANCE_SCORE": rng.randint(50, 100),
+    } for i, name in enumerate(p["keywords"][0] for p in PILLARS.values() for _ in range(5))]
+    csv_path = tmp_path / "research_db.csv"
+    pd.DataFrame(rows).to_csv(csv_path, index=False)
+
+    monkeypatch.setitem(orchestrator.ANALYSIS_CONFIG, 'ENABLE_NETWORK_ANALYSIS', False)
+    monkeypatch.setitem(orchestrator.ANALYSIS_CONFIG, 'CACHE_RESULTS', False)
+    database = ResearchDatabase(str(csv_path))
+    config = {'version_history_path': str(tmp_path / "missing_history.json")}
+
+    def make():
+        api_manager = SlowAPIManager()
+        return PillarAnalyzer(PILLARS, database, api_manager, [], [], config=config), api_manager
+
+    return make
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("workers", [1, 7])
+def test_pillar_iteration_wall_clock(analyzer_factory, workers):
+    analyzer, api_manager = analyzer_factory()
+
+    start = time.perf_counter()
+    outcomes = analyzer.analyze_pillars(list(PILLARS.items()), max_workers=workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{workers} worker(s): {len(PILLARS)} pillars in {elapsed:.2f}s "
+          f"(max {api_manager.max_in_flight} in flight)")
+    assert api_manager.calls == len(PILLARS)
+    assert api_manager.max_in_flight == min(workers, len(PILLARS))
+    if workers > 1:
+        # Sequential cost is len(PILLARS) * API_LATENCY; allow generous scheduling slack
+        assert elapsed < len(PILLARS) * API_LATENCY / 2
+    assert list(outcomes) == list(PILLARS)
+
+
+@pytest.mark.performance
+def test_parallel_results_match_sequential(analyzer_factory):
+    sequential, _ = analyzer_factory()
+    parallel, _ = analyzer_factory()
+    events = []
+
+    expected = sequential.analyze_pillars(list(PILLARS.items()), max_workers=1)
+    actual = parallel.analyze_pillars(
+        list(PILLARS.items()), max_workers=4,
+        on_complete=lambda name, completeness, done, total: events.append((name, done, total))
+    )
+
+    assert list(actual) == list(PILLARS)
+    assert {name: outcome[1] for name, outcome in actual.items()} == \
+        {name: outcome[1] for name, outcome in expected.items()}
+    assert sorted(name for name, _, _ in events) == sorted(PILLARS)
+    assert [done for _, done, _ in events] == list(range(1, len(PILLARS) + 1))
+    assert all(total == len(PILLARS) for _, _, total in events)
@@ -0,0 +1,86 @@
+"""Benchmark: judge start-up and checkpoints scale with the pending queue, not the corpus."""
+
+import json
+import time
+
+import pytest
+
+from literature_review.analysis.judge import (
+    extract_pending_claims_from_history,
+    load_version_history,
+    update_claims_in_history,
+)
+from literature_review.io.version_history_store import open_version_history
+
+CORPUS_SIZES = (2_000, 20_000)
+CLAIMS_PER_PAPER = 4
+PENDING = 100
+BATCH_SIZE = 10
+
+
+def write_history(path, num_papers):
+    history = {}
+    for i in range(num_papers):
+        claims = [{"claim_id": f"{i}-{j}", "pillar": "Pillar 1", "sub_requirement": f"Sub-{j}",
+                   "status": "pending_judge_review" if i < PENDING and j == 0 else "approved",
+                   "evidence_quality": {"composite_score": 3.5}, "evidence_chunk": "evidence " * 20}
+                  for j in range(CLAIMS_PER_PAPER)]
+        history[f"paper_{i:05d}.pdf"] = [{"timestamp": "2025-01-01T00:00:00",
+                                          "review": {"FILENAME": f"paper_{i:05d}.pdf", "Requirement(s)": claims},
+                                          "changes": {"status": "new_review"}}]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(history, f)
+
+
+def judge(batch):
+    for claim in batch:
+        claim["status"] = "approved"
+        claim["judge_notes"] = "Approved."
+        claim["judge_timestamp"] = "2025-02-01T00:00:00"
+
+
+def legacy_run(path):
+    """Previous judge: parse the history, walk it for pending claims, walk it again per checkpoint."""
+    start = time.perf_counter()
+    history = load_version_history(path)
+    pending = extract_pending_claims_from_history(history)
+    judged = []
+    for n in range(0, len(pending), BATCH_SIZE):
+        judge(pending[n:n + BATCH_SIZE])
+        judged.extend(pending[n:n + BATCH_SIZE])
+        update_claims_in_history(history, judged)
+    return time.perf_counter() - start, len(pending)
+
+
+def store_run(path):
+    store = open_version_history(path)  # Imported before timing, as on every run after the first
+    start = time.perf_counter()
+    pending = store.pending_claims()
+    for n in range(0, len(pending), BATCH_SIZE):
+        judge(pending[n:n + BATCH_SIZE])
+        store.put_claims(pending[n:n + BATCH_SIZE])
+    elapsed = time.perf_counter() - start
+    assert store.pending_count() == 0
+    return elapsed, len(pending)
+
+
+@pytest.mark.performance
+def test_judge_cost_tracks_pending_claims(tmp_path):
+    results = {}
+    for num_papers in CORPUS_SIZES:
+        legacy_path, store_path = tmp_path / f"legacy_{num_papers}.json", tmp_path / f"store_{num_papers}.json"
+        write_history(legacy_path, num_papers)
+        write_history(store_path, num_papers)
+        open_version_history(str(store_path))
+        results[num_papers] = (legacy_run(str(legacy_path)), store_run(str(store_path)))
+
+    print()
+    for num_papers, ((legacy_seconds, _), (store_seconds, _)) in results.items():
+        print(f"{num_papers} papers, {PENDING} pending: history walk {legacy_seconds * 1000:.0f}ms, "
+              f"queue {store_seconds * 1000:.0f}ms")
+
+    (small_legacy, small_store), (large_legacy, large_store) = results[CORPUS_SIZES[0]], results[CORPUS_SIZES[1]]
+    assert small_legacy[1] == small_store[1] == large_legacy[1] == large_store[1] == PENDING
+    assert large_store[0] < large_legacy[0] / 10
+    # 10x the corpus with the same pending claims: the queue's cost stays roughly flat
+    assert large_store[0] < small_store[0] * 3 + 0.05
@@ -0,0 +1,77 @@
+"""
+Benchmark: RelevanceScorer.batch_score with semantic scoring, batched vs per pair.
+
+The encoder is a fake with a fixed cost per encode call plus a smaller cost per
+text, roughly the shape of a sentence-transformer forward pass on CPU. The
+previous scorer encoded the paper and gap texts for every (paper, gap) pair.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from literature_review.utils.embedding_service import EmbeddingService
+from literature_review.utils.relevance_scorer import RelevanceScorer
+
+CALL_SECONDS = 0.002
+TEXT_SECONDS = 0.0002
+NUM_PAPERS = 40
+NUM_GAPS = 15
+
+
+class TimedModel:
+    def __init__(self):
+        self.calls = 0
+        self.texts = 0
+
+    def encode(self, texts, **kwargs):
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        self.calls += 1
+        self.texts += len(texts)
+        time.sleep(CALL_SECONDS + TEXT_SECONDS * len(texts))
+        vectors = np.stack([np.random.default_rng(abs(hash(t)) % 2**32).normal(size=64) for t in texts])
+        return vectors[0] if single else vectors
+
+
+def legacy_semantic_score(model, text1, text2):
+    embedding1 = model.encode(text1, convert_to_numpy=True)
+    embedding2 = model.encode(text2, convert_to_numpy=True)
+    similarity = np.dot(embedding1, embedding2) / (np.linalg.norm(embedding1) * np.linalg.norm(embedding2))
+    return max(0.0, min(1.0, float(similarity)))
+
+
+@pytest.mark.performance
+def test_batched_embeddings_beat_per_pair_encoding():
+    papers = [{"filename": f"p{i}.pdf", "title": f"Paper {i}", "abstract": f"spiking network study {i}"}
+              for i in range(NUM_PAPERS)]
+    gaps = [{"keywords": ["spiking"], "requirement_text": f"Requirement {j}"} for j in range(NUM_GAPS)]
+
+    legacy_model = TimedModel()
+    scorer = RelevanceScorer(use_semantic=True, embedding_service=EmbeddingService(model=TimedModel()))
+    start = time.time()
+    legacy = {}
+    for paper in papers:
+        paper_text = scorer._get_paper_text(paper)
+        legacy[paper["filename"]] = max(
+            scorer._blend(scorer._keyword_match_score(paper_text, gap["keywords"]),
+                          legacy_semantic_score(legacy_model, paper_text, gap["requirement_text"]))
+            for gap in gaps)
+    legacy_seconds = time.time() - start
+
+    model = TimedModel()
+    scorer = RelevanceScorer(use_semantic=True, embedding_service=EmbeddingService(model=model))
+    start = time.time()
+    batched = scorer.batch_score(papers, gaps)
+    batched_seconds = time.time() - start
+
+    print(f"\nbatch_score {NUM_PAPERS} papers x {NUM_GAPS} gaps: per pair {legacy_seconds:.2f}s "
+          f"({legacy_model.calls} encode calls), batched {batched_seconds:.3f}s ({model.calls} encode calls)")
+
+    assert batched == pytest.approx(legacy, abs=1e-5)
+    assert legacy_model.calls == 2 * NUM_PAPERS * NUM_GAPS
+    assert model.texts == NUM_PAPERS + NUM_GAPS
+    assert batched_seconds < legacy_seconds / 10
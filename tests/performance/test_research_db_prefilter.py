@@ -0,0 +1,118 @@
+"""Benchmark: inverted-index keyword prefilter in ResearchDatabase.get_relevant_papers."""
+
+import random
+import time
+
+import pandas as pd
+import pytest
+
+from literature_review import orchestrator
+from literature_review.orchestrator import ResearchDatabase
+
+NUM_PAPERS = 10_000
+
+PILLARS = {
+    "Pillar 1: Biological Stimulus-Response (Sensory)": ["sensory", "stimulus", "receptor", "transduction"],
+    "Pillar 2: Neural Encoding (Spikes)": ["spike", "encoding", "rate code", "temporal coding"],
+    "Pillar 3: Synaptic Plasticity (Learning)": ["stdp", "plasticity", "hebbian", "long-term potentiation"],
+    "Pillar 4: Memory Systems (Consolidation)": ["memory", "hippocampus", "consolidation", "replay"],
+    "Pillar 5: Network Dynamics (Oscillations)": ["oscillation", "gamma", "attractor", "recurrent network"],
+    "Pillar 6: Neuromorphic Hardware (Chips)": ["neuromorphic", "memristor", "loihi", "analog circuit"],
+    "Pillar 7: Cognitive Architecture (Reasoning)": ["cognitive", "reasoning", "working memory", "attention"],
+}
+
+VOCABULARY = [
+    "sensory", "stimulus", "receptor", "transduction", "spike", "spiking", "encoding", "rate", "code",
+    "temporal", "coding", "stdp", "plasticity", "hebbian", "long-term", "potentiation", "memory",
+    "hippocampus", "hippocampal", "consolidation", "replay", "oscillation", "oscillations", "gamma",
+    "attractor", "recurrent", "network", "networks", "neuromorphic", "memristor", "loihi", "analog",
+    "circuit", "cognitive", "reasoning", "working", "attention", "model", "data", "results", "cortex",
+    "dendrite", "learning", "deep", "brain", "simulation", "energy", "efficient", "robot", "vision",
+] + [f"term{i}" for i in range(2000)]
+
+
+def legacy_get_relevant_papers(db: pd.DataFrame, pillar_name: str, pillar_keywords):
+    """The previous per-(field x keyword) str.contains scan, kept as the baseline."""
+    pillar_short = pillar_name.split(':')[1].split('(')[0].strip() if ':' in pillar_name else pillar_name
+    conditions = []
+    for field in ResearchDatabase.SEARCH_FIELDS:
+        if field in db.columns:
+            for keyword in [pillar_short] + pillar_keywords:
+                if keyword:
+                    conditions.append(db[field].str.contains(keyword, case=False, na=False))
+    combined = pd.concat(conditions, axis=1).any(axis=1)
+    return db[combined].drop_duplicates(subset=['FILENAME'])
+
+
+def random_text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words)).capitalize()
+
+
+@pytest.fixture(scope="module")
+def research_db(tmp_path_factory):
+    rng = random.Random(7)
+    rows = []
+    for i in range(NUM_PAPERS):
+        rows.append({
+            "FILENAME": f"paper_{i:05d}.pdf",
+            "TITLE": random_text(rng, 8),
+            "CORE_DOMAIN": random_text(rng, 2),
+            "SUB_DOMAIN": random_text(rng, 2),
+            "APPLICABILITY_NOTES": random_text(rng, 20),
+            "KEYWORDS": ", ".join(rng.choice(VOCABULARY) for _ in range(5)),
+            "CORE_CONCEPTS": random_text(rng, 6),
+            "INTERDISCIPLINARY_BRIDGES": random_text(rng, 6),
+            "MAJOR_FINDINGS": random_text(rng, 30),
+            "CORE_DOMAIN_RELEVANCE_SCORE": rng.randint(0, 100),
+        })
+    csv_path = tmp_path_factory.mktemp("prefilter") / "research_db.csv"
+    pd.DataFrame(rows).to_csv(csv_path, index=False)
+
+    original = orchestrator.ANALYSIS_CONFIG['ENABLE_NETWORK_ANALYSIS']
+    orchestrator.ANALYSIS_CONFIG['ENABLE_NETWORK_ANALYSIS'] = False
+    try:
+        yield ResearchDatabase(str(csv_path))
+    finally:
+        orchestrator.ANALYSIS_CONFIG['ENABLE_NETWORK_ANALYSIS'] = original
+
+
+@pytest.mark.performance
+def test_index_matches_legacy_substring_semantics(research_db):
+    """Index lookups return exactly the rows the str.contains scan returned."""
+    for pillar_name, keywords in PILLARS.items():
+        expected = legacy_get_relevant_papers(research_db.db, pillar_name, keywords)
+        actual = research_db.get_relevant_papers(pillar_name, keywords)
+        assert list(actual['FILENAME']) == list(expected['FILENAME']), pillar_name
+
+
+@pytest.mark.performance
+def test_prefilter_lookup_10k_papers_7_pillars(research_db):
+    """All 7 pillar lookups at 10k papers complete in milliseconds."""
+    start = time.perf_counter()
+    for pillar_name, keywords in PILLARS.items():
+        legacy_get_relevant_papers(research_db.db, pillar_name, keywords)
+    legacy_seconds = time.perf_counter() - start
+
+    research_db.build_search_index()  # drop the keyword cache warmed by other tests
+    start = time.perf_counter()
+    for pillar_name, keywords in PILLARS.items():
+        research_db.get_relevant_papers(pillar_name, keywords)
+    cold_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for pillar_name, keywords in PILLARS.items():
+        research_db.get_relevant_papers(pillar_name, keywords)
+    warm_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    research_db.build_search_index()
+    build_seconds = time.perf_counter() - start
+
+    print(f"\nget_relevant_papers, {NUM_PAPERS:,} papers x {len(PILLARS)} pillars:")
+    print(f"  str.contains scan:        {legacy_seconds * 1000:8.1f} ms")
+    print(f"  inverted index (cold):    {cold_seconds * 1000:8.1f} ms")
+    print(f"  inverted index (warm):    {warm_seconds * 1000:8.1f} ms")
+    print(f"  index build (once/load):  {build_seconds * 1000:8.1f} ms")
+
+    assert cold_seconds < legacy_seconds / 5
+    assert warm_seconds < 0.5
@@ -0,0 +1,101 @@
+"""Benchmark: columnar research store vs. parsing the monolithic CSV on every load."""
+
+import json
+import os
+import random
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from literature_review.io.research_store import open_research_store
+from literature_review.orchestrator import ResearchDatabase
+
+NUM_PAPERS = 20_000
+TEXT_COLUMNS = ["ANALYSIS_GAPS", "APPLICABILITY_NOTES", "IMPLEMENTATION_DETAILS",
+                "IMPROVEMENT_SUGGESTIONS", "MAJOR_FINDINGS", "RISKS", "SCALABILITY_NOTES"]
+
+
+@pytest.fixture(scope="module")
+def csv_path(tmp_path_factory):
+    rng = random.Random(12)
+    filenames = [f"paper_{i:05d}.pdf" for i in range(NUM_PAPERS)]
+    rows = []
+    for i, filename in enumerate(filenames):
+        claims = [{"claim_id": f"{i}-{j}", "pillar": f"Pillar {j % 7 + 1}", "sub_requirement": f"Sub-{j}",
+                   "status": "approved", "evidence_chunk": "evidence " * 20} for j in range(3)]
+        row = {column: f"{column.lower()} " * 25 for column in TEXT_COLUMNS}
+        row.update({
+            "FILENAME": filename,
+            "TITLE": f"Paper {i}",
+            "KEYWORDS": json.dumps(["spiking", "plasticity", f"topic-{i % 50}"]),
+            "CORE_CONCEPTS": json.dumps(["memory", "encoding"]),
+            "MENTIONED_PAPERS": json.dumps(rng.sample(filenames, 3)),
+            "CORE_DOMAIN_RELEVANCE_SCORE": rng.randint(0, 100),
+            "PUBLICATION_YEAR": rng.randint(2000, 2025),
+            "Requirement(s)": json.dumps(claims),
+        })
+        rows.append(row)
+    path = tmp_path_factory.mktemp("research_store") / "research_db.csv"
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return str(path)
+
+
+LOADER = """
+import json, sys, time
+import numpy as np
+import pandas as pd
+from literature_review.io.research_store import open_research_store
+
+def rss_kb(field):
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith(field))
+
+mode, csv_path, columns = sys.argv[1], sys.argv[2], json.loads(sys.argv[3])
+with open("/proc/self/clear_refs", "w") as f:
+    f.write("5")  # Reset the RSS high-water mark left behind by imports
+baseline = rss_kb("VmRSS")
+start = time.perf_counter()
+if mode == "csv":
+    # Previous DEEP_LOOP load: full CSV into the DataFrame, then again with claims parsed per row
+    db = pd.read_csv(csv_path)
+    records = pd.read_csv(csv_path, encoding="utf-8").replace({np.nan: None}).to_dict("records")
+    for row in records:
+        row["Requirement(s)"] = json.loads(row["Requirement(s)"])
+else:
+    store = open_research_store(csv_path)
+    db, records = store.read_papers(columns), store.read_records(["FILENAME"])
+seconds = time.perf_counter() - start
+print(json.dumps({
+    "seconds": seconds,
+    "peak_kb": rss_kb("VmHWM") - baseline,
+    "papers": len(db),
+    "claims": sum(len(row["Requirement(s)"]) for row in records),
+}))
+"""
+
+
+def measure(mode, csv_path):
+    """Run one load in a fresh interpreter so peak RSS covers only that load."""
+    result = subprocess.run(
+        [sys.executable, "-c", LOADER, mode, csv_path, json.dumps(ResearchDatabase.ANALYSIS_COLUMNS)],
+        capture_output=True, text=True, check=True, cwd=os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')),
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(not os.path.exists("/proc/self/clear_refs"), reason="needs Linux peak-RSS reset")
+def test_store_load_beats_csv(csv_path):
+    open_research_store(csv_path)  # One-time import, as on the first run after upgrading
+
+    legacy = measure("csv", csv_path)
+    store = measure("store", csv_path)
+
+    print(f"\n{NUM_PAPERS} papers: CSV {legacy['seconds']:.2f}s / peak +{legacy['peak_kb'] // 1024}MB, "
+          f"store {store['seconds']:.2f}s / peak +{store['peak_kb'] // 1024}MB")
+    assert store["papers"] == legacy["papers"] == NUM_PAPERS
+    assert store["claims"] == legacy["claims"]
+    assert store["seconds"] < legacy["seconds"] / 2
+    assert store["peak_kb"] < legacy["peak_kb"]
@@ -0,0 +1,87 @@
+"""Benchmark: resident ResearchDataLayer vs. reloading everything every DEEP_LOOP iteration."""
+
+import json
+import os
+import random
+import time
+
+import pandas as pd
+import pytest
+
+from literature_review import orchestrator
+from literature_review.orchestrator import (
+    ResearchDataLayer,
+    ResearchDatabase,
+    load_approved_claims_from_version_history,
+    load_research_db_records,
+)
+
+NUM_PAPERS = 5_000
+ITERATIONS = 10
+
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory):
+    rng = random.Random(11)
+    root = tmp_path_factory.mktemp("resident")
+    filenames = [f"paper_{i:05d}.pdf" for i in range(NUM_PAPERS)]
+    rows, history = [], {}
+    for i, filename in enumerate(filenames):
+        claims = [{"claim_id": f"{i}-{j}", "pillar": f"Pillar {j % 7 + 1}", "sub_requirement": f"Sub-{j}",
+                   "status": "approved", "claim_summary": "x" * 80} for j in range(3)]
+        rows.append({
+            "FILENAME": filename,
+            "TITLE": f"Paper {i}",
+            "MAJOR_FINDINGS": "findings " * 20,
+            "MENTIONED_PAPERS": str(rng.sample(filenames, 3)),
+            "CORE_DOMAIN_RELEVANCE_SCORE": rng.randint(0, 100),
+            "Requirement(s)": json.dumps(claims),
+        })
+        history[filename] = [{"timestamp": "2025-01-01", "review": {"Requirement(s)": claims}}]
+    csv_path, history_path = root / "research_db.csv", root / "history.json"
+    pd.DataFrame(rows).to_csv(csv_path, index=False)
+    history_path.write_text(json.dumps(history), encoding="utf-8")
+    return str(csv_path), str(history_path), history
+
+
+def judge_one_paper(history_path, history, iteration):
+    """Simulate the judge approving one new claim per iteration."""
+    versions = history[f"paper_{iteration:05d}.pdf"]
+    versions[-1]["review"]["Requirement(s)"].append(
+        {"claim_id": f"new-{iteration}", "pillar": "Pillar 1", "sub_requirement": "Sub-0", "status": "approved"})
+    with open(history_path, "w", encoding="utf-8") as f:
+        json.dump(history, f)
+    stat = os.stat(history_path)
+    os.utime(history_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + iteration * 1_000_000_000))
+
+
+@pytest.mark.performance
+def test_resident_layer_vs_full_reload(corpus, monkeypatch):
+    csv_path, history_path, history = corpus
+    monkeypatch.setitem(orchestrator.ANALYSIS_CONFIG, 'ENABLE_NETWORK_ANALYSIS', True)
+
+    start = time.perf_counter()
+    database = ResearchDatabase(csv_path)
+    load_research_db_records(csv_path)
+    load_approved_claims_from_version_history(history_path)
+    per_iteration_reload = time.perf_counter() - start
+
+    start = time.perf_counter()
+    layer = ResearchDataLayer(csv_path, history_path)
+    initial = time.perf_counter() - start
+    refresh_seconds = []
+    for iteration in range(1, ITERATIONS):
+        judge_one_paper(history_path, history, iteration)
+        start = time.perf_counter()
+        summary = layer.refresh()
+        refresh_seconds.append(time.perf_counter() - start)
+        assert summary == {'research_db_reloaded': False, 'papers_updated': [f"paper_{iteration:05d}.pdf"]}
+
+    legacy_total = per_iteration_reload * ITERATIONS
+    resident_total = initial + sum(refresh_seconds)
+    print(f"\n{NUM_PAPERS} papers x {ITERATIONS} iterations: reload every iteration ~{legacy_total:.1f}s, "
+          f"resident {resident_total:.1f}s (initial {initial:.2f}s, "
+          f"refresh avg {sum(refresh_seconds) / len(refresh_seconds) * 1000:.0f}ms)")
+    assert layer.database.paper_network.number_of_nodes() == database.paper_network.number_of_nodes()
+    assert len(layer.approved_claims) == NUM_PAPERS * 3 + ITERATIONS - 1
+    assert resident_total < legacy_total / 3
@@ -0,0 +1,81 @@
+"""
+Benchmark: similar-paper lookup for a batch of new papers against a large corpus.
+
+The previous implementation rebuilt the target embedding matrix from the cache
+with a Python loop for every new paper and found each match with a linear scan
+of existing_papers. It is reproduced here from the cached embeddings and timed
+against NetworkAnalyzer.find_similar_papers over the vector index.
+"""
+
+import time
+
+import numpy as np
+import pytest
+from sklearn.metrics.pairwise import cosine_similarity
+
+from literature_review.reviewers import journal_reviewer as jr
+
+NUM_EXISTING = 5000
+NUM_NEW = 50
+DIM = 384
+THRESHOLD = 0.85
+
+
+class LookupEmbedder:
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def encode(self, texts, **kwargs):
+        if isinstance(texts, list):
+            return np.stack([self.encode(text) for text in texts])
+        return self.vectors[texts.split("Title: ", 1)[1].split(".", 1)[0]]
+
+
+def legacy_find_similar(paper_embedding, paper_key, existing_papers, cache):
+    target_keys, target_embeddings_list = [], []
+    for existing in existing_papers:
+        existing_key = existing.get('FILENAME', '')
+        if not existing_key or existing_key == paper_key: continue
+        target_keys.append(existing_key)
+        target_embeddings_list.append(cache[existing_key])
+    similarities = cosine_similarity([paper_embedding], np.array(target_embeddings_list))[0]
+    similar = []
+    for i, similarity in enumerate(similarities):
+        if similarity > THRESHOLD:
+            target_paper = next((p for p in existing_papers if p.get('FILENAME') == target_keys[i]), None)
+            similar.append((target_paper, float(similarity)))
+    return sorted(similar, key=lambda x: x[1], reverse=True)
+
+
+@pytest.mark.performance
+def test_index_query_beats_matrix_rebuild(tmp_path, monkeypatch):
+    monkeypatch.setattr(jr, "EMBEDDINGS_CACHE", str(tmp_path / "embeddings_cache.npy"))
+    monkeypatch.setattr(jr, "LEGACY_EMBEDDINGS_CACHE", str(tmp_path / "embeddings_cache.pkl"))
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(50, DIM))
+    vectors = {f"p{i}": (centers[i % 50] + rng.normal(scale=0.15, size=DIM)).astype(np.float32)
+               for i in range(NUM_EXISTING + NUM_NEW)}
+    existing = [{"FILENAME": f"p{i}.pdf", "TITLE": f"p{i}"} for i in range(NUM_EXISTING)]
+    new = [{"FILENAME": f"p{i}.pdf", "TITLE": f"p{i}"} for i in range(NUM_EXISTING, NUM_EXISTING + NUM_NEW)]
+    cache = {f"p{i}.pdf": vectors[f"p{i}"] for i in range(NUM_EXISTING + NUM_NEW)}
+
+    start = time.time()
+    legacy = [legacy_find_similar(cache[p["FILENAME"]], p["FILENAME"], existing, cache)[:10] for p in new]
+    legacy_seconds = time.time() - start
+
+    analyzer = jr.NetworkAnalyzer(LookupEmbedder(vectors))
+    analyzer.find_similar_papers(new[0], existing, threshold=THRESHOLD)  # Index the corpus once
+    analyzer.save_embeddings_cache()
+    start_up = time.time()
+    analyzer = jr.NetworkAnalyzer(LookupEmbedder(vectors))
+    start_up_seconds = time.time() - start_up
+    start = time.time()
+    indexed = [analyzer.find_similar_papers(p, existing, threshold=THRESHOLD) for p in new]
+    indexed_seconds = time.time() - start
+
+    print(f"\nSimilar papers for {NUM_NEW} new vs {NUM_EXISTING} existing: "
+          f"matrix rebuild {legacy_seconds:.2f}s, index {indexed_seconds:.2f}s "
+          f"(index open {start_up_seconds * 1000:.1f} ms)")
+
+    assert [[p["FILENAME"] for p, _ in r] for r in indexed] == [[p["FILENAME"] for p, _ in r] for r in legacy]
+    assert indexed_seconds < legacy_seconds / 3
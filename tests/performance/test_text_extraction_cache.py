@@ -0,0 +1,50 @@
+"""Benchmark: shared cached PDF extraction vs. running both extractors per stage."""
+
+import os
+import time
+
+import pdfplumber
+import pypdf
+import pytest
+
+from literature_review.utils.text_extraction import extract_document
+
+SAMPLE_PDF = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'raw', 'Research-Papers', 'journal-1', '2010.05446v5.pdf')
+STAGES = 3  # journal reviewer, deep reviewer, DRA
+
+
+def legacy_extract(filepath):
+    """Previous behaviour: full pdfplumber and pypdf passes, keep the longer text."""
+    with pdfplumber.open(filepath) as pdf:
+        plumber_text = "".join((p.extract_text(x_tolerance=1, y_tolerance=1) or "") + "\n" for p in pdf.pages)
+    with open(filepath, 'rb') as f:
+        pypdf_text = "".join((p.extract_text() or "") + "\n" for p in pypdf.PdfReader(f).pages)
+    return max(plumber_text, pypdf_text, key=len)
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(not os.path.exists(SAMPLE_PDF), reason="sample paper not available")
+def test_repeat_reads_cost_a_cache_lookup(tmp_path):
+    cache_path = str(tmp_path / "extracted_text.db")
+
+    # Every stage re-parsed the file the same way, so one legacy pass times them all
+    start = time.perf_counter()
+    legacy_text = legacy_extract(SAMPLE_PDF)
+    legacy = (time.perf_counter() - start) * STAGES
+
+    start = time.perf_counter()
+    cold = extract_document(SAMPLE_PDF, cache_path=cache_path)
+    cold_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(STAGES - 1):
+        warm = extract_document(SAMPLE_PDF, cache_path=cache_path)
+    warm_seconds = (time.perf_counter() - start) / (STAGES - 1)
+
+    print(f"\n{len(cold.pages)} pages x {STAGES} stages: legacy {legacy:.2f}s, "
+          f"shared {cold_seconds + warm_seconds * (STAGES - 1):.2f}s "
+          f"(cold {cold_seconds:.2f}s, warm {warm_seconds * 1000:.1f}ms)")
+    assert warm.from_cache and warm.pages == cold.pages
+    assert len(cold.text) >= 0.9 * len(legacy_text)
+    assert warm_seconds < cold_seconds / 20
+    assert cold_seconds + warm_seconds * (STAGES - 1) < legacy / 2
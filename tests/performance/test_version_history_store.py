@@ -0,0 +1,96 @@
+"""Benchmark: judge checkpoints on the version history store vs. full JSON rewrites."""
+
+import copy
+import json
+import os
+import time
+
+import pytest
+
+from literature_review.analysis.judge import (
+    extract_pending_claims_from_history,
+    load_version_history,
+    save_version_history,
+    update_claims_in_history,
+)
+from literature_review.io.version_history_store import open_version_history
+
+NUM_PAPERS = 1_000
+CLAIMS_PER_PAPER = 5
+BATCH_SIZE = 10
+BATCHES = 30
+
+
+@pytest.fixture
+def history():
+    history = {}
+    for i in range(NUM_PAPERS):
+        filename = f"paper_{i:05d}.pdf"
+        # One claim per paper still awaits judgment
+        claims = [{"claim_id": f"{i}-{j}", "pillar": f"Pillar {j + 1}", "sub_requirement": f"Sub-{j}",
+                   "status": "approved" if j else "pending_judge_review", "evidence_chunk": "evidence " * 30}
+                  for j in range(CLAIMS_PER_PAPER)]
+        review = {"FILENAME": filename, "TITLE": f"Paper {i}", "MAJOR_FINDINGS": "findings " * 40,
+                  "Requirement(s)": claims}
+        history[filename] = [{"timestamp": "2025-01-01T00:00:00", "review": review, "changes": {"status": "new_review"}}]
+    return history
+
+
+def judge(batch):
+    for claim in batch:
+        claim["status"] = "approved"
+        claim["judge_notes"] = "Approved."
+        claim["judge_timestamp"] = "2025-02-01T00:00:00"
+
+
+def latest_claims(history):
+    """Latest claim contents, ignoring the _source_* tags extract_pending_claims_from_history adds."""
+    return {filename: [{k: v for k, v in claim.items() if not k.startswith("_source")}
+                       for claim in versions[-1]["review"]["Requirement(s)"]]
+            for filename, versions in history.items()}
+
+
+@pytest.mark.performance
+def test_store_checkpoints_beat_full_rewrites(history, tmp_path):
+    legacy_path, store_path = str(tmp_path / "legacy.json"), str(tmp_path / "store.json")
+    for path in (legacy_path, store_path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(copy.deepcopy(history), f)
+
+    # Previous judge loop: cumulative update + full rewrite after every batch
+    start = time.perf_counter()
+    version_history = load_version_history(legacy_path)
+    pending = extract_pending_claims_from_history(version_history)
+    legacy_read = time.perf_counter() - start
+    judged = []
+    for n in range(BATCHES):
+        batch = pending[n * BATCH_SIZE:(n + 1) * BATCH_SIZE]
+        judge(batch)
+        judged.extend(batch)
+        version_history = update_claims_in_history(version_history, judged)
+        save_version_history(legacy_path, version_history)
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store = open_version_history(store_path)  # One-time import, as on the first run after upgrading
+    import_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pending = store.pending_claims()
+    store_read = time.perf_counter() - start
+    for n in range(BATCHES):
+        batch = pending[n * BATCH_SIZE:(n + 1) * BATCH_SIZE]
+        judge(batch)
+        store.put_claims(batch)
+    store.export_json(store_path)
+    store_seconds = time.perf_counter() - start
+
+    print(f"\n{NUM_PAPERS} papers, {BATCHES} checkpoints: full rewrites {legacy_seconds:.2f}s "
+          f"({os.path.getsize(legacy_path) // 1024} KB), store {store_seconds:.2f}s "
+          f"({os.path.getsize(store_path) // 1024} KB, import {import_seconds:.2f}s); "
+          f"pending read {legacy_read * 1000:.0f}ms vs {store_read * 1000:.0f}ms")
+
+    assert latest_claims(load_version_history(store_path)) == latest_claims(version_history)
+    assert len(store.pending_claims()) == NUM_PAPERS - BATCHES * BATCH_SIZE
+    assert store_seconds < legacy_seconds / 5
+    assert store_read < legacy_read
@@ -55,8 +55,8 @@ class TestTaskCard2AcceptanceCriteria:
         assert 'save_deep_coverage_db(' not in main_code, "Judge.py still calls save_deep_coverage_db!"
         assert 'save_research_db(' not in main_code, "Judge.py still calls save_research_db!"
         
-        # Verify it DOES call save_version_history
-        assert 'save_version_history(' in main_code, "Judge.py should call save_version_history!"
+        # Verify it DOES save the version history (via the version history store)
+        assert 'export_json(VERSION_HISTORY_FILE)' in main_code, "Judge.py should save the version history!"
     
     def test_no_database_loads_in_main(self):
         """✅ Verify Judge.py does NOT load from databases in main()"""
@@ -71,7 +71,7 @@ class TestTaskCard2AcceptanceCriteria:
         assert 'load_research_db(' not in main_code, "Judge.py should not load from CSV database!"
         
         # Should ONLY load from version history
-        assert 'load_version_history(' in main_code, "Judge.py must load from version history!"
+        assert 'open_version_history(VERSION_HISTORY_FILE)' in main_code, "Judge.py must load from version history!"
 
 
 class TestVersionHistoryIO:
@@ -485,12 +485,12 @@ def test_pr1_acceptance_summary():
             'save_research_db(' not in main_code,
         
                         "✅ Judge loads claims ONLY from version history":
-            'load_version_history(' in main_code and
+            'open_version_history(VERSION_HISTORY_FILE)' in main_code and
             'load_deep_coverage_db(' not in main_code and
             'load_research_db(' not in main_code,
         
         "✅ Judge saves ONLY to version history":
-            'save_version_history(' in main_code,
+            'export_json(VERSION_HISTORY_FILE)' in main_code,
         
                 "✅ New version history I/O functions exist":
             all(func in judge_code for func in [
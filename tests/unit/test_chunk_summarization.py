@@ -0,0 +1,62 @@
+"""Unit tests for parallel chunk summarization in journal_reviewer.PaperAnalyzer."""
+
+import json
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from literature_review.reviewers import journal_reviewer as jr
+from literature_review.reviewers.journal_reviewer import PaperAnalyzer
+
+PILLARS = json.dumps({"Pillar 1: Test": {"requirements": {"REQ-1": ["Sub-1.1: Spike encoding"]}}}, indent=2)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setitem(jr.REVIEW_CONFIG, 'CHUNK_SIZE', 100)
+    monkeypatch.setitem(jr.REVIEW_CONFIG, 'MAX_CONCURRENT_CHUNKS', 4)
+
+
+def chunk_number(prompt):
+    return int(prompt.split("This is CHUNK ", 1)[1].split(" ", 1)[0])
+
+
+def test_summaries_compiled_in_chunk_order():
+    text = "".join(f"[{i:02d}]" + "x" * 96 for i in range(8))
+    api_manager = Mock()
+    # Later chunks answer first; chunk 3 fails
+    delays = {n: (9 - n) * 0.01 for n in range(1, 10)}
+
+    def respond(prompt, is_json=False):
+        n = chunk_number(prompt)
+        time.sleep(delays[n])
+        return None if n == 3 else f"  summary {n}  "
+    api_manager.cached_api_call.side_effect = respond
+
+    summary = PaperAnalyzer.summarize_text_chunks(text, api_manager, PILLARS)
+
+    total = api_manager.cached_api_call.call_count
+    assert total == 9  # 90-char stride over 800 chars
+    headers = [f"--- SUMMARY OF CHUNK {n}/{total} ---" for n in range(1, total + 1)]
+    positions = [summary.index(header) for header in headers]
+    assert positions == sorted(positions)
+    assert f"{headers[1]}\nsummary 2\n" in summary
+    assert f"{headers[2]}\n[[[ Summarization Failed ]]]\n" in summary
+    assert summary.startswith("[[[ This document was summarized from multiple chunks")
+
+
+def test_chunk_prompts_carry_minified_pillars():
+    api_manager = Mock()
+    api_manager.cached_api_call.return_value = "summary"
+
+    PaperAnalyzer.summarize_text_chunks("y" * 250, api_manager, PILLARS)
+
+    prompt = api_manager.cached_api_call.call_args_list[0].args[0]
+    assert json.dumps(json.loads(PILLARS), separators=(',', ':')) in prompt
+    assert PILLARS not in prompt
+
+
+def test_compact_pillar_context_keeps_non_json():
+    assert PaperAnalyzer.compact_pillar_context("") == ""
+    assert PaperAnalyzer.compact_pillar_context("Pillar 1: free text") == "Pillar 1: free text"
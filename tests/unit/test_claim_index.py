@@ -0,0 +1,51 @@
+"""Unit tests for the per-pillar ClaimIndex used by PillarAnalyzer."""
+
+import copy
+
+import pandas as pd
+
+from literature_review.orchestrator import ClaimIndex, PillarAnalyzer
+
+PILLAR = "Pillar 1: Sensory Encoding (Biology)"
+
+
+def make_claim(claim_id, sub_req="Sub-1.1", status="approved", pillar=PILLAR, **extra):
+    return {"claim_id": claim_id, "pillar": pillar, "sub_requirement": sub_req,
+            "status": status, "claim_summary": f"Claim {claim_id}", **extra}
+
+
+def test_build_orders_version_history_before_research_db():
+    records = [{"FILENAME": "csv.pdf", "Requirement(s)": [make_claim("c1")]}]
+    version_claims = [make_claim("v1", filename="json.pdf")]
+
+    entries = ClaimIndex.build(records, version_claims).claims(PILLAR)
+    assert [(e.claim["claim_id"], e.filename, e.source) for e in entries] == [
+        ("v1", "json.pdf", ClaimIndex.SOURCE_VERSION_HISTORY),
+        ("c1", "csv.pdf", ClaimIndex.SOURCE_RESEARCH_DB),
+    ]
+
+
+def test_filters_by_status_and_sub_requirement():
+    records = [{"FILENAME": "a.pdf", "Requirement(s)": [
+        make_claim("a", "Sub-1.1"), make_claim("b", "Sub-1.2"),
+        make_claim("c", "Sub-1.1", status="rejected"), make_claim("d", pillar="Pillar 2"),
+    ]}]
+    index = ClaimIndex.build(records, [])
+
+    assert [e.claim["claim_id"] for e in index.claims(PILLAR)] == ["a", "b"]
+    assert [e.claim["claim_id"] for e in index.claims(PILLAR, sub_requirement="Sub-1.1")] == ["a"]
+    assert [e.claim["claim_id"] for e in index.claims(PILLAR, status=None)] == ["a", "b", "c"]
+    assert index.claims("Pillar 9") == []
+
+
+def test_build_expert_prompt_does_not_mutate_claims():
+    records = [{"FILENAME": "csv.pdf", "Requirement(s)": [make_claim("c1")]}]
+    version_claims = [make_claim("v1", filename="json.pdf")]
+    before = copy.deepcopy((records, version_claims))
+
+    analyzer = PillarAnalyzer.__new__(PillarAnalyzer)
+    analyzer.claim_index = ClaimIndex.build(records, version_claims)
+    prompt = analyzer.build_expert_prompt(PILLAR, {"requirements": {"REQ-1": ["Sub-1.1"]}}, pd.DataFrame())
+
+    assert "FROM PAPER: csv.pdf" in prompt and "FROM PAPER: json.pdf" in prompt
+    assert (records, version_claims) == before
@@ -0,0 +1,89 @@
+"""Unit tests for concurrent, temperature-diversified consensus evaluation in journal_reviewer."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from literature_review.reviewers import journal_reviewer as jr
+from literature_review.reviewers.journal_reviewer import PaperAnalyzer, PaperMetadata
+
+METADATA = PaperMetadata(filename="paper.pdf", filepath="paper.pdf", domain_context="", extraction_quality=0.5,
+                         extraction_method="pdfplumber", timestamp="2025-01-01T00:00:00")
+
+
+def analysis(score):
+    response = {key: "N/A" for key in PaperAnalyzer.REQUIRED_JSON_KEYS}
+    for key in ["MAJOR_FINDINGS", "KEYWORDS", "CORE_CONCEPTS", "INTERDISCIPLINARY_BRIDGES", "NETWORK_ARCHITECTURE",
+                "BRAIN_REGIONS", "DATASET_USED", "SIMILAR_PAPERS", "MENTIONED_PAPERS", "Requirement(s)"]:
+        response[key] = []
+    response.update({field: score for field in PaperAnalyzer.CONSENSUS_NUMERIC_FIELDS})
+    response["PUBLICATION_YEAR"] = 2024
+    return response
+
+
+def api_manager_for(scores_by_temperature, barrier=None):
+    """First evaluation scores scores_by_temperature[None]; later ones by their temperature."""
+    api_manager = Mock()
+
+    def default_call(prompt, use_cache=True, is_json=True):
+        if barrier:
+            barrier.wait()
+        return analysis(scores_by_temperature[None])
+
+    def temperature_call(prompt, temperature, cache_key=None, is_json=True):
+        if barrier:
+            barrier.wait()
+        return analysis(scores_by_temperature[temperature])
+    api_manager.cached_api_call.side_effect = default_call
+    api_manager.call_with_temperature.side_effect = temperature_call
+    return api_manager
+
+
+@pytest.fixture(autouse=True)
+def consensus_config(monkeypatch):
+    monkeypatch.setitem(jr.REVIEW_CONFIG, 'CONSENSUS_TEMPERATURES', [0.2, 0.5, 0.8])
+    monkeypatch.setitem(jr.REVIEW_CONFIG, 'CONSENSUS_EARLY_STOP', True)
+    monkeypatch.setitem(jr.REVIEW_CONFIG, 'CONSENSUS_SCORE_TOLERANCE', 10)
+
+
+def test_two_evaluations_run_concurrently_with_distinct_temperatures():
+    # Both evaluations must be in flight at once to pass the barrier
+    api_manager = api_manager_for({None: 60, 0.5: 80}, barrier=threading.Barrier(2, timeout=5))
+
+    result = PaperAnalyzer.consensus_evaluation("text " * 200, METADATA, api_manager, "{}", num_evaluations=2)
+
+    assert result['CORE_DOMAIN_RELEVANCE_SCORE'] == 70
+    call = api_manager.call_with_temperature.call_args
+    assert call.args[1] == 0.5
+    assert call.kwargs['cache_key'].startswith("paper.pdf_consensus_1_0.5_")
+
+
+def test_early_stop_when_first_two_agree():
+    api_manager = api_manager_for({None: 60, 0.5: 65, 0.8: 10})
+
+    result = PaperAnalyzer.consensus_evaluation("text " * 200, METADATA, api_manager, "{}", num_evaluations=3)
+
+    assert api_manager.call_with_temperature.call_count == 1
+    assert result['CORE_DOMAIN_RELEVANCE_SCORE'] == 62
+
+
+def test_disagreement_runs_remaining_evaluations():
+    api_manager = api_manager_for({None: 60, 0.5: 90, 0.8: 30})
+
+    result = PaperAnalyzer.consensus_evaluation("text " * 200, METADATA, api_manager, "{}", num_evaluations=3)
+
+    assert [c.args[1] for c in api_manager.call_with_temperature.call_args_list] == [0.5, 0.8]
+    assert result['CORE_DOMAIN_RELEVANCE_SCORE'] == 60
+
+
+def test_large_document_summarized_once(monkeypatch):
+    monkeypatch.setitem(jr.REVIEW_CONFIG, 'CHUNK_SIZE', 100)
+    summarize = Mock(return_value="[[[ This document was summarized from multiple chunks ]]] summary")
+    monkeypatch.setattr(PaperAnalyzer, 'summarize_text_chunks', summarize)
+    api_manager = api_manager_for({None: 60, 0.5: 60})
+
+    result = PaperAnalyzer.consensus_evaluation("x" * 500, METADATA, api_manager, "{}", num_evaluations=2)
+
+    assert summarize.call_count == 1
+    assert result['SUMMARIZED_FROM_CHUNKS'] is True
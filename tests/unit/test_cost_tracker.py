@@ -14,6 +14,7 @@ import pytest
 import sys
 import os
 import json
+import gc
 import tempfile
 from datetime import datetime
 
@@ -314,3 +315,76 @@ class TestCostTracker:
             with open(report_file, 'r') as f:
                 saved_report = json.load(f)
             assert saved_report['session_summary']['total_calls'] == 1
+
+    def test_calls_appended_to_jsonl_ledger(self):
+        """Test that logged calls are appended to the ledger and reloaded."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = os.path.join(tmpdir, 'api_cost_log.jsonl')
+            
+            tracker = CostTracker(log_file=log_file)
+            tracker.log_api_call('judge', 'gemini-1.5-flash', 1000, 500, 0, paper='a.pdf')
+            tracker.log_api_call('judge', 'gemini-1.5-flash', 1000, 500, 0, paper='b.pdf')
+            tracker.close()
+            
+            with open(log_file, 'r') as f:
+                lines = [json.loads(line) for line in f]
+            assert [line['paper'] for line in lines] == ['a.pdf', 'b.pdf']
+            
+            reloaded = CostTracker(log_file=log_file)
+            assert reloaded.get_total_summary()['total_calls'] == 2
+            assert reloaded.get_session_summary()['total_calls'] == 0
+            assert reloaded.cost_per_paper_analysis()['total_papers_analyzed'] == 2
+            reloaded.close()
+    
+    def test_legacy_json_log_migrated(self):
+        """Test that an existing api_cost_log.json array is migrated to the ledger."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            legacy_file = os.path.join(tmpdir, 'api_cost_log.json')
+            legacy_entry = {
+                'timestamp': '2025-01-01T00:00:00',
+                'module': 'old_module',
+                'model': 'gemini-1.5-flash',
+                'operation': '',
+                'paper': 'old.pdf',
+                'tokens': {'input': 100, 'output': 50, 'cached': 0, 'total': 150},
+                'cost_usd': 0.5,
+                'cache_savings_usd': 0.0
+            }
+            with open(legacy_file, 'w') as f:
+                json.dump([legacy_entry], f, indent=2)
+            
+            tracker = CostTracker(log_file=legacy_file)
+            
+            assert tracker.log_file == os.path.join(tmpdir, 'api_cost_log.jsonl')
+            assert os.path.exists(tracker.log_file)
+            assert not os.path.exists(legacy_file)
+            assert os.path.exists(legacy_file + '.migrated')
+            assert tracker.usage_log == [legacy_entry]
+            assert tracker.get_budget_status(1.0)['spent'] == 0.5
+            tracker.close()
+    
+    def test_aggregates_match_full_rescan(self):
+        """Test that running aggregates equal a summary recomputed from the log."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = CostTracker(log_file=os.path.join(tmpdir, 'log.jsonl'))
+            for i in range(30):
+                tracker.log_api_call(f'module_{i % 3}', 'gemini-1.5-pro', 1000 + i, 200 + i, i * 10,
+                                     paper=f'paper_{i % 7}.pdf')
+            
+            assert tracker.get_total_summary() == tracker._summarize_calls(tracker.usage_log)
+            tracker.close()
+    
+    def test_unreferenced_tracker_flushes_and_stops_its_writer(self):
+        """Test that a dropped tracker is collected, flushing its ledger and ending its writer thread."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = os.path.join(tmpdir, 'log.jsonl')
+            tracker = CostTracker(log_file=log_file, flush_interval=60)
+            tracker.log_api_call('judge', 'gemini-1.5-pro', 1000, 200)
+            writer_thread = tracker._writer._thread
+            
+            del tracker
+            gc.collect()
+            
+            assert not writer_thread.is_alive()
+            with open(log_file) as f:
+                assert len(f.readlines()) == 1
@@ -0,0 +1,102 @@
+"""Unit tests for the planned, concurrent deep reviewer run."""
+
+import re
+import threading
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from literature_review.io.version_history_store import VersionHistoryStore
+from literature_review.reviewers import deep_reviewer as dr
+
+
+def gap(sub_requirement, papers):
+    return {"pillar": "Pillar 1: Test", "requirement_key": "REQ-1", "sub_requirement_key": sub_requirement,
+            "gap_analysis": "Missing evidence.", "contributing_papers": papers}
+
+
+class CountingExtractor:
+    """Serves canned pages per file and counts extractions."""
+
+    def __init__(self, pages_by_file):
+        self.pages_by_file = pages_by_file
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def robust_text_extraction(self, filepath):
+        with self._lock:
+            self.calls.append(filepath)
+        pages = self.pages_by_file[filepath]
+        return "".join(pages), pages
+
+
+def respond(prompt, use_cache=True):
+    """One claim per prompt, quoting the first page marker of the chunk and the target sub-requirement."""
+    if "broken.pdf" in prompt:
+        return None
+    paper_text = prompt.split("--- START FULL PAPER TEXT", 1)[1]
+    page = re.search(r"--- Page (\d+) ---", paper_text).group(1)
+    sub_requirement = re.search(r"Sub-Requirement \(Target\): (.+)", prompt).group(1)
+    return {"new_claims": [{"claim_summary": "Mock", "evidence_chunk": f"{sub_requirement} evidence on page {page}",
+                            "page_number": int(page), "reviewer_confidence": 0.9}]}
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    pages = {
+        "a.pdf": [f"\n--- Page {i} ---\n" + "a" * 600 for i in range(1, 4)],
+        "b.pdf": ["\n--- Page 1 ---\n" + "b" * 600],
+        "broken.pdf": ["\n--- Page 1 ---\n" + "c" * 600],
+    }
+    monkeypatch.setattr(dr, "find_paper_filepath", lambda filename, folder: filename if filename in pages else None)
+    monkeypatch.setitem(dr.REVIEW_CONFIG, "DEEP_REVIEWER_CHUNK_SIZE", 1000)  # a.pdf splits into 3 chunks
+    monkeypatch.setitem(dr.REVIEW_CONFIG, "MAX_CONCURRENT_CHUNKS", 4)
+
+    research_db = pd.DataFrame([{"FILENAME": name, "TITLE": name, "SUBDOMAIN_RELEVANCE_TO_RESEARCH_SCORE": 80}
+                                for name in ["a.pdf", "b.pdf", "broken.pdf", "missing.pdf"]])
+    gaps = [gap("Sub-1.1", ["a.pdf", "b.pdf", "missing.pdf"]), gap("Sub-1.2", ["a.pdf", "broken.pdf"])]
+    store = VersionHistoryStore(str(tmp_path / "history.db"))
+    api_manager = Mock()
+    api_manager.cached_api_call.side_effect = respond
+    return gaps, research_db, store, api_manager, CountingExtractor(pages)
+
+
+def test_plan_groups_gaps_by_paper(setup):
+    gaps, research_db, _, _, _ = setup
+    all_claims = [{"filename": "b.pdf", "sub_requirement": "Sub-1.1", "status": "approved"}]
+
+    plan = dr.plan_deep_review(gaps, research_db, all_claims)
+
+    assert list(plan) == ["a.pdf", "missing.pdf", "broken.pdf"]
+    assert [g["sub_requirement_key"] for g in plan["a.pdf"]["gaps"]] == ["Sub-1.1", "Sub-1.2"]
+
+
+def test_run_extracts_each_paper_once_and_saves_per_paper(setup):
+    gaps, research_db, store, api_manager, extractor = setup
+    plan = dr.plan_deep_review(gaps, research_db, [])
+    add_claims = Mock(wraps=store.add_claims)
+    store.add_claims = add_claims
+
+    found = dr.run_deep_review(plan, api_manager, extractor, store, [])
+
+    assert sorted(extractor.calls) == ["a.pdf", "b.pdf", "broken.pdf"]
+    # a.pdf: 3 chunks x 2 gaps, b.pdf: 1, broken.pdf: 1
+    assert api_manager.cached_api_call.call_count == 8
+    assert sorted(c.kwargs["filename"] for c in add_claims.call_args_list) == ["a.pdf", "b.pdf"]
+
+    a_claims = [c for filename, c in store.claims() if filename == "a.pdf"]
+    assert found == len(a_claims) + 1 == 7
+    assert {(c["sub_requirement"], c["page_number"]) for c in a_claims} == {
+        (sub_req, page) for sub_req in ("Sub-1.1", "Sub-1.2") for page in (1, 2, 3)}
+    assert all(c["status"] == "pending_judge_review" for _, c in store.claims())
+
+
+def test_rerun_skips_known_claims(setup):
+    gaps, research_db, store, api_manager, extractor = setup
+    plan = dr.plan_deep_review(gaps, research_db, [])
+    dr.run_deep_review(plan, api_manager, extractor, store, [])
+    all_claims = [{**c, "filename": filename} for filename, c in store.claims()]
+
+    assert dr.run_deep_review(plan, api_manager, extractor, store, all_claims) == 0
+    assert len(store.claims()) == len(all_claims)
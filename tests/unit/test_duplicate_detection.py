@@ -2,15 +2,21 @@
 Unit tests for duplicate detection functionality
 """
 
+import io
+import json
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
 from webdashboard.duplicate_detector import (
+    DuplicateIndex,
     compute_pdf_hash,
     check_for_duplicates,
-    load_existing_papers_from_review_log
+    get_duplicate_index,
+    load_existing_papers_from_review_log,
+    save_upload_with_hash
 )
 
 
@@ -343,3 +349,76 @@ class TestLoadExistingPapersFromReviewLog:
             assert result == []
         finally:
             Path(temp_file.name).unlink()
+
+
+class TestStreamingHash:
+    """Tests for hashing uploads while saving them"""
+    
+    def test_save_matches_compute_pdf_hash(self, tmp_path):
+        """Test that the streamed hash equals the hash of the saved file"""
+        content = b"%PDF-1.4 " + os.urandom(3 * 1024 * 1024 + 17)
+        target = tmp_path / "upload.pdf"
+        
+        file_hash, size = save_upload_with_hash(io.BytesIO(content), target)
+        
+        assert target.read_bytes() == content
+        assert size == len(content)
+        assert file_hash == compute_pdf_hash(target)
+    
+    def test_precomputed_hash_is_used(self):
+        """Test that a hash computed during upload is not recomputed"""
+        new_papers = [{
+            'title': 'Unrelated',
+            'hash': 'abc',
+            'file_path': '/nonexistent/file.pdf',
+            'original_name': 'new.pdf'
+        }]
+        existing = [{'title': 'Existing', 'hash': 'abc', 'id': 'existing1'}]
+        
+        result = check_for_duplicates(new_papers, existing)
+        
+        assert result['duplicates'][0]['match_info']['method'] == 'hash'
+
+
+class TestDuplicateIndex:
+    """Tests for the indexed duplicate lookup"""
+    
+    def test_fuzzy_match_picks_best_candidate(self):
+        """Test that the closest title above the threshold wins"""
+        index = DuplicateIndex([
+            {'title': 'Graph Neural Networks for Molecules', 'id': 'far'},
+            {'title': 'Graph Neural Networks for Molecular Property Prediction', 'id': 'close'},
+            {'title': 'Transformers in Vision', 'id': 'other'}
+        ])
+        
+        match, similarity = index.find_fuzzy('graph neural network for molecular property prediction', 0.9)
+        
+        assert match['id'] == 'close'
+        assert similarity >= 0.9
+        assert index.find_fuzzy('reinforcement learning', 0.9) == (None, 0.0)
+    
+    def test_low_threshold_compares_every_title(self):
+        """Test that thresholds too low for the n-gram filter still match"""
+        index = DuplicateIndex([{'title': 'abcd', 'id': '1'}])
+        
+        match, similarity = index.find_fuzzy('abxy', 0.5)
+        
+        assert match['id'] == '1'
+        assert similarity == 0.5
+    
+    def test_review_log_index_is_cached_until_file_changes(self, tmp_path):
+        """Test that the shared index is rebuilt only when review_log.json changes"""
+        review_log = tmp_path / 'review_log.json'
+        review_log.write_text(json.dumps([{'title': 'Paper 1', 'hash': 'h1'}]))
+        
+        index = get_duplicate_index(review_log)
+        assert get_duplicate_index(review_log) is index
+        assert 'h1' in index.hashes
+        
+        review_log.write_text(json.dumps({'papers': [{'title': 'Paper 1'}, {'title': 'Paper 2', 'hash': 'h2'}]}))
+        stat = review_log.stat()
+        os.utime(review_log, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        rebuilt = get_duplicate_index(review_log)
+        
+        assert rebuilt is not index
+        assert len(rebuilt) == 2 and 'h2' in rebuilt.hashes
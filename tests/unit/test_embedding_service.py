@@ -0,0 +1,111 @@
+"""Unit tests for the shared embedding service and batched relevance scoring."""
+
+import hashlib
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from literature_review.analysis.relevance_assessor import RelevanceAssessor
+from literature_review.utils.embedding_service import EmbeddingService
+from literature_review.utils.relevance_scorer import RelevanceScorer
+
+
+class HashingModel:
+    """Deterministic bag-of-words encoder that records each encode call."""
+
+    DIM = 32
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, show_progress_bar=False, **kwargs):
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        self.calls.append(len(texts))
+        vectors = np.zeros((len(texts), self.DIM), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[i, int(hashlib.md5(word.encode()).hexdigest(), 16) % self.DIM] += 1.0
+            vectors[i, 0] += 0.1  # Keep empty texts off the zero vector
+        return vectors[0] if single else vectors
+
+
+def test_embed_many_encodes_each_text_once_in_batches():
+    model = HashingModel()
+    service = EmbeddingService(model=model, batch_size=8)
+
+    first = service.embed_many(["spiking networks", "memory", "spiking networks"])
+    second = service.embed_many(["memory", "plasticity"])
+
+    assert first.shape == (3, HashingModel.DIM)
+    assert np.allclose(first[0], first[2])
+    assert np.allclose(np.linalg.norm(first, axis=1), 1.0)
+    assert np.allclose(second[0], first[1])
+    assert model.calls == [2, 1]
+    assert service.encoded_texts == 3
+
+
+def test_cache_persists_by_text_hash(tmp_path):
+    path = str(tmp_path / "text_embeddings.npy")
+    service = EmbeddingService(model=HashingModel(), cache_path=path)
+    expected = service.embed_many(["a b c", "d e"])
+    service.save()
+
+    model = HashingModel()
+    reloaded = EmbeddingService(model=model, cache_path=path)
+    assert np.allclose(reloaded.embed_many(["d e", "a b c"]), expected[::-1])
+    assert model.calls == []
+
+
+PAPERS = [
+    {"filename": "stdp.pdf", "title": "STDP learning", "abstract": "spike timing plasticity in spiking networks"},
+    {"filename": "gpu.pdf", "title": "GPU kernels", "abstract": "hardware acceleration of simulation"},
+    {"filename": "empty.pdf"},
+]
+GAPS = [
+    {"keywords": ["stdp", "plasticity"], "requirement_text": "Implement spike timing plasticity"},
+    {"keywords": ["hardware"], "requirement_text": ""},
+    {"keywords": [], "requirement_text": "Neuromorphic hardware acceleration"},
+]
+
+
+def test_batch_score_matches_pairwise_scores_with_one_encode_per_text():
+    model = HashingModel()
+    scorer = RelevanceScorer(use_semantic=True, embedding_service=EmbeddingService(model=model))
+
+    results = scorer.batch_score(PAPERS, GAPS)
+
+    # Three paper texts and three distinct gap texts, in two batched calls
+    assert model.calls == [3, 3]
+    for paper in PAPERS:
+        expected = max(scorer.score_relevance(paper, gap) for gap in GAPS)
+        assert results[paper["filename"]] == pytest.approx(expected, abs=1e-6)
+    assert model.calls == [3, 3]  # Pairwise scoring reused the cached embeddings
+
+
+def test_assessor_batches_paper_and_gap_embeddings():
+    model = HashingModel()
+    assessor = RelevanceAssessor(use_semantic=True, embedding_service=EmbeddingService(model=model))
+    gaps = [{"gap_id": f"G{i}", "requirement_text": gap["requirement_text"]} for i, gap in enumerate(GAPS)]
+
+    results = assessor.batch_assess(PAPERS, gaps)
+
+    assert model.calls == [6]
+    assert [r["filename"] for r in results] == ["stdp.pdf", "gpu.pdf", "empty.pdf"]
+    assert "G0" in results[0]["matched_gaps"]
+
+
+def test_batches_leave_saving_to_the_service_owner(tmp_path):
+    path = tmp_path / "text_embeddings.npy"
+    service = EmbeddingService(model=HashingModel(), cache_path=str(path))
+    gaps = [{"gap_id": f"G{i}", "requirement_text": gap["requirement_text"]} for i, gap in enumerate(GAPS)]
+
+    RelevanceScorer(use_semantic=True, embedding_service=service).batch_score(PAPERS, GAPS)
+    RelevanceAssessor(use_semantic=True, embedding_service=service).batch_assess(PAPERS, gaps)
+
+    # The cache is written once, by save() (at exit for shared services), not after every batch
+    assert not path.exists()
+    service.save()
+    assert len(EmbeddingService(model=HashingModel(), cache_path=str(path)).cache) == len(service.cache)
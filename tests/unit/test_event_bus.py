@@ -0,0 +1,147 @@
+"""Unit tests for the dashboard job event bus."""
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+from webdashboard import event_bus as eb
+from webdashboard.event_bus import JOBS_TOPIC, JobEventBus, job_topic
+
+
+@pytest.fixture
+def bus(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for directory in (eb.STATUS_DIR, eb.LOGS_DIR):
+        directory.mkdir(parents=True)
+    return JobEventBus(queue_size=5)
+
+
+def append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def queued(subscription):
+    messages = []
+    while not subscription.queue.empty():
+        messages.append(subscription.queue.get_nowait())
+    return messages
+
+
+async def settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def test_publish_reaches_topic_subscribers_only(bus):
+    assert bus.publish(JOBS_TOPIC, {"type": "nobody"}) == 0
+    jobs = bus.subscribe(JOBS_TOPIC)
+    other = bus.subscribe(job_topic("a"))
+
+    assert bus.publish(JOBS_TOPIC, {"type": "job_update"}) == 1
+    assert await jobs.get_batch() == [{"type": "job_update"}]
+    assert other.queue.empty()
+
+    jobs.close()
+    assert bus.subscriber_count(JOBS_TOPIC) == 0
+
+
+async def test_slow_subscriber_drops_oldest(bus):
+    subscription = bus.subscribe(JOBS_TOPIC)
+    for i in range(8):
+        bus.publish(JOBS_TOPIC, {"n": i})
+
+    assert [m["n"] for m in await subscription.get_batch()] == [3, 4, 5, 6, 7]
+    assert subscription.dropped == 3
+
+
+async def test_publish_from_worker_thread(bus):
+    subscription = bus.subscribe(JOBS_TOPIC)
+    await asyncio.to_thread(bus.publish, JOBS_TOPIC, {"type": "from_thread"})
+
+    assert await asyncio.wait_for(subscription.get_batch(), 1) == [{"type": "from_thread"}]
+
+
+async def test_job_history_then_one_shared_read_per_change(bus):
+    log = eb.log_path("job")
+    append(log, "before 1\nbefore 2\n")
+    append(eb.progress_path("job"), json.dumps({"stage": "Judge"}) + "\nnot json\n")
+
+    first, events, lines = bus.subscribe_job("job")
+    assert events == [{"stage": "Judge"}]
+    assert lines == ["before 1\n", "before 2\n"]
+
+    append(log, "after 1\n")
+    bus.notify_file_changed(log)
+    second, _, lines = bus.subscribe_job("job")  # Flushes the pending append to the first subscriber
+    assert lines == ["before 1\n", "before 2\n", "after 1\n"]
+    assert queued(first) == [{"type": "logs", "lines": ["after 1\n"]}]
+
+    reads = bus.tail_reads
+    for i in range(3):
+        append(log, f"burst {i}\n")
+        bus.notify_file_changed(log.resolve())  # Absolute and relative paths name the same file
+    append(log, "partial")
+    await settle()
+
+    expected = [{"type": "logs", "lines": ["burst 0\n", "burst 1\n", "burst 2\n"]}]
+    assert queued(first) == expected
+    assert queued(second) == expected
+    assert bus.tail_reads == reads + 1
+
+
+async def test_unwatched_jobs_are_not_read(bus):
+    append(eb.log_path("quiet"), "line\n")
+    bus.notify_file_changed(eb.log_path("quiet"))
+    bus.handle_external_change(eb.log_path("quiet"))
+    await settle()
+
+    assert bus.tail_reads == 0
+
+
+async def test_status_follows_earlier_output_and_is_not_republished(bus):
+    jobs = bus.subscribe(JOBS_TOPIC)
+    job, _, _ = bus.subscribe_job("job")
+    append(eb.log_path("job"), "last line\n")
+    eb.status_path("job").write_text(json.dumps({"id": "job", "status": "completed"}))
+
+    bus.notify_file_changed(eb.log_path("job"))
+    bus.publish_job_status({"id": "job", "status": "completed"})
+    bus.handle_external_change(eb.status_path("job"))  # The watcher seeing our own write
+    await settle()
+
+    assert [m["type"] for m in queued(job)] == ["logs", "status"]
+    assert queued(jobs) == [{"type": "job_update", "job": {"id": "job", "status": "completed"}}]
+
+
+async def test_external_status_write_is_published(bus):
+    jobs = bus.subscribe(JOBS_TOPIC)
+    eb.status_path("other").write_text(json.dumps({"id": "other", "status": "running"}))
+
+    bus.handle_external_change(eb.status_path("other").resolve())
+
+    assert queued(jobs) == [{"type": "job_update", "job": {"id": "other", "status": "running"}}]
+
+
+@pytest.mark.parametrize("use_watchfiles", [True, False])
+async def test_watcher_tails_files_written_by_other_processes(bus, monkeypatch, use_watchfiles):
+    if use_watchfiles:
+        pytest.importorskip("watchfiles")
+    else:
+        monkeypatch.setattr(eb, "watchfiles", None)
+        monkeypatch.setattr(eb, "POLL_INTERVAL_SECONDS", 0.05)
+    subscription, _, _ = bus.subscribe_job("job")
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(bus.watch_external_writes(stop))
+    await asyncio.sleep(0.2)
+
+    writer = f"open({str(eb.log_path('job'))!r}, 'a').write('from subprocess\\n')"
+    process = await asyncio.create_subprocess_exec(sys.executable, "-c", writer)
+    await process.wait()
+
+    assert await asyncio.wait_for(subscription.get_batch(), 5) == [
+        {"type": "logs", "lines": ["from subprocess\n"]}]
+    stop.set()
+    await asyncio.wait_for(watcher, 5)
@@ -0,0 +1,120 @@
+"""Unit tests for the SQLite job catalog."""
+
+import json
+
+import pytest
+
+from webdashboard.job_catalog import JobCatalog, decode_cursor, get_job_catalog
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    jobs_dir, status_dir = tmp_path / "jobs", tmp_path / "status"
+    jobs_dir.mkdir()
+    status_dir.mkdir()
+    return tmp_path, jobs_dir, status_dir
+
+
+@pytest.fixture
+def catalog(dirs):
+    tmp_path, jobs_dir, status_dir = dirs
+    return JobCatalog(str(tmp_path / "job_catalog.db"), jobs_dir, status_dir)
+
+
+def write_job(jobs_dir, job_id, created_at, status="completed", run_mode="ONCE", **extra):
+    data = {"id": job_id, "status": status, "created_at": created_at, "config": {"run_mode": run_mode}, **extra}
+    (jobs_dir / f"{job_id}.json").write_text(json.dumps(data))
+
+
+class CountingSummary:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, job):
+        self.calls.append(job["id"])
+        return {"status_seen": job["status"]}
+
+
+def test_lists_newest_first_with_filters(catalog, dirs):
+    _, jobs_dir, _ = dirs
+    write_job(jobs_dir, "a", "2025-01-01T00:00:00")
+    write_job(jobs_dir, "b", "2025-01-03T00:00:00", status="failed", run_mode="DEEP_LOOP")
+    write_job(jobs_dir, "c", "2025-01-02T00:00:00", run_mode="DEEP_LOOP")
+
+    jobs, count, next_cursor = catalog.list_jobs()
+    assert [j["id"] for j in jobs] == ["b", "c", "a"]
+    assert count == 3 and next_cursor is None
+
+    assert [j["id"] for j in catalog.list_jobs(status="completed")[0]] == ["c", "a"]
+    assert [j["id"] for j in catalog.list_jobs(run_mode="DEEP_LOOP", status="completed")[0]] == ["c"]
+
+
+def test_cursor_pages_are_stable_across_inserts(catalog, dirs):
+    _, jobs_dir, _ = dirs
+    for i in range(5):
+        write_job(jobs_dir, f"job-{i}", f"2025-01-0{i + 1}T00:00:00")
+
+    first, count, cursor = catalog.list_jobs(limit=2)
+    write_job(jobs_dir, "newest", "2025-02-01T00:00:00")
+    second, _, cursor = catalog.list_jobs(limit=2, cursor=cursor)
+    third, _, last = catalog.list_jobs(limit=2, cursor=cursor)
+
+    assert [j["id"] for j in first + second + third] == ["job-4", "job-3", "job-2", "job-1", "job-0"]
+    assert count == 5 and last is None
+    assert [j["id"] for j in catalog.list_jobs(limit=2, offset=1)[0]] == ["job-4", "job-3"]
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_status_file_overrides_job_status(catalog, dirs):
+    _, jobs_dir, status_dir = dirs
+    write_job(jobs_dir, "job", "2025-01-01T00:00:00", status="queued")
+    assert catalog.list_jobs(status="queued")[1] == 1
+
+    (status_dir / "job.json").write_text(json.dumps({"id": "job", "status": "completed"}))
+    catalog.refresh("job")
+
+    assert catalog.list_jobs(status="queued")[1] == 0
+    assert catalog.list_jobs(status="completed")[0][0]["status"] == "completed"
+
+
+def test_summaries_are_cached_until_files_change(catalog, dirs):
+    _, jobs_dir, status_dir = dirs
+    write_job(jobs_dir, "a", "2025-01-01T00:00:00", status="running")
+    write_job(jobs_dir, "b", "2025-01-02T00:00:00")
+    summarize = CountingSummary()
+
+    catalog.list_jobs(summarize=summarize)
+    jobs, _, _ = catalog.list_jobs(summarize=summarize)
+    assert sorted(summarize.calls) == ["a", "b"]
+    assert jobs[1]["summary"] == {"status_seen": "running"}
+
+    (status_dir / "a.json").write_text(json.dumps({"id": "a", "status": "completed"}))
+    jobs, _, _ = catalog.list_jobs(summarize=summarize)
+    assert sorted(summarize.calls) == ["a", "a", "b"]
+    assert jobs[1]["summary"] == {"status_seen": "completed"}
+
+
+def test_sync_only_reads_changed_files(catalog, dirs):
+    _, jobs_dir, _ = dirs
+    for i in range(3):
+        write_job(jobs_dir, f"job-{i}", "2025-01-01T00:00:00")
+    assert catalog.sync() == 3
+    assert catalog.sync() == 0
+
+    write_job(jobs_dir, "job-1", "2025-01-01T00:00:00", extra="changed")
+    (jobs_dir / "job-2.json").unlink()
+    assert catalog.sync() == 2
+    assert len(catalog) == 2
+    assert catalog.get_jobs(["job-1", "missing"])["job-1"]["extra"] == "changed"
+
+
+def test_catalog_persists_and_is_shared(dirs):
+    tmp_path, jobs_dir, status_dir = dirs
+    write_job(jobs_dir, "job", "2025-01-01T00:00:00")
+    db_path = str(tmp_path / "job_catalog.db")
+    get_job_catalog(db_path, jobs_dir, status_dir).sync()
+
+    reopened = JobCatalog(db_path, jobs_dir, status_dir)
+    assert reopened.sync() == 0
+    assert get_job_catalog(db_path, jobs_dir, status_dir) is get_job_catalog(db_path, str(jobs_dir), status_dir)
@@ -0,0 +1,188 @@
+"""Unit tests for streaming pipeline execution, cancel, pause and timeouts in PipelineJobRunner."""
+
+import asyncio
+import json
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from webdashboard import job_runner as jr
+from webdashboard.job_runner import PipelineJobRunner
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Uses POSIX process signals")
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner = PipelineJobRunner(max_workers=2)
+
+    def build(job_id, job_data):
+        script = textwrap.dedent(job_data["script"])
+        return [sys.executable, "-u", "-c", script], tmp_path / "outputs"
+    monkeypatch.setattr(runner, "_build_orchestrator_command", build)
+    return runner
+
+
+def log_text(job_id):
+    path = Path(f"workspace/logs/{job_id}.log")
+    return path.read_text() if path.exists() else ""
+
+
+def status(job_id):
+    return json.loads(Path(f"workspace/status/{job_id}.json").read_text())
+
+
+async def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.02)
+
+
+async def test_output_is_logged_while_the_pipeline_runs(runner):
+    job = {"script": """
+        import sys, time
+        print("first line")
+        print("[2026-01-01 10:00:00] [INFO] Starting stage: Judge (attempt 1/3)")
+        print("warning on stderr", file=sys.stderr)
+        time.sleep(1.5)
+        print("[2026-01-01 10:00:02] [SUCCESS] ✅ Stage complete: Judge")
+    """}
+    task = asyncio.create_task(runner._run_orchestrator("job-1", job))
+
+    await wait_for(lambda: "first line" in log_text("job-1") and "STDERR: warning on stderr" in log_text("job-1"))
+    assert not task.done()
+
+    result = await task
+    assert result["status"] == "success"
+    # Orchestrator log lines reach the log through --log-file, so they are not copied again
+    assert "Starting stage" not in log_text("job-1")
+    events = [json.loads(line) for line in Path("workspace/status/job-1_progress.jsonl").read_text().splitlines()]
+    assert [(e["stage"], e["phase"]) for e in events] == [("Judge", "starting"), ("Judge", "complete")]
+
+
+async def test_failure_reports_stderr_tail(runner):
+    job = {"script": """
+        import sys
+        for i in range(100):
+            print(f"noise {i}", file=sys.stderr)
+        print("Traceback: boom", file=sys.stderr)
+        sys.exit(3)
+    """}
+
+    with pytest.raises(RuntimeError) as excinfo:
+        await runner._run_orchestrator("job-2", job)
+
+    message = str(excinfo.value)
+    assert "exit code 3" in message and message.endswith("Traceback: boom")
+    assert "noise 0" not in message  # Only the last STDERR_TAIL_LINES lines are kept
+    assert "STDERR: noise 0" in log_text("job-2")
+
+
+async def test_long_lines_are_split_not_fatal(runner, monkeypatch):
+    monkeypatch.setattr(jr, "STREAM_LINE_LIMIT", 1024)
+    job = {"script": """
+        print("x" * 5000)
+        print("after")
+    """}
+
+    await runner._run_orchestrator("job-3", job)
+
+    assert "after" in log_text("job-3")
+    assert log_text("job-3").count("x") == 5000
+
+
+async def test_per_job_timeout_stops_the_pipeline(runner):
+    job = {"config": {"timeout_seconds": 0.5}, "script": """
+        import time
+        print("started")
+        time.sleep(30)
+    """}
+
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="timed out after 0 seconds|timed out after 1 seconds"):
+        await runner._run_orchestrator("job-4", job)
+
+    assert time.monotonic() - start < 5
+    assert "started" in log_text("job-4")
+    assert "job-4" not in runner.processes
+
+
+async def test_cancel_interrupts_then_marks_job_cancelled(runner):
+    job = {"script": """
+        import time
+        try:
+            print("working")
+            time.sleep(30)
+        except KeyboardInterrupt:
+            print("checkpoint saved")
+            raise SystemExit(130)
+    """}
+    task = asyncio.create_task(runner.process_job("job-5", job))
+    runner.running_jobs["job-5"] = task
+    await wait_for(lambda: "working" in log_text("job-5"))
+
+    assert await runner.cancel_job("job-5")
+    await task
+
+    assert status("job-5")["status"] == "cancelled"
+    assert "checkpoint saved" in log_text("job-5")  # SIGINT let the pipeline stop cleanly
+
+
+async def test_cancel_while_spawning_stops_the_new_process(runner, monkeypatch):
+    job = {"script": """
+        import time
+        print("working")
+        time.sleep(30)
+    """}
+    spawn = asyncio.create_subprocess_exec
+
+    async def spawn_then_cancel(*args, **kwargs):
+        process = await spawn(*args, **kwargs)
+        # The process exists but the runner has not registered it yet
+        assert await runner.cancel_job("job-8")
+        return process
+    monkeypatch.setattr(jr.asyncio, "create_subprocess_exec", spawn_then_cancel)
+
+    task = asyncio.create_task(runner.process_job("job-8", job))
+    runner.running_jobs["job-8"] = task
+    await asyncio.wait_for(task, timeout=jr.CANCEL_GRACE_SECONDS + 5)
+
+    assert status("job-8")["status"] == "cancelled"
+    assert "job-8" not in runner.processes
+
+
+async def test_pause_and_resume(runner):
+    job = {"script": """
+        import time
+        for i in range(6):
+            print(f"tick {i}")
+            time.sleep(0.1)
+    """}
+    task = asyncio.create_task(runner._run_orchestrator("job-6", job))
+    await wait_for(lambda: "tick 0" in log_text("job-6"))
+
+    assert runner.pause_job("job-6")
+    assert not runner.pause_job("job-6")
+    paused_ticks = log_text("job-6").count("tick")
+    await asyncio.sleep(0.5)
+    assert log_text("job-6").count("tick") <= paused_ticks + 1  # At most one line was already in flight
+
+    assert runner.resume_job("job-6")
+    assert (await task)["status"] == "success"
+    assert "tick 5" in log_text("job-6")
+
+
+async def test_cancelled_while_queued_never_runs(runner):
+    job = {"script": "print('ran')"}
+    await runner.enqueue_job("job-7", job)
+
+    assert await runner.cancel_job("job-7")
+
+    assert runner.queue.qsize() == 0
+    assert status("job-7")["status"] == "cancelled"
+    assert "ran" not in log_text("job-7")
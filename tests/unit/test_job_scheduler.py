@@ -0,0 +1,244 @@
+"""Unit tests for dashboard job admission: priority, fair share, API budget and metrics."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from literature_review.utils.global_rate_limiter import API_RPM_ENV_VAR, API_RPM_FILE_ENV_VAR
+from webdashboard.job_runner import PipelineJobRunner
+from webdashboard.job_scheduler import JobScheduler, job_owner, job_priority
+
+
+async def admitted(scheduler, count):
+    return [(await asyncio.wait_for(scheduler.get(), 1)).job_id for _ in range(count)]
+
+
+async def blocked(scheduler):
+    try:
+        await asyncio.wait_for(scheduler.get(), 0.05)
+    except asyncio.TimeoutError:
+        return True
+    return False
+
+
+async def test_concurrency_is_bounded():
+    scheduler = JobScheduler(max_concurrent=2)
+    for i in range(3):
+        await scheduler.put(f"job-{i}", {})
+
+    assert await admitted(scheduler, 2) == ["job-0", "job-1"]
+    assert await blocked(scheduler)
+
+    await scheduler.release("job-0")
+    assert await admitted(scheduler, 1) == ["job-2"]
+
+
+async def test_interactive_jobs_go_before_bulk_imports():
+    scheduler = JobScheduler(max_concurrent=1)
+    await scheduler.put("import", {"input_method": "directory"})
+    await scheduler.put("upload", {})
+    await scheduler.put("rerun", {}, priority="interactive")
+
+    assert [job.job_id for job in scheduler.queued_jobs()] == ["rerun", "upload", "import"]
+    order = []
+    for _ in range(3):
+        order += await admitted(scheduler, 1)
+        await scheduler.release(order[-1])
+    assert order == ["rerun", "upload", "import"]
+
+    with pytest.raises(ValueError):
+        await scheduler.put("bad", {}, priority="urgent")
+
+
+async def test_fair_share_across_owners():
+    scheduler = JobScheduler(max_concurrent=2)
+    for i in range(3):
+        await scheduler.put(f"alice-{i}", {"user": "alice"})
+    await scheduler.put("bob-0", {"user": "bob"})
+
+    # Bob's only job starts before Alice's second although it was queued later
+    assert await admitted(scheduler, 2) == ["alice-0", "bob-0"]
+    await scheduler.release("bob-0")
+    assert await admitted(scheduler, 1) == ["alice-1"]
+
+
+async def test_api_budget_reservations_limit_admission():
+    scheduler = JobScheduler(max_concurrent=3, api_budget_rpm=10)
+    await scheduler.put("big", {"config": {"api_budget_rpm": 8}})
+    await scheduler.put("medium", {"config": {"api_budget_rpm": 5}})
+    await scheduler.put("huge", {"config": {"api_budget_rpm": 50}})
+
+    assert await admitted(scheduler, 1) == ["big"]
+    assert await blocked(scheduler)  # A slot is free, but 8 + 5 RPM exceeds the budget
+    assert scheduler.metrics()["api_reserved_rpm"] == 8
+
+    await scheduler.release("big")
+    assert await admitted(scheduler, 1) == ["medium"]
+    await scheduler.release("medium")
+    job = await asyncio.wait_for(scheduler.get(), 1)
+    assert (job.job_id, job.api_rpm) == ("huge", 10)  # Capped at the whole budget
+
+
+async def test_default_reservation_splits_the_budget():
+    budget = {"rpm": 12}
+    scheduler = JobScheduler(max_concurrent=3, api_budget_rpm=lambda: budget["rpm"])
+
+    assert (await scheduler.put("job", {})).api_rpm == 4
+    assert (await scheduler.put("unbudgeted", {}, priority="bulk")).api_rpm == 4
+    assert JobScheduler(max_concurrent=2)._reservation({}) == 0
+
+
+async def test_unreserved_budget_goes_to_running_jobs():
+    scheduler = JobScheduler(max_concurrent=3, api_budget_rpm=12)
+    await scheduler.put("first", {})
+    await scheduler.get()
+
+    # Alone, a job may use the whole budget, not just its reservation
+    assert scheduler.allowances() == {"first": 12}
+
+    await scheduler.put("second", {})
+    await scheduler.get()
+    assert scheduler.allowances() == {"first": 6, "second": 6}
+
+    # A job with its own api_budget_rpm keeps exactly that
+    await scheduler.put("fixed", {"config": {"api_budget_rpm": 2}})
+    await scheduler.get()
+    assert scheduler.allowances() == {"first": 5, "second": 5, "fixed": 2}
+
+    await scheduler.release("second")
+    assert scheduler.allowances() == {"first": 10, "fixed": 2}
+    assert scheduler.metrics()["api_allowance_rpm"] == {"first": 10, "fixed": 2}
+
+
+async def test_remove_and_metrics():
+    scheduler = JobScheduler(max_concurrent=1)
+    await scheduler.put("running", {"user": "alice"})
+    await scheduler.put("waiting", {"user": "bob"}, priority="bulk")
+    await scheduler.put("dropped", {"user": "bob"})
+    await admitted(scheduler, 1)
+
+    assert await scheduler.remove("dropped")
+    assert not await scheduler.remove("dropped")
+    assert not await scheduler.remove("running")
+
+    metrics = scheduler.metrics()
+    assert metrics["running"] == 1 and metrics["queue_depth"] == 1
+    assert metrics["queue_depth_by_priority"] == {"interactive": 0, "normal": 0, "bulk": 1}
+    assert metrics["queue_depth_by_owner"] == {"bob": 1}
+    assert metrics["wait_seconds"]["samples"] == 1
+    assert metrics["wait_seconds"]["oldest_queued"] >= 0
+
+
+def test_job_priority_and_owner_defaults():
+    assert job_priority({}) == "normal"
+    assert job_priority({"input_method": "directory"}) == "bulk"
+    assert job_priority({"input_method": "directory", "config": {"priority": "interactive"}}) == "interactive"
+    assert job_owner({}) == "anonymous"
+    assert job_owner({"config": {"user": "carol"}}) == "carol"
+    assert job_owner({"user": "alice", "config": {"owner": "dave"}}) == "alice"
+    assert job_owner({"config": {"owner": "dave"}}) == "dave"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses POSIX process signals")
+async def test_runner_admits_jobs_and_passes_their_api_reservation(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner = PipelineJobRunner(max_workers=1, api_budget_rpm=6)
+
+    def build(job_id, job_data):
+        script = textwrap.dedent(f"""
+            import os, time
+            print("rpm", os.environ.get({API_RPM_ENV_VAR!r}))
+            time.sleep(0.3)
+        """)
+        return [sys.executable, "-u", "-c", script], tmp_path / "outputs"
+    monkeypatch.setattr(runner, "_build_orchestrator_command", build)
+
+    worker = asyncio.create_task(runner.start())
+    for i in range(3):
+        await runner.enqueue_job(f"job-{i}", {"config": {"api_budget_rpm": 4}})
+    await asyncio.sleep(0.1)
+
+    # Only the admitted job is a task; the others wait in the queue
+    assert runner.get_running_jobs() == ["job-0"]
+    assert runner.get_queued_jobs() == ["job-1", "job-2"]
+
+    deadline = time.monotonic() + 10
+    while runner.queue.admitted_total < 3 or runner.running_jobs:
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.05)
+    worker.cancel()
+
+    assert "rpm 4" in Path("workspace/logs/job-2.log").read_text()
+    assert runner.queue.metrics()["wait_seconds"]["max"] >= 0.3
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses POSIX process signals")
+async def test_runner_publishes_each_jobs_api_allowance(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner = PipelineJobRunner(max_workers=2, api_budget_rpm=10)
+
+    def build(job_id, job_data):
+        script = textwrap.dedent(f"""
+            import os, time
+            print("rpm", os.environ.get({API_RPM_ENV_VAR!r}))
+            time.sleep(30)
+        """)
+        return [sys.executable, "-u", "-c", script], tmp_path / "outputs"
+    monkeypatch.setattr(runner, "_build_orchestrator_command", build)
+
+    worker = asyncio.create_task(runner.start())
+    allowance_file = Path("workspace/status/job-0_api_rpm")
+    try:
+        await runner.enqueue_job("job-0", {})
+        await asyncio.sleep(0.3)
+        # Running alone, the job gets the whole budget
+        assert allowance_file.read_text().strip() == "10"
+
+        await runner.enqueue_job("job-1", {})
+        await asyncio.sleep(0.3)
+        assert allowance_file.read_text().strip() == "5"
+        assert Path("workspace/status/job-1_api_rpm").read_text().strip() == "5"
+
+        await runner.cancel_job("job-1")
+        deadline = time.monotonic() + 10
+        while "job-1" in runner.running_jobs:
+            assert time.monotonic() < deadline
+            await asyncio.sleep(0.05)
+        assert not Path("workspace/status/job-1_api_rpm").exists()
+        assert allowance_file.read_text().strip() == "10"
+    finally:
+        await runner.cancel_job("job-0")
+        while runner.running_jobs:
+            await asyncio.sleep(0.05)
+        worker.cancel()
+
+    assert "rpm 10" in Path("workspace/logs/job-0.log").read_text()
+    assert not allowance_file.exists()
+
+
+def test_limiter_reads_rpm_from_environment():
+    code = "from literature_review.utils.global_rate_limiter import global_limiter; print(global_limiter.global_rpm_limit)"
+    env = {**os.environ, API_RPM_ENV_VAR: "4"}
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True,
+                            cwd=Path(__file__).parents[2])
+    assert result.stdout.strip() == "4"
+
+
+def test_limiter_follows_the_rpm_file(tmp_path):
+    rpm_file = tmp_path / "job_api_rpm"
+    rpm_file.write_text("3")
+    code = textwrap.dedent("""
+        from literature_review.utils.global_rate_limiter import global_limiter
+        global_limiter.wait_for_quota()
+        print(global_limiter.global_rpm_limit)
+    """)
+    env = {**os.environ, API_RPM_ENV_VAR: "6", API_RPM_FILE_ENV_VAR: str(rpm_file)}
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True,
+                            cwd=Path(__file__).parents[2])
+    assert result.stdout.strip().splitlines()[-1] == "3"
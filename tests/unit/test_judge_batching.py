@@ -0,0 +1,110 @@
+"""Unit tests for concurrent and packed-prompt judging in judge.judge_claims."""
+
+import os
+import sys
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from literature_review.analysis import judge
+from literature_review.analysis.judge import (
+    build_packed_judge_prompt,
+    judge_claims,
+    judge_with_consensus,
+)
+
+DEFINITIONS = {"Sub-1.1": "Sub-1.1: Spike encoding", "Sub-1.2": "Sub-1.2: Plasticity"}
+
+
+def verdict(verdict="approved", composite=4.2):
+    return {
+        "verdict": verdict,
+        "evidence_quality": {
+            "strength_score": 4, "rigor_score": 4, "study_type": "experimental",
+            "relevance_score": 4, "directness": 3, "is_recent": True,
+            "reproducibility_score": 4, "composite_score": composite, "confidence_level": "high"
+        },
+        "judge_notes": "Mock verdict."
+    }
+
+
+def claim(claim_id, sub_requirement="Sub-1.1"):
+    return {"claim_id": claim_id, "pillar": "Pillar 1", "sub_requirement": sub_requirement,
+            "status": "pending_judge_review"}
+
+
+def claims_in_prompt(prompt):
+    return prompt.count('"claim_id"')
+
+
+@pytest.fixture(autouse=True)
+def judge_config(monkeypatch):
+    monkeypatch.setitem(judge.API_CONFIG, "ENABLE_ADAPTIVE_CONSENSUS", False)
+    monkeypatch.setitem(judge.API_CONFIG, "PACKED_PROMPTS", False)
+    monkeypatch.setitem(judge.API_CONFIG, "MAX_CONCURRENT_CLAIMS", 4)
+    monkeypatch.setitem(judge.API_CONFIG, "MAX_CLAIMS_PER_PROMPT", 2)
+    monkeypatch.setattr(judge, "find_robust_sub_requirement_text", DEFINITIONS.get)
+
+
+def test_concurrent_judging_keeps_input_order():
+    claims = [claim(f"c-{i}") for i in range(6)] + [claim("unknown", "Sub-9.9")]
+    api_manager = Mock()
+    api_manager.cached_api_call.side_effect = lambda prompt, **kwargs: verdict(
+        "rejected" if '"c-3"' in prompt else "approved")
+
+    results = judge_claims(claims, api_manager)
+
+    assert [ruling["verdict"] for _, ruling in results] == ["approved"] * 3 + ["rejected"] + ["approved"] * 2 + ["rejected"]
+    assert results[-1][0] is None
+    assert "Could not find sub-requirement definition" in results[-1][1]["judge_notes"]
+    assert api_manager.cached_api_call.call_count == 6  # No request for the undefined sub-requirement
+    assert all(c["status"] == "pending_judge_review" for c in claims)
+
+
+def test_packed_prompts_group_claims_by_sub_requirement(monkeypatch):
+    monkeypatch.setitem(judge.API_CONFIG, "PACKED_PROMPTS", True)
+    claims = [claim("a-1"), claim("b-1", "Sub-1.2"), claim("a-2"), claim("a-3")]
+    api_manager = Mock()
+
+    def respond(prompt, **kwargs):
+        if claims_in_prompt(prompt) == 1:
+            return verdict("rejected")
+        # The second claim in each packed request gets an invalid verdict
+        return {"judgments": [{"claim_index": 1, **verdict()},
+                              {"claim_index": 2, "verdict": "maybe"}]}
+    api_manager.cached_api_call.side_effect = respond
+
+    results = judge_claims(claims, api_manager)
+
+    # Requests: [a-1, a-2] packed, [a-3] and [b-1] alone, plus a retry of a-2 on its own
+    assert sorted(claims_in_prompt(c.args[0]) for c in api_manager.cached_api_call.call_args_list) == [1, 1, 1, 2]
+    assert [ruling["verdict"] for _, ruling in results] == ["approved", "rejected", "rejected", "rejected"]
+    assert [definition for definition, _ in results] == [DEFINITIONS["Sub-1.1"], DEFINITIONS["Sub-1.2"],
+                                                        DEFINITIONS["Sub-1.1"], DEFINITIONS["Sub-1.1"]]
+
+
+def test_packed_prompt_numbers_claims():
+    prompt = build_packed_judge_prompt([claim("a-1"), claim("a-2")], DEFINITIONS["Sub-1.1"])
+
+    assert "### Claim 1" in prompt and "### Claim 2" in prompt
+    assert '"claim_index"' in prompt and DEFINITIONS["Sub-1.1"] in prompt
+
+
+def test_consensus_judges_run_in_parallel(monkeypatch):
+    monkeypatch.setitem(judge.API_CONFIG, "CONSENSUS_JUDGES", 3)
+    # Each judge waits until all three are in flight; sequential calls would break the barrier
+    barrier = threading.Barrier(3, timeout=5)
+    api_manager = Mock()
+
+    def respond(prompt, temperature, cache_key=None, is_json=True):
+        barrier.wait()
+        return verdict(composite=3.0 + temperature)
+    api_manager.call_with_temperature.side_effect = respond
+
+    result = judge_with_consensus(claim("a-1"), DEFINITIONS["Sub-1.1"], api_manager)
+
+    assert result["verdict"] == "approved"
+    assert api_manager.call_with_temperature.call_count == 3
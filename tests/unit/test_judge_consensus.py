@@ -341,3 +341,18 @@ class TestConsensusJudgment:
         assert result["consensus_metadata"]["vote_breakdown"]["approved"] == 2
         assert result["consensus_metadata"]["vote_breakdown"]["rejected"] == 1
         assert result["consensus_metadata"]["requires_human_review"] is False
+    
+    def test_judge_with_consensus_cache_key_tracks_prompt(self):
+        """Test consensus cache keys change when the claim text changes."""
+        def cache_keys(claim_text):
+            mock_api = Mock()
+            mock_api.call_with_temperature = Mock(return_value=None)
+            claim = {'claim_id': 'test_consensus_003', 'extracted_claim_text': claim_text}
+            judge_with_consensus(claim, 'Test requirement definition', mock_api)
+            return sorted(c.kwargs['cache_key'] for c in mock_api.call_with_temperature.call_args_list)
+        
+        original = cache_keys('Original claim text')
+        
+        assert original == cache_keys('Original claim text')
+        assert len(set(original)) == API_CONFIG["CONSENSUS_JUDGES"]
+        assert set(original).isdisjoint(cache_keys('Edited claim text'))
@@ -0,0 +1,225 @@
+"""Unit tests for the unified LLM client."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from literature_review.utils import llm_client
+from literature_review.utils.global_rate_limiter import global_limiter
+from literature_review.utils.llm_client import (
+    FakeTransport,
+    LLMClient,
+    MemoryCache,
+    NullCache,
+    PersistentCache,
+    ReplayTransport,
+    make_fake_response,
+    prompt_cache_key,
+)
+from literature_review.utils.response_cache import ResponseCache
+
+
+class StubLimiter:
+    """Limiter that never waits; error classification comes from the real limiter."""
+
+    def __init__(self):
+        self.successes = 0
+        self.failures = 0
+        self.modules = []
+        self._lock = threading.Lock()
+
+    def validate_request(self, prompt, config):
+        return (True, "Valid") if prompt else (False, "Empty prompt")
+
+    def should_abort_pipeline(self):
+        return False
+
+    def wait_for_quota(self, module=None, input_tokens=0, output_tokens=0):
+        with self._lock:
+            self.modules.append(module)
+
+    def record_response_usage(self, response, module=None):
+        pass
+
+    def record_request(self, success, error=None, response_text=""):
+        with self._lock:
+            if success:
+                self.successes += 1
+            else:
+                self.failures += 1
+
+    def categorize_error(self, error, response_text=""):
+        return global_limiter.categorize_error(error, response_text)
+
+    def get_action_for_error(self, category, attempt=1):
+        return global_limiter.get_action_for_error(category, attempt)
+
+
+class FlakyTransport:
+    """Returns the scripted responses in order; Exceptions in the script are raised."""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.calls = 0
+
+    def generate(self, model, prompt, config):
+        self.calls += 1
+        item = self.script.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return make_fake_response(item, prompt)
+
+
+@pytest.fixture(autouse=True)
+def no_retry_sleep(monkeypatch):
+    monkeypatch.setattr(llm_client.time, 'sleep', lambda seconds: None)
+
+
+def make_client(transport, **kwargs):
+    kwargs.setdefault('limiter', StubLimiter())
+    return LLMClient(transport, **kwargs)
+
+
+class TestCall:
+    def test_json_response_is_parsed_and_cached(self):
+        transport = FakeTransport(lambda prompt: json.dumps({"echo": prompt}))
+        client = make_client(transport)
+
+        assert client.call("hello") == {"echo": "hello"}
+        assert client.call("hello") == {"echo": "hello"}
+        assert transport.calls == 1
+
+    def test_use_cache_false_calls_again(self):
+        transport = FakeTransport(lambda prompt: "plain text")
+        client = make_client(transport)
+
+        assert client.call("hello", is_json=False) == "plain text"
+        assert client.call("hello", is_json=False, use_cache=False) == "plain text"
+        assert transport.calls == 2
+
+    def test_custom_cache_key_separates_entries(self):
+        transport = FakeTransport(lambda prompt: '{"ok": true}')
+        client = make_client(transport)
+
+        client.call("same prompt", cache_key="judge_1")
+        client.call("same prompt", cache_key="judge_2")
+        client.call("same prompt", cache_key="judge_1")
+        assert transport.calls == 2
+
+    def test_doubled_quotes_repaired_on_first_attempt(self):
+        client = make_client(FlakyTransport(['{""verdict": "accepted"}']))
+        assert client.call("judge this") == {"verdict": "accepted"}
+
+    def test_retries_after_transient_error(self):
+        limiter = StubLimiter()
+        transport = FlakyTransport([Exception("503 UNAVAILABLE"), '{"ok": 1}'])
+        client = make_client(transport, limiter=limiter)
+
+        assert client.call("prompt") == {"ok": 1}
+        assert transport.calls == 2
+        assert (limiter.failures, limiter.successes) == (1, 1)
+
+    def test_gives_up_after_retry_attempts(self):
+        transport = FlakyTransport([Exception("503 UNAVAILABLE")] * 3)
+        client = make_client(transport, retry_attempts=3)
+
+        assert client.call("prompt") is None
+        assert transport.calls == 3
+
+    def test_authentication_error_aborts_without_retry(self):
+        transport = FlakyTransport([Exception("401 authentication failed"), '{"ok": 1}'])
+        client = make_client(transport)
+
+        assert client.call("prompt") is None
+        assert transport.calls == 1
+
+    def test_invalid_request_is_not_sent(self):
+        transport = FakeTransport(lambda prompt: "{}")
+        client = make_client(transport)
+
+        assert client.call("") is None
+        assert transport.calls == 0
+
+    def test_module_passed_to_limiter(self):
+        limiter = StubLimiter()
+        client = make_client(FakeTransport(lambda prompt: "{}"), limiter=limiter, module='judge')
+
+        client.call("a")
+        client.call("b", module='deep_reviewer')
+        assert limiter.modules == ['judge', 'deep_reviewer']
+
+    def test_on_response_hook_receives_context(self):
+        seen = []
+        client = make_client(FakeTransport(lambda prompt: "{}"),
+                             on_response=lambda response, context: seen.append(context))
+
+        client.call("prompt", context={"paper": "a.pdf"})
+        assert seen == [{"paper": "a.pdf"}]
+
+
+class TestConcurrency:
+    def test_call_many_preserves_order(self):
+        client = make_client(FakeTransport(lambda prompt: json.dumps({"n": int(prompt)}), latency=0.01))
+        prompts = [str(i) for i in range(12)]
+
+        results = client.call_many(prompts, max_workers=6)
+        assert [r["n"] for r in results] == list(range(12))
+
+    def test_acall(self):
+        client = make_client(FakeTransport(lambda prompt: '{"async": true}'))
+        assert asyncio.run(client.acall("prompt")) == {"async": True}
+
+
+class TestCacheBackends:
+    def test_memory_cache_shares_caller_dict(self):
+        store = {}
+        client = make_client(FakeTransport(lambda prompt: '{"x": 1}'), cache=MemoryCache(store))
+
+        client.call("prompt")
+        assert store == {prompt_cache_key("prompt"): {"x": 1}}
+
+    def test_null_cache_never_hits(self):
+        transport = FakeTransport(lambda prompt: "{}")
+        client = make_client(transport, cache=NullCache())
+
+        client.call("prompt")
+        client.call("prompt")
+        assert transport.calls == 2
+
+    def test_persistent_cache_survives_new_client(self, tmp_path):
+        transport = FakeTransport(lambda prompt: '{"x": 1}')
+        db_path = str(tmp_path / "responses.db")
+        make_client(transport, cache=PersistentCache(ResponseCache(db_path))).call("prompt")
+        make_client(transport, cache=PersistentCache(ResponseCache(db_path))).call("prompt")
+
+        assert transport.calls == 1
+
+    def test_persistent_cache_keys_on_model_and_config(self, tmp_path):
+        transport = FakeTransport(lambda prompt: '{"x": 1}')
+        cache = PersistentCache(ResponseCache(str(tmp_path / "responses.db")))
+        client = make_client(transport, cache=cache)
+
+        client.call("prompt", config={"temperature": 0.0})
+        client.call("prompt", config={"temperature": 0.7})
+        client.call("prompt", config={"temperature": 0.0})
+        assert transport.calls == 2
+
+
+class TestReplayTransport:
+    def test_record_then_replay(self, tmp_path):
+        path = str(tmp_path / "recordings.jsonl")
+        live = FakeTransport(lambda prompt: json.dumps({"prompt": prompt}))
+
+        recorder = make_client(ReplayTransport(path, inner=live), cache=NullCache())
+        assert recorder.call("first") == {"prompt": "first"}
+
+        replayer = make_client(ReplayTransport(path), cache=NullCache())
+        assert replayer.call("first") == {"prompt": "first"}
+        assert live.calls == 1
+
+    def test_missing_recording_raises(self, tmp_path):
+        transport = ReplayTransport(str(tmp_path / "empty.jsonl"))
+        with pytest.raises(LookupError):
+            transport.generate("gemini-2.5-flash", "unknown", None)
@@ -0,0 +1,109 @@
+"""Unit tests for the content-addressed PillarAnalyzer result cache."""
+
+import pandas as pd
+import pytest
+
+from literature_review import orchestrator
+from literature_review.orchestrator import PillarAnalyzer, ResearchDatabase
+
+PILLAR = "Pillar 1: Sensory Encoding (Biology)"
+OTHER_PILLAR = "Pillar 2: Spike Timing (Neural)"
+DEFINITIONS = {
+    PILLAR: {"keywords": ["sensory"], "requirements": {"REQ-1": ["Sub-1.1"]}},
+    OTHER_PILLAR: {"keywords": ["spike"], "requirements": {"REQ-2": ["Sub-2.1"]}},
+}
+
+
+class CountingAPIManager:
+    def __init__(self):
+        self.calls = 0
+
+    def cached_api_call(self, prompt, use_cache=True, is_json=True, **kwargs):
+        self.calls += 1
+        req = "REQ-1" if f'PILLAR: "{PILLAR}"' in prompt else "REQ-2"
+        return {req: {f"Sub-{req[-1]}.1": {
+            "completeness_percent": 40, "gap_analysis": "Mocked",
+            "confidence_level": "high", "contributing_papers": []
+        }}}
+
+
+def claim(pillar, summary):
+    return {"pillar": pillar, "sub_requirement": "Sub-1.1", "status": "approved",
+            "claim_summary": summary, "evidence_chunk": "..."}
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    monkeypatch.setitem(orchestrator.ANALYSIS_CONFIG, 'ENABLE_NETWORK_ANALYSIS', False)
+    monkeypatch.setitem(orchestrator.ANALYSIS_CONFIG, 'CACHE_RESULTS', True)
+    csv_path = tmp_path / "research_db.csv"
+    pd.DataFrame([
+        {"FILENAME": "a.pdf", "TITLE": "Sensory coding", "KEYWORDS": "sensory", "MAJOR_FINDINGS": "x"},
+        {"FILENAME": "b.pdf", "TITLE": "Spike timing", "KEYWORDS": "spike", "MAJOR_FINDINGS": "y"},
+    ]).to_csv(csv_path, index=False)
+    return ResearchDatabase(str(csv_path))
+
+
+@pytest.fixture
+def make_analyzer(database, tmp_path):
+    config = {
+        'analysis_cache_path': str(tmp_path / "pillar_analysis.db"),
+        'version_history_path': str(tmp_path / "missing_history.json"),
+    }
+
+    def make(claims):
+        api_manager = CountingAPIManager()
+        return PillarAnalyzer(DEFINITIONS, database, api_manager, [], claims, config=config), api_manager
+
+    return make
+
+
+def test_unchanged_inputs_hit_cache_across_runs(make_analyzer):
+    claims = [claim(PILLAR, "Encodes stimuli")]
+    first, first_api = make_analyzer(claims)
+    results, completeness, waterfall = first.analyze_pillar(PILLAR, DEFINITIONS[PILLAR])
+
+    second, second_api = make_analyzer(claims)
+    assert second.analyze_pillar(PILLAR, DEFINITIONS[PILLAR]) == (results, completeness, waterfall)
+    assert (first_api.calls, second_api.calls) == (1, 0)
+
+
+def test_replaced_claim_with_same_count_recomputes(make_analyzer):
+    first, _ = make_analyzer([claim(PILLAR, "Encodes stimuli")])
+    first.analyze_pillar(PILLAR, DEFINITIONS[PILLAR])
+
+    second, second_api = make_analyzer([claim(PILLAR, "Encodes stimuli with rate codes")])
+    second.analyze_pillar(PILLAR, DEFINITIONS[PILLAR])
+    assert second_api.calls == 1
+
+
+def test_other_pillar_changes_do_not_invalidate(make_analyzer):
+    first, _ = make_analyzer([claim(PILLAR, "Encodes stimuli"), claim(OTHER_PILLAR, "Old")])
+    first.analyze_pillar(PILLAR, DEFINITIONS[PILLAR])
+
+    second, second_api = make_analyzer([claim(PILLAR, "Encodes stimuli"), claim(OTHER_PILLAR, "New")])
+    second.analyze_pillar(PILLAR, DEFINITIONS[PILLAR])
+    assert second_api.calls == 0
+
+
+def test_requirement_definition_change_recomputes(make_analyzer):
+    analyzer, api_manager = make_analyzer([claim(PILLAR, "Encodes stimuli")])
+    analyzer.analyze_pillar(PILLAR, DEFINITIONS[PILLAR])
+
+    changed = {**DEFINITIONS[PILLAR], "requirements": {"REQ-1": ["Sub-1.1", "Sub-1.2"]}}
+    analyzer.analyze_pillar(PILLAR, changed)
+    assert api_manager.calls == 2
+
+
+def test_unreadable_store_is_kept_and_analysis_continues(database, tmp_path):
+    cache_path = tmp_path / "corrupt.db"
+    cache_path.write_bytes(b"not a sqlite database" * 100)
+    config = {'analysis_cache_path': str(cache_path),
+              'version_history_path': str(tmp_path / "missing_history.json")}
+
+    analyzer = PillarAnalyzer(DEFINITIONS, database, CountingAPIManager(), [], [], config=config)
+    _, completeness, _ = analyzer.analyze_pillar(PILLAR, DEFINITIONS[PILLAR])
+
+    assert analyzer.cache is None
+    assert completeness > 0
+    assert cache_path.exists()
@@ -174,7 +174,7 @@ class TestExtractTextWithProvenance:
     """Test suite for extract_text_with_provenance function."""
     
     @pytest.mark.unit
-    @patch('literature_review.reviewers.journal_reviewer.pdfplumber')
+    @patch('literature_review.utils.text_extraction.pdfplumber')
     def test_extracts_pages_with_metadata(self, mock_pdfplumber):
         """Test that pages are extracted with correct metadata."""
         # Mock PDF with 2 pages
@@ -201,7 +201,7 @@ class TestExtractTextWithProvenance:
         assert result[1]["char_start"] == len(result[0]["text"])
     
     @pytest.mark.unit
-    @patch('literature_review.reviewers.journal_reviewer.pdfplumber')
+    @patch('literature_review.utils.text_extraction.pdfplumber')
     def test_handles_empty_pages(self, mock_pdfplumber):
         """Test handling of pages with no extractable text."""
         mock_page1 = Mock()
@@ -221,7 +221,7 @@ class TestExtractTextWithProvenance:
         assert result[1]["text"] == "Some text on page 2"
     
     @pytest.mark.unit
-    @patch('literature_review.reviewers.journal_reviewer.pdfplumber')
+    @patch('literature_review.utils.text_extraction.pdfplumber')
     def test_cumulative_char_offsets(self, mock_pdfplumber):
         """Test that character offsets are cumulative across pages."""
         mock_page1 = Mock()
@@ -247,7 +247,7 @@ class TestExtractTextWithProvenance:
         assert result[2]["char_end"] == 225
     
     @pytest.mark.unit
-    @patch('literature_review.reviewers.journal_reviewer.pdfplumber')
+    @patch('literature_review.utils.text_extraction.pdfplumber')
     @patch('literature_review.reviewers.journal_reviewer.logger')
     def test_handles_extraction_error(self, mock_logger, mock_pdfplumber):
         """Test error handling when PDF extraction fails."""
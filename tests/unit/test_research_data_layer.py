@@ -0,0 +1,109 @@
+"""Unit tests for the resident ResearchDataLayer used across DEEP_LOOP iterations."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from literature_review import orchestrator
+from literature_review.orchestrator import ResearchDataLayer
+
+PILLAR = "Pillar 1: Sensory Encoding (Biology)"
+
+
+def claim(claim_id, status="approved", sub_req="Sub-1.1"):
+    return {"claim_id": claim_id, "pillar": PILLAR, "sub_requirement": sub_req, "status": status}
+
+
+def write_history(path, claims_by_file):
+    history = {
+        filename: [{"timestamp": "2025-01-01T00:00:00", "review": {"Requirement(s)": claims}}]
+        for filename, claims in claims_by_file.items()
+    }
+    path.write_text(json.dumps(history), encoding="utf-8")
+
+
+def bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    monkeypatch.setitem(orchestrator.ANALYSIS_CONFIG, 'ENABLE_NETWORK_ANALYSIS', False)
+    csv_path = tmp_path / "research_db.csv"
+    pd.DataFrame([
+        {"FILENAME": "a.pdf", "TITLE": "Sensory paper", "Requirement(s)": json.dumps([claim("csv-1")])},
+        {"FILENAME": "b.pdf", "TITLE": "Spike paper", "Requirement(s)": "[]"},
+    ]).to_csv(csv_path, index=False)
+    history_path = tmp_path / "history.json"
+    write_history(history_path, {"a.pdf": [claim("v-1"), claim("v-2", status="pending_judge_review")],
+                                 "b.pdf": [claim("v-3")]})
+    return csv_path, history_path
+
+
+def approved_ids(layer):
+    return [entry.claim["claim_id"] for entry in layer.claim_index.claims(PILLAR)]
+
+
+def test_initial_load(files):
+    layer = ResearchDataLayer(str(files[0]), str(files[1]))
+
+    assert len(layer.database.db) == 2
+    assert [c["claim_id"] for c in layer.approved_claims] == ["v-1", "v-3"]
+    assert approved_ids(layer) == ["v-1", "v-3", "csv-1"]
+
+
+def test_unchanged_files_are_not_reread(files):
+    layer = ResearchDataLayer(str(files[0]), str(files[1]))
+    bump_mtime(files[0])  # Touched but identical content
+
+    with patch.object(orchestrator, "ResearchDatabase") as reload_db, \
+            patch.object(orchestrator.json, "load") as reload_json:
+        summary = layer.refresh()
+
+    reload_db.assert_not_called()
+    reload_json.assert_not_called()
+    assert summary == {'research_db_reloaded': False, 'papers_updated': []}
+
+
+def test_judge_delta_updates_only_changed_papers(files):
+    layer = ResearchDataLayer(str(files[0]), str(files[1]))
+    database = layer.database
+
+    write_history(files[1], {"a.pdf": [claim("v-1"), claim("v-2")], "b.pdf": [claim("v-3")]})
+    bump_mtime(files[1])
+    with patch.object(orchestrator, "ResearchDatabase") as reload_db:
+        summary = layer.refresh()
+
+    reload_db.assert_not_called()
+    assert layer.database is database
+    assert summary == {'research_db_reloaded': False, 'papers_updated': ["a.pdf"]}
+    assert approved_ids(layer) == ["v-1", "v-3", "csv-1", "v-2"]
+
+
+def test_rejected_and_removed_claims_leave_the_index(files):
+    layer = ResearchDataLayer(str(files[0]), str(files[1]))
+
+    write_history(files[1], {"a.pdf": [claim("v-1", status="rejected")]})
+    bump_mtime(files[1])
+    summary = layer.refresh()
+
+    assert sorted(summary['papers_updated']) == ["a.pdf", "b.pdf"]
+    assert approved_ids(layer) == ["csv-1"]
+    assert layer.approved_claims == []
+
+
+def test_research_db_change_reloads_and_rebuilds(files):
+    layer = ResearchDataLayer(str(files[0]), str(files[1]))
+
+    pd.DataFrame([{"FILENAME": "c.pdf", "TITLE": "New", "Requirement(s)": json.dumps([claim("csv-2")])}]) \
+        .to_csv(files[0], index=False)
+    bump_mtime(files[0])
+    summary = layer.refresh()
+
+    assert summary['research_db_reloaded']
+    assert list(layer.database.db["FILENAME"]) == ["c.pdf"]
+    assert approved_ids(layer) == ["v-1", "v-3", "csv-2"]
@@ -0,0 +1,103 @@
+"""Unit tests for the columnar research database store."""
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from literature_review.io.research_store import ResearchStore, open_research_store, research_store_path
+
+PILLAR = "Pillar 1: Sensory Encoding (Biology)"
+
+
+def claim(claim_id, status="approved"):
+    return {"claim_id": claim_id, "pillar": PILLAR, "sub_requirement": "Sub-1.1", "status": status}
+
+
+def review(filename, **overrides):
+    row = {
+        "FILENAME": filename,
+        "TITLE": f"Title of {filename}",
+        "KEYWORDS": ["spiking", "encoding"],
+        "CORE_DOMAIN_RELEVANCE_SCORE": 80,
+        "SUMMARIZED_FROM_CHUNKS": False,
+        "Requirement(s)": [claim(f"{filename}-1")],
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResearchStore(str(tmp_path / "research.db"))
+
+
+def test_upsert_updates_rows_and_replaces_claims(store):
+    store.upsert_papers([review("a.pdf"), review("b.pdf")])
+    store.upsert_papers([review("a.pdf", TITLE="Revised", **{"Requirement(s)": [claim("a-2", "rejected")]})])
+
+    records = store.read_records(parse_lists=True)
+    assert [r["FILENAME"] for r in records] == ["a.pdf", "b.pdf"]  # Update keeps the row's position
+    assert records[0]["TITLE"] == "Revised"
+    assert records[0]["KEYWORDS"] == ["spiking", "encoding"]
+    assert [c["claim_id"] for c in records[0]["Requirement(s)"]] == ["a-2"]
+    assert [c["claim_id"] for c in store.read_claims(pillar=PILLAR, status="approved")] == ["b.pdf-1"]
+
+
+def test_partial_upsert_keeps_other_columns(store):
+    store.upsert_papers([review("a.pdf")])
+    store.upsert_papers([{"FILENAME": "a.pdf", "NEW_COLUMN": "extra"}])
+
+    record = store.read_records()[0]
+    assert record["TITLE"] == "Title of a.pdf"
+    assert record["NEW_COLUMN"] == "extra"
+    assert len(record["Requirement(s)"]) == 1
+    assert store.columns[-1] == "NEW_COLUMN"
+
+
+def test_read_papers_projects_columns_with_typed_values(store):
+    store.upsert_papers([review("a.pdf", SUMMARIZED_FROM_CHUNKS=True), review("b.pdf", CORE_DOMAIN_RELEVANCE_SCORE="N/A")])
+
+    df = store.read_papers(["FILENAME", "CORE_DOMAIN_RELEVANCE_SCORE", "SUMMARIZED_FROM_CHUNKS"])
+    assert list(df.columns) == ["FILENAME", "CORE_DOMAIN_RELEVANCE_SCORE", "SUMMARIZED_FROM_CHUNKS"]
+    assert df["CORE_DOMAIN_RELEVANCE_SCORE"].tolist() == [80, "N/A"]
+    assert df["SUMMARIZED_FROM_CHUNKS"].tolist() == [True, False]
+
+    requirements = store.read_papers(["Requirement(s)"])["Requirement(s)"].tolist()
+    assert json.loads(requirements[0]) == [claim("a.pdf-1")]
+
+
+def test_import_normalizes_legacy_cells_and_exports_csv(store, tmp_path):
+    csv_path = tmp_path / "research_db.csv"
+    pd.DataFrame([
+        {"FILENAME": "a.pdf", "MENTIONED_PAPERS": "['b.pdf', 'c.pdf']", "PUBLICATION_YEAR": 2020,
+         "Requirement(s)": json.dumps([claim("a-1")])},
+        {"FILENAME": "b.pdf", "MENTIONED_PAPERS": "[]", "PUBLICATION_YEAR": None, "Requirement(s)": ""},
+    ]).to_csv(csv_path, index=False)
+
+    assert store.import_csv(str(csv_path)) == 2
+    assert store.read_papers(["MENTIONED_PAPERS"])["MENTIONED_PAPERS"][0] == '["b.pdf", "c.pdf"]'
+
+    export_path = tmp_path / "export.csv"
+    assert store.export_csv(str(export_path)) == 2
+    exported = pd.read_csv(export_path)
+    assert list(exported.columns) == ["FILENAME", "MENTIONED_PAPERS", "PUBLICATION_YEAR", "Requirement(s)"]
+    assert exported["PUBLICATION_YEAR"].tolist()[0] == 2020
+    assert json.loads(exported["Requirement(s)"][0]) == [claim("a-1")]
+    assert exported["Requirement(s)"][1] == "[]"
+
+
+def test_open_reimports_when_csv_changes(tmp_path):
+    csv_path = str(tmp_path / "research_db.csv")
+    pd.DataFrame([{"FILENAME": "a.pdf", "TITLE": "One"}]).to_csv(csv_path, index=False)
+
+    store = open_research_store(csv_path)
+    assert os.path.exists(research_store_path(csv_path))
+    assert store.read_papers()["TITLE"].tolist() == ["One"]
+
+    pd.DataFrame([{"FILENAME": "a.pdf", "TITLE": "One"}, {"FILENAME": "b.pdf", "TITLE": "Two"}]) \
+        .to_csv(csv_path, index=False)
+    store = open_research_store(csv_path)
+    assert store.read_papers()["TITLE"].tolist() == ["One", "Two"]
+    assert open_research_store(str(tmp_path / "missing.csv")) is None
@@ -0,0 +1,165 @@
+"""Unit tests for the persistent SQLite response cache."""
+
+import multiprocessing
+import sqlite3
+import time
+
+import pytest
+
+from literature_review.utils.response_cache import (
+    ResponseCache,
+    config_fingerprint,
+    make_cache_key,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = ResponseCache(str(tmp_path / "responses.db"))
+    yield store
+    store.close()
+
+
+def _write_entries(db_path, worker, count):
+    store = ResponseCache(db_path)
+    for i in range(count):
+        store.set(f"w{worker}-{i}", {"worker": worker, "i": i})
+    store.close()
+
+
+class TestKeys:
+    def test_key_depends_on_model_config_and_prompt(self):
+        base = make_cache_key("gemini-2.5-flash", {"temperature": 0.0}, "abc")
+        assert base == make_cache_key("gemini-2.5-flash", {"temperature": 0.0}, "abc")
+        assert base != make_cache_key("gemini-1.5-pro", {"temperature": 0.0}, "abc")
+        assert base != make_cache_key("gemini-2.5-flash", {"temperature": 0.7}, "abc")
+        assert base != make_cache_key("gemini-2.5-flash", {"temperature": 0.0}, "abd")
+
+    def test_config_fingerprint_ignores_key_order(self):
+        assert config_fingerprint({"a": 1, "b": 2}) == config_fingerprint({"b": 2, "a": 1})
+        assert config_fingerprint(None) == ""
+
+
+class TestResponseCache:
+    def test_roundtrip_and_counters(self, cache):
+        assert cache.get("k") is None
+        cache.set("k", {"verdict": "accepted", "scores": [1, 2]})
+        assert cache.get("k") == {"verdict": "accepted", "scores": [1, 2]}
+
+        stats = cache.stats()
+        assert stats["entry_count"] == 1
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_ttl_expires_entry(self, cache):
+        cache.set("short", "text", ttl=0.05)
+        cache.set("long", "text", ttl=60)
+        time.sleep(0.1)
+
+        assert cache.get("short") is None
+        assert cache.get("long") == "text"
+        assert cache.stats()["expirations"] == 1
+
+    def test_purge_expired(self, cache):
+        cache.set("a", 1, ttl=0.01)
+        cache.set("b", 2)
+        time.sleep(0.05)
+
+        assert cache.purge_expired() == 1
+        assert cache.stats()["entry_count"] == 1
+
+    def test_lru_eviction_respects_size_cap(self, tmp_path):
+        store = ResponseCache(str(tmp_path / "small.db"), max_bytes=250)
+        payload = "x" * 100
+        store.set("first", payload)
+        store.set("second", payload)
+        store.get("first")  # first is now more recently used than second
+        store.set("third", payload)
+
+        assert store.get("second") is None
+        assert store.get("first") == payload
+        assert store.get("third") == payload
+        assert store.stats()["evictions"] == 1
+        store.close()
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        db_path = str(tmp_path / "responses.db")
+        first = ResponseCache(db_path)
+        first.set("k", [1, 2, 3])
+        first.close()
+
+        second = ResponseCache(db_path)
+        assert second.get("k") == [1, 2, 3]
+        second.close()
+
+    def test_clear_resets_entries_and_counters(self, cache):
+        cache.set("k", 1)
+        cache.get("k")
+        cache.clear()
+
+        stats = cache.stats()
+        assert stats["entry_count"] == 0
+        assert stats["hits"] == 0
+
+    def test_concurrent_processes_share_store(self, tmp_path):
+        db_path = str(tmp_path / "shared.db")
+        ResponseCache(db_path).close()
+        processes = [multiprocessing.Process(target=_write_entries, args=(db_path, worker, 25))
+                     for worker in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        store = ResponseCache(db_path)
+        assert store.stats()["entry_count"] == 100
+        assert store.get("w3-24") == {"worker": 3, "i": 24}
+        store.close()
+
+    def test_size_total_tracks_replace_eviction_and_expiry(self, tmp_path):
+        store = ResponseCache(str(tmp_path / "sized.db"), max_bytes=1000)
+        store.set("a", "x" * 100)
+        store.set("a", "x" * 300)
+        store.set("b", "y" * 50, ttl=0.01)
+        for i in range(10):
+            store.set(f"c{i}", "z" * 200)
+        time.sleep(0.05)
+        store.purge_expired()
+
+        conn = store._connection()
+        stored = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        tracked = conn.execute("SELECT value FROM counters WHERE name = 'bytes'").fetchone()[0]
+        assert tracked == stored <= 1000
+        store.close()
+
+    def test_get_does_not_wait_for_writers(self, cache):
+        cache.set("k", 1)
+        writer = sqlite3.connect(cache.db_path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            start = time.monotonic()
+            assert cache.get("k") == 1
+            assert cache.get("missing") is None
+            assert time.monotonic() - start < 1.0
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+        assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+
+    def test_read_only_reports_stats_without_writing(self, tmp_path):
+        db_path = str(tmp_path / "responses.db")
+        writer = ResponseCache(db_path)
+        writer.set("k", 1)
+        writer.close()
+
+        reader = ResponseCache(db_path, read_only=True)
+        assert reader.get("k") == 1
+        assert reader.stats()["entry_count"] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            reader.set("other", 2)
+        reader.close()
+
+    def test_read_only_requires_existing_database(self, tmp_path):
+        with pytest.raises(sqlite3.OperationalError):
+            ResponseCache(str(tmp_path / "missing.db"), read_only=True).stats()
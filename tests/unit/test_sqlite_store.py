@@ -0,0 +1,70 @@
+"""Unit tests for the shared SQLite store plumbing."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from literature_review.utils.sqlite_store import SQLiteStore, StoreRegistry
+
+
+class CounterStore(SQLiteStore):
+    def __init__(self, db_path, read_only=False):
+        super().__init__(db_path, read_only=read_only)
+        if not read_only:
+            self._connection().execute("CREATE TABLE IF NOT EXISTS items (name TEXT PRIMARY KEY)")
+
+    def add(self, name, fail=False):
+        with self._transaction() as conn:
+            conn.execute("INSERT INTO items (name) VALUES (?)", (name,))
+            if fail:
+                raise RuntimeError("boom")
+
+    def names(self):
+        return [row[0] for row in self._connection().execute("SELECT name FROM items ORDER BY name")]
+
+
+class TestSQLiteStore:
+    def test_creates_directory_and_uses_wal(self, tmp_path):
+        store = CounterStore(str(tmp_path / "nested" / "items.db"))
+        assert store._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        store.close()
+
+    def test_transaction_rolls_back_on_error(self, tmp_path):
+        store = CounterStore(str(tmp_path / "items.db"))
+        store.add("kept")
+        with pytest.raises(RuntimeError):
+            store.add("dropped", fail=True)
+
+        assert store.names() == ["kept"]
+        store.close()
+
+    def test_one_connection_per_thread(self, tmp_path):
+        store = CounterStore(str(tmp_path / "items.db"))
+        connections = []
+        thread = threading.Thread(target=lambda: connections.append(store._connection()))
+        thread.start()
+        thread.join()
+
+        assert connections[0] is not store._connection()
+        assert store._connection() is store._connection()
+        store.close()
+
+    def test_read_only_cannot_write(self, tmp_path):
+        db_path = str(tmp_path / "items.db")
+        CounterStore(db_path).add("a")
+
+        reader = CounterStore(db_path, read_only=True)
+        assert reader.names() == ["a"]
+        with pytest.raises(sqlite3.OperationalError):
+            reader.add("b")
+        reader.close()
+
+
+class TestStoreRegistry:
+    def test_returns_one_instance_per_key(self, tmp_path):
+        registry = StoreRegistry(CounterStore)
+        first = registry.get(str(tmp_path / "a.db"))
+
+        assert registry.get(str(tmp_path / "a.db")) is first
+        assert registry.get(str(tmp_path / "b.db")) is not first
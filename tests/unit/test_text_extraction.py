@@ -0,0 +1,97 @@
+"""Unit tests for the shared, SHA-256-cached PDF text extractor."""
+
+from unittest.mock import patch
+
+import pytest
+
+from literature_review.utils import text_extraction
+from literature_review.utils.text_extraction import ExtractedDocument, extract_document, file_sha256
+
+
+def write_pdf(path, pages):
+    """Write a minimal single-font PDF with one line of text per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for text in pages:
+        stream = f"BT /F1 10 Tf 40 700 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        page_ids.append(len(objects))
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(page_ids)} >>"
+
+    body, offsets = b"%PDF-1.4\n", []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    body += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(body)
+    return str(path)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "extracted_text.db")
+
+
+def test_extracts_pages_and_caches_by_content(tmp_path, cache_path):
+    pdf = write_pdf(tmp_path / "paper.pdf", ["Abstract of the paper", "Methods section"])
+
+    first = extract_document(pdf, cache_path=cache_path)
+    assert not first.from_cache
+    assert [page.strip() for page in first.pages] == ["Abstract of the paper", "Methods section"]
+
+    # A copy under another name is the same content, so it is a cache hit
+    copy = tmp_path / "renamed.pdf"
+    copy.write_bytes((tmp_path / "paper.pdf").read_bytes())
+    with patch.object(text_extraction, "_extract_pdf_pages") as parser:
+        second = extract_document(str(copy), cache_path=cache_path)
+    parser.assert_not_called()
+    assert second.from_cache and second.pages == first.pages and second.method == first.method
+    assert second.sha256 == file_sha256(pdf)
+
+
+def test_changed_file_is_reparsed(tmp_path, cache_path):
+    pdf = tmp_path / "paper.pdf"
+    extract_document(write_pdf(pdf, ["Version one"]), cache_path=cache_path)
+    document = extract_document(write_pdf(pdf, ["Version two"]), cache_path=cache_path)
+    assert not document.from_cache
+    assert document.pages[0].strip() == "Version two"
+
+
+def test_probe_skips_second_extractor_for_text_rich_first_page(tmp_path):
+    pdf = write_pdf(tmp_path / "paper.pdf", ["word " * 60, "more"])
+    with patch.object(text_extraction, "_pypdf_pages") as pypdf_pages:
+        document = extract_document(pdf, cache_path=None)
+    pypdf_pages.assert_not_called()
+    assert document.method == "pdfplumber"
+
+
+def test_falls_back_when_pdfplumber_cannot_open(tmp_path):
+    pdf = write_pdf(tmp_path / "paper.pdf", ["Only pypdf can read this"])
+    with patch.object(text_extraction.pdfplumber, "open", side_effect=Exception("broken")):
+        document = extract_document(pdf, cache_path=None)
+    assert document.method == "pypdf"
+    assert "Only pypdf can read this" in document.text
+
+
+def test_unreadable_file_raises(tmp_path):
+    bad = tmp_path / "bad.pdf"
+    bad.write_bytes(b"not a pdf")
+    with pytest.raises(Exception):
+        extract_document(str(bad), cache_path=None)
+
+
+def test_text_formats_match_reviewer_conventions():
+    document = ExtractedDocument("sha", "pdfplumber", ["first", "", None, "last"])
+
+    assert document.text == "first\nlast\n"
+    full_text, pages_text = document.paged_text()
+    assert full_text == "\n--- Page 1 ---\nfirst\n\n--- Page 4 ---\nlast\n"
+    assert pages_text[1] == "\n--- Page 2 ---\n[No text extracted]\n"
+    assert pages_text[2] == "\n--- Page 3 ---\n[Error extracting page]\n"
+    assert document.quality == pytest.approx(9 / (4 * 1500.0))
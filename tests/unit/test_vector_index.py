@@ -0,0 +1,163 @@
+"""Unit tests for the persistent vector index and NetworkAnalyzer.find_similar_papers."""
+
+import json
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from literature_review.io import vector_index
+from literature_review.io.vector_index import VectorIndex, keys_path_for
+from literature_review.reviewers import journal_reviewer as jr
+
+
+def unit(*values):
+    vector = np.array(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_search_ranks_by_cosine_and_applies_threshold():
+    index = VectorIndex()
+    index.add("a", [1, 0, 0])
+    index.add("b", [1, 1, 0])
+    index.add("c", [0, 0, 5])
+
+    results = index.search([2, 0, 0], k=3)
+
+    assert [key for key, _ in results] == ["a", "b", "c"]
+    assert results[0][1] == pytest.approx(1.0)
+    assert results[1][1] == pytest.approx(unit(1, 1, 0)[0])
+    assert [key for key, _ in index.search([1, 0, 0], k=3, threshold=0.5, exclude=["a"])] == ["b"]
+
+
+def test_save_and_memory_mapped_reload(tmp_path):
+    path = str(tmp_path / "embeddings.npy")
+    index = VectorIndex(path)
+    for i in range(20):
+        index.add(f"paper_{i}", np.eye(20)[i] + 0.1)
+    assert index.save()
+    assert not index.save()  # Nothing changed since
+
+    reloaded = VectorIndex(path)
+    assert isinstance(reloaded._base, np.memmap)
+    assert reloaded.keys() == [f"paper_{i}" for i in range(20)]
+    assert reloaded.search(np.eye(20)[7], k=1)[0][0] == "paper_7"
+    with open(keys_path_for(path)) as f:
+        assert json.load(f)["dim"] == 20
+
+    # Appends and replacements stay in memory until saved
+    reloaded.add("paper_3", np.eye(20)[0])
+    reloaded.add("paper_new", np.eye(20)[19])
+    assert reloaded.search(np.eye(20)[0], k=1)[0][0] == "paper_3"
+    assert len(VectorIndex(path)) == 20
+    reloaded.save()
+    assert VectorIndex(path).search(np.eye(20)[0], k=1)[0][0] == "paper_3"
+    assert len(VectorIndex(path)) == 21
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/maps"), reason="Reads the process memory map")
+def test_save_releases_the_mapping_before_replacing(tmp_path, monkeypatch):
+    path = str(tmp_path / "embeddings.npy")
+    index = VectorIndex(path)
+    index.add("a", [1, 0, 0])
+    index.save()
+
+    # Windows refuses to replace a mapped file, so nothing may map it at that point
+    real_replace = os.replace
+
+    def replace(src, dst):
+        with open("/proc/self/maps") as f:
+            assert not [line for line in f if dst in line]
+        real_replace(src, dst)
+    monkeypatch.setattr(vector_index.os, "replace", replace)
+
+    index = VectorIndex(path)
+    assert isinstance(index._base, np.memmap)
+    index.add("b", [0, 1, 0])
+    assert index.save()
+    index.add("c", [0, 0, 1])
+    index.add("a", [1, 1, 0])
+    assert index.save()
+
+    reloaded = VectorIndex(path)
+    assert reloaded.keys() == ["a", "b", "c"]
+    assert reloaded.search([1, 1, 0], k=1)[0][0] == "a"
+
+
+def test_inconsistent_files_load_empty(tmp_path):
+    path = str(tmp_path / "embeddings.npy")
+    np.save(path, np.ones((3, 4), dtype=np.float32))
+    with open(keys_path_for(path), "w") as f:
+        json.dump({"keys": ["only-one"]}, f)
+
+    assert len(VectorIndex(path)) == 0
+
+
+@pytest.mark.skipif(vector_index.hnswlib is None, reason="hnswlib not installed")
+def test_hnsw_backend_matches_exact_search():
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(200, 16))
+    exact, hnsw = VectorIndex(), VectorIndex(backend="hnsw")
+    for i, vector in enumerate(vectors[:150]):
+        exact.add(str(i), vector)
+        hnsw.add(str(i), vector)
+    hnsw.search(vectors[0], k=5)  # Builds the graph; later adds extend it
+    for i, vector in enumerate(vectors[150:], start=150):
+        exact.add(str(i), vector)
+        hnsw.add(str(i), vector)
+
+    for query in vectors[::20]:
+        approximate, expected = hnsw.search(query, k=5, exclude=["0"]), exact.search(query, k=5, exclude=["0"])
+        assert [key for key, _ in approximate] == [key for key, _ in expected]
+        assert [score for _, score in approximate] == pytest.approx([score for _, score in expected], abs=1e-5)
+
+
+class FakeEmbedder:
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.encoded = []
+
+    def encode(self, texts, **kwargs):
+        if isinstance(texts, list):
+            return np.stack([self.encode(text) for text in texts])
+        title = texts.split("Title: ", 1)[1].split(".", 1)[0]
+        self.encoded.append(title)
+        return self.vectors[title]
+
+
+@pytest.fixture
+def cache_paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(jr, "EMBEDDINGS_CACHE", str(tmp_path / "embeddings_cache.npy"))
+    monkeypatch.setattr(jr, "LEGACY_EMBEDDINGS_CACHE", str(tmp_path / "embeddings_cache.pkl"))
+    return tmp_path
+
+
+def paper(name):
+    return {"FILENAME": f"{name}.pdf", "TITLE": name}
+
+
+def test_find_similar_papers_queries_index(cache_paths):
+    embedder = FakeEmbedder({"new": unit(1, 0, 0), "close": unit(1, 0.1, 0), "closer": unit(1, 0.05, 0),
+                             "far": unit(0, 1, 0), "other": unit(1, 0.01, 0)})
+    analyzer = jr.NetworkAnalyzer(embedder)
+    analyzer.get_embedding("Title: other.", "other.pdf")  # Indexed but not an existing paper
+
+    existing = [paper("close"), paper("closer"), paper("far"), paper("new")]
+    similar = analyzer.find_similar_papers(paper("new"), existing, threshold=0.9)
+
+    assert [p["FILENAME"] for p, _ in similar] == ["closer.pdf", "close.pdf"]
+    assert analyzer.find_similar_papers(paper("new"), existing, threshold=0.9, top_k=1)[0][0]["TITLE"] == "closer"
+    assert sorted(embedder.encoded) == ["close", "closer", "far", "new", "other"]  # Each paper embedded once
+
+
+def test_legacy_pickle_cache_is_imported_and_saved_as_npy(cache_paths):
+    with open(jr.LEGACY_EMBEDDINGS_CACHE, "wb") as f:
+        pickle.dump({"a.pdf": np.array([3.0, 4.0]), "b.pdf": np.array([0.0, 1.0])}, f)
+
+    analyzer = jr.NetworkAnalyzer(embedder=None)
+    assert analyzer.embeddings_cache.get("a.pdf") == pytest.approx([0.6, 0.8])
+    analyzer.save_embeddings_cache()
+
+    assert jr.NetworkAnalyzer(embedder=None).embeddings_cache.keys() == ["a.pdf", "b.pdf"]
+    assert (cache_paths / "embeddings_cache.keys.json").exists()
@@ -0,0 +1,242 @@
+"""Unit tests for the append-only review version history store."""
+
+import copy
+import json
+import os
+
+import pytest
+
+from literature_review.analysis.judge import (
+    add_new_claims_to_history,
+    extract_pending_claims_from_history,
+    migrate_existing_claims_in_store,
+    update_claims_in_history,
+)
+from literature_review.io.version_history_store import (
+    VersionHistoryStore,
+    open_version_history,
+    version_history_store_path,
+)
+from literature_review.reviewers.deep_reviewer import add_claim_to_version_history
+
+
+def claim(claim_id, status="pending_judge_review", **extra):
+    return {"claim_id": claim_id, "pillar": "Pillar 1", "sub_requirement": "Sub-1.1", "status": status, **extra}
+
+
+def version(review, timestamp="2025-01-01T00:00:00", status="new_review"):
+    return {"timestamp": timestamp, "review": review, "changes": {"status": status}}
+
+
+@pytest.fixture
+def history():
+    return {
+        "a.pdf": [
+            version({"FILENAME": "a.pdf", "TITLE": "A", "Requirement(s)": [claim("a-1")]}),
+            version({"FILENAME": "a.pdf", "TITLE": "A (revised)",
+                     "Requirement(s)": [claim("a-1", sub_requirement_key="1.1"), claim("a-2", "approved")]},
+                    timestamp="2025-01-02T00:00:00", status="re_review"),
+        ],
+        "b.pdf": [version({"FILENAME": "b.pdf", "Requirement(s)": [claim("b-1"), claim("b-2", "rejected")]})],
+    }
+
+
+@pytest.fixture
+def store(tmp_path, history):
+    json_path = tmp_path / "history.json"
+    json_path.write_text(json.dumps(history), encoding="utf-8")
+    store = VersionHistoryStore(str(tmp_path / "history.db"))
+    store.import_json(str(json_path))
+    return store
+
+
+def judged(claims):
+    for c in claims:
+        c["status"] = "approved"
+        c["judge_notes"] = "Approved."
+        c["judge_timestamp"] = "2025-02-01T00:00:00"
+    return claims
+
+
+def without_timestamps(history):
+    return {filename: [{**v, "timestamp": None} for v in versions] for filename, versions in history.items()}
+
+
+def untagged(history):
+    """Drop the '_source_*' tags extract_pending_claims_from_history adds in place (the store never keeps them)."""
+    for versions in history.values():
+        for v in versions:
+            for c in v["review"]["Requirement(s)"]:
+                for key in [k for k in c if k.startswith("_")]:
+                    del c[key]
+    return history
+
+
+def latest_state(history):
+    """Each paper's latest review and version changes (the dict helpers also rewrite older versions in place)."""
+    return {filename: (versions[-1]["review"], [v["changes"] for v in versions])
+            for filename, versions in history.items()}
+
+
+def test_import_export_round_trip(store, history, tmp_path):
+    assert store.history() == history
+    assert len(store) == 2 and "a.pdf" in store
+
+    export_path = tmp_path / "export.json"
+    assert store.export_json(str(export_path)) == 2
+    assert json.loads(export_path.read_text(encoding="utf-8")) == history
+
+
+def test_pending_claims_match_extract(store, history):
+    assert store.pending_claims() == extract_pending_claims_from_history(copy.deepcopy(history))
+
+
+def test_put_claims_matches_legacy_update_and_skips_unchanged(store, history):
+    pending = judged(store.pending_claims())
+    assert store.put_claims(pending) == 2
+    assert store.put_claims(pending) == 0  # Re-sent checkpoint writes nothing
+
+    expected = copy.deepcopy(history)
+    update_claims_in_history(expected, judged(extract_pending_claims_from_history(expected)))
+    assert latest_state(store.history()) == latest_state(untagged(expected))
+    assert store.history()["a.pdf"][1] == history["a.pdf"][1]  # Earlier versions keep their content
+    assert store.pending_claims() == []
+    assert [c["status"] for _, c in store.claims()] == ["approved", "approved", "approved", "rejected"]
+
+
+def test_put_claims_removes_dropped_keys_and_shares_unchanged_claims(store):
+    pending = store.pending_claims()
+    pending[0].pop("sub_requirement_key")
+    store.put_claims(pending[:1])
+
+    versions = store.history()["a.pdf"]
+    assert "sub_requirement_key" not in versions[-1]["review"]["Requirement(s)"][0]
+    assert versions[-1]["review"]["Requirement(s)"][1] is versions[-2]["review"]["Requirement(s)"][1]
+
+
+def test_judge_tags_are_not_stored_or_versioned(store, tmp_path):
+    store.append_review("c.pdf", {"FILENAME": "c.pdf", "Requirement(s)": [claim("c-1")]}, {"status": "new_review"})
+    pending = store.pending_claims()
+    assert all(c["_source_type"] == "version_history" for c in pending)
+    versions_before = {filename: len(versions) for filename, versions in store.history().items()}
+
+    judged([c for c in pending if c["claim_id"] == "c-1"])
+    assert store.put_claims(pending) == 1
+    store.add_claims([{**claim("c-2"), "_source_filename": "c.pdf", "_source_type": "dra_appeal"}])
+
+    export_path = tmp_path / "export.json"
+    store.export_json(str(export_path))
+    exported = json.loads(export_path.read_text(encoding="utf-8"))
+    claims = [c for versions in exported.values() for v in versions for c in v["review"]["Requirement(s)"]]
+    assert not [key for c in claims for key in c if key.startswith("_")]
+    assert "_source_filename" not in store.latest_review("c.pdf")["Requirement(s)"][0]
+    # Only the judged paper gets a judge_update version; untouched pending claims write nothing
+    assert {filename: len(versions) for filename, versions in exported.items()} == {
+        **versions_before, "c.pdf": versions_before["c.pdf"] + 2}
+    assert [v["changes"]["status"] for v in exported["c.pdf"]][-2:] == ["judge_update", "dra_appeal"]
+
+
+def test_add_claims_matches_legacy_dra_appeal(store, history):
+    new_claims = [{**claim("a-3"), "filename": "a.pdf"}, {**claim("x-1"), "filename": "missing.pdf"}]
+    assert store.add_claims(new_claims) == 1
+    assert store.add_claims(new_claims) == 0  # Already present
+
+    expected = add_new_claims_to_history(copy.deepcopy(history), copy.deepcopy(new_claims))
+    assert latest_state(store.history()) == latest_state(expected)
+
+
+def test_add_claims_amend_latest_matches_deep_reviewer(store, history):
+    store.add_claims([claim("a-9")], filename="a.pdf", status="deep_reviewer_claims", amend_latest=True)
+    store.add_claims([claim("n-1")], filename="new.pdf", status="deep_reviewer_claims",
+                     amend_latest=True, create_missing=True)
+
+    expected = copy.deepcopy(history)
+    add_claim_to_version_history(expected, "a.pdf", claim("a-9"))
+    add_claim_to_version_history(expected, "new.pdf", claim("n-1"))
+    assert without_timestamps(store.history()) == without_timestamps(expected)
+
+
+def test_append_review_diffs_against_latest(store):
+    latest = store.latest_review("b.pdf")
+    latest["TITLE"] = "B"
+    latest["Requirement(s)"][0]["status"] = "approved"
+    store.append_review("b.pdf", latest, {"TITLE": "added"})
+    store.append_review("b.pdf", {"FILENAME": "b.pdf", "Requirement(s)": []}, {})  # Shrinks: snapshot
+
+    versions = store.history()["b.pdf"]
+    assert [v["changes"] for v in versions[1:]] == [{"TITLE": "added"}, {}]
+    assert versions[1]["review"] == latest
+    assert store.latest_review("b.pdf") == {"FILENAME": "b.pdf", "Requirement(s)": []}
+
+
+def test_open_reimports_external_changes(tmp_path, history):
+    json_path = str(tmp_path / "history.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(history, f)
+
+    store = open_version_history(json_path)
+    assert os.path.exists(version_history_store_path(json_path))
+    store.put_claims(judged(store.pending_claims()))
+    assert open_version_history(json_path).unexported == 2  # JSON unchanged: writes kept
+
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"c.pdf": history["b.pdf"]}, f)
+    os.utime(json_path, ns=(0, os.stat(json_path).st_mtime_ns + 1_000_000_000))
+    assert list(open_version_history(json_path).history()) == ["c.pdf"]
+
+    os.remove(json_path)
+    assert len(open_version_history(json_path)) == 0
+
+
+def test_pending_queue_follows_status_transitions(store):
+    assert store.pending_count() == 2
+
+    # Claims created by the journal reviewer, deep reviewer and DRA all join the queue
+    store.append_review("c.pdf", {"FILENAME": "c.pdf", "Requirement(s)": [claim("c-1")]}, {"status": "new_review"})
+    store.add_claims([claim("b-3")], filename="b.pdf", status="deep_reviewer_claims", amend_latest=True)
+    store.add_claims([{**claim("a-3"), "_source_filename": "a.pdf"}])
+    assert [c["claim_id"] for c in store.pending_claims()] == ["a-1", "b-1", "c-1", "b-3", "a-3"]
+    assert [c["claim_id"] for c in store.pending_claims(limit=2)] == ["a-1", "b-1"]
+
+    first = judged(store.pending_claims(limit=2))
+    first[1]["status"] = "rejected"
+    store.put_claims(first)
+    assert [c["claim_id"] for c in store.pending_claims()] == ["c-1", "b-3", "a-3"]
+    assert [(t["from_status"], t["to_status"]) for t in store.transitions("b-1")] == [
+        ("pending_judge_review", "rejected")]
+    assert [(t["from_status"], t["to_status"]) for t in store.transitions("c-1")] == [
+        (None, "pending_judge_review")]
+
+    store.append_review("c.pdf", {"FILENAME": "c.pdf", "Requirement(s)": []}, {})  # Re-review drops the claim
+    assert store.pending_count() == 2
+
+
+def test_import_rebuilds_queue_and_counts_imports(store, tmp_path, history):
+    store.put_claims(judged(store.pending_claims()))
+    imports = store.import_id
+
+    json_path = tmp_path / "history.json"
+    store.import_json(str(json_path))
+    assert store.import_id == imports + 1
+    assert store.pending_count() == 2
+    assert store.transitions() == []
+
+
+def test_quality_migration_runs_once_per_import(store, tmp_path):
+    assert migrate_existing_claims_in_store(store) == 1
+    assert all("evidence_quality" in c for _, c in store.claims(status="approved"))
+
+    store.add_claims([claim("a-4", "approved")], filename="a.pdf")
+    assert migrate_existing_claims_in_store(store) == 0  # No rescan until the JSON is re-imported
+
+    store.import_json(str(tmp_path / "history.json"))
+    assert migrate_existing_claims_in_store(store) == 1
+
+
+def test_queue_backfilled_for_stores_without_one(store):
+    conn = store._connection()
+    conn.execute("DELETE FROM claim_queue")
+    conn.execute("DELETE FROM meta WHERE name = 'claim_queue'")
+
+    reopened = VersionHistoryStore(store.db_path)
+    assert [c["claim_id"] for c in reopened.pending_claims()] == ["a-1", "b-1"]
@@ -243,3 +243,50 @@ def test_root_endpoint(test_client):
     assert response.status_code == 200
     # Should contain HTML content
     assert "html" in response.text.lower()
+
+
+def test_upload_records_job_owner(test_client, api_key, sample_pdf):
+    """Test the X-User header becomes the job's owner for fair sharing"""
+    from webdashboard.job_scheduler import job_owner
+
+    files = {"file": ("test.pdf", io.BytesIO(sample_pdf), "application/pdf")}
+    headers = {"X-API-KEY": api_key, "X-User": "alice"}
+    job_id = test_client.post("/api/upload", files=files, headers=headers).json()["job_id"]
+
+    job = test_client.get(f"/api/jobs/{job_id}", headers={"X-API-KEY": api_key}).json()
+    assert job["user"] == "alice"
+    assert job_owner(job) == "alice"
+
+
+def test_configure_job_scheduling_options(test_client, api_key, create_job):
+    """Test owner, priority and API budget set at configure time reach the scheduler"""
+    from webdashboard.job_scheduler import JobScheduler, job_owner, job_priority
+
+    create_job("test-job-1", "draft")
+    headers = {"X-API-KEY": api_key, "X-User": "alice"}
+    config = {
+        "pillar_selections": ["ALL"],
+        "run_mode": "ONCE",
+        "owner": "bob",
+        "priority": "interactive",
+        "api_budget_rpm": 3
+    }
+    response = test_client.post("/api/jobs/test-job-1/configure", json=config, headers=headers)
+    assert response.status_code == 200
+
+    job = test_client.get("/api/jobs/test-job-1", headers={"X-API-KEY": api_key}).json()
+    assert job["user"] == "bob"
+    assert job["priority"] == "interactive"
+    assert job["config"]["api_budget_rpm"] == 3
+    assert (job_owner(job), job_priority(job)) == ("bob", "interactive")
+    assert JobScheduler(api_budget_rpm=10)._reservation(job) == 3
+
+
+def test_configure_job_rejects_unknown_priority(test_client, api_key, create_job):
+    """Test configure validates the priority class and API budget"""
+    create_job("test-job-1", "draft")
+    headers = {"X-API-KEY": api_key}
+    for extra in ({"priority": "urgent"}, {"api_budget_rpm": 0}):
+        config = {"pillar_selections": ["ALL"], "run_mode": "ONCE", **extra}
+        response = test_client.post("/api/jobs/test-job-1/configure", json=config, headers=headers)
+        assert response.status_code == 422
@@ -320,11 +320,14 @@ async def compare_jobs(
             detail="Cannot compare more than 5 jobs at once"
         )
     
-    jobs_dir = get_jobs_dir()
+    from webdashboard import app as app_module
+    
+    # Catalogued jobs carry their latest status and cached summary metrics
+    jobs = app_module.get_catalog().get_jobs(request.job_ids, summarize=app_module.extract_summary_metrics)
     comparison = []
     
     for job_id in request.job_ids:
-        job_data = load_job(job_id)
+        job_data = jobs.get(job_id)
         
         if not job_data:
             raise HTTPException(
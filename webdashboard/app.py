@@ -16,14 +16,13 @@ import logging
 import mimetypes
 import os
 import shutil
-import time
 import traceback
 import uuid
 import zipfile
 import csv
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 
 from fastapi import FastAPI, File, HTTPException, UploadFile, WebSocket, WebSocketDisconnect, Header, Request, Query
 from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse, JSONResponse
@@ -31,13 +30,12 @@ from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 from typing import Any
 
-from webdashboard.duplicate_detector import (
-    check_for_duplicates,
-    load_existing_papers_from_review_log
-)
+from webdashboard.duplicate_detector import get_duplicate_index, save_upload_with_hash
 from webdashboard.api.incremental import router as incremental_router
 from webdashboard.api.bulk_operations import router as bulk_router
 from webdashboard.api.system_metrics import router as system_metrics_router
+from webdashboard.event_bus import JOBS_TOPIC, event_bus
+from webdashboard.job_catalog import CATALOG_FILENAME, JobCatalog, get_job_catalog
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -125,12 +123,15 @@ API_KEY = os.getenv("DASHBOARD_API_KEY", "dev-key-change-in-production")
 # Cost estimation constants
 DEFAULT_CACHE_HIT_RATE = 0.8  # Assume 80% cache hit rate for cost estimates
 
+# Pipeline jobs allowed to run at once; further jobs wait in the scheduler queue
+MAX_CONCURRENT_JOBS = int(os.getenv("DASHBOARD_MAX_CONCURRENT_JOBS", "2"))
+
 # Global job runner instance
 job_runner: Optional["PipelineJobRunner"] = None
 
 # WebSocket connections manager
 class ConnectionManager:
-    """Manages WebSocket connections for real-time updates"""
+    """Manages WebSocket connections for real-time updates (messages are delivered through the job event bus)"""
     
     def __init__(self):
         self.active_connections: List[WebSocket] = []
@@ -145,16 +146,7 @@ class ConnectionManager:
     
     async def broadcast(self, message: dict):
         """Send message to all connected clients"""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.append(connection)
-        
-        # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        event_bus.publish(JOBS_TOPIC, message)
 
 manager = ConnectionManager()
 
@@ -165,11 +157,14 @@ async def startup_event():
     global job_runner
     from webdashboard.job_runner import PipelineJobRunner
     
-    job_runner = PipelineJobRunner(max_workers=2)
+    job_runner = PipelineJobRunner(max_workers=MAX_CONCURRENT_JOBS)
     
     # Start background worker
     asyncio.create_task(job_runner.start())
     
+    # Push status, progress and log writes made by other processes to WebSocket subscribers
+    asyncio.create_task(event_bus.watch_external_writes())
+    
     print("Dashboard started with background job runner")
 
 # Pydantic models with enhanced documentation
@@ -273,6 +268,13 @@ class JobConfig(BaseModel):
         resume_from_checkpoint: Continue from saved checkpoint file (default: None)
         experimental: Enable cutting-edge experimental features (default: False, deprecated - use experimental_config)
         experimental_config: Detailed experimental features configuration
+        
+        Scheduling options:
+        owner: Owner for fair sharing between users (default: the X-User header)
+        priority: Priority class - "interactive", "normal" or "bulk" (default: bulk for
+            directory imports, otherwise normal)
+        api_budget_rpm: API requests per minute reserved for this job (default: an even
+            share of the dashboard's API budget)
     """
     pillar_selections: List[str]
     run_mode: str  # "ONCE" or "DEEP_LOOP"
@@ -302,6 +304,11 @@ class JobConfig(BaseModel):
     # Pre-filter configuration (PARITY-W2-5)
     pre_filter: Optional[str] = None  # None=default, ""=full, "section1,section2"=custom
     
+    # Scheduling options
+    owner: Optional[str] = None
+    priority: Optional[Literal["interactive", "normal", "bulk"]] = None
+    api_budget_rpm: Optional[float] = Field(None, gt=0)
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -321,7 +328,10 @@ class JobConfig(BaseModel):
                 "budget": 5.00,
                 "relevance_threshold": 0.7,
                 "experimental": False,
-                "experimental_config": None
+                "experimental_config": None,
+                "owner": "alice",
+                "priority": "normal",
+                "api_budget_rpm": None
             }
         }
 
@@ -380,6 +390,7 @@ class JobListResponse(BaseModel):
     """Response containing list of jobs"""
     jobs: List[Dict]
     count: int
+    next_cursor: Optional[str] = None
     
     class Config:
         json_schema_extra = {
@@ -392,7 +403,8 @@ class JobListResponse(BaseModel):
                         "created_at": "2024-11-17T12:00:00Z"
                     }
                 ],
-                "count": 1
+                "count": 1,
+                "next_cursor": None
             }
         }
 
@@ -591,11 +603,20 @@ def load_job(job_id: str) -> Optional[dict]:
     except Exception:
         return None
 
+def get_catalog() -> JobCatalog:
+    """Job catalog indexing JOBS_DIR and STATUS_DIR"""
+    return get_job_catalog(WORKSPACE_DIR / CATALOG_FILENAME, JOBS_DIR, STATUS_DIR)
+
 def save_job(job_id: str, job_data: dict):
     """Save job data to file"""
     job_file = get_job_file(job_id)
     with open(job_file, 'w') as f:
         json.dump(job_data, f, indent=2)
+    
+    try:
+        get_catalog().refresh(job_id)
+    except Exception as e:
+        logger.warning(f"Failed to update job catalog for {job_id}: {e}")
 
 
 # Allowed directory prefixes for security (directory input feature)
@@ -1057,7 +1078,8 @@ async def genealogy():
 )
 async def upload_file(
     file: UploadFile = File(..., description="PDF file to upload"),
-    api_key: str = Header(None, alias="X-API-KEY", description="API authentication key")
+    api_key: str = Header(None, alias="X-API-KEY", description="API authentication key"),
+    user: Optional[str] = Header(None, alias="X-User", description="Job owner, for fair sharing of job slots")
 ):
     """
     Upload a single PDF file and create a new analysis job.
@@ -1090,8 +1112,7 @@ async def upload_file(
     # Save uploaded file
     target_path = UPLOADS_DIR / f"{job_id}.pdf"
     try:
-        with open(target_path, 'wb') as out:
-            shutil.copyfileobj(file.file, out)
+        file_hash, _ = save_upload_with_hash(file.file, target_path)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
     
@@ -1101,6 +1122,8 @@ async def upload_file(
         "status": "queued",
         "filename": file.filename,
         "file_path": str(target_path),
+        "hash": file_hash,
+        "user": user,
         "created_at": datetime.utcnow().isoformat(),
         "started_at": None,
         "completed_at": None,
@@ -1150,7 +1173,8 @@ async def upload_file(
 )
 async def upload_batch(
     files: List[UploadFile] = File(..., description="List of PDF files to upload"),
-    api_key: str = Header(None, alias="X-API-KEY", description="API authentication key")
+    api_key: str = Header(None, alias="X-API-KEY", description="API authentication key"),
+    user: Optional[str] = Header(None, alias="X-User", description="Job owner, for fair sharing of job slots")
 ):
     """
     Upload multiple PDF files for a single analysis job with duplicate detection.
@@ -1205,12 +1229,13 @@ async def upload_batch(
             safe_filename = "".join(c for c in file.filename if c.isalnum() or c in "._- ")
             target_path = job_dir / safe_filename
             
-            with open(target_path, 'wb') as out:
-                shutil.copyfileobj(file.file, out)
+            # Hash while writing so duplicate detection never re-reads the file
+            file_hash, size = save_upload_with_hash(file.file, target_path)
             uploaded_files.append({
                 "original_name": file.filename,
                 "path": str(target_path),
-                "size": target_path.stat().st_size,
+                "size": size,
+                "hash": file_hash,
                 "title": file.filename.replace('.pdf', '').replace('_', ' ').replace('-', ' ')
             })
     except Exception as e:
@@ -1222,10 +1247,8 @@ async def upload_batch(
         )
     
     # Check for duplicates against existing papers in review_log.json
-    review_log_path = BASE_DIR / "review_log.json"
-    existing_papers = load_existing_papers_from_review_log(review_log_path)
-    
-    duplicate_check = check_for_duplicates(uploaded_files, existing_papers)
+    # (the index is cached and only rebuilt when review_log.json changes)
+    duplicate_check = get_duplicate_index(BASE_DIR / "review_log.json").check(uploaded_files)
     
     # Create job record - status is "draft" until configured
     job_data = {
@@ -1233,6 +1256,7 @@ async def upload_batch(
         "status": "draft",  # Not queued until configured
         "files": uploaded_files,
         "file_count": len(uploaded_files),
+        "user": user,
         "created_at": datetime.utcnow().isoformat(),
         "config": None,  # Will be set when user configures job
         "duplicate_check": duplicate_check  # Store duplicate check results
@@ -1583,7 +1607,8 @@ async def scan_directory(
 )
 async def create_job_from_directory(
     request: Request,
-    api_key: str = Header(None, alias="X-API-KEY", description="API authentication key")
+    api_key: str = Header(None, alias="X-API-KEY", description="API authentication key"),
+    user: Optional[str] = Header(None, alias="X-User", description="Job owner, for fair sharing of job slots")
 ):
     """
     Create a draft job from directory scan results (PARITY-W3-2).
@@ -1641,6 +1666,7 @@ async def create_job_from_directory(
         "csv_count": scan_result.csv_count,
         "scan_recursive": scan_recursive,
         "follow_symlinks": follow_symlinks,
+        "user": user,
         "created_at": datetime.utcnow().isoformat(),
         "started_at": None,
         "completed_at": None,
@@ -1752,19 +1778,33 @@ async def analyze_directory_state(
     }
 )
 async def list_jobs(
+    status: Optional[str] = Query(None, description="Only jobs with this status"),
+    run_mode: Optional[str] = Query(None, description="Only jobs with this run mode (ONCE or DEEP_LOOP)"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size (all matching jobs if omitted)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    offset: int = Query(0, ge=0, description="Jobs to skip (ignored when cursor is given)"),
     api_key: str = Header(None, alias="X-API-KEY", description="API authentication key")
 ):
     """
     List all jobs with summary metrics.
     
-    Returns all jobs sorted by creation time (newest first) with:
+    Returns jobs sorted by creation time (newest first) with:
     - Basic job information (ID, status, timestamps)
     - Summary metrics (completeness, critical gaps, paper count)
     - Progress indicators
     
+    Jobs are served from the job catalog, so listing does not read every job
+    file. Each job includes its latest runner status.
+    
+    **Query Parameters:**
+    - status, run_mode: Optional filters
+    - limit: Page size; pass next_cursor as cursor to fetch the next page
+    - offset: Alternative to cursor for jumping to a page
+    
     **Response includes:**
     - jobs: Array of job objects with full details
-    - count: Total number of jobs
+    - count: Total number of matching jobs
+    - next_cursor: Cursor for the next page, or null on the last page
     
     **Summary metrics for each job:**
     - completeness: Overall analysis completeness percentage (0-100)
@@ -1774,24 +1814,19 @@ async def list_jobs(
     """
     verify_api_key(api_key)
     
-    jobs = []
-    for job_file in JOBS_DIR.glob("*.json"):
-        try:
-            with open(job_file, 'r') as f:
-                job_data = json.load(f)
-                
-                # Extract summary metrics for each job
-                summary = extract_summary_metrics(job_data)
-                job_data["summary"] = summary
-                
-                jobs.append(job_data)
-        except Exception:
-            continue
-    
-    # Sort by created_at (newest first)
-    jobs.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+    try:
+        jobs, count, next_cursor = get_catalog().list_jobs(
+            status=status,
+            run_mode=run_mode,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            summarize=extract_summary_metrics
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return {"jobs": jobs, "count": len(jobs)}
+    return {"jobs": jobs, "count": count, "next_cursor": next_cursor}
 
 @app.get(
     "/api/jobs/{job_id}",
@@ -1916,6 +1951,10 @@ async def retry_job(
     if status_file.exists():
         status_file.unlink()
     
+    # Re-runs are interactive: they start ahead of normal and bulk jobs
+    if job_runner and job_id not in job_runner.running_jobs and not job_runner.queue.is_queued(job_id):
+        await job_runner.enqueue_job(job_id, job_data, priority="interactive")
+    
     # Broadcast update
     await manager.broadcast({
         "type": "job_retry",
@@ -1945,7 +1984,8 @@ async def retry_job(
 async def configure_job(
     job_id: str,
     config: JobConfig,
-    api_key: str = Header(None, alias="X-API-KEY", description="API authentication key")
+    api_key: str = Header(None, alias="X-API-KEY", description="API authentication key"),
+    user: Optional[str] = Header(None, alias="X-User", description="Job owner, for fair sharing of job slots")
 ):
     """
     Configure job parameters before execution.
@@ -2093,6 +2133,10 @@ async def configure_job(
     config_dict = config.dict()
     config_dict["output_dir"] = str(output_dir)
     job_data["config"] = config_dict
+    # Scheduling: owner, priority class and API reservation (see job_scheduler)
+    job_data["user"] = config.owner or job_data.get("user") or user
+    if config.priority:
+        job_data["priority"] = config.priority
     job_data["fresh_analysis"] = fresh_analysis
     job_data["directory_state"] = dir_state
     save_job(job_id, job_data)
@@ -2806,50 +2850,23 @@ async def get_cache_stats(
     api_key: str = Header(None, alias="X-API-KEY", description="API authentication key")
 ):
     """
-    Get cache statistics for all cache directories.
+    Get LLM response cache statistics.
     
-    Shows size, entry count, hit rate, age.
+    Reads entry count, size, hit/miss counters and entry age from the
+    persistent response cache store, opened read-only.
     """
     verify_api_key(api_key)
     
-    cache_dirs = [
-        BASE_DIR / "cache",
-        BASE_DIR / "deep_reviewer_cache",
-        BASE_DIR / "judge_cache"
-    ]
+    from literature_review.utils.response_cache import DEFAULT_CACHE_DB, ResponseCache
     
     stats = {}
-    
-    for cache_dir in cache_dirs:
-        if not cache_dir.exists():
-            continue
-        
-        # Count files and size
-        files = list(cache_dir.rglob("*.json"))
-        total_size = sum(f.stat().st_size for f in files)
-        
-        # Get oldest and newest
-        if files:
-            oldest = min(files, key=lambda f: f.stat().st_mtime)
-            newest = max(files, key=lambda f: f.stat().st_mtime)
-            
-            stats[cache_dir.name] = {
-                "entry_count": len(files),
-                "total_size_mb": round(total_size / (1024 * 1024), 2),
-                "oldest_entry": datetime.fromtimestamp(
-                    oldest.stat().st_mtime
-                ).isoformat(),
-                "newest_entry": datetime.fromtimestamp(
-                    newest.stat().st_mtime
-                ).isoformat()
-            }
-        else:
-            stats[cache_dir.name] = {
-                "entry_count": 0,
-                "total_size_mb": 0.0,
-                "oldest_entry": None,
-                "newest_entry": None
-            }
+    cache_db = BASE_DIR / DEFAULT_CACHE_DB
+    if cache_db.exists():
+        store = ResponseCache(str(cache_db), read_only=True)
+        try:
+            stats["llm_responses"] = store.stats()
+        finally:
+            store.close()
     
     return {
         "caches": stats,
@@ -3025,6 +3042,131 @@ async def start_job(
         "message": "Job queued for execution"
     }
 
+@app.get(
+    "/api/scheduler/metrics",
+    tags=["Jobs"],
+    summary="Get job scheduler metrics",
+    responses={
+        200: {"description": "Queue depth, wait times and API budget reservations"},
+        401: {"description": "Invalid or missing API key", "model": ErrorResponse}
+    }
+)
+async def get_scheduler_metrics(
+    api_key: str = Header(None, alias="X-API-KEY", description="API authentication key")
+):
+    """
+    Get job scheduler metrics.
+    
+    **Returns:**
+    - max_concurrent: Jobs allowed to run at once
+    - running: Jobs currently running
+    - queue_depth: Jobs waiting to start, also broken down by priority class and owner
+    - api_budget_rpm / api_reserved_rpm: API requests per minute shared by running
+      jobs, and how much of it running jobs have reserved
+    - wait_seconds: Age of the oldest queued job, and average/max queue wait of
+      recently started jobs
+    - queued_jobs: Waiting job IDs, next to start first
+    """
+    verify_api_key(api_key)
+    
+    if not job_runner:
+        raise HTTPException(status_code=503, detail="Job runner not started")
+    
+    metrics = job_runner.queue.metrics()
+    metrics["queued_jobs"] = job_runner.get_queued_jobs()
+    return metrics
+
+_JOB_CONTROL_RESPONSES = {
+    200: {
+        "description": "Signal delivered to the job's pipeline",
+    },
+    401: {
+        "description": "Invalid or missing API key",
+        "model": ErrorResponse
+    },
+    409: {
+        "description": "Job is not running (or not paused, for unpause)",
+        "model": ErrorResponse
+    }
+}
+
+
+async def _control_job(job_id: str, action: str, delivered: bool, status: str, message: str) -> dict:
+    """Broadcast and report a cancel/pause/unpause signal, or 409 if it could not be delivered."""
+    if not delivered:
+        raise HTTPException(status_code=409, detail=f"Cannot {action} job {job_id}: not running")
+    
+    await manager.broadcast({
+        "type": "job_signal",
+        "job_id": job_id,
+        "action": action,
+        "status": status
+    })
+    
+    return {
+        "job_id": job_id,
+        "status": status,
+        "message": message
+    }
+
+
+@app.post(
+    "/api/jobs/{job_id}/cancel",
+    tags=["Jobs"],
+    summary="Cancel a running job",
+    responses=_JOB_CONTROL_RESPONSES
+)
+async def cancel_job(
+    job_id: str,
+    api_key: str = Header(None, alias="X-API-KEY", description="API authentication key")
+):
+    """
+    Cancel a running or waiting job.
+    
+    The pipeline receives SIGINT so it can checkpoint and exit, and is killed
+    after a grace period. The job then ends with status 'cancelled'.
+    """
+    verify_api_key(api_key)
+    delivered = bool(job_runner) and await job_runner.cancel_job(job_id)
+    return await _control_job(job_id, "cancel", delivered, "cancelling",
+                              "Cancellation requested; the pipeline is given time to stop cleanly")
+
+
+@app.post(
+    "/api/jobs/{job_id}/pause",
+    tags=["Jobs"],
+    summary="Pause a running job",
+    responses=_JOB_CONTROL_RESPONSES
+)
+async def pause_job(
+    job_id: str,
+    api_key: str = Header(None, alias="X-API-KEY", description="API authentication key")
+):
+    """
+    Suspend a running job's pipeline process (SIGSTOP; not available on Windows).
+    
+    Use /api/jobs/{job_id}/unpause to continue it.
+    """
+    verify_api_key(api_key)
+    delivered = bool(job_runner) and job_runner.pause_job(job_id)
+    return await _control_job(job_id, "pause", delivered, "paused", "Job paused")
+
+
+@app.post(
+    "/api/jobs/{job_id}/unpause",
+    tags=["Jobs"],
+    summary="Continue a paused job",
+    responses=_JOB_CONTROL_RESPONSES
+)
+async def unpause_job(
+    job_id: str,
+    api_key: str = Header(None, alias="X-API-KEY", description="API authentication key")
+):
+    """Continue a job suspended with /api/jobs/{job_id}/pause (SIGCONT)."""
+    verify_api_key(api_key)
+    delivered = bool(job_runner) and job_runner.resume_job(job_id)
+    return await _control_job(job_id, "unpause", delivered, "running", "Job resumed")
+
 @app.post(
     "/api/prompts/{prompt_id}/respond",
     tags=["Interactive"],
@@ -3631,6 +3773,49 @@ async def download_job_file(
         filename=job_data.get("filename", f"{job_id}.pdf")
     )
 
+async def _wait_for_disconnect(websocket: WebSocket):
+    """Return once the client closes the connection (push-only sockets ignore client messages)."""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
+async def _push_events(websocket: WebSocket, subscription, handle_batch):
+    """
+    Forward event bus messages to a WebSocket until the client leaves
+    
+    Args:
+        websocket: Accepted WebSocket connection
+        subscription: Event bus subscription to drain
+        handle_batch: Async callable receiving each batch of queued messages;
+            returns False to end the stream
+    """
+    disconnected = asyncio.create_task(_wait_for_disconnect(websocket))
+    try:
+        while True:
+            batch = asyncio.create_task(subscription.get_batch())
+            done, _ = await asyncio.wait({batch, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if batch not in done:
+                batch.cancel()
+                return
+            if await handle_batch(batch.result()) is False:
+                return
+    finally:
+        disconnected.cancel()
+
+
+def _load_jobs() -> List[dict]:
+    jobs = []
+    for job_file in JOBS_DIR.glob("*.json"):
+        try:
+            with open(job_file, 'r') as f:
+                jobs.append(json.load(f))
+        except Exception:
+            continue
+    return jobs
+
+
 @app.websocket("/ws/jobs")
 async def websocket_endpoint(websocket: WebSocket):
     """
@@ -3639,54 +3824,34 @@ async def websocket_endpoint(websocket: WebSocket):
     Clients connect here to receive live updates about job status changes
     """
     await manager.connect(websocket)
+    subscription = event_bus.subscribe(JOBS_TOPIC)
     
     try:
         # Send initial state
-        jobs = []
-        for job_file in JOBS_DIR.glob("*.json"):
-            try:
-                with open(job_file, 'r') as f:
-                    jobs.append(json.load(f))
-            except Exception:
-                continue
-        
         await websocket.send_json({
             "type": "initial_state",
-            "jobs": jobs
+            "jobs": _load_jobs()
         })
         
-        # Keep connection alive and watch for status updates
-        last_check = time.time()
-        status_mtimes = {}
+        dropped = 0
         
-        while True:
-            await asyncio.sleep(1)
-            
-            # Check for status file updates every second
-            current_time = time.time()
-            if current_time - last_check >= 1:
-                last_check = current_time
-                
-                # Check all status files for updates
-                for status_file in STATUS_DIR.glob("*.json"):
-                    try:
-                        mtime = status_file.stat().st_mtime
-                        if status_file not in status_mtimes or status_mtimes[status_file] < mtime:
-                            status_mtimes[status_file] = mtime
-                            
-                            # Read and broadcast update
-                            with open(status_file, 'r') as f:
-                                status_data = json.load(f)
-                                await websocket.send_json({
-                                    "type": "job_update",
-                                    "job": status_data
-                                })
-                    except Exception:
-                        continue
+        async def send_updates(messages: List[dict]):
+            nonlocal dropped
+            if subscription.dropped != dropped:
+                # The client fell behind and missed updates: resend the full state instead
+                dropped = subscription.dropped
+                await websocket.send_json({"type": "initial_state", "jobs": _load_jobs()})
+            for message in messages:
+                await websocket.send_json(message)
+        
+        await _push_events(websocket, subscription, send_updates)
     
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        pass
     except Exception:
+        pass
+    finally:
+        subscription.close()
         manager.disconnect(websocket)
 
 @app.websocket("/ws/jobs/{job_id}/progress")
@@ -3704,6 +3869,7 @@ async def job_progress_stream(websocket: WebSocket, job_id: str):
         job_id: Unique job identifier
     """
     await websocket.accept()
+    subscription, events, log_lines = event_bus.subscribe_job(job_id)
     
     try:
         # Send initial status
@@ -3714,59 +3880,43 @@ async def job_progress_stream(websocket: WebSocket, job_id: str):
                 "job": job_data
             })
         
-        # Watch for progress updates
-        progress_file = Path(f"workspace/status/{job_id}_progress.jsonl")
-        log_file = Path(f"workspace/logs/{job_id}.log")
+        # Progress and log written before the client connected
+        for event in events:
+            await websocket.send_json({"type": "progress", "event": event})
+        if log_lines:
+            await websocket.send_json({"type": "logs", "lines": log_lines})
         
-        last_progress_pos = 0
-        last_log_pos = 0
+        if job_data and job_data.get("status") in ["completed", "failed", "cancelled"]:
+            await websocket.send_json({"type": "job_complete", "status": job_data["status"]})
+            return
         
-        while True:
-            # Check if job is still active
-            current_job = load_job(job_id)
-            if current_job and current_job.get("status") in ["completed", "failed"]:
-                await websocket.send_json({
-                    "type": "job_complete",
-                    "status": current_job["status"]
-                })
-                break
-            
-            # Stream progress updates
-            if progress_file.exists():
-                with open(progress_file, 'r') as f:
-                    f.seek(last_progress_pos)
-                    new_lines = f.readlines()
-                    last_progress_pos = f.tell()
-                
-                for line in new_lines:
-                    try:
-                        event = json.loads(line)
-                        await websocket.send_json({
-                            "type": "progress",
-                            "event": event
-                        })
-                    except json.JSONDecodeError:
-                        pass
-            
-            # Stream log updates
-            if log_file.exists():
-                with open(log_file, 'r') as f:
-                    f.seek(last_log_pos)
-                    new_lines = f.readlines()
-                    last_log_pos = f.tell()
-                
-                if new_lines:
-                    await websocket.send_json({
-                        "type": "logs",
-                        "lines": new_lines
-                    })
-            
-            await asyncio.sleep(0.5)  # Poll every 500ms
+        async def send_updates(messages: List[dict]) -> bool:
+            pending_lines: List[str] = []
+            for message in messages:
+                # Consecutive log chunks go out as one message
+                if message["type"] == "logs":
+                    pending_lines.extend(message["lines"])
+                    continue
+                if pending_lines:
+                    await websocket.send_json({"type": "logs", "lines": pending_lines})
+                    pending_lines = []
+                if message["type"] == "progress":
+                    await websocket.send_json(message)
+                elif message["type"] == "status" and message["job"].get("status") in ["completed", "failed", "cancelled"]:
+                    await websocket.send_json({"type": "job_complete", "status": message["job"]["status"]})
+                    return False
+            if pending_lines:
+                await websocket.send_json({"type": "logs", "lines": pending_lines})
+            return True
+        
+        await _push_events(websocket, subscription, send_updates)
     
     except WebSocketDisconnect:
         pass
     except Exception as e:
         logger.error(f"WebSocket error for job {job_id}: {e}")
+    finally:
+        subscription.close()
 
 @app.get(
     "/api/jobs/{job_id}/proof-scorecard",
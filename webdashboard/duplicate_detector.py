@@ -5,16 +5,36 @@ Provides functionality to detect duplicate PDFs across upload batches using:
 - PDF hash (SHA256)
 - Exact title matching
 - Fuzzy title matching
+
+Uploads are hashed while they are written (save_upload_with_hash), and the
+existing papers are held in a DuplicateIndex: hash and title lookups plus a
+character n-gram index over normalized titles, so fuzzy matching only runs
+SequenceMatcher on titles that can still reach the threshold. The index for
+review_log.json is shared through get_duplicate_index and rebuilt only when
+the file changes.
 """
 
 import hashlib
+import json
 import logging
+import math
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Read size for hashing and for streaming uploads to disk
+HASH_CHUNK_SIZE = 1024 * 1024
+# Character n-gram length used by the fuzzy title index
+TITLE_NGRAM = 3
+# Title segments a fuzzy match candidate must contain (when titles are long enough)
+MIN_SEGMENT_HITS = 4
+
 
 def compute_pdf_hash(file_path: Path) -> str:
     """
@@ -28,11 +48,264 @@ def compute_pdf_hash(file_path: Path) -> str:
     """
     sha256 = hashlib.sha256()
     with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
+        while chunk := f.read(HASH_CHUNK_SIZE):
             sha256.update(chunk)
     return sha256.hexdigest()
 
 
+def save_upload_with_hash(source: BinaryIO, target_path: Path) -> Tuple[str, int]:
+    """
+    Stream an uploaded file to disk, hashing it on the way
+    
+    Args:
+        source: Readable binary file object (e.g. UploadFile.file)
+        target_path: Where to write the file
+    
+    Returns:
+        Tuple of (SHA256 hash as hexadecimal string, size in bytes)
+    """
+    sha256 = hashlib.sha256()
+    size = 0
+    with open(target_path, 'wb') as out:
+        while chunk := source.read(HASH_CHUNK_SIZE):
+            sha256.update(chunk)
+            out.write(chunk)
+            size += len(chunk)
+    return sha256.hexdigest(), size
+
+
+def normalize_title(title: str) -> str:
+    """Title key used for exact and fuzzy matching"""
+    return title.lower().strip()
+
+
+def _segments_survive(title_key: str, other_key: str, max_edits: int) -> bool:
+    """
+    Cheap necessary condition for the two titles to differ by at most
+    max_edits unmatched characters: each one breaks at most one of
+    2 * (max_edits + 1) segments of title_key, and the rest appear in
+    other_key shifted by at most max_edits.
+    """
+    count = min(len(title_key), 2 * (max_edits + 1))
+    if count <= max_edits:
+        return True
+    segment_length = len(title_key) // count
+    misses = 0
+    for i in range(count):
+        start = i * segment_length
+        end = start + segment_length if i < count - 1 else len(title_key)
+        if other_key.find(title_key[start:end], max(0, start - max_edits), end + max_edits) < 0:
+            misses += 1
+            if misses > max_edits:
+                return False
+    return True
+
+
+class DuplicateIndex:
+    """
+    Lookup structures over existing papers for check_for_duplicates.
+    
+    Fuzzy matching uses a positional character n-gram index over normalized
+    titles. A SequenceMatcher ratio of at least the threshold bounds the
+    length of a match and how many characters the two titles can differ by
+    (k). Split into k + r segments, the new title keeps at least r segments
+    that the match contains verbatim, each shifted by at most k characters.
+    Candidates are collected per segment through its rarest n-gram at a
+    compatible offset in titles of a compatible length, and only titles that
+    contain enough segments are compared with SequenceMatcher. Results are
+    the same as comparing against every title.
+    """
+    
+    def __init__(self, existing_database: Optional[List[Dict]] = None):
+        self.hashes: Dict[str, Dict] = {}
+        self.titles: Dict[str, Dict] = {}
+        self._title_keys: List[str] = []
+        # n-gram -> title positions and offsets of each occurrence
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._offsets: Dict[str, List[int]] = defaultdict(list)
+        # Occurrences sorted by (title length, offset), built on first use
+        self._sorted_postings: Dict[str, Tuple[List[Tuple[int, int]], List[int]]] = {}
+        for paper in existing_database or []:
+            self.add(paper)
+    
+    def __len__(self) -> int:
+        return len(self._title_keys)
+    
+    def add(self, paper: Dict):
+        """Index an existing paper by hash and title"""
+        if paper.get('hash'):
+            self.hashes[paper['hash']] = paper
+        
+        if paper.get('title'):
+            title_key = normalize_title(paper['title'])
+            if title_key not in self.titles:
+                position = len(self._title_keys)
+                self._title_keys.append(title_key)
+                for offset in range(len(title_key) - TITLE_NGRAM + 1):
+                    gram = title_key[offset:offset + TITLE_NGRAM]
+                    self._postings[gram].append(position)
+                    self._offsets[gram].append(offset)
+                self._sorted_postings.clear()
+            # Later papers with the same title win, as with a plain dict
+            self.titles[title_key] = paper
+    
+    def find_fuzzy(self, title_key: str, fuzzy_threshold: float) -> Tuple[Optional[Dict], float]:
+        """
+        Best existing title with similarity >= fuzzy_threshold
+        
+        Returns:
+            Tuple of (existing paper or None, similarity)
+        """
+        length = len(title_key)
+        if fuzzy_threshold > 0:
+            # ratio = 2 * matches / (len_a + len_b) <= 2 * min / (len_a + len_b)
+            min_length = math.ceil(length * fuzzy_threshold / (2 - fuzzy_threshold) - 1e-9)
+            max_length = math.floor(length * (2 - fuzzy_threshold) / fuzzy_threshold + 1e-9)
+            candidates = self._fuzzy_candidates(title_key, fuzzy_threshold, min_length, max_length)
+        else:
+            min_length, max_length = 0, math.inf
+            candidates = range(len(self._title_keys))
+        
+        best_similarity = 0.0
+        best_match = None
+        matcher = SequenceMatcher(None, title_key)
+        # Compare in insertion order so ties go to the same paper as a full scan
+        for position in sorted(candidates):
+            existing_key = self._title_keys[position]
+            if not min_length <= len(existing_key) <= max_length:
+                continue
+            max_edits = math.floor((1 - fuzzy_threshold) * (length + len(existing_key)) + 1e-9)
+            if not _segments_survive(title_key, existing_key, max_edits):
+                continue
+            matcher.set_seq2(existing_key)
+            if matcher.real_quick_ratio() < fuzzy_threshold or matcher.quick_ratio() < fuzzy_threshold:
+                continue
+            similarity = matcher.ratio()
+            if similarity >= fuzzy_threshold and similarity > best_similarity:
+                best_similarity = similarity
+                best_match = self.titles[existing_key]
+        return best_match, best_similarity
+    
+    def _fuzzy_candidates(self, title_key: str, fuzzy_threshold: float, min_length: int, max_length: int):
+        # Characters that may differ between two titles whose ratio reaches the
+        # threshold (at the longest allowed partner length)
+        max_edits = math.floor((1 - fuzzy_threshold) * (len(title_key) + max_length) + 1e-9)
+        # Each differing character breaks at most one segment, so a match
+        # contains at least `required` of the segments verbatim, each shifted by
+        # at most max_edits characters
+        count = max_edits + MIN_SEGMENT_HITS
+        segment_length = len(title_key) // count
+        if segment_length < TITLE_NGRAM:
+            count = max_edits + 1
+            segment_length = len(title_key) // count
+            if segment_length < TITLE_NGRAM:
+                return range(len(self._title_keys))
+        required = count - max_edits
+        
+        title_keys = self._title_keys
+        hits: Dict[int, int] = defaultdict(int)
+        for i in range(count):
+            start = i * segment_length
+            end = start + segment_length if i < count - 1 else len(title_key)
+            segment = title_key[start:end]
+            offset = min(
+                range(start, end - TITLE_NGRAM + 1),
+                key=lambda j: len(self._postings.get(title_key[j:j + TITLE_NGRAM], ()))
+            )
+            low, high = max(0, start - max_edits), end + max_edits
+            matched = {
+                position
+                for position in self._postings_near(title_key[offset:offset + TITLE_NGRAM], offset - max_edits,
+                                                    offset + max_edits, min_length, max_length)
+                if title_keys[position].find(segment, low, high) >= 0
+            }
+            for position in matched:
+                hits[position] += 1
+        return [position for position, hit_count in hits.items() if hit_count >= required]
+    
+    def _postings_near(self, gram: str, min_offset: int, max_offset: int, min_length: int, max_length: int):
+        """Titles of length [min_length, max_length] with `gram` at an offset in [min_offset, max_offset]"""
+        if gram not in self._postings:
+            return
+        entry = self._sorted_postings.get(gram)
+        if entry is None:
+            lengths = [len(self._title_keys[position]) for position in self._postings[gram]]
+            order = sorted(range(len(lengths)), key=lambda i: (lengths[i], self._offsets[gram][i]))
+            entry = (
+                [(lengths[i], self._offsets[gram][i]) for i in order],
+                [self._postings[gram][i] for i in order]
+            )
+            self._sorted_postings[gram] = entry
+        keys, positions = entry
+        for length in range(min_length, max_length + 1):
+            lo = bisect_left(keys, (length, min_offset))
+            hi = bisect_right(keys, (length, max_offset))
+            yield from positions[lo:hi]
+    
+    def check(self, new_papers: List[Dict], fuzzy_threshold: float = 0.95) -> Dict:
+        """Check new papers against the index (see check_for_duplicates)"""
+        duplicates = []
+        new = []
+        matches = {}
+        
+        for paper in new_papers:
+            is_duplicate = False
+            match_info = None
+            
+            # Method 1: Hash match (most reliable)
+            paper_hash = paper.get('hash')
+            if not paper_hash and 'file_path' in paper:
+                try:
+                    paper_hash = compute_pdf_hash(Path(paper['file_path']))
+                    paper['hash'] = paper_hash
+                except Exception as e:
+                    logger.warning(f"Failed to compute hash for {paper.get('original_name', 'unknown')}: {e}")
+            
+            if paper_hash and paper_hash in self.hashes:
+                is_duplicate = True
+                match_info = {
+                    'method': 'hash',
+                    'existing_paper': self.hashes[paper_hash],
+                    'confidence': 1.0
+                }
+            
+            # Method 2: Exact title match
+            if not is_duplicate and 'title' in paper and paper['title']:
+                title_key = normalize_title(paper['title'])
+                if title_key in self.titles:
+                    is_duplicate = True
+                    match_info = {
+                        'method': 'exact_title',
+                        'existing_paper': self.titles[title_key],
+                        'confidence': 1.0
+                    }
+            
+            # Method 3: Fuzzy title match
+            if not is_duplicate and 'title' in paper and paper['title']:
+                best_match, best_similarity = self.find_fuzzy(normalize_title(paper['title']), fuzzy_threshold)
+                if best_match:
+                    is_duplicate = True
+                    match_info = {
+                        'method': 'fuzzy_title',
+                        'existing_paper': best_match,
+                        'confidence': best_similarity
+                    }
+            
+            # Categorize paper
+            if is_duplicate and match_info:
+                paper['match_info'] = match_info
+                duplicates.append(paper)
+                matches[paper.get('original_name', paper.get('id', ''))] = match_info
+            else:
+                new.append(paper)
+        
+        return {
+            'duplicates': duplicates,
+            'new': new,
+            'matches': matches
+        }
+
+
 def check_for_duplicates(
     new_papers: List[Dict],
     existing_database: List[Dict],
@@ -47,7 +320,8 @@ def check_for_duplicates(
     3. Fuzzy title match (>= fuzzy_threshold similarity)
     
     Args:
-        new_papers: List of new paper metadata dicts with 'file_path' and 'title'
+        new_papers: List of new paper metadata dicts with 'title' and either
+            'hash' (computed while uploading) or 'file_path' to hash
         existing_database: List of existing paper metadata dicts
         fuzzy_threshold: Minimum similarity ratio for fuzzy matching (0.0-1.0)
     
@@ -57,89 +331,7 @@ def check_for_duplicates(
             - 'new': List of truly new papers
             - 'matches': Dict mapping new_paper_id -> existing_paper info
     """
-    duplicates = []
-    new = []
-    matches = {}
-    
-    # Build lookup structures for existing papers
-    existing_hashes = {}
-    existing_titles = {}
-    
-    for paper in existing_database:
-        # Build hash lookup if hash exists
-        if 'hash' in paper and paper['hash']:
-            existing_hashes[paper['hash']] = paper
-        
-        # Build title lookup
-        if 'title' in paper and paper['title']:
-            title_key = paper['title'].lower().strip()
-            existing_titles[title_key] = paper
-    
-    # Check each new paper
-    for paper in new_papers:
-        is_duplicate = False
-        match_info = None
-        
-        # Method 1: Hash match (most reliable)
-        if 'file_path' in paper:
-            try:
-                paper_hash = compute_pdf_hash(Path(paper['file_path']))
-                paper['hash'] = paper_hash
-                
-                if paper_hash in existing_hashes:
-                    is_duplicate = True
-                    match_info = {
-                        'method': 'hash',
-                        'existing_paper': existing_hashes[paper_hash],
-                        'confidence': 1.0
-                    }
-            except Exception as e:
-                logger.warning(f"Failed to compute hash for {paper.get('original_name', 'unknown')}: {e}")
-        
-        # Method 2: Exact title match
-        if not is_duplicate and 'title' in paper and paper['title']:
-            title_key = paper['title'].lower().strip()
-            if title_key in existing_titles:
-                is_duplicate = True
-                match_info = {
-                    'method': 'exact_title',
-                    'existing_paper': existing_titles[title_key],
-                    'confidence': 1.0
-                }
-        
-        # Method 3: Fuzzy title match
-        if not is_duplicate and 'title' in paper and paper['title']:
-            new_title = paper['title'].lower().strip()
-            best_similarity = 0.0
-            best_match = None
-            
-            for existing_title_key, existing_paper in existing_titles.items():
-                similarity = SequenceMatcher(None, new_title, existing_title_key).ratio()
-                if similarity >= fuzzy_threshold and similarity > best_similarity:
-                    best_similarity = similarity
-                    best_match = existing_paper
-            
-            if best_match:
-                is_duplicate = True
-                match_info = {
-                    'method': 'fuzzy_title',
-                    'existing_paper': best_match,
-                    'confidence': best_similarity
-                }
-        
-        # Categorize paper
-        if is_duplicate and match_info:
-            paper['match_info'] = match_info
-            duplicates.append(paper)
-            matches[paper.get('original_name', paper.get('id', ''))] = match_info
-        else:
-            new.append(paper)
-    
-    return {
-        'duplicates': duplicates,
-        'new': new,
-        'matches': matches
-    }
+    return DuplicateIndex(existing_database).check(new_papers, fuzzy_threshold)
 
 
 def load_existing_papers_from_review_log(review_log_path: Path) -> List[Dict]:
@@ -152,8 +344,6 @@ def load_existing_papers_from_review_log(review_log_path: Path) -> List[Dict]:
     Returns:
         List of paper metadata dictionaries
     """
-    import json
-    
     if not review_log_path.exists():
         return []
     
@@ -175,3 +365,32 @@ def load_existing_papers_from_review_log(review_log_path: Path) -> List[Dict]:
     except Exception as e:
         logger.error(f"Failed to load review_log.json: {e}")
         return []
+
+
+# Shared indexes, keyed by absolute review log path
+_duplicate_indexes: Dict[str, Tuple[Optional[Tuple[int, int]], DuplicateIndex]] = {}
+_duplicate_indexes_lock = threading.Lock()
+
+
+def get_duplicate_index(review_log_path: Path) -> DuplicateIndex:
+    """
+    Get the DuplicateIndex of the papers in review_log.json
+    
+    The index is kept between calls and rebuilt only when the file's
+    modification time or size changes.
+    """
+    key = os.path.abspath(str(review_log_path))
+    try:
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = None
+    
+    with _duplicate_indexes_lock:
+        cached = _duplicate_indexes.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        index = DuplicateIndex(load_existing_papers_from_review_log(Path(key)))
+        _duplicate_indexes[key] = (signature, index)
+        logger.debug(f"Indexed {len(index)} existing titles from {key}")
+        return index
@@ -0,0 +1,353 @@
+"""
+Job Event Bus
+
+In-process publish/subscribe for dashboard job updates, replacing per-websocket
+polling of the workspace files.
+
+Status updates are published directly by PipelineJobRunner.update_job_status.
+Progress JSONL and job log files are append-only and shared with the pipeline
+subprocess, which writes its own log lines through --log-file, so they are
+tailed instead: writers call notify_file_changed, and one shared tail per file
+reads the appended bytes once and publishes them to that job's subscribers.
+Changes made by other processes are picked up by a single watcher task
+(watchfiles/inotify when available, otherwise one shared polling loop).
+
+A file change costs one read, independent of how many clients are connected
+or how many jobs exist; only jobs with subscribers are tailed.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import watchfiles
+except ImportError:
+    watchfiles = None
+
+logger = logging.getLogger(__name__)
+
+JOBS_TOPIC = "jobs"
+# Messages buffered per subscriber before the oldest are dropped
+SUBSCRIBER_QUEUE_SIZE = 1000
+# Polling interval of the fallback watcher when watchfiles is not installed
+POLL_INTERVAL_SECONDS = 1.0
+
+STATUS_DIR = Path("workspace/status")
+LOGS_DIR = Path("workspace/logs")
+
+
+def job_topic(job_id: str) -> str:
+    """Topic carrying status, progress and log messages for one job."""
+    return f"job:{job_id}"
+
+
+def progress_path(job_id: str) -> Path:
+    return STATUS_DIR / f"{job_id}_progress.jsonl"
+
+
+def log_path(job_id: str) -> Path:
+    return LOGS_DIR / f"{job_id}.log"
+
+
+def status_path(job_id: str) -> Path:
+    return STATUS_DIR / f"{job_id}.json"
+
+
+TAILED_FILES = {"progress": progress_path, "log": log_path}
+
+
+def classify_path(path: Path) -> Optional[Tuple[str, str]]:
+    """Map a workspace file to (job_id, kind) with kind 'status', 'progress' or 'log'."""
+    name = path.name
+    if path.parent.name == LOGS_DIR.name and name.endswith(".log"):
+        return name[:-len(".log")], "log"
+    if path.parent.name == STATUS_DIR.name:
+        if name.endswith("_progress.jsonl"):
+            return name[:-len("_progress.jsonl")], "progress"
+        if name.endswith(".json"):
+            return name[:-len(".json")], "status"
+    return None
+
+
+class Subscription:
+    """A subscriber's bounded message queue; the oldest messages are dropped when it is full."""
+
+    def __init__(self, bus: "JobEventBus", topics: Tuple[str, ...], maxsize: int):
+        self.bus = bus
+        self.topics = topics
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def put(self, message: dict):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    async def get_batch(self) -> List[dict]:
+        """Wait for at least one message, then return everything queued."""
+        messages = [await self.queue.get()]
+        while not self.queue.empty():
+            messages.append(self.queue.get_nowait())
+        return messages
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+
+class JobEventBus:
+    """Topic-based fan-out of job messages to websocket subscribers."""
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._offsets: Dict[Tuple[str, str], int] = {}  # Bytes of each tailed (job_id, kind) file already published
+        self._pending_tails: Set[Tuple[str, str]] = set()
+        self._own_writes: Dict[Path, Tuple[int, int]] = {}  # Status files written in-process: (mtime_ns, size)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self.tail_reads = 0
+
+    # --- Subscriptions ---
+
+    def subscribe(self, *topics: str) -> Subscription:
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(self, topics, self.queue_size)
+        with self._lock:
+            for topic in topics:
+                self._subscribers[topic].add(subscription)
+        return subscription
+
+    def subscribe_job(self, job_id: str) -> Tuple[Subscription, List[dict], List[str]]:
+        """
+        Subscribe to one job, returning its progress events and log lines so far
+
+        Pending appends are published to existing subscribers first, so the
+        history returned here ends exactly where the new subscription's
+        messages begin.
+        """
+        topic = job_topic(job_id)
+        for kind in ("progress", "log"):
+            if self.subscriber_count(topic):
+                self._tail(job_id, kind)
+            else:
+                self._offsets[(job_id, kind)] = self._size(TAILED_FILES[kind](job_id))
+        subscription = self.subscribe(topic)
+        progress_lines = self._read_lines(progress_path(job_id), 0, self._offsets[(job_id, "progress")])
+        events = [event for event in map(self._parse_event, progress_lines) if event is not None]
+        log_lines = self._read_lines(log_path(job_id), 0, self._offsets[(job_id, "log")])
+        return subscription, events, log_lines
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            for topic in subscription.topics:
+                subscribers = self._subscribers.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[topic]
+
+    def subscriber_count(self, topic: str) -> int:
+        return len(self._subscribers.get(topic, ()))
+
+    # --- Publishing ---
+
+    def publish(self, topic: str, message: dict) -> int:
+        """Queue a message for every subscriber of topic. Safe to call from any thread."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(topic, ()))
+        if not subscribers:
+            return 0
+        if self._on_loop_thread():
+            for subscription in subscribers:
+                subscription.put(message)
+        else:
+            for subscription in subscribers:
+                self._loop.call_soon_threadsafe(subscription.put, message)
+        return len(subscribers)
+
+    def publish_job_status(self, status_data: dict):
+        """Publish a status update this process just wrote to its status file."""
+        job_id = status_data["id"]
+        self._remember_write(status_path(job_id))  # So the file watcher does not publish it again
+        self.publish(JOBS_TOPIC, {"type": "job_update", "job": status_data})
+        if self.subscriber_count(job_topic(job_id)):
+            if self._on_loop_thread():
+                # Output written before this status reaches subscribers before it
+                for kind in TAILED_FILES:
+                    self._tail(job_id, kind)
+            self.publish(job_topic(job_id), {"type": "status", "job": status_data})
+
+    def notify_file_changed(self, path: Path):
+        """
+        Tell the bus a progress or log file was appended to
+
+        Tails are coalesced: any number of notifications for a file before the
+        event loop next runs cost one read. Safe to call from any thread.
+        """
+        classified = classify_path(Path(path))
+        if classified is None or classified[1] == "status":
+            return
+        if not self.subscriber_count(job_topic(classified[0])):
+            return
+        with self._lock:
+            if classified in self._pending_tails:
+                return
+            self._pending_tails.add(classified)
+        if self._on_loop_thread():
+            self._loop.call_soon(self._run_pending_tail, classified)
+        else:
+            self._loop.call_soon_threadsafe(self._run_pending_tail, classified)
+
+    def _run_pending_tail(self, tailed: Tuple[str, str]):
+        with self._lock:
+            self._pending_tails.discard(tailed)
+        self._tail(*tailed)
+
+    def _tail(self, job_id: str, kind: str):
+        """Publish whatever was appended to a job's progress or log file since the last tail."""
+        path = TAILED_FILES[kind](job_id)
+        start = self._offsets.get((job_id, kind), 0)
+        size = self._size(path)
+        if size < start:
+            start = 0  # Truncated or replaced: start over
+        if size == start:
+            return
+        self.tail_reads += 1
+        data = self._read_bytes(path, start, size)
+        end = data.rfind(b"\n") + 1  # Publish whole lines; a partial last line waits for the next tail
+        if end == 0:
+            return
+        self._offsets[(job_id, kind)] = start + end
+        lines = data[:end].decode("utf-8", errors="replace").splitlines(keepends=True)
+        topic = job_topic(job_id)
+        if kind == "log":
+            self.publish(topic, {"type": "logs", "lines": lines})
+        else:
+            for event in (self._parse_event(line) for line in lines):
+                if event is not None:
+                    self.publish(topic, {"type": "progress", "event": event})
+
+    # --- External writers ---
+
+    def handle_external_change(self, path: Path):
+        """React to a change reported by the file watcher."""
+        classified = classify_path(Path(path))
+        if classified is None:
+            return
+        job_id, kind = classified
+        if kind != "status":
+            if self.subscriber_count(job_topic(job_id)):
+                self._tail(job_id, kind)
+            return
+        path = status_path(job_id)
+        if not (self.subscriber_count(JOBS_TOPIC) or self.subscriber_count(job_topic(job_id))):
+            return
+        if self._own_writes.get(path) == self._stat(path):
+            return  # Already published by publish_job_status
+        try:
+            with open(path, "r") as f:
+                status_data = json.load(f)
+        except (OSError, ValueError):
+            return  # Missing or mid-write; the next change event will carry it
+        self._remember_write(path)
+        self.publish(JOBS_TOPIC, {"type": "job_update", "job": status_data})
+        self.publish(job_topic(job_id), {"type": "status", "job": status_data})
+
+    async def watch_external_writes(self, stop_event: Optional[asyncio.Event] = None):
+        """Watch the status and log directories for writes by other processes."""
+        self._loop = asyncio.get_running_loop()
+        for directory in (STATUS_DIR, LOGS_DIR):
+            directory.mkdir(parents=True, exist_ok=True)
+        if watchfiles is not None:
+            logger.info("Watching job files with watchfiles")
+            async for changes in watchfiles.awatch(STATUS_DIR, LOGS_DIR, stop_event=stop_event,
+                                                   recursive=False, debounce=50, step=20):
+                for _, changed_path in changes:
+                    self.handle_external_change(Path(changed_path))
+            return
+
+        logger.info("watchfiles not installed; polling job files every %.1fs", POLL_INTERVAL_SECONDS)
+        seen: Dict[Path, Tuple[int, int]] = {}
+        while stop_event is None or not stop_event.is_set():
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+            for path in self._watched_paths():
+                stat = self._stat(path)
+                if stat is not None and seen.get(path) != stat:
+                    seen[path] = stat
+                    self.handle_external_change(path)
+
+    def _watched_paths(self) -> List[Path]:
+        """Files the polling fallback checks: statuses only while someone watches the job list."""
+        with self._lock:
+            topics = list(self._subscribers)
+        paths = []
+        if JOBS_TOPIC in topics:
+            paths.extend(p for p in STATUS_DIR.glob("*.json"))
+        for topic in topics:
+            if topic.startswith("job:"):
+                job_id = topic[len("job:"):]
+                paths.extend([progress_path(job_id), log_path(job_id)])
+                if JOBS_TOPIC not in topics:
+                    paths.append(status_path(job_id))
+        return paths
+
+    # --- Helpers ---
+
+    def _on_loop_thread(self) -> bool:
+        if self._loop is None:
+            return True
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _remember_write(self, path: Path):
+        stat = self._stat(path)
+        if stat is not None:
+            self._own_writes[Path(path)] = stat
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _size(path: Path) -> int:
+        try:
+            return Path(path).stat().st_size
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _read_bytes(path: Path, start: int, end: int) -> bytes:
+        try:
+            with open(path, "rb") as f:
+                f.seek(start)
+                return f.read(end - start)
+        except OSError:
+            return b""
+
+    def _read_lines(self, path: Path, start: int, end: int) -> List[str]:
+        if end <= start:
+            return []
+        return self._read_bytes(path, start, end).decode("utf-8", errors="replace").splitlines(keepends=True)
+
+    @staticmethod
+    def _parse_event(line: str) -> Optional[dict]:
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            return None
+
+
+# Shared bus for the dashboard process
+event_bus = JobEventBus()
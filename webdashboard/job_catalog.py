@@ -0,0 +1,281 @@
+"""
+Job Catalog
+SQLite index of the dashboard's job files for fast listing and filtering.
+
+Job records stay in JOBS_DIR/<id>.json, with the runner's latest status in
+STATUS_DIR/<id>.json. The catalog keeps one row per job with indexed
+created_at, status and run-mode columns, the raw job and status JSON, and the
+job's summary metrics, so listing thousands of jobs does not open every file.
+
+Rows are refreshed when save_job or the job runner writes a file. Files
+changed by anything else are found by sync(), which compares file sizes and
+mtimes (no parsing) before each query. Summary metrics are computed on first
+read and cached until the job or status file changes.
+"""
+
+import base64
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from literature_review.utils.sqlite_store import SQLiteStore, StoreRegistry
+
+CATALOG_FILENAME = "job_catalog.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    status TEXT,
+    run_mode TEXT,
+    job_state TEXT NOT NULL,
+    status_state TEXT,
+    job_json TEXT NOT NULL,
+    status_json TEXT,
+    summary TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at, job_id);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at, job_id);
+CREATE INDEX IF NOT EXISTS idx_jobs_run_mode_created ON jobs(run_mode, created_at, job_id);
+"""
+
+
+def _file_state(entry) -> str:
+    """Change marker for a file (os.DirEntry or Path): size and mtime."""
+    stat = entry.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def encode_cursor(created_at: str, job_id: str) -> str:
+    """Opaque cursor pointing just past (created_at, job_id) in newest-first order."""
+    return base64.urlsafe_b64encode(json.dumps([created_at, job_id]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors."""
+    try:
+        created_at, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    return str(created_at), str(job_id)
+
+
+class JobCatalog(SQLiteStore):
+    """
+    Indexed view of the job and status files.
+
+    Args:
+        db_path: Path to the SQLite database file
+        jobs_dir: Directory of <job_id>.json job records
+        status_dir: Directory of <job_id>.json runner status files
+    """
+
+    def __init__(self, db_path: str, jobs_dir: Path, status_dir: Path):
+        super().__init__(db_path)
+        self.jobs_dir = Path(jobs_dir)
+        self.status_dir = Path(status_dir)
+        self._lock = threading.Lock()
+        conn = self._connection()
+        conn.executescript(_SCHEMA)
+        # (job_state, status_state) of every catalogued job, for sync()
+        self._states: Dict[str, Tuple[str, Optional[str]]] = {
+            job_id: (job_state, status_state)
+            for job_id, job_state, status_state in conn.execute("SELECT job_id, job_state, status_state FROM jobs")
+        }
+
+    # --- Updates ---
+
+    def refresh(self, job_id: str) -> None:
+        """Re-read one job's files after a write (removes the row if the job file is gone)."""
+        with self._lock, self._transaction() as conn:
+            self._refresh(conn, job_id)
+
+    def _refresh(self, conn: sqlite3.Connection, job_id: str) -> None:
+        job_file = self.jobs_dir / f"{job_id}.json"
+        status_file = self.status_dir / f"{job_id}.json"
+        try:
+            job_state = _file_state(job_file)
+            job_text = job_file.read_text()
+            job_data = json.loads(job_text)
+        except FileNotFoundError:
+            self._delete(conn, job_id)
+            return
+        except (OSError, ValueError):
+            return  # Unreadable or mid-write; the next write or sync picks it up
+        if not isinstance(job_data, dict):
+            return
+
+        status_state, status_text, status_data = None, None, {}
+        try:
+            status_state = _file_state(status_file)
+            status_text = status_file.read_text()
+            status_data = json.loads(status_text)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            status_state, status_text = None, None
+
+        merged = {**job_data, **status_data} if isinstance(status_data, dict) else job_data
+        config = job_data.get("config") or {}
+        conn.execute(
+            "INSERT OR REPLACE INTO jobs (job_id, created_at, status, run_mode, job_state, status_state, "
+            "job_json, status_json, summary) VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL)",
+            (job_id, str(job_data.get("created_at") or ""), merged.get("status"),
+             config.get("run_mode") if isinstance(config, dict) else None,
+             job_state, status_state, job_text, status_text))
+        self._states[job_id] = (job_state, status_state)
+
+    def _delete(self, conn: sqlite3.Connection, job_id: str) -> None:
+        conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+        self._states.pop(job_id, None)
+
+    def sync(self) -> int:
+        """
+        Catch up with files written outside save_job and the job runner
+
+        Only file metadata is compared; changed jobs are re-read. Returns the
+        number of jobs refreshed or removed.
+        """
+        job_states = self._scan(self.jobs_dir)
+        status_states = self._scan(self.status_dir)
+        changed = [job_id for job_id, job_state in job_states.items()
+                   if self._states.get(job_id) != (job_state, status_states.get(job_id))]
+        removed = [job_id for job_id in list(self._states) if job_id not in job_states]
+        if changed or removed:
+            with self._lock, self._transaction() as conn:
+                for job_id in changed:
+                    self._refresh(conn, job_id)
+                for job_id in removed:
+                    self._delete(conn, job_id)
+        return len(changed) + len(removed)
+
+    @staticmethod
+    def _scan(directory: Path) -> Dict[str, str]:
+        states = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith(".json") and entry.is_file():
+                        try:
+                            states[name[:-len(".json")]] = _file_state(entry)
+                        except OSError:
+                            continue
+        except FileNotFoundError:
+            pass
+        return states
+
+    # --- Queries ---
+
+    def list_jobs(
+        self,
+        status: Optional[str] = None,
+        run_mode: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        summarize: Optional[Callable[[dict], dict]] = None
+    ) -> Tuple[List[dict], int, Optional[str]]:
+        """
+        Jobs newest first, as job data merged with the latest status
+
+        Args:
+            status: Only jobs with this status
+            run_mode: Only jobs with this config run_mode
+            limit: Page size (None for all matching jobs)
+            cursor: next_cursor from the previous page
+            offset: Rows to skip (ignored when a cursor is given)
+            summarize: Computes the "summary" of each job; results are cached
+
+        Returns:
+            (jobs, total number of matching jobs, next_cursor or None)
+        """
+        self.sync()
+        where, params = [], []
+        if status is not None:
+            where.append("status = ?")
+            params.append(status)
+        if run_mode is not None:
+            where.append("run_mode = ?")
+            params.append(run_mode)
+        conn = self._connection()
+        filters = f" WHERE {' AND '.join(where)}" if where else ""
+        total = conn.execute(f"SELECT COUNT(*) FROM jobs{filters}", params).fetchone()[0]
+
+        if cursor:
+            where.append("(created_at, job_id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+            offset = 0
+        sql = ("SELECT job_id, created_at, job_json, status_json, summary FROM jobs"
+               + (f" WHERE {' AND '.join(where)}" if where else "")
+               + " ORDER BY created_at DESC, job_id DESC")
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit + 1, offset])
+        elif offset:
+            sql += " LIMIT -1 OFFSET ?"
+            params.append(offset)
+        rows = conn.execute(sql, params).fetchall()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][1], rows[-1][0])
+        return self._materialize(rows, summarize), total, next_cursor
+
+    def get_jobs(self, job_ids: List[str], summarize: Optional[Callable[[dict], dict]] = None) -> Dict[str, dict]:
+        """Catalogued jobs by id (missing ids are left out)."""
+        for job_id in job_ids:
+            if self._states.get(job_id) != self._current_state(job_id):
+                self.refresh(job_id)
+        placeholders = ", ".join("?" * len(job_ids))
+        rows = self._connection().execute(
+            f"SELECT job_id, created_at, job_json, status_json, summary FROM jobs WHERE job_id IN ({placeholders})",
+            job_ids).fetchall()
+        return {job["id"]: job for job in self._materialize(rows, summarize)}
+
+    def _current_state(self, job_id: str) -> Optional[Tuple[str, Optional[str]]]:
+        try:
+            job_state = _file_state(self.jobs_dir / f"{job_id}.json")
+        except OSError:
+            return None
+        try:
+            status_state = _file_state(self.status_dir / f"{job_id}.json")
+        except OSError:
+            status_state = None
+        return job_state, status_state
+
+    def _materialize(self, rows: List[tuple], summarize: Optional[Callable[[dict], dict]]) -> List[dict]:
+        jobs, computed = [], []
+        for job_id, _, job_json, status_json, summary in rows:
+            job = json.loads(job_json)
+            job.setdefault("id", job_id)
+            if status_json:
+                job.update(json.loads(status_json))
+            if summarize is not None:
+                if summary is None:
+                    job_summary = summarize(job)
+                    computed.append((json.dumps(job_summary), job_id))
+                else:
+                    job_summary = json.loads(summary)
+                job["summary"] = job_summary
+            jobs.append(job)
+        if computed:
+            with self._lock, self._transaction() as conn:
+                conn.executemany("UPDATE jobs SET summary = ? WHERE job_id = ?", computed)
+        return jobs
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+
+# Shared instances, one per catalog file and job directories
+_job_catalogs: StoreRegistry[JobCatalog] = StoreRegistry(JobCatalog)
+
+
+def get_job_catalog(db_path: str, jobs_dir: Path, status_dir: Path) -> JobCatalog:
+    """Get the shared JobCatalog for `db_path` indexing `jobs_dir` and `status_dir`."""
+    return _job_catalogs.get(*(os.path.abspath(str(p)) for p in (db_path, jobs_dir, status_dir)))
@@ -8,29 +8,85 @@ Manages job lifecycle: queued → running → completed/failed
 import asyncio
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import os
+import re
+import signal
+import sys
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
+from literature_review.utils.global_rate_limiter import API_RPM_ENV_VAR, API_RPM_FILE_ENV_VAR, global_limiter
 from webdashboard.eta_calculator import AdaptiveETACalculator
+from webdashboard.event_bus import event_bus
+from webdashboard.job_catalog import CATALOG_FILENAME, get_job_catalog
+from webdashboard.job_scheduler import JobScheduler
 
 logger = logging.getLogger(__name__)
 
+# Default wall-clock limit per job; override per job with config["timeout_seconds"]
+DEFAULT_JOB_TIMEOUT_SECONDS = 7200
+# Seconds a cancelled or timed-out pipeline gets to stop after SIGINT before it is killed
+CANCEL_GRACE_SECONDS = 10.0
+# Longest output line kept whole; longer lines are split. Bounds buffering per stream.
+STREAM_LINE_LIMIT = 64 * 1024
+# stderr lines kept in memory for the failure message
+STDERR_TAIL_LINES = 20
+
+# pipeline_orchestrator.py log lines; these are already appended to the job log via --log-file
+ORCHESTRATOR_LOG_LINE = re.compile(r'^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] \[(\w+)\] (.*)$')
+STAGE_LOG_PATTERNS = [
+    (re.compile(r'Starting stage: (.+?) \(attempt \d+/\d+\)'), 'starting'),
+    (re.compile(r'Stage (?:complete|validated): (.+)$'), 'complete'),
+    (re.compile(r'Stage failed: (.+?) \(attempt \d+\)'), 'error'),
+]
+
+
+class JobCancelled(Exception):
+    """Raised when a running job is stopped by cancel_job."""
+
+
+@dataclass
+class OutputProgressEvent:
+    """Stage progress parsed from pipeline output (fields as in orchestrator.ProgressEvent)"""
+    timestamp: str
+    stage: str
+    phase: str
+    message: str
+    percentage: Optional[float] = None
+    metadata: Optional[Dict] = None
+
 
 class PipelineJobRunner:
     """Background worker to execute queued pipeline jobs"""
     
-    def __init__(self, max_workers: int = 2):
+    def __init__(
+        self,
+        max_workers: int = 2,
+        job_timeout: float = DEFAULT_JOB_TIMEOUT_SECONDS,
+        api_budget_rpm: Optional[float] = None
+    ):
         """
         Initialize job runner
         
         Args:
             max_workers: Maximum number of concurrent jobs to process
+            job_timeout: Default wall-clock limit per job in seconds
+            api_budget_rpm: API requests per minute shared by running jobs
+                (default: the global rate limiter's limit)
         """
-        self.queue = asyncio.Queue()
+        # Queued jobs wait in the scheduler; only admitted jobs become tasks
+        self.queue = JobScheduler(
+            max_concurrent=max_workers,
+            api_budget_rpm=api_budget_rpm or (lambda: global_limiter.global_rpm_limit)
+        )
         self.running_jobs: Dict[str, asyncio.Task] = {}
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.job_timeout = job_timeout
+        self.processes: Dict[str, asyncio.subprocess.Process] = {}  # job_id -> running pipeline
+        self.cancel_requested: set = set()
+        self.paused_jobs: set = set()
         self.logger = logging.getLogger(__name__)
         self.eta_calculator = AdaptiveETACalculator()
         self.stage_timings: Dict[str, Dict] = {}  # job_id -> {stage -> start_time}
@@ -39,9 +95,14 @@ class PipelineJobRunner:
         """Start the background worker loop"""
         self.logger.info("Job runner started")
         while True:
-            job_id, job_data = await self.queue.get()
-            task = asyncio.create_task(self.process_job(job_id, job_data))
-            self.running_jobs[job_id] = task
+            job = await self.queue.get()
+            self.logger.info(
+                f"Admitting job {job.job_id} ({job.priority}, owner {job.owner}, "
+                f"{job.api_rpm:g} RPM reserved) after {job.admitted_at - job.enqueued_at:.1f}s in queue"
+            )
+            task = asyncio.create_task(self.process_job(job.job_id, job.job_data))
+            self.running_jobs[job.job_id] = task
+            self._publish_api_allowances()
             
     async def process_job(self, job_id: str, job_data: dict):
         """
@@ -52,39 +113,52 @@ class PipelineJobRunner:
             job_data: Job configuration and metadata
         """
         try:
+            if job_id in self.cancel_requested:
+                raise JobCancelled("Job cancelled before it started")
             self.logger.info(f"Starting job {job_id}")
             
             # Update job status to running
             await self.update_job_status(job_id, "running")
             
-            # Run orchestrator in thread pool (it's blocking/sync)
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                self.executor,
-                self._run_orchestrator_sync,
-                job_id,
-                job_data
-            )
+            # Pipeline output is streamed into the job log while it runs
+            result = await self._run_orchestrator(job_id, job_data)
             
             # Update job status to completed
             await self.update_job_status(job_id, "completed", result=result)
             
+        except JobCancelled as e:
+            self.logger.info(f"Job {job_id} cancelled")
+            await self.update_job_status(job_id, "cancelled", error=str(e))
         except Exception as e:
             self.logger.error(f"Job {job_id} failed: {e}", exc_info=True)
             await self.update_job_status(job_id, "failed", error=str(e))
         finally:
             self.running_jobs.pop(job_id, None)
+            self.cancel_requested.discard(job_id)
+            self.paused_jobs.discard(job_id)
+            await self.queue.release(job_id)
+            self._api_allowance_file(job_id).unlink(missing_ok=True)
+            self._publish_api_allowances()
             
-    async def enqueue_job(self, job_id: str, job_data: dict):
+    async def enqueue_job(
+        self,
+        job_id: str,
+        job_data: dict,
+        priority: Optional[str] = None,
+        owner: Optional[str] = None
+    ):
         """
         Add a job to the processing queue
         
         Args:
             job_id: Unique job identifier
             job_data: Job configuration and metadata
+            priority: Priority class ("interactive", "normal" or "bulk");
+                defaults to the job's own setting
+            owner: Owner for fair sharing; defaults to the job's "user"
         """
-        await self.queue.put((job_id, job_data))
-        self.logger.info(f"Job {job_id} queued")
+        job = await self.queue.put(job_id, job_data, priority=priority, owner=owner)
+        self.logger.info(f"Job {job_id} queued ({job.priority}, position {self.queue.qsize()})")
         
     def get_running_jobs(self) -> list:
         """
@@ -95,6 +169,90 @@ class PipelineJobRunner:
         """
         return list(self.running_jobs.keys())
     
+    def get_queued_jobs(self) -> list:
+        """
+        Get list of job IDs waiting for a worker slot, next to start first
+        """
+        return [job.job_id for job in self.queue.queued_jobs()]
+    
+    def _api_allowance_file(self, job_id: str) -> Path:
+        return Path(f"workspace/status/{job_id}_api_rpm").resolve()
+    
+    def _publish_api_allowances(self):
+        """
+        Write each running job's current API allowance for its pipeline's rate limiter
+        
+        Allowances change whenever a job is admitted or finishes; the pipeline
+        re-reads its file (API_RPM_FILE_ENV_VAR) every few seconds.
+        """
+        for job_id, rpm in self.queue.allowances().items():
+            path = self._api_allowance_file(job_id)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Replace atomically so the pipeline never reads a partial value
+                tmp_path = path.with_name(path.name + ".tmp")
+                tmp_path.write_text(f"{rpm:g}\n")
+                os.replace(tmp_path, path)
+            except OSError as e:
+                self.logger.warning(f"Failed to publish API allowance for {job_id}: {e}")
+    
+    def _signal_job(self, job_id: str, sig: int) -> bool:
+        """Send a signal to a job's pipeline and the stage scripts it started."""
+        process = self.processes.get(job_id)
+        if process is None or process.returncode is not None:
+            return False
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(process.pid, sig)  # The pipeline runs in its own process group
+            else:
+                process.send_signal(sig)
+        except ProcessLookupError:
+            return False
+        return True
+    
+    async def cancel_job(self, job_id: str) -> bool:
+        """
+        Cancel a job that is running or waiting for a worker slot
+        
+        The pipeline gets SIGINT first so it can stop cleanly (checkpoint
+        written, partial outputs kept) and is killed if it is still running
+        after CANCEL_GRACE_SECONDS.
+        
+        Returns:
+            True if the job was known to the runner and is being cancelled
+        """
+        if await self.queue.remove(job_id):
+            await self.update_job_status(job_id, "cancelled", error="Job cancelled before it started")
+            return True
+        if job_id not in self.running_jobs:
+            return False
+        self.cancel_requested.add(job_id)
+        self._write_log(job_id, "🛑 Cancellation requested")
+        # Without a process yet, _run_orchestrator stops the pipeline once it is spawned
+        if job_id in self.processes:
+            await self._stop_process(job_id, self.processes[job_id])
+        return True
+    
+    def pause_job(self, job_id: str) -> bool:
+        """Suspend a running job's pipeline (SIGSTOP). POSIX only."""
+        if not hasattr(signal, 'SIGSTOP') or job_id in self.paused_jobs:
+            return False
+        if not self._signal_job(job_id, signal.SIGSTOP):
+            return False
+        self.paused_jobs.add(job_id)
+        self._write_log(job_id, "⏸️ Job paused")
+        return True
+    
+    def resume_job(self, job_id: str) -> bool:
+        """Resume a paused job's pipeline (SIGCONT)."""
+        if job_id not in self.paused_jobs:
+            return False
+        self.paused_jobs.discard(job_id)
+        if not self._signal_job(job_id, signal.SIGCONT):
+            return False
+        self._write_log(job_id, "▶️ Job resumed")
+        return True
+    
     async def update_job_status(
         self,
         job_id: str,
@@ -121,7 +279,7 @@ class PipelineJobRunner:
         
         if status == "running":
             status_data["started_at"] = datetime.utcnow().isoformat()
-        elif status in ["completed", "failed"]:
+        elif status in ["completed", "failed", "cancelled"]:
             status_data["completed_at"] = datetime.utcnow().isoformat()
         
         if progress:
@@ -138,16 +296,13 @@ class PipelineJobRunner:
         with open(status_file, 'w') as f:
             json.dump(status_data, f, indent=2)
         
-        # Broadcast WebSocket update
+        # Push to WebSocket subscribers
+        event_bus.publish_job_status(status_data)
+        
         try:
-            # Import here to avoid circular dependency
-            from webdashboard.app import manager
-            await manager.broadcast({
-                "type": "job_update",
-                "job": status_data
-            })
+            get_job_catalog(f"workspace/{CATALOG_FILENAME}", Path("workspace/jobs"), status_file.parent).refresh(job_id)
         except Exception as e:
-            self.logger.warning(f"Failed to broadcast status update: {e}")
+            self.logger.warning(f"Failed to update job catalog for {job_id}: {e}")
     
     def _write_log(self, job_id: str, message: str):
         """
@@ -163,6 +318,7 @@ class PipelineJobRunner:
         timestamp = datetime.utcnow().isoformat()
         with open(log_file, 'a') as f:
             f.write(f"[{timestamp}] {message}\n")
+        event_bus.notify_file_changed(log_file)
     
     def _write_progress_event(self, job_id: str, event):
         """
@@ -193,6 +349,7 @@ class PipelineJobRunner:
         
         with open(progress_file, 'a') as f:
             f.write(json.dumps(event_dict) + '\n')
+        event_bus.notify_file_changed(progress_file)
     
     def _track_stage_timing(self, job_id: str, event):
         """
@@ -275,21 +432,17 @@ class PipelineJobRunner:
         paper_count = self._get_paper_count(job_id)
         return self.eta_calculator.calculate_eta(current_stage, paper_count)
     
-    def _run_orchestrator_sync(self, job_id: str, job_data: dict):
+    def _build_orchestrator_command(self, job_id: str, job_data: dict) -> Tuple[List[str], Path]:
         """
-        Run orchestrator synchronously (called in thread pool)
+        Build the pipeline_orchestrator.py command line for a job
         
         Args:
             job_id: Job identifier
             job_data: Job configuration and metadata
             
         Returns:
-            Result dictionary from orchestrator execution
+            (command, output directory)
         """
-        import subprocess
-        import sys
-        from pathlib import Path
-        
         # Default relevance threshold constant
         DEFAULT_RELEVANCE_THRESHOLD = 0.7
         
@@ -432,43 +585,165 @@ class PipelineJobRunner:
                 f"⚠️  Force re-analysis enabled (cache disabled, costs may be higher)"
             )
         
-        try:
-            # Execute pipeline orchestrator
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(Path(__file__).parent.parent),  # Run from repo root
-                timeout=7200  # 2 hour timeout
-            )
-            
-            # Log stdout and stderr
-            if result.stdout:
-                self._write_log(job_id, f"STDOUT:\n{result.stdout}")
-            if result.stderr:
-                self._write_log(job_id, f"STDERR:\n{result.stderr}")
-            
-            if result.returncode != 0:
-                error_msg = f"Pipeline failed with exit code {result.returncode}"
-                if result.stderr:
-                    error_msg += f": {result.stderr}"
-                raise RuntimeError(error_msg)
+        return cmd, output_dir
+    
+    async def _run_orchestrator(self, job_id: str, job_data: dict) -> Dict:
+        """
+        Run the pipeline as a subprocess, streaming its output as it is produced
+        
+        stdout and stderr are read line by line into the job log, and stage
+        start/complete/failure lines become progress events in the job's
+        progress JSONL. Only a short stderr tail is kept in memory, for the
+        failure message. The job is stopped after config["timeout_seconds"]
+        (default: the runner's job_timeout).
+        
+        Args:
+            job_id: Job identifier
+            job_data: Job configuration and metadata
             
-            return {
-                "status": "success",
-                "output_dir": str(output_dir),
-                "command": " ".join(cmd),
-                "dry_run": config.get("dry_run", False),
-                "force_enabled": config.get("force", False),
-                "force_confirmed": config.get("force_confirmed", False),
-                "cache_disabled": config.get("force", False)
+        Returns:
+            Result dictionary from orchestrator execution
+        """
+        config = job_data.get("config", {})
+        cmd, output_dir = self._build_orchestrator_command(job_id, job_data)
+        timeout = float(config.get("timeout_seconds") or self.job_timeout)
+        
+        # The pipeline's own rate limiter gets this job's share of the API budget,
+        # and follows the allowance file as other jobs start and finish
+        env = None
+        allowance = self.queue.allowances().get(job_id)
+        if allowance:
+            env = {
+                **os.environ,
+                API_RPM_ENV_VAR: f"{allowance:g}",
+                API_RPM_FILE_ENV_VAR: str(self._api_allowance_file(job_id))
             }
-            
-        except subprocess.TimeoutExpired:
-            error_msg = "Pipeline execution timed out after 2 hours"
+        
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(Path(__file__).parent.parent),  # Run from repo root
+            env=env,
+            limit=STREAM_LINE_LIMIT,
+            start_new_session=hasattr(os, 'killpg')  # Own process group, so signals reach stage scripts too
+        )
+        self.processes[job_id] = process
+        stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        try:
+            if job_id in self.cancel_requested:
+                # Cancelled while the process was being spawned
+                await self._stop_process(job_id, process)
+            await asyncio.wait_for(
+                asyncio.gather(
+                    self._stream_output(job_id, process.stdout, "STDOUT"),
+                    self._stream_output(job_id, process.stderr, "STDERR", stderr_tail),
+                    process.wait()
+                ),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            await self._stop_process(job_id, process)
+            error_msg = f"Pipeline execution timed out after {timeout:.0f} seconds"
             self._write_log(job_id, error_msg)
             raise RuntimeError(error_msg)
-        except Exception as e:
-            self._write_log(job_id, f"Pipeline execution failed: {str(e)}")
+        except asyncio.CancelledError:
+            await self._stop_process(job_id, process)
             raise
+        finally:
+            self.processes.pop(job_id, None)
+        
+        if job_id in self.cancel_requested:
+            raise JobCancelled("Job cancelled by user")
+        
+        if process.returncode != 0:
+            error_msg = f"Pipeline failed with exit code {process.returncode}"
+            if stderr_tail:
+                error_msg += ": " + "\n".join(stderr_tail)
+            self._write_log(job_id, f"Pipeline execution failed: {error_msg}")
+            raise RuntimeError(error_msg)
+        
+        return {
+            "status": "success",
+            "output_dir": str(output_dir),
+            "command": " ".join(cmd),
+            "dry_run": config.get("dry_run", False),
+            "force_enabled": config.get("force", False),
+            "force_confirmed": config.get("force_confirmed", False),
+            "cache_disabled": config.get("force", False)
+        }
+    
+    async def _stream_output(
+        self,
+        job_id: str,
+        stream: asyncio.StreamReader,
+        label: str,
+        tail: Optional[deque] = None
+    ):
+        """
+        Copy one pipeline output stream into the job log, a line at a time
+        
+        Args:
+            job_id: Job identifier
+            stream: Subprocess stdout or stderr
+            label: Prefix for stderr lines in the log ("STDOUT" lines are unprefixed)
+            tail: Optional bounded deque receiving the most recent lines
+        """
+        log_file = Path(f"workspace/logs/{job_id}.log").resolve()
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_file, 'a', buffering=1, encoding='utf-8') as log:
+            while True:
+                try:
+                    raw = await stream.readuntil(b'\n')
+                except asyncio.IncompleteReadError as e:
+                    raw = e.partial  # Last line without a newline
+                except asyncio.LimitOverrunError as e:
+                    # Line longer than STREAM_LINE_LIMIT: log the buffered part as its own line
+                    raw = await stream.read(e.consumed)
+                if not raw:
+                    break
+                line = raw.decode('utf-8', errors='replace').rstrip('\r\n')
+                if tail is not None:
+                    tail.append(line)
+                
+                orchestrator_line = ORCHESTRATOR_LOG_LINE.match(line)
+                if orchestrator_line:
+                    self._record_stage_progress(job_id, orchestrator_line.group(2))
+                    continue
+                
+                timestamp = datetime.utcnow().isoformat()
+                prefix = "" if label == "STDOUT" else f"{label}: "
+                log.write(f"[{timestamp}] {prefix}{line}\n")
+                event_bus.notify_file_changed(log_file)
+    
+    def _record_stage_progress(self, job_id: str, message: str):
+        """Write a progress event for orchestrator stage start/complete/failure lines."""
+        for pattern, phase in STAGE_LOG_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                self._write_progress_event(job_id, OutputProgressEvent(
+                    timestamp=datetime.utcnow().isoformat(),
+                    stage=match.group(1).strip(),
+                    phase=phase,
+                    message=message
+                ))
+                return
+    
+    async def _stop_process(self, job_id: str, process: asyncio.subprocess.Process):
+        """Interrupt the pipeline, then kill it if it outlives the grace period."""
+        if process.returncode is not None:
+            return
+        self.resume_job(job_id)  # A stopped process cannot handle SIGINT
+        if hasattr(os, 'killpg'):
+            self._signal_job(job_id, signal.SIGINT)
+        else:
+            process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=CANCEL_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            if hasattr(os, 'killpg'):
+                self._signal_job(job_id, signal.SIGKILL)
+            else:
+                process.kill()
+            await process.wait()
 
@@ -0,0 +1,255 @@
+"""
+Job Scheduler
+
+Admission control for dashboard pipeline jobs. Queued jobs wait here until a
+worker slot and enough API budget are free; only admitted jobs become tasks.
+
+- Priority classes: interactive jobs (re-runs a user is waiting on) go before
+  normal jobs, which go before bulk imports. Priority is strict.
+- Fair share: within a class, the next job comes from the owner with the
+  fewest running jobs, oldest job first, so one owner's batch cannot hold
+  every slot while others wait.
+- API budget: each job reserves a requests-per-minute share of the global
+  rate limiter's budget, and is only admitted while the reservations of the
+  running jobs leave room for it. The reservation is a guaranteed minimum:
+  jobs without their own "api_budget_rpm" also split whatever the running
+  jobs leave unreserved, so a job running alone may use the whole budget
+  and is cut back to its reservation when another job is admitted. The
+  pipeline runs in its own process with its own limiter, so the runner
+  passes each job's current allowance down to it (see API_RPM_ENV_VAR and
+  API_RPM_FILE_ENV_VAR).
+
+The head job of the highest class is never skipped for a smaller job that
+happens to fit, so large jobs cannot be starved.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Union
+
+PRIORITY_CLASSES = ("interactive", "normal", "bulk")
+DEFAULT_PRIORITY = "normal"
+DEFAULT_OWNER = "anonymous"
+# Admitted-job wait times kept for the wait-time metrics
+WAIT_HISTORY_SIZE = 1000
+
+
+def job_priority(job_data: dict) -> str:
+    """Priority class of a job: explicit "priority", else bulk for directory imports."""
+    config = job_data.get("config") or {}
+    priority = job_data.get("priority") or config.get("priority")
+    if priority in PRIORITY_CLASSES:
+        return priority
+    if job_data.get("input_method") == "directory":
+        return "bulk"
+    return DEFAULT_PRIORITY
+
+
+def job_owner(job_data: dict) -> str:
+    """Owner used for fair sharing (jobs without one share a single queue)."""
+    config = job_data.get("config") or {}
+    return str(job_data.get("user") or config.get("owner") or config.get("user") or DEFAULT_OWNER)
+
+
+@dataclass
+class QueuedJob:
+    """A job waiting for (or holding) a worker slot."""
+    job_id: str
+    job_data: dict
+    priority: str
+    owner: str
+    api_rpm: float
+    seq: int
+    # True when the job set its own api_budget_rpm, which is then also its limit
+    fixed_rpm: bool = False
+    enqueued_at: float = field(default_factory=time.monotonic)
+    admitted_at: Optional[float] = None
+
+
+class JobScheduler:
+    """
+    Bounded, prioritized, fair-share job queue.
+
+    Args:
+        max_concurrent: Jobs allowed to run at once
+        api_budget_rpm: Total API requests per minute shared by running jobs,
+            or a callable returning it (None for no API budget)
+        default_job_rpm: Reservation for jobs that do not set config
+            "api_budget_rpm" (default: the budget split across max_concurrent).
+            These jobs may also use the unreserved budget (see allowances).
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 2,
+        api_budget_rpm: Union[None, float, Callable[[], float]] = None,
+        default_job_rpm: Optional[float] = None
+    ):
+        self.max_concurrent = max_concurrent
+        self._budget = api_budget_rpm
+        self.default_job_rpm = default_job_rpm
+        self._queues: Dict[str, Dict[str, Deque[QueuedJob]]] = {p: defaultdict(deque) for p in PRIORITY_CLASSES}
+        self._queued: Dict[str, QueuedJob] = {}
+        self.running: Dict[str, QueuedJob] = {}
+        self._changed = asyncio.Condition()
+        self._seq = itertools.count()
+        self._waits: Deque[float] = deque(maxlen=WAIT_HISTORY_SIZE)
+        self.admitted_total = 0
+
+    # --- Budget ---
+
+    @property
+    def api_budget_rpm(self) -> Optional[float]:
+        return self._budget() if callable(self._budget) else self._budget
+
+    def _reservation(self, job_data: dict) -> float:
+        config = job_data.get("config") or {}
+        budget = self.api_budget_rpm
+        rpm = config.get("api_budget_rpm") or self.default_job_rpm
+        if not rpm:
+            rpm = budget / self.max_concurrent if budget else 0.0
+        # A job asking for more than the whole budget would never start
+        return min(float(rpm), budget) if budget else float(rpm)
+
+    def reserved_rpm(self) -> float:
+        return sum(job.api_rpm for job in self.running.values())
+
+    def allowances(self) -> Dict[str, float]:
+        """
+        API requests per minute each running job may use right now.
+
+        Jobs that set "api_budget_rpm" get exactly that; the others get their
+        reservation plus an even split of the budget left unreserved.
+        """
+        budget = self.api_budget_rpm
+        running = self.running.values()
+        shared = [job for job in running if not job.fixed_rpm]
+        spare = max(0.0, budget - self.reserved_rpm()) / len(shared) if budget and shared else 0.0
+        return {job.job_id: job.api_rpm + (0.0 if job.fixed_rpm else spare) for job in running}
+
+    # --- Queue operations ---
+
+    async def put(self, job_id: str, job_data: dict, priority: Optional[str] = None,
+                  owner: Optional[str] = None) -> QueuedJob:
+        """Queue a job (priority and owner default to the job's own settings)."""
+        if priority is not None and priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority class: {priority} (expected one of {', '.join(PRIORITY_CLASSES)})")
+        job = QueuedJob(
+            job_id=job_id,
+            job_data=job_data,
+            priority=priority or job_priority(job_data),
+            owner=owner or job_owner(job_data),
+            api_rpm=self._reservation(job_data),
+            seq=next(self._seq),
+            fixed_rpm=bool((job_data.get("config") or {}).get("api_budget_rpm"))
+        )
+        async with self._changed:
+            self._queues[job.priority][job.owner].append(job)
+            self._queued[job_id] = job
+            self._changed.notify_all()
+        return job
+
+    async def get(self) -> QueuedJob:
+        """Wait for the next job that may start, and mark it running."""
+        async with self._changed:
+            while True:
+                job = self._next_candidate()
+                if job is not None and self._fits(job):
+                    self._admit(job)
+                    return job
+                await self._changed.wait()
+
+    def _next_candidate(self) -> Optional[QueuedJob]:
+        running_by_owner: Dict[str, int] = defaultdict(int)
+        for job in self.running.values():
+            running_by_owner[job.owner] += 1
+        for priority in PRIORITY_CLASSES:
+            heads = [queue[0] for queue in self._queues[priority].values() if queue]
+            if heads:
+                return min(heads, key=lambda job: (running_by_owner[job.owner], job.seq))
+        return None
+
+    def _fits(self, job: QueuedJob) -> bool:
+        if len(self.running) >= self.max_concurrent:
+            return False
+        budget = self.api_budget_rpm
+        return not budget or self.reserved_rpm() + job.api_rpm <= budget + 1e-9
+
+    def _admit(self, job: QueuedJob):
+        queue = self._queues[job.priority][job.owner]
+        queue.popleft()
+        if not queue:
+            del self._queues[job.priority][job.owner]
+        del self._queued[job.job_id]
+        job.admitted_at = time.monotonic()
+        self._waits.append(job.admitted_at - job.enqueued_at)
+        self.admitted_total += 1
+        self.running[job.job_id] = job
+
+    async def release(self, job_id: str):
+        """Free a finished job's slot and API reservation."""
+        async with self._changed:
+            if self.running.pop(job_id, None) is not None:
+                self._changed.notify_all()
+
+    async def remove(self, job_id: str) -> bool:
+        """Drop a job that has not started yet. Returns False if it is not queued."""
+        async with self._changed:
+            job = self._queued.pop(job_id, None)
+            if job is None:
+                return False
+            queue = self._queues[job.priority][job.owner]
+            queue.remove(job)
+            if not queue:
+                del self._queues[job.priority][job.owner]
+            self._changed.notify_all()
+            return True
+
+    async def notify_budget_changed(self):
+        """Re-check admission after the API budget or max_concurrent changed."""
+        async with self._changed:
+            self._changed.notify_all()
+
+    # --- Introspection ---
+
+    def qsize(self) -> int:
+        """Number of jobs waiting to start."""
+        return len(self._queued)
+
+    def is_queued(self, job_id: str) -> bool:
+        return job_id in self._queued
+
+    def queued_jobs(self) -> List[QueuedJob]:
+        """Waiting jobs in the order they would currently be considered."""
+        return sorted(self._queued.values(), key=lambda job: (PRIORITY_CLASSES.index(job.priority), job.seq))
+
+    def metrics(self) -> Dict:
+        """Queue depth, running jobs, API reservations and wait times."""
+        now = time.monotonic()
+        waits = list(self._waits)
+        queued = list(self._queued.values())
+        by_priority = {priority: 0 for priority in PRIORITY_CLASSES}
+        by_owner: Dict[str, int] = defaultdict(int)
+        for job in queued:
+            by_priority[job.priority] += 1
+            by_owner[job.owner] += 1
+        return {
+            "max_concurrent": self.max_concurrent,
+            "running": len(self.running),
+            "queue_depth": len(queued),
+            "queue_depth_by_priority": by_priority,
+            "queue_depth_by_owner": dict(by_owner),
+            "api_budget_rpm": self.api_budget_rpm,
+            "api_reserved_rpm": round(self.reserved_rpm(), 2),
+            "api_allowance_rpm": {job_id: round(rpm, 2) for job_id, rpm in self.allowances().items()},
+            "admitted_total": self.admitted_total,
+            "wait_seconds": {
+                "oldest_queued": round(max((now - job.enqueued_at for job in queued), default=0.0), 3),
+                "average": round(sum(waits) / len(waits), 3) if waits else 0.0,
+                "max": round(max(waits), 3) if waits else 0.0,
+                "samples": len(waits)
+            }
+        }